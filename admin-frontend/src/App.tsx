@@ -695,9 +695,10 @@ function LLMUsagePage({
   }
 
   return (
-    <div className="grid grid-cols-4 gap-3 max-[900px]:grid-cols-1" data-testid="admin-llm-usage">
+    <div className="grid grid-cols-5 gap-3 max-[900px]:grid-cols-1" data-testid="admin-llm-usage">
       <Metric label={t("usage.totalTokens")} value={formatNumber(usage?.totals.total_tokens ?? 0)} detail={t("usage.promptCompletion", { prompt: formatNumber(usage?.totals.prompt_tokens ?? 0), completion: formatNumber(usage?.totals.completion_tokens ?? 0) })} />
       <Metric label={t("usage.cacheHitRate")} value={formatRate(usage?.totals.cache_hit_rate)} detail={t("usage.cacheTokens", { hit: formatNumber(usage?.totals.cache_hit_tokens ?? 0), miss: formatNumber(usage?.totals.cache_miss_tokens ?? 0) })} />
+      <Metric label={t("usage.contextTokensSaved")} value={formatNumber(usage?.totals.context_tokens_saved ?? 0)} detail={t("usage.contextTrimmedRuns", { count: formatNumber(usage?.totals.context_trimmed_run_count ?? 0) })} />
       <Metric label={t("usage.runs")} value={formatNumber(usage?.totals.run_count ?? 0)} detail={t("usage.bucket", { bucket: usage?.bucket ?? "hour" })} />
       <Metric label={t("usage.missing")} value={formatNumber(usage?.totals.missing_usage_count ?? 0)} detail={t("usage.range", { range })} />
       <Panel title={t("usage.title")}>
@@ -732,6 +733,12 @@ function LLMUsagePage({
             valueLabel={(value) => `${value}%`}
             fixedMax={100}
           />
+          <UsageLineChart
+            title={t("usage.contextSavings")}
+            models={usage?.models ?? []}
+            valueForPoint={(point) => point.context_tokens_saved}
+            valueLabel={(value) => formatNumber(value)}
+          />
         </div>
         <div className="overflow-x-auto rounded-lg border border-border">
           <table className="min-w-[760px] w-full border-collapse text-sm leading-5">
@@ -743,6 +750,7 @@ function LLMUsagePage({
                 <th className="px-3 py-2 text-right font-semibold">{t("usage.promptTokens")}</th>
                 <th className="px-3 py-2 text-right font-semibold">{t("usage.completionTokens")}</th>
                 <th className="px-3 py-2 text-right font-semibold">{t("usage.cacheHitRate")}</th>
+                <th className="px-3 py-2 text-right font-semibold">{t("usage.contextTokensSaved")}</th>
                 <th className="px-3 py-2 text-right font-semibold">{t("usage.runs")}</th>
                 <th className="px-3 py-2 text-right font-semibold">{t("usage.missing")}</th>
               </tr>
@@ -760,6 +768,7 @@ function LLMUsagePage({
                   <td className="px-3 py-2 text-right tabular-nums">{formatNumber(model.prompt_tokens)}</td>
                   <td className="px-3 py-2 text-right tabular-nums">{formatNumber(model.completion_tokens)}</td>
                   <td className="px-3 py-2 text-right tabular-nums">{formatRate(model.cache_hit_rate)}</td>
+                  <td className="px-3 py-2 text-right tabular-nums">{formatNumber(model.context_tokens_saved)}</td>
                   <td className="px-3 py-2 text-right tabular-nums">{formatNumber(model.run_count)}</td>
                   <td className="px-3 py-2 text-right tabular-nums">{formatNumber(model.missing_usage_count)}</td>
                 </tr>
@@ -92,6 +92,9 @@ const resources = {
         promptCompletion: "prompt {{prompt}} / completion {{completion}}",
         cacheHitRate: "Cache hit rate",
         cacheTokens: "hit {{hit}} / miss {{miss}}",
+        contextTokensSaved: "Context 削減 token",
+        contextTrimmedRuns: "trim 実行 {{count}} 件",
+        contextSavings: "Context 削減量",
         runs: "Runs",
         bucket: "{{bucket}} bucket",
         missing: "Usage missing",
@@ -241,6 +244,9 @@ const resources = {
         promptCompletion: "prompt {{prompt}} / completion {{completion}}",
         cacheHitRate: "Cache hit rate",
         cacheTokens: "hit {{hit}} / miss {{miss}}",
+        contextTokensSaved: "Context tokens saved",
+        contextTrimmedRuns: "{{count}} trimmed runs",
+        contextSavings: "Context savings",
         runs: "Runs",
         bucket: "{{bucket}} bucket",
         missing: "Usage missing",
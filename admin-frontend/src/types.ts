@@ -110,6 +110,12 @@ export type LLMUsageSeriesPoint = {
   cache_miss_tokens: number;
   cache_hit_rate: number | null;
   missing_usage_count: number;
+  context_tokens_saved: number;
+  context_trimmed_run_count: number;
+  latency_run_count: number;
+  latency_p50_ms: number | null;
+  latency_p95_ms: number | null;
+  latency_p99_ms: number | null;
 };
 
 export type LLMUsageModel = {
@@ -124,6 +130,12 @@ export type LLMUsageModel = {
   cache_miss_tokens: number;
   cache_hit_rate: number | null;
   missing_usage_count: number;
+  context_tokens_saved: number;
+  context_trimmed_run_count: number;
+  latency_run_count: number;
+  latency_p50_ms: number | null;
+  latency_p95_ms: number | null;
+  latency_p99_ms: number | null;
   series: LLMUsageSeriesPoint[];
 };
 
@@ -0,0 +1,44 @@
+"""llm context budget trimming telemetry"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0036_llm_context_trimming"
+down_revision = "0035_drop_quest_counters"
+branch_labels = None
+depends_on = None
+
+
+def _column_names(inspector: sa.Inspector, table_name: str) -> set[str]:
+    return {column["name"] for column in inspector.get_columns(table_name)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "llm_runs" not in set(inspector.get_table_names()):
+        return
+
+    llm_run_columns = _column_names(inspector, "llm_runs")
+    with op.batch_alter_table("llm_runs") as batch:
+        if "context_tokens_saved" not in llm_run_columns:
+            batch.add_column(sa.Column("context_tokens_saved", sa.Integer(), nullable=True))
+        if "context_trimming" not in llm_run_columns:
+            batch.add_column(sa.Column("context_trimming", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "llm_runs" not in set(inspector.get_table_names()):
+        return
+
+    llm_run_columns = _column_names(inspector, "llm_runs")
+    with op.batch_alter_table("llm_runs") as batch:
+        if "context_trimming" in llm_run_columns:
+            batch.drop_column("context_trimming")
+        if "context_tokens_saved" in llm_run_columns:
+            batch.drop_column("context_tokens_saved")
@@ -0,0 +1,38 @@
+"""world reference directory version counter"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0037_world_reference_version"
+down_revision = "0036_llm_context_trimming"
+branch_labels = None
+depends_on = None
+
+
+def _column_names(inspector: sa.Inspector, table_name: str) -> set[str]:
+    return {column["name"] for column in inspector.get_columns(table_name)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "worlds" not in set(inspector.get_table_names()):
+        return
+
+    if "reference_version" not in _column_names(inspector, "worlds"):
+        with op.batch_alter_table("worlds") as batch:
+            batch.add_column(sa.Column("reference_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "worlds" not in set(inspector.get_table_names()):
+        return
+
+    if "reference_version" in _column_names(inspector, "worlds"):
+        with op.batch_alter_table("worlds") as batch:
+            batch.drop_column("reference_version")
@@ -0,0 +1,38 @@
+"""session state snapshot version counters"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0038_session_state_versions"
+down_revision = "0037_world_reference_version"
+branch_labels = None
+depends_on = None
+
+
+def _column_names(inspector: sa.Inspector, table_name: str) -> set[str]:
+    return {column["name"] for column in inspector.get_columns(table_name)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    table_names = set(inspector.get_table_names())
+    for table_name in ("worlds", "actors"):
+        if table_name not in table_names or "state_version" in _column_names(inspector, table_name):
+            continue
+        with op.batch_alter_table(table_name) as batch:
+            batch.add_column(sa.Column("state_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    table_names = set(inspector.get_table_names())
+    for table_name in ("actors", "worlds"):
+        if table_name not in table_names or "state_version" not in _column_names(inspector, table_name):
+            continue
+        with op.batch_alter_table(table_name) as batch:
+            batch.drop_column("state_version")
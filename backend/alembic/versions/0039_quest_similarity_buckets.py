@@ -0,0 +1,50 @@
+"""quest template minhash signatures and lsh buckets"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0039_quest_similarity_buckets"
+down_revision = "0038_session_state_versions"
+branch_labels = None
+depends_on = None
+
+
+def _tables() -> set[str]:
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _column_names(table_name: str) -> set[str]:
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns(table_name)}
+
+
+def upgrade() -> None:
+    tables = _tables()
+    if "quest_templates" in tables and "similarity_signature" not in _column_names("quest_templates"):
+        with op.batch_alter_table("quest_templates") as batch:
+            batch.add_column(sa.Column("similarity_signature", sa.JSON(), nullable=True))
+    if "quest_template_similarity_buckets" in tables:
+        return
+    op.create_table(
+        "quest_template_similarity_buckets",
+        sa.Column("world_id", sa.String(length=64), nullable=False),
+        sa.Column("band_key", sa.String(length=48), nullable=False),
+        sa.Column("quest_template_id", sa.String(length=96), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["quest_template_id", "world_id"],
+            ["quest_templates.id", "quest_templates.world_id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("world_id", "band_key", "quest_template_id"),
+    )
+
+
+def downgrade() -> None:
+    tables = _tables()
+    if "quest_template_similarity_buckets" in tables:
+        op.drop_table("quest_template_similarity_buckets")
+    if "quest_templates" in tables and "similarity_signature" in _column_names("quest_templates"):
+        with op.batch_alter_table("quest_templates") as batch:
+            batch.drop_column("similarity_signature")
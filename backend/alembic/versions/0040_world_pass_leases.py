@@ -0,0 +1,38 @@
+"""expiring leases for idle world passes across scheduler replicas"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0040_world_pass_leases"
+down_revision = "0039_quest_similarity_buckets"
+branch_labels = None
+depends_on = None
+
+
+def _tables() -> set[str]:
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    if "world_pass_leases" in _tables():
+        return
+    op.create_table(
+        "world_pass_leases",
+        sa.Column("world_id", sa.String(length=64), nullable=False),
+        sa.Column("holder", sa.String(length=128), nullable=False),
+        sa.Column("acquired_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["world_id"], ["worlds.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("world_id"),
+    )
+
+
+def downgrade() -> None:
+    if "world_pass_leases" in _tables():
+        op.drop_table("world_pass_leases")
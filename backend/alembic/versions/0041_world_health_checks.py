@@ -0,0 +1,42 @@
+"""cached per-world shared health results with an incremental high-water mark"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0041_world_health_checks"
+down_revision = "0040_world_pass_leases"
+branch_labels = None
+depends_on = None
+
+
+def _tables() -> set[str]:
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    if "world_health_checks" in _tables():
+        return
+    op.create_table(
+        "world_health_checks",
+        sa.Column("world_id", sa.String(length=64), nullable=False),
+        sa.Column("pack_id", sa.String(length=120), nullable=False),
+        sa.Column("world_template_id", sa.String(length=120), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("check_mode", sa.String(length=16), nullable=False),
+        sa.Column("checked_through", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_full_check_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("replay_state", sa.JSON(), nullable=False),
+        sa.Column("summary", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["world_id"], ["worlds.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("world_id"),
+    )
+
+
+def downgrade() -> None:
+    if "world_health_checks" in _tables():
+        op.drop_table("world_health_checks")
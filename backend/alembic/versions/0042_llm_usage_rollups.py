@@ -0,0 +1,74 @@
+"""hourly llm usage rollups with latency histograms"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0042_llm_usage_rollups"
+down_revision = "0041_world_health_checks"
+branch_labels = None
+depends_on = None
+
+
+def _tables() -> set[str]:
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = _tables()
+    if "llm_runs" in tables:
+        llm_run_columns = {column["name"] for column in inspector.get_columns("llm_runs")}
+        if "latency_ms" not in llm_run_columns:
+            with op.batch_alter_table("llm_runs") as batch:
+                batch.add_column(sa.Column("latency_ms", sa.Integer(), nullable=True))
+        if "ix_llm_runs_created_at" not in {index["name"] for index in inspector.get_indexes("llm_runs")}:
+            op.create_index("ix_llm_runs_created_at", "llm_runs", ["created_at"])
+    if "llm_usage_rollups" not in tables:
+        op.create_table(
+            "llm_usage_rollups",
+            sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("world_id", sa.String(length=64), nullable=False),
+            sa.Column("model_lane", sa.String(length=32), nullable=False),
+            sa.Column("model_id", sa.String(length=120), nullable=False),
+            sa.Column("provider_name", sa.String(length=64), nullable=False),
+            sa.Column("run_count", sa.Integer(), nullable=False),
+            sa.Column("prompt_tokens", sa.Integer(), nullable=False),
+            sa.Column("completion_tokens", sa.Integer(), nullable=False),
+            sa.Column("total_tokens", sa.Integer(), nullable=False),
+            sa.Column("cache_hit_tokens", sa.Integer(), nullable=False),
+            sa.Column("cache_miss_tokens", sa.Integer(), nullable=False),
+            sa.Column("missing_usage_count", sa.Integer(), nullable=False),
+            sa.Column("context_tokens_saved", sa.Integer(), nullable=False),
+            sa.Column("context_trimmed_run_count", sa.Integer(), nullable=False),
+            sa.Column("latency_histogram", sa.JSON(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("bucket_start", "world_id", "model_lane", "model_id", "provider_name"),
+        )
+    if "rollup_watermarks" not in tables:
+        op.create_table(
+            "rollup_watermarks",
+            sa.Column("name", sa.String(length=64), nullable=False),
+            sa.Column("rolled_through", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("name"),
+        )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = _tables()
+    if "rollup_watermarks" in tables:
+        op.drop_table("rollup_watermarks")
+    if "llm_usage_rollups" in tables:
+        op.drop_table("llm_usage_rollups")
+    if "llm_runs" in tables:
+        if "ix_llm_runs_created_at" in {index["name"] for index in inspector.get_indexes("llm_runs")}:
+            op.drop_index("ix_llm_runs_created_at", table_name="llm_runs")
+        if "latency_ms" in {column["name"] for column in inspector.get_columns("llm_runs")}:
+            with op.batch_alter_table("llm_runs") as batch:
+                batch.drop_column("latency_ms")
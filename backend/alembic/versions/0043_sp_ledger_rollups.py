@@ -0,0 +1,69 @@
+"""daily sp ledger rollups and keyset indexes"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0043_sp_ledger_rollups"
+down_revision = "0042_llm_usage_rollups"
+branch_labels = None
+depends_on = None
+
+
+SP_LEDGER_KEYSET_INDEXES = {
+    "ix_sp_ledger_created_at_id": ["created_at", "id"],
+    "ix_sp_ledger_user_created_at_id": ["user_sub", "created_at", "id"],
+    "ix_sp_ledger_world_created_at_id": ["world_id", "created_at", "id"],
+    "ix_sp_ledger_reference_type_created_at_id": ["reference_type", "created_at", "id"],
+}
+
+
+def _tables() -> set[str]:
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = _tables()
+    if "sp_ledger" in tables:
+        existing_indexes = {index["name"] for index in inspector.get_indexes("sp_ledger")}
+        for name, columns in SP_LEDGER_KEYSET_INDEXES.items():
+            if name not in existing_indexes:
+                op.create_index(name, "sp_ledger", columns)
+    if "sp_ledger_daily_rollups" not in tables:
+        op.create_table(
+            "sp_ledger_daily_rollups",
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("reason_code", sa.String(length=64), nullable=False),
+            sa.Column("entry_count", sa.Integer(), nullable=False),
+            sa.Column("delta_total", sa.Integer(), nullable=False),
+            sa.Column("paid_delta_total", sa.Integer(), nullable=False),
+            sa.Column("bonus_delta_total", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("day", "reason_code"),
+        )
+        if "sp_ledger" in tables:
+            day = "CAST(created_at AT TIME ZONE 'UTC' AS DATE)" if bind.dialect.name == "postgresql" else "date(created_at)"
+            op.execute(
+                "INSERT INTO sp_ledger_daily_rollups "
+                "(day, reason_code, entry_count, delta_total, paid_delta_total, bonus_delta_total, created_at, updated_at) "
+                f"SELECT {day}, reason_code, COUNT(id), SUM(delta), SUM(paid_delta), SUM(bonus_delta), "
+                "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP "
+                f"FROM sp_ledger GROUP BY {day}, reason_code"
+            )
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = _tables()
+    if "sp_ledger_daily_rollups" in tables:
+        op.drop_table("sp_ledger_daily_rollups")
+    if "sp_ledger" in tables:
+        existing_indexes = {index["name"] for index in inspector.get_indexes("sp_ledger")}
+        for name in SP_LEDGER_KEYSET_INDEXES:
+            if name in existing_indexes:
+                op.drop_index(name, table_name="sp_ledger")
@@ -0,0 +1,72 @@
+"""index quest templates written before similarity buckets existed"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.modules.world_state.quest_similarity import quest_template_similarity
+
+
+revision = "0044_quest_similarity_backfill"
+down_revision = "0043_sp_ledger_rollups"
+branch_labels = None
+depends_on = None
+
+
+def _tables() -> set[str]:
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    if not {"quest_templates", "quest_template_similarity_buckets"} <= _tables():
+        return
+    bind = op.get_bind()
+    quest_templates = sa.table(
+        "quest_templates",
+        sa.column("id", sa.String()),
+        sa.column("world_id", sa.String()),
+        sa.column("title", sa.String()),
+        sa.column("description", sa.Text()),
+        sa.column("similarity_signature", sa.JSON()),
+    )
+    buckets = sa.table(
+        "quest_template_similarity_buckets",
+        sa.column("world_id", sa.String()),
+        sa.column("band_key", sa.String()),
+        sa.column("quest_template_id", sa.String()),
+    )
+    rows = bind.execute(
+        sa.select(
+            quest_templates.c.id,
+            quest_templates.c.world_id,
+            quest_templates.c.title,
+            quest_templates.c.description,
+            quest_templates.c.similarity_signature,
+        )
+    ).all()
+    for row in rows:
+        if row.similarity_signature:
+            continue
+        signature, keys = quest_template_similarity(row.title or "", row.description or "")
+        bind.execute(
+            quest_templates.update()
+            .where(quest_templates.c.id == row.id, quest_templates.c.world_id == row.world_id)
+            .values(similarity_signature=signature)
+        )
+        bind.execute(
+            buckets.delete().where(
+                buckets.c.world_id == row.world_id,
+                buckets.c.quest_template_id == row.id,
+            )
+        )
+        if keys:
+            bind.execute(
+                buckets.insert(),
+                [{"world_id": row.world_id, "band_key": key, "quest_template_id": row.id} for key in sorted(keys)],
+            )
+
+
+def downgrade() -> None:
+    # The signatures and buckets are dropped with their table and column by 0039's downgrade.
+    pass
@@ -0,0 +1,60 @@
+"""shard daily sp ledger rollups"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0045_sp_ledger_rollup_shards"
+down_revision = "0044_quest_similarity_backfill"
+branch_labels = None
+depends_on = None
+
+
+def _tables() -> set[str]:
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _rebuild_rollups(*, sharded: bool) -> None:
+    """Recreates the rollup table with or without the shard key and refills it from ``sp_ledger``.
+
+    Rollups are derived data, so rebuilding beats altering the primary key on both dialects.
+    Backfilled totals land in shard 0; live writes spread over the shards from then on.
+    """
+    bind = op.get_bind()
+    tables = _tables()
+    if "sp_ledger_daily_rollups" in tables:
+        op.drop_table("sp_ledger_daily_rollups")
+    key = ["day", "reason_code", "shard"] if sharded else ["day", "reason_code"]
+    op.create_table(
+        "sp_ledger_daily_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("reason_code", sa.String(length=64), nullable=False),
+        *([sa.Column("shard", sa.Integer(), nullable=False)] if sharded else []),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.Column("delta_total", sa.Integer(), nullable=False),
+        sa.Column("paid_delta_total", sa.Integer(), nullable=False),
+        sa.Column("bonus_delta_total", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(*key),
+    )
+    if "sp_ledger" in tables:
+        day = "CAST(created_at AT TIME ZONE 'UTC' AS DATE)" if bind.dialect.name == "postgresql" else "date(created_at)"
+        op.execute(
+            "INSERT INTO sp_ledger_daily_rollups "
+            f"(day, reason_code, {'shard, ' if sharded else ''}entry_count, delta_total, paid_delta_total, "
+            "bonus_delta_total, created_at, updated_at) "
+            f"SELECT {day}, reason_code, {'0, ' if sharded else ''}COUNT(id), SUM(delta), SUM(paid_delta), "
+            "SUM(bonus_delta), CURRENT_TIMESTAMP, CURRENT_TIMESTAMP "
+            f"FROM sp_ledger GROUP BY {day}, reason_code"
+        )
+
+
+def upgrade() -> None:
+    _rebuild_rollups(sharded=True)
+
+
+def downgrade() -> None:
+    _rebuild_rollups(sharded=False)
@@ -25,6 +25,8 @@ def health(
         container.settings,
         container.projection_service,
         container.observability_service,
+        llm_circuit_breakers=container.model_router.circuit_breakers.snapshot(),
+        council_speculation=container.council_service.speculation_stats(),
     )
     embedding = memory_status(db, container.memory_service)
     release_gate = container.eval_service.latest_release_checklist(db)
@@ -43,6 +43,7 @@ from app.modules.admin_ops.service import (
     world_travel_log,
     world_chapter_branches,
     world_consequence_threads,
+    world_event_integrity_report,
     world_ticks,
 )
 from app.modules.economy_sp.service import InsufficientSPError
@@ -169,6 +170,8 @@ def get_observability_summary(
         container.observability_service,
         pack_id=pack_id,
         world_template_id=world_template_id,
+        llm_circuit_breakers=container.model_router.circuit_breakers.snapshot(),
+        council_speculation=container.council_service.speculation_stats(),
     )
     db.commit()
     return payload
@@ -449,6 +452,20 @@ def get_world_shared_world(
     return world_shared_context(db, world_id=world_id)
 
 
+@router.get("/worlds/{world_id}/event-integrity")
+def get_world_event_integrity(
+    world_id: str,
+    mode: Literal["full", "sample"] = Query(default="full"),
+    limit: int = Query(default=200, ge=1, le=1000),
+    sample_size: int = Query(default=1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    container: AppContainer = Depends(get_container),
+    user: UserIdentity = Depends(get_current_ops_user),
+) -> dict[str, object]:
+    del container, user
+    return world_event_integrity_report(db, world_id=world_id, mode=mode, limit=limit, sample_size=sample_size)
+
+
 @router.get("/worlds/{world_id}/history")
 def get_world_history(
     world_id: str,
@@ -503,12 +520,16 @@ def get_sp_ledger(
     user_sub: str | None = Query(default=None, max_length=128),
     world_id: str | None = Query(default=None, max_length=64),
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, max_length=256),
     db: Session = Depends(get_db),
     container: AppContainer = Depends(get_container),
     user: UserIdentity = Depends(get_current_ops_user),
 ) -> dict[str, object]:
     del user
-    return sp_ledger(db, container.economy_service, user_sub=user_sub, world_id=world_id, limit=limit)
+    try:
+        return sp_ledger(db, container.economy_service, user_sub=user_sub, world_id=world_id, limit=limit, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=str(exc)) from exc
 
 
 @router.post("/sp/adjustments")
@@ -165,7 +165,12 @@ def get_session_state(
     state["world_pack"] = world_pack
     cache_db = container.session_factory()
     try:
-        return localize_session_state(cache_db, container.model_router, state)
+        return localize_session_state(
+            cache_db,
+            container.model_router,
+            state,
+            batch_executor=container.localization_batch_executor,
+        )
     finally:
         cache_db.close()
 
@@ -229,7 +234,12 @@ def get_session_quests(
     }
     cache_db = container.session_factory()
     try:
-        localized = localize_session_state(cache_db, container.model_router, payload)
+        localized = localize_session_state(
+            cache_db,
+            container.model_router,
+            payload,
+            batch_executor=container.localization_batch_executor,
+        )
     finally:
         cache_db.close()
     localized_quests = localized.get("quests") if isinstance(localized.get("quests"), list) else items
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from functools import partial
+
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field
@@ -189,6 +193,7 @@ def _localize_turn_content(
     content: dict[str, object],
     *,
     generate_missing: bool = True,
+    on_cached: Callable[[dict[str, object]], None] | None = None,
 ) -> dict[str, object]:
     world_id = str(result.turn.world_id)
     actor_id = str(result.turn.actor_id or "")
@@ -209,38 +214,45 @@ def _localize_turn_content(
             actor_id=actor_id,
             play_language=dict(play_language),
             generate_missing=generate_missing,
+            on_cached=on_cached,
+            batch_executor=container.localization_batch_executor,
         )
         return localized
     finally:
         db.close()
 
 
-def _persist_player_facing_turn_text(container: AppContainer, result, content: dict[str, object]) -> None:
-    updates = {
+def _player_facing_turn_text(content: dict[str, object]) -> dict[str, str]:
+    return {
         "narrative": str(content.get("narrative") or ""),
         "npc_reaction": str(content.get("npc_reaction") or ""),
         "consequence_summary": str(content.get("consequence_summary") or ""),
         "scene_summary": str(content.get("scene_summary") or ""),
     }
-    if not any(updates.values()):
-        return
+
+
+def _persist_player_facing_turn_text(container: AppContainer, turn_id: str, event_id: str, updates: dict[str, str]) -> None:
+    # Runs on the localization pool while result events go out, so it only touches its own session.
     db = container.session_factory()
     try:
-        turn = db.get(Turn, result.turn.id)
+        turn = db.get(Turn, turn_id)
         if turn is not None and isinstance(turn.resolved_output, dict):
             turn.resolved_output = {**turn.resolved_output, **updates}
-        event = db.get(Event, result.event.id)
+        event = db.get(Event, event_id)
         if event is not None and updates["narrative"]:
             event.narrative = updates["narrative"]
         db.commit()
-        if isinstance(result.turn.resolved_output, dict):
-            result.turn.resolved_output = {**result.turn.resolved_output, **updates}
-        if updates["narrative"]:
-            result.event.narrative = updates["narrative"]
     finally:
         db.close()
 
 
+def _apply_player_facing_turn_text(result, updates: dict[str, str]) -> None:
+    if isinstance(result.turn.resolved_output, dict):
+        result.turn.resolved_output = {**result.turn.resolved_output, **updates}
+    if updates["narrative"]:
+        result.event.narrative = updates["narrative"]
+
+
 async def _emit_response_localization_progress(
     *,
     session_id: str,
@@ -407,36 +419,58 @@ async def _resolve_turn_background(
         )
 
     if not result.succeeded:
-        localization_started_at = time.perf_counter()
-        await _emit_response_localization_progress(
-            session_id=session_id,
-            turn_id=turn_id,
-            world_context=world_context,
-            status="started",
-        )
-        failure_payload = _localize_turn_content(
+        await _deliver_localized_turn(
             container,
             result,
             _failure_response_content(result, world_context),
-            generate_missing=True,
-        )
-        await _emit_response_localization_progress(
             session_id=session_id,
             turn_id=turn_id,
             world_context=world_context,
-            status="completed",
-            started_at=localization_started_at,
-        )
-        _persist_player_facing_turn_text(container, result, failure_payload)
-        await _emit_turn_result_events(result, world_context, failure_payload)
-        await realtime_hub.emit_with_world_context(
-            session_id,
-            "turn.failed",
-            {**failure_payload, "retryable": True},
-            world_context,
+            final_event="turn.failed",
+            final_fields={"retryable": True},
         )
         return
 
+    await _deliver_localized_turn(
+        container,
+        result,
+        _success_response_content(result, world_context),
+        session_id=session_id,
+        turn_id=turn_id,
+        world_context=world_context,
+        final_event="turn.resolved",
+    )
+
+
+async def _deliver_localized_turn(
+    container: AppContainer,
+    result,
+    content: dict[str, object],
+    *,
+    session_id: str,
+    turn_id: str,
+    world_context: dict[str, object],
+    final_event: str,
+    final_fields: dict[str, object] | None = None,
+) -> None:
+    loop = asyncio.get_running_loop()
+    executor = container.turn_localization_executor
+    cached_deliveries: list[Future[None]] = []
+
+    def deliver_cached(cached_payload: dict[str, object]) -> None:
+        # Called from the localization worker before the model call for missing segments.
+        cached_deliveries.append(
+            asyncio.run_coroutine_threadsafe(
+                realtime_hub.emit_with_world_context(
+                    session_id,
+                    "turn.localization.partial",
+                    {**cached_payload, "turn_id": turn_id, "partial": True},
+                    world_context,
+                ),
+                loop,
+            )
+        )
+
     localization_started_at = time.perf_counter()
     await _emit_response_localization_progress(
         session_id=session_id,
@@ -444,12 +478,14 @@ async def _resolve_turn_background(
         world_context=world_context,
         status="started",
     )
-    success_payload = _localize_turn_content(
-        container,
-        result,
-        _success_response_content(result, world_context),
-        generate_missing=True,
+    # Localization may call the model; keep it on a bounded pool so the event loop stays free
+    # for every other socket and request on this worker.
+    localized = await loop.run_in_executor(
+        executor,
+        partial(_localize_turn_content, container, result, content, generate_missing=True, on_cached=deliver_cached),
     )
+    for delivery in cached_deliveries:
+        await asyncio.wrap_future(delivery)
     await _emit_response_localization_progress(
         session_id=session_id,
         turn_id=turn_id,
@@ -457,12 +493,29 @@ async def _resolve_turn_background(
         status="completed",
         started_at=localization_started_at,
     )
-    _persist_player_facing_turn_text(container, result, success_payload)
-    await _emit_turn_result_events(result, world_context, success_payload)
+    updates = _player_facing_turn_text(localized)
+    if any(updates.values()):
+        # The worker gets plain ids and strings; ``result`` is read by the emits below and only
+        # updated on this loop once both are done.
+        persisted = loop.run_in_executor(
+            executor,
+            _persist_player_facing_turn_text,
+            container,
+            result.turn.id,
+            result.event.id,
+            updates,
+        )
+        try:
+            await _emit_turn_result_events(result, world_context, localized)
+        finally:
+            await persisted
+        _apply_player_facing_turn_text(result, updates)
+    else:
+        await _emit_turn_result_events(result, world_context, localized)
     await realtime_hub.emit_with_world_context(
         session_id,
-        "turn.resolved",
-        success_payload,
+        final_event,
+        {**localized, **(final_fields or {})},
         world_context,
     )
 
@@ -52,8 +52,17 @@ class Settings(BaseSettings):
     release_shadow_limit: int = 5
     release_check_timeout_seconds: float = 300.0
     release_check_total_budget_seconds: float = 900.0
+    release_health_full_check_hours: float = 24.0
     world_idle_interval_seconds: int = 60
     world_idle_grace_seconds: int = 60
+    world_scheduler_jitter_ratio: float = 0.1
+    world_scheduler_refresh_seconds: int = 30
+    world_scheduler_max_passes_per_tick: int = 8
+    world_scheduler_max_workers: int = 4
+    world_pass_timeout_seconds: float = 180.0
+    world_pass_lease_seconds: int = 300
+    world_pass_retry_base_seconds: float = 15.0
+    world_pass_max_retries: int = 3
     model_provider: str = "openai_compatible"
     embedding_provider: str = "openai_compatible"
     gemini_api_key: str = ""
@@ -70,7 +79,33 @@ class Settings(BaseSettings):
     openai_compat_response_format: str = "json_schema"
     openai_compat_context_cache_enabled: bool = True
     openai_compat_explicit_context_cache_enabled: bool = False
+    openai_compat_streaming_enabled: bool = False
     openai_compat_context_cache_ttl_seconds: int = 3600
+    llm_circuit_breaker_enabled: bool = True
+    llm_circuit_window_size: int = 20
+    llm_circuit_min_requests: int = 5
+    llm_circuit_error_rate_threshold: float = 0.5
+    llm_circuit_slow_call_seconds: float = 20.0
+    llm_circuit_slow_call_rate_threshold: float = 0.8
+    llm_circuit_open_seconds: float = 30.0
+    llm_circuit_half_open_probes: int = 1
+    llm_retry_budget_ratio: float = 0.2
+    llm_retry_budget_capacity: float = 10.0
+    council_speculative_narrative_enabled: bool = True
+    llm_context_budget_enabled: bool = True
+    llm_context_token_budget: int = 12000
+    turn_localization_max_workers: int = 4
+    localization_batch_max_tokens: int = 1200
+    localization_batch_max_items: int = 48
+    localization_batch_max_workers: int = 4
+    turn_context_expected_concurrent_turns: int = 8
+    turn_context_prefetch_max_workers: int = 0
+    turn_context_planner_max_workers: int = 0
+    session_state_snapshot_cache_enabled: bool = True
+    session_state_snapshot_cache_size: int = 1024
+    session_state_snapshot_ttl_seconds: float = 30.0
+    session_state_snapshot_shared_url: str = ""
+    event_loop_lag_probe_interval_seconds: float = 0.5
     openai_compat_embedding_api_key: str = ""
     openai_compat_embedding_base_url: str = ""
     openai_compat_embedding_model: str = ""
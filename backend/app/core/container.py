@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from sqlalchemy.orm import Session, sessionmaker
@@ -14,9 +15,16 @@ from app.modules.graph_projection.service import ProjectionService
 from app.modules.identity.oidc import BaseOIDCAdapter, build_oidc_adapter
 from app.modules.llm_harness.service import ModelRouter
 from app.modules.observability.service import ObservabilityService
+from app.modules.session.prefetch import ContextPrefetcher
 from app.modules.world_pack.service import PackRegistry, configure_pack_registry
 from app.modules.world_memory.service import MemoryService
 from app.modules.world_state.ambient import AmbientWorldPassService
+from app.modules.world_state.snapshot import (
+    SessionStateSnapshotCache,
+    build_shared_snapshot_tier,
+    install_session_state_snapshots,
+    install_session_state_versioning,
+)
 
 
 @dataclass
@@ -34,6 +42,21 @@ class AppContainer:
     observability_service: ObservabilityService
     memory_service: MemoryService
     ambient_world_service: AmbientWorldPassService
+    turn_localization_executor: ThreadPoolExecutor
+    localization_batch_executor: ThreadPoolExecutor
+    context_prefetcher: ContextPrefetcher
+    session_state_snapshots: SessionStateSnapshotCache
+
+    def close(self) -> None:
+        """Shuts down the worker pools this container owns; it cannot serve turns afterwards.
+
+        Work already running finishes (in-flight localizations still persist); queued work is
+        dropped, since nothing is left to deliver it to.
+        """
+
+        self.turn_localization_executor.shutdown(wait=True, cancel_futures=True)
+        self.localization_batch_executor.shutdown(wait=True, cancel_futures=True)
+        self.context_prefetcher.close()
 
 
 def build_container(settings: Settings | None = None) -> AppContainer:
@@ -83,6 +106,14 @@ def build_container(settings: Settings | None = None) -> AppContainer:
             "or EMBEDDING_PROVIDER=gemini_developer_api"
         )
     session_factory = create_session_factory(resolved_settings)
+    install_session_state_versioning(session_factory)
+    session_state_snapshots = SessionStateSnapshotCache(
+        enabled=resolved_settings.session_state_snapshot_cache_enabled,
+        max_entries=resolved_settings.session_state_snapshot_cache_size,
+        ttl_seconds=resolved_settings.session_state_snapshot_ttl_seconds,
+        shared_tier=build_shared_snapshot_tier(resolved_settings.session_state_snapshot_shared_url),
+    )
+    install_session_state_snapshots(session_factory, session_state_snapshots)
     observability_service = ObservabilityService(resolved_settings)
     engine = session_factory.kw["bind"]
     observability_service.instrument_sqlalchemy(engine)
@@ -108,6 +139,7 @@ def build_container(settings: Settings | None = None) -> AppContainer:
         memory_service,
         observability_service,
     )
+    concurrent_turns = max(resolved_settings.turn_context_expected_concurrent_turns, 1)
     return AppContainer(
         settings=resolved_settings,
         session_factory=session_factory,
@@ -122,4 +154,25 @@ def build_container(settings: Settings | None = None) -> AppContainer:
         observability_service=observability_service,
         memory_service=memory_service,
         ambient_world_service=ambient_world_service,
+        turn_localization_executor=ThreadPoolExecutor(
+            max_workers=max(resolved_settings.turn_localization_max_workers, 1),
+            thread_name_prefix="turn-localization",
+        ),
+        localization_batch_executor=ThreadPoolExecutor(
+            max_workers=max(resolved_settings.localization_batch_max_workers, 1),
+            thread_name_prefix="play-localization",
+        ),
+        context_prefetcher=ContextPrefetcher(
+            session_factory,
+            ThreadPoolExecutor(
+                # A turn loads at most two database sources at once (alias index and directory).
+                max_workers=max(resolved_settings.turn_context_prefetch_max_workers or 2 * concurrent_turns, 1),
+                thread_name_prefix="turn-context-prefetch",
+            ),
+            model_executor=ThreadPoolExecutor(
+                max_workers=max(resolved_settings.turn_context_planner_max_workers or concurrent_turns, 1),
+                thread_name_prefix="turn-context-planner",
+            ),
+        ),
+        session_state_snapshots=session_state_snapshots,
     )
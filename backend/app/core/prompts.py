@@ -38,6 +38,7 @@ class PromptDefinition:
     eval_dataset_ref: str
     world_invariants: list[str]
     instructions: str
+    context_token_budget: int | None = None
 
 
 class PromptRegistry:
@@ -73,6 +74,7 @@ class PromptRegistry:
             eval_dataset_ref=definition.eval_dataset_ref,
             world_invariants=list(definition.world_invariants),
             instructions=instructions,
+            context_token_budget=definition.context_token_budget,
         )
 
     def _load_definitions(self) -> dict[str, PromptDefinition]:
@@ -121,3 +123,5 @@ class PromptRegistry:
             )
         if not definition.instructions.strip():
             raise ValueError(f"Prompt {definition.prompt_id} has empty instructions in {prompt_file.name}")
+        if definition.context_token_budget is not None and definition.context_token_budget <= 0:
+            raise ValueError(f"Prompt {definition.prompt_id} has a non-positive context_token_budget in {prompt_file.name}")
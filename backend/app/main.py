@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import select
@@ -10,6 +14,7 @@ from app.core.container import AppContainer, build_container
 from app.core.realtime import realtime_hub
 from app.models.entities import Session as GameSession
 from app.modules.actor.service import get_player_profile_for_user
+from app.modules.observability.loop_lag import EventLoopLagMonitor
 from app.modules.world_pack.service import world_context_for_world
 
 
@@ -55,8 +60,25 @@ def create_app(container: AppContainer | None = None) -> FastAPI:
             "GEMINI_API_KEY is required when MODEL_PROVIDER=gemini_developer_api "
             "or EMBEDDING_PROVIDER=gemini_developer_api"
         )
-    app = FastAPI(title="GESTALOKA v2 API", version="0.1.0")
+    loop_lag_monitor = EventLoopLagMonitor(
+        resolved_container.observability_service,
+        interval_seconds=resolved_container.settings.event_loop_lag_probe_interval_seconds,
+    )
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        loop_lag_monitor.start()
+        try:
+            yield
+        finally:
+            await loop_lag_monitor.stop()
+            # A container passed in belongs to the caller, who may serve another app from it.
+            if container is None:
+                await asyncio.to_thread(resolved_container.close)
+
+    app = FastAPI(title="GESTALOKA v2 API", version="0.1.0", lifespan=lifespan)
     app.state.container = resolved_container
+    app.state.loop_lag_monitor = loop_lag_monitor
 
     app.add_middleware(
         CORSMiddleware,
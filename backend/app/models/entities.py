@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 import hashlib
 from uuid import uuid4
 
 from sqlalchemy import (
     Boolean,
     CheckConstraint,
+    Date,
     DateTime,
     Float,
     ForeignKey,
@@ -56,6 +57,8 @@ class World(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(120))
     status: Mapped[str] = mapped_column(String(32), default="active")
     state: Mapped[dict] = mapped_column(JSON, default=dict)
+    reference_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    state_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
 
 class PackPreprocessRun(Base, TimestampMixin):
@@ -226,6 +229,7 @@ class Actor(Base, TimestampMixin):
     first_seen_session_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     first_seen_actor_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     source_event_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    state_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
 
 class PlayerProfile(Base, TimestampMixin):
@@ -287,6 +291,30 @@ class WorldTick(Base, TimestampMixin):
     completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
+class WorldPassLease(Base, TimestampMixin):
+    __tablename__ = "world_pass_leases"
+
+    world_id: Mapped[str] = mapped_column(ForeignKey("worlds.id", ondelete="CASCADE"), primary_key=True)
+    holder: Mapped[str] = mapped_column(String(128))
+    acquired_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+
+class WorldHealthCheck(Base, TimestampMixin):
+    __tablename__ = "world_health_checks"
+
+    world_id: Mapped[str] = mapped_column(ForeignKey("worlds.id", ondelete="CASCADE"), primary_key=True)
+    pack_id: Mapped[str] = mapped_column(String(120))
+    world_template_id: Mapped[str] = mapped_column(String(120))
+    status: Mapped[str] = mapped_column(String(32))
+    check_mode: Mapped[str] = mapped_column(String(16))
+    checked_through: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    last_full_check_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    replay_state: Mapped[dict] = mapped_column(JSON, default=dict)
+    summary: Mapped[dict] = mapped_column(JSON, default=dict)
+
+
 class Turn(Base, TimestampMixin):
     __tablename__ = "turns"
     __table_args__ = (
@@ -754,6 +782,22 @@ class QuestTemplate(Base, TimestampMixin):
     reward_name: Mapped[str] = mapped_column(String(120))
     reward_description: Mapped[str] = mapped_column(Text, default="")
     state: Mapped[dict] = mapped_column(JSON, default=dict)
+    similarity_signature: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+
+
+class QuestTemplateSimilarityBucket(Base):
+    __tablename__ = "quest_template_similarity_buckets"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["quest_template_id", "world_id"],
+            ["quest_templates.id", "quest_templates.world_id"],
+            ondelete="CASCADE",
+        ),
+    )
+
+    world_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    band_key: Mapped[str] = mapped_column(String(48), primary_key=True)
+    quest_template_id: Mapped[str] = mapped_column(String(96), primary_key=True)
 
 
 class QuestAssignment(Base, TimestampMixin):
@@ -883,6 +927,10 @@ class SPLedgerEntry(Base, TimestampMixin):
         CheckConstraint("actor_id IS NULL OR world_id IS NOT NULL", name="ck_sp_ledger_actor_requires_world"),
         ForeignKeyConstraint(["world_id"], ["worlds.id"], ondelete="SET NULL"),
         ForeignKeyConstraint(["actor_id", "world_id"], ["actors.id", "actors.world_id"]),
+        Index("ix_sp_ledger_created_at_id", "created_at", "id"),
+        Index("ix_sp_ledger_user_created_at_id", "user_sub", "created_at", "id"),
+        Index("ix_sp_ledger_world_created_at_id", "world_id", "created_at", "id"),
+        Index("ix_sp_ledger_reference_type_created_at_id", "reference_type", "created_at", "id"),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=new_id)
@@ -902,9 +950,25 @@ class SPLedgerEntry(Base, TimestampMixin):
     note: Mapped[str | None] = mapped_column(Text, nullable=True)
 
 
+class SPLedgerDailyRollup(Base, TimestampMixin):
+    __tablename__ = "sp_ledger_daily_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    reason_code: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # Spreads one day/reason total over several rows, so concurrent ledger writes rarely share one.
+    shard: Mapped[int] = mapped_column(Integer, primary_key=True, default=0)
+    entry_count: Mapped[int] = mapped_column(Integer, default=0)
+    delta_total: Mapped[int] = mapped_column(Integer, default=0)
+    paid_delta_total: Mapped[int] = mapped_column(Integer, default=0)
+    bonus_delta_total: Mapped[int] = mapped_column(Integer, default=0)
+
+
 class LLMRun(Base, TimestampMixin):
     __tablename__ = "llm_runs"
-    __table_args__ = (ForeignKeyConstraint(["turn_id", "world_id"], ["turns.id", "turns.world_id"]),)
+    __table_args__ = (
+        ForeignKeyConstraint(["turn_id", "world_id"], ["turns.id", "turns.world_id"]),
+        Index("ix_llm_runs_created_at", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=new_id)
     world_id: Mapped[str] = mapped_column(String(64))
@@ -923,6 +987,9 @@ class LLMRun(Base, TimestampMixin):
     total_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
     prompt_cache_hit_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
     prompt_cache_miss_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    context_tokens_saved: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    context_trimming: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
     input_hash: Mapped[str] = mapped_column(String(128))
     input_context_hash: Mapped[str | None] = mapped_column(String(128), nullable=True)
     schema_version: Mapped[str] = mapped_column(String(32))
@@ -935,6 +1002,33 @@ class LLMRun(Base, TimestampMixin):
     langfuse_status: Mapped[str] = mapped_column(String(32), default="disabled")
 
 
+class LLMUsageRollup(Base, TimestampMixin):
+    __tablename__ = "llm_usage_rollups"
+
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    world_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model_lane: Mapped[str] = mapped_column(String(32), primary_key=True)
+    model_id: Mapped[str] = mapped_column(String(120), primary_key=True)
+    provider_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    run_count: Mapped[int] = mapped_column(Integer, default=0)
+    prompt_tokens: Mapped[int] = mapped_column(Integer, default=0)
+    completion_tokens: Mapped[int] = mapped_column(Integer, default=0)
+    total_tokens: Mapped[int] = mapped_column(Integer, default=0)
+    cache_hit_tokens: Mapped[int] = mapped_column(Integer, default=0)
+    cache_miss_tokens: Mapped[int] = mapped_column(Integer, default=0)
+    missing_usage_count: Mapped[int] = mapped_column(Integer, default=0)
+    context_tokens_saved: Mapped[int] = mapped_column(Integer, default=0)
+    context_trimmed_run_count: Mapped[int] = mapped_column(Integer, default=0)
+    latency_histogram: Mapped[list] = mapped_column(JSON, default=list)
+
+
+class RollupWatermark(Base, TimestampMixin):
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    rolled_through: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
 class LLMContextCacheEntry(Base, TimestampMixin):
     __tablename__ = "llm_context_cache_entries"
     __table_args__ = (
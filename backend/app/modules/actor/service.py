@@ -15,6 +15,7 @@ from app.modules.world_state.entity_generation import (
     materialize_entity_draft,
     pack_seed_entity_key,
 )
+from app.modules.world_state.reference_version import bump_world_reference_version
 
 GENDER_VALUES = {"male", "female", "unspecified", "other"}
 NARRATIVE_PREFERENCE_OPTIONS = {
@@ -370,6 +371,7 @@ def _ensure_seeded_npc(
         npc.visibility_scope = npc.visibility_scope or "world"
         if home_location_id and npc.current_location_id != home_location_id:
             npc.current_location_id = home_location_id
+            bump_world_reference_version(db, world_id)
         profile = db.execute(
             select(NPCProfile).where(NPCProfile.world_id == world_id, NPCProfile.actor_id == npc.id)
         ).scalar_one_or_none()
@@ -416,6 +418,7 @@ def _ensure_seeded_npc(
     )
     db.add(npc)
     db.flush()
+    bump_world_reference_version(db, world_id)
     db.add(
         NPCProfile(
             actor_id=npc.id,
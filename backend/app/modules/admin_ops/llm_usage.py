@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.entities import LLMRun, LLMUsageRollup, RollupWatermark
+
+
+LLM_USAGE_WATERMARK = "llm_usage_hourly"
+# Runs are stamped when the turn builds them but only become visible when the turn commits,
+# so an hour is rolled up once it has been closed for this long.
+LLM_USAGE_ROLLUP_GRACE = timedelta(hours=1)
+LLM_USAGE_COMPACTION_MAX_HOURS = 24 * 7
+# Upper bounds (inclusive, milliseconds) of the latency histogram buckets; one overflow bucket
+# follows the last bound.
+LLM_LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 15000, 30000, 60000, 120000)
+USAGE_COUNTERS = (
+    "run_count",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_tokens",
+    "cache_hit_tokens",
+    "cache_miss_tokens",
+    "missing_usage_count",
+    "context_tokens_saved",
+    "context_trimmed_run_count",
+)
+
+UsageKey = tuple[datetime, str, str, str, str]
+
+
+def empty_latency_histogram() -> list[int]:
+    return [0] * (len(LLM_LATENCY_BUCKETS_MS) + 1)
+
+
+def merge_latency_histogram(target: list[int], source: Iterable[int]) -> list[int]:
+    for index, count in enumerate(source):
+        if index < len(target):
+            target[index] += int(count)
+    return target
+
+
+def latency_percentile_ms(histogram: list[int], quantile: float) -> int | None:
+    """Upper bound of the bucket holding ``quantile``; the overflow bucket reports the last bound."""
+    total = sum(histogram)
+    if total <= 0:
+        return None
+    rank = quantile * total
+    seen = 0
+    for index, count in enumerate(histogram):
+        seen += count
+        if count and seen >= rank:
+            return LLM_LATENCY_BUCKETS_MS[min(index, len(LLM_LATENCY_BUCKETS_MS) - 1)]
+    return LLM_LATENCY_BUCKETS_MS[-1]
+
+
+def aggregate_llm_runs(db: Session, *, start_at: datetime, end_at: datetime) -> dict[UsageKey, dict[str, Any]]:
+    """Hour x world x lane x model x provider usage for raw runs in ``[start_at, end_at)``.
+
+    Grouping happens in SQL (``date_trunc`` on PostgreSQL, ``strftime`` on SQLite), so only one
+    row per group and latency bucket reaches Python.
+    """
+    if end_at <= start_at:
+        return {}
+    hour = _hour_bucket(db)
+    prompt_tokens = func.coalesce(LLMRun.prompt_tokens, 0)
+    cache_hit_tokens = func.coalesce(LLMRun.prompt_cache_hit_tokens, 0)
+    context_tokens_saved = func.coalesce(LLMRun.context_tokens_saved, 0)
+    latency_bucket = case(
+        (LLMRun.latency_ms.is_(None), -1),
+        *((LLMRun.latency_ms <= bound, index) for index, bound in enumerate(LLM_LATENCY_BUCKETS_MS)),
+        else_=len(LLM_LATENCY_BUCKETS_MS),
+    ).label("latency_bucket")
+    rows = db.execute(
+        select(
+            hour,
+            LLMRun.world_id,
+            LLMRun.model_lane,
+            LLMRun.model_id,
+            LLMRun.provider_name,
+            latency_bucket,
+            func.count(LLMRun.id),
+            func.sum(prompt_tokens),
+            func.sum(func.coalesce(LLMRun.completion_tokens, 0)),
+            func.sum(func.coalesce(LLMRun.total_tokens, 0)),
+            func.sum(cache_hit_tokens),
+            func.sum(
+                case(
+                    (LLMRun.prompt_cache_miss_tokens.is_not(None), LLMRun.prompt_cache_miss_tokens),
+                    (prompt_tokens > cache_hit_tokens, prompt_tokens - cache_hit_tokens),
+                    else_=0,
+                )
+            ),
+            func.sum(
+                case(
+                    (
+                        and_(
+                            LLMRun.prompt_tokens.is_(None),
+                            LLMRun.completion_tokens.is_(None),
+                            LLMRun.total_tokens.is_(None),
+                        ),
+                        1,
+                    ),
+                    else_=0,
+                )
+            ),
+            func.sum(context_tokens_saved),
+            func.sum(case((context_tokens_saved != 0, 1), else_=0)),
+        )
+        .where(LLMRun.created_at >= start_at, LLMRun.created_at < end_at)
+        .group_by(hour, LLMRun.world_id, LLMRun.model_lane, LLMRun.model_id, LLMRun.provider_name, latency_bucket)
+    ).all()
+
+    groups: dict[UsageKey, dict[str, Any]] = {}
+    for row in rows:
+        key = (_as_hour(row[0]), row[1], row[2], row[3], row[4])
+        group = groups.setdefault(key, _empty_usage_counters())
+        for name, value in zip(USAGE_COUNTERS, row[6:]):
+            group[name] += int(value or 0)
+        if int(row[5]) >= 0:
+            group["latency_histogram"][int(row[5])] += int(row[6])
+    return groups
+
+
+def rolled_up_llm_usage(db: Session, *, start_at: datetime, end_at: datetime) -> dict[UsageKey, dict[str, Any]]:
+    groups: dict[UsageKey, dict[str, Any]] = {}
+    if end_at <= start_at:
+        return groups
+    for rollup in db.execute(
+        select(LLMUsageRollup).where(LLMUsageRollup.bucket_start >= start_at, LLMUsageRollup.bucket_start < end_at)
+    ).scalars():
+        key = (_as_hour(rollup.bucket_start), rollup.world_id, rollup.model_lane, rollup.model_id, rollup.provider_name)
+        group = groups.setdefault(key, _empty_usage_counters())
+        for name in USAGE_COUNTERS:
+            group[name] += int(getattr(rollup, name) or 0)
+        merge_latency_histogram(group["latency_histogram"], rollup.latency_histogram or [])
+    return groups
+
+
+def llm_usage_groups(db: Session, *, start_at: datetime, end_at: datetime) -> dict[UsageKey, dict[str, Any]]:
+    """Usage for ``[start_at, end_at)``: rollups up to the watermark, raw runs after it."""
+    rolled_through = llm_usage_rolled_through(db)
+    split_at = min(max(rolled_through, start_at), end_at) if rolled_through is not None else start_at
+    groups = rolled_up_llm_usage(db, start_at=start_at, end_at=split_at)
+    for key, group in aggregate_llm_runs(db, start_at=split_at, end_at=end_at).items():
+        target = groups.setdefault(key, _empty_usage_counters())
+        for name in USAGE_COUNTERS:
+            target[name] += group[name]
+        merge_latency_histogram(target["latency_histogram"], group["latency_histogram"])
+    return groups
+
+
+def llm_usage_rolled_through(db: Session) -> datetime | None:
+    value = db.execute(
+        select(RollupWatermark.rolled_through).where(RollupWatermark.name == LLM_USAGE_WATERMARK)
+    ).scalar_one_or_none()
+    return _as_utc(value) if value is not None else None
+
+
+def compact_llm_usage_rollups(
+    db: Session,
+    *,
+    now: datetime | None = None,
+    max_hours: int = LLM_USAGE_COMPACTION_MAX_HOURS,
+) -> bool:
+    """Rolls closed hours of raw runs into ``llm_usage_rollups`` and advances the watermark.
+
+    The watermark row is locked first, so concurrent workers roll each hour exactly once. At
+    most ``max_hours`` hours are compacted per call. Returns whether the watermark row was
+    created or moved, even across hours without runs; the caller commits when it did.
+    """
+    cutoff = _floor_hour(now or datetime.now(timezone.utc)) - LLM_USAGE_ROLLUP_GRACE
+    watermark, created = _locked_watermark(db, cutoff=cutoff)
+    if watermark is None:
+        return False
+    start_at = _as_utc(watermark.rolled_through)
+    end_at = min(cutoff, start_at + timedelta(hours=max_hours))
+    if end_at <= start_at:
+        return created
+    groups = aggregate_llm_runs(db, start_at=start_at, end_at=end_at)
+    db.add_all(
+        LLMUsageRollup(
+            bucket_start=bucket_start,
+            world_id=world_id,
+            model_lane=model_lane,
+            model_id=model_id,
+            provider_name=provider_name,
+            **group,
+        )
+        for (bucket_start, world_id, model_lane, model_id, provider_name), group in sorted(groups.items())
+    )
+    watermark.rolled_through = end_at
+    db.flush()
+    return True
+
+
+def _locked_watermark(db: Session, *, cutoff: datetime) -> tuple[RollupWatermark | None, bool]:
+    statement = (
+        select(RollupWatermark)
+        .where(RollupWatermark.name == LLM_USAGE_WATERMARK)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    watermark = db.execute(statement).scalar_one_or_none()
+    if watermark is not None:
+        return watermark, False
+    earliest = db.execute(select(func.min(LLMRun.created_at))).scalar_one_or_none()
+    rolled_through = _floor_hour(earliest) if earliest is not None else cutoff
+    try:
+        with db.begin_nested():
+            db.add(RollupWatermark(name=LLM_USAGE_WATERMARK, rolled_through=rolled_through))
+    except IntegrityError:
+        # Another worker created it; compact on its next pass rather than racing it now.
+        return None, False
+    return db.execute(statement).scalar_one(), True
+
+
+def _empty_usage_counters() -> dict[str, Any]:
+    return {**{name: 0 for name in USAGE_COUNTERS}, "latency_histogram": empty_latency_histogram()}
+
+
+def _hour_bucket(db: Session) -> Any:
+    if db.get_bind().dialect.name == "postgresql":
+        return func.date_trunc("hour", func.timezone("UTC", LLMRun.created_at)).label("bucket_start")
+    return func.strftime("%Y-%m-%d %H:00:00", LLMRun.created_at).label("bucket_start")
+
+
+def _as_hour(value: datetime | str) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return _floor_hour(value)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _floor_hour(value: datetime) -> datetime:
+    return _as_utc(value).replace(minute=0, second=0, microsecond=0)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Literal
 
 from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
@@ -19,7 +19,14 @@ from app.models.entities import (
     Turn,
     World,
 )
-from app.modules.economy_sp.service import EconomyService
+from app.modules.admin_ops.llm_usage import (
+    USAGE_COUNTERS,
+    empty_latency_histogram,
+    latency_percentile_ms,
+    llm_usage_groups,
+    merge_latency_histogram,
+)
+from app.modules.economy_sp.service import EconomyService, encode_ledger_cursor
 from app.modules.graph_projection.service import ProjectionService
 from app.modules.observability.service import CanaryProbeResult, ObservabilityService
 from app.modules.world_pack.service import get_pack_registry, nullable_world_context_for_world, world_context_for_world
@@ -33,6 +40,11 @@ from app.modules.world_state.ambient import (
     list_world_ticks_debug,
 )
 from app.modules.world_state.branch import list_route_pressures_debug
+from app.modules.world_state.health import (
+    EVENT_INTEGRITY_GAP_LIMIT,
+    EVENT_INTEGRITY_SAMPLE_SIZE,
+    world_event_integrity,
+)
 from app.modules.world_state.scene import list_chapter_tracks_debug, list_scene_frames_debug
 from app.modules.world_state.service import (
     build_shared_world_context,
@@ -120,6 +132,9 @@ def _empty_usage_bucket(bucket_start: datetime) -> dict[str, object]:
         "cache_miss_tokens": 0,
         "cache_hit_rate": None,
         "missing_usage_count": 0,
+        "context_tokens_saved": 0,
+        "context_trimmed_run_count": 0,
+        "latency_histogram": empty_latency_histogram(),
     }
 
 
@@ -134,6 +149,11 @@ def _finalize_usage_bucket(bucket: dict[str, object]) -> dict[str, object]:
     cache_hit_tokens = int(bucket["cache_hit_tokens"])
     cache_miss_tokens = int(bucket["cache_miss_tokens"])
     bucket["cache_hit_rate"] = _usage_hit_rate(cache_hit_tokens, cache_miss_tokens)
+    histogram = bucket.pop("latency_histogram")
+    bucket["latency_run_count"] = sum(histogram)  # type: ignore[arg-type]
+    bucket["latency_p50_ms"] = latency_percentile_ms(histogram, 0.50)  # type: ignore[arg-type]
+    bucket["latency_p95_ms"] = latency_percentile_ms(histogram, 0.95)  # type: ignore[arg-type]
+    bucket["latency_p99_ms"] = latency_percentile_ms(histogram, 0.99)  # type: ignore[arg-type]
     return bucket
 
 
@@ -156,62 +176,34 @@ def llm_usage_timeline(db: Session, *, range_name: str) -> dict[str, object]:
     bucket_starts = [start_at + (step * index) for index in range(bucket_count)]
     bucket_index = {item: index for index, item in enumerate(bucket_starts)}
 
-    rows = list(
-        db.execute(
-            select(LLMRun)
-            .where(LLMRun.created_at >= start_at, LLMRun.created_at < end_at)
-            .order_by(LLMRun.created_at.asc(), LLMRun.id.asc())
-        ).scalars()
-    )
+    groups = llm_usage_groups(db, start_at=start_at, end_at=end_at)
 
     totals = _empty_usage_bucket(start_at)
     totals.pop("bucket_start")
     models: dict[tuple[str, str, str], dict[str, object]] = {}
 
-    for row in rows:
-        row_created_at = _as_utc(row.created_at)
-        bucket_start = _floor_day(row_created_at) if bucket == "day" else _floor_hour(row_created_at)
+    for (hour_start, _world_id, model_lane, model_id, provider_name), group in sorted(groups.items()):
+        bucket_start = _floor_day(hour_start) if bucket == "day" else hour_start
         if bucket_start not in bucket_index:
             continue
 
-        key = (row.model_id, row.model_lane, row.provider_name)
+        key = (model_id, model_lane, provider_name)
         if key not in models:
             models[key] = {
-                "model_id": row.model_id,
-                "model_lane": row.model_lane,
-                "provider_name": row.provider_name,
-                "run_count": 0,
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "total_tokens": 0,
-                "cache_hit_tokens": 0,
-                "cache_miss_tokens": 0,
-                "cache_hit_rate": None,
-                "missing_usage_count": 0,
+                "model_id": model_id,
+                "model_lane": model_lane,
+                "provider_name": provider_name,
+                **_empty_usage_bucket(start_at),
                 "series": [_empty_usage_bucket(item) for item in bucket_starts],
             }
+            models[key].pop("bucket_start")
         model = models[key]
         series_item = model["series"][bucket_index[bucket_start]]  # type: ignore[index]
 
-        prompt_tokens = row.prompt_tokens or 0
-        completion_tokens = row.completion_tokens or 0
-        total_tokens = row.total_tokens or 0
-        cache_hit_tokens = row.prompt_cache_hit_tokens or 0
-        cache_miss_tokens = (
-            row.prompt_cache_miss_tokens
-            if row.prompt_cache_miss_tokens is not None
-            else max(prompt_tokens - cache_hit_tokens, 0)
-        )
-        missing_usage = row.prompt_tokens is None and row.completion_tokens is None and row.total_tokens is None
-
         for target in (totals, model, series_item):
-            target["run_count"] = int(target["run_count"]) + 1
-            target["prompt_tokens"] = int(target["prompt_tokens"]) + prompt_tokens
-            target["completion_tokens"] = int(target["completion_tokens"]) + completion_tokens
-            target["total_tokens"] = int(target["total_tokens"]) + total_tokens
-            target["cache_hit_tokens"] = int(target["cache_hit_tokens"]) + cache_hit_tokens
-            target["cache_miss_tokens"] = int(target["cache_miss_tokens"]) + cache_miss_tokens
-            target["missing_usage_count"] = int(target["missing_usage_count"]) + (1 if missing_usage else 0)
+            for name in USAGE_COUNTERS:
+                target[name] = int(target[name]) + int(group[name])
+            merge_latency_histogram(target["latency_histogram"], group["latency_histogram"])  # type: ignore[arg-type]
 
     _finalize_usage_bucket(totals)
     model_items = []
@@ -239,6 +231,8 @@ def observability_summary(
     *,
     pack_id: str | None = None,
     world_template_id: str | None = None,
+    llm_circuit_breakers: dict[str, object] | None = None,
+    council_speculation: dict[str, object] | None = None,
 ) -> dict[str, object]:
     snapshot = runtime_snapshot(db, settings, projection_service)
     observability_service.sync_outbox_metrics(
@@ -290,6 +284,8 @@ def observability_summary(
         "langfuse": langfuse_status,
         "recent_traces": recent_traces,
         "metrics": metrics,
+        "llm_circuit_breakers": llm_circuit_breakers or {},
+        "council_speculation": council_speculation or {},
     }
 
 
@@ -480,12 +476,12 @@ def sp_ledger(
     user_sub: str | None,
     world_id: str | None,
     limit: int,
+    cursor: str | None = None,
 ) -> dict[str, object]:
+    items = economy_service.list_ledger(db, user_sub=user_sub, world_id=world_id, limit=limit, cursor=cursor)
     return {
-        "items": _ledger_entries_with_world_context(
-            db,
-            economy_service.list_ledger(db, user_sub=user_sub, world_id=world_id, limit=limit),
-        ),
+        "items": _ledger_entries_with_world_context(db, items),
+        "next_cursor": encode_ledger_cursor(items[-1]) if len(items) == limit else None,
     }
 
 
@@ -841,6 +837,21 @@ def world_shared_context(db: Session, *, world_id: str) -> dict[str, object]:
     })
 
 
+def world_event_integrity_report(
+    db: Session,
+    *,
+    world_id: str,
+    mode: Literal["full", "sample"] = "full",
+    limit: int = EVENT_INTEGRITY_GAP_LIMIT,
+    sample_size: int = EVENT_INTEGRITY_SAMPLE_SIZE,
+) -> dict[str, object]:
+    return _with_world_context(
+        db,
+        world_id,
+        world_event_integrity(db, world_id=world_id, mode=mode, limit=limit, sample_size=sample_size),
+    )
+
+
 def world_history(
     db: Session,
     *,
@@ -1013,6 +1024,7 @@ def _turn_trace(db: Session, turn: Turn, *, include_attempts: bool) -> dict[str,
             "provider_response_id": final_run.provider_response_id,
             "prompt_cache_hit_tokens": final_run.prompt_cache_hit_tokens,
             "prompt_cache_miss_tokens": final_run.prompt_cache_miss_tokens,
+            "context_trimming": final_run.context_trimming,
             "output_schema_status": final_run.output_schema_status,
             "langfuse_trace_id": final_run.langfuse_trace_id,
             "langfuse_observation_id": final_run.langfuse_observation_id,
@@ -1034,6 +1046,7 @@ def _turn_trace(db: Session, turn: Turn, *, include_attempts: bool) -> dict[str,
                     "provider_response_id": item.provider_response_id,
                     "prompt_cache_hit_tokens": item.prompt_cache_hit_tokens,
                     "prompt_cache_miss_tokens": item.prompt_cache_miss_tokens,
+                    "context_trimming": item.context_trimming,
                     "approval_status": item.approval_status,
                     "output_schema_status": item.output_schema_status,
                     "langfuse_trace_id": item.langfuse_trace_id,
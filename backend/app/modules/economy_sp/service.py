@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import base64
 from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from typing import Any
+import zlib
 
-from sqlalchemy import func, select
+from sqlalchemy import Date, cast, delete, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
-from app.models.entities import SPAccount, SPLedgerEntry
+from app.models.entities import SPAccount, SPLedgerDailyRollup, SPLedgerEntry
 
 
 ALLOWED_SP_REASON_CODES = {
@@ -25,6 +31,8 @@ ALLOWED_SP_REASON_CODES = {
 }
 
 SP_BUCKETS = {"paid", "bonus"}
+SP_LEDGER_ROLLUP_TOTALS = ("entry_count", "delta_total", "paid_delta_total", "bonus_delta_total")
+SP_LEDGER_ROLLUP_SHARDS = 16
 
 
 class InsufficientSPError(Exception):
@@ -55,6 +63,26 @@ class SPMutationResult:
     bonus_delta: int
 
 
+def encode_ledger_cursor(entry: dict[str, object]) -> str:
+    """Opaque keyset cursor for the ledger page that ends at ``entry`` (an ``_entry_to_dict`` payload)."""
+    raw = f"{entry['created_at']}|{entry['id']}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_ledger_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at_text, entry_id = raw.split("|", 1)
+        created_at = datetime.fromisoformat(created_at_text)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid SP ledger cursor") from exc
+    if not entry_id:
+        raise ValueError("Invalid SP ledger cursor")
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at.astimezone(timezone.utc), entry_id
+
+
 class EconomyService:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
@@ -190,8 +218,22 @@ class EconomyService:
 
     def overview(self, db: Session) -> dict[str, object]:
         total_accounts = db.execute(select(func.count(SPAccount.user_sub))).scalar_one()
-        total_ledger_entries = db.execute(select(func.count(SPLedgerEntry.id))).scalar_one()
         totals = db.execute(select(func.coalesce(func.sum(SPAccount.paid_balance), 0), func.coalesce(func.sum(SPAccount.bonus_balance), 0))).one()
+        # Ledger totals come from the daily rollup shards, so the cost does not grow with the ledger.
+        ledger_by_reason = [
+            {
+                "reason_code": reason_code,
+                **{name: int(value or 0) for name, value in zip(SP_LEDGER_ROLLUP_TOTALS, values)},
+            }
+            for reason_code, *values in db.execute(
+                select(
+                    SPLedgerDailyRollup.reason_code,
+                    *(func.sum(getattr(SPLedgerDailyRollup, name)) for name in SP_LEDGER_ROLLUP_TOTALS),
+                )
+                .group_by(SPLedgerDailyRollup.reason_code)
+                .order_by(SPLedgerDailyRollup.reason_code)
+            ).all()
+        ]
         recent_adjustments = [
             self._entry_to_dict(entry)
             for entry in db.execute(
@@ -211,7 +253,8 @@ class EconomyService:
             "total_paid_sp": int(totals[0]),
             "total_bonus_sp": int(totals[1]),
             "total_accounts": int(total_accounts),
-            "total_ledger_entries": int(total_ledger_entries),
+            "total_ledger_entries": sum(int(item["entry_count"]) for item in ledger_by_reason),
+            "ledger_by_reason": ledger_by_reason,
             "recent_adjustments": recent_adjustments,
         }
 
@@ -222,15 +265,103 @@ class EconomyService:
         user_sub: str | None = None,
         world_id: str | None = None,
         limit: int = 50,
+        cursor: str | None = None,
     ) -> list[dict[str, object]]:
+        """Newest-first ledger page; ``cursor`` (see ``encode_ledger_cursor``) resumes after the previous page."""
         stmt = select(SPLedgerEntry)
         if user_sub is not None:
             stmt = stmt.where(SPLedgerEntry.user_sub == user_sub)
         if world_id is not None:
             stmt = stmt.where(SPLedgerEntry.world_id == world_id)
+        if cursor is not None:
+            created_at, entry_id = decode_ledger_cursor(cursor)
+            stmt = stmt.where(tuple_(SPLedgerEntry.created_at, SPLedgerEntry.id) < tuple_(created_at, entry_id))
         stmt = stmt.order_by(SPLedgerEntry.created_at.desc(), SPLedgerEntry.id.desc()).limit(limit)
         return [self._entry_to_dict(entry) for entry in db.execute(stmt).scalars()]
 
+    def reconcile_ledger_rollups(
+        self,
+        db: Session,
+        *,
+        since: date | None = None,
+        until: date | None = None,
+        repair: bool = False,
+    ) -> dict[str, object]:
+        """Compares ``sp_ledger_daily_rollups`` with totals recomputed from ``sp_ledger``.
+
+        Days in ``[since, until)`` are checked per day and reason, summed over the shards;
+        ``until`` defaults to today (UTC), because the current day is still being written. With
+        ``repair`` a drifted day and reason is rewritten from the raw entries as a single shard-0
+        row. The caller commits.
+        """
+        until = until or datetime.now(timezone.utc).date()
+        day = _ledger_day(db)
+        raw_stmt = select(
+            day,
+            SPLedgerEntry.reason_code,
+            func.count(SPLedgerEntry.id),
+            func.sum(SPLedgerEntry.delta),
+            func.sum(SPLedgerEntry.paid_delta),
+            func.sum(SPLedgerEntry.bonus_delta),
+        ).where(SPLedgerEntry.created_at < _day_start(until))
+        rollup_stmt = select(
+            SPLedgerDailyRollup.day,
+            SPLedgerDailyRollup.reason_code,
+            *(func.sum(getattr(SPLedgerDailyRollup, name)) for name in SP_LEDGER_ROLLUP_TOTALS),
+        ).where(SPLedgerDailyRollup.day < until)
+        if since is not None:
+            raw_stmt = raw_stmt.where(SPLedgerEntry.created_at >= _day_start(since))
+            rollup_stmt = rollup_stmt.where(SPLedgerDailyRollup.day >= since)
+        expected = {
+            (_as_date(row[0]), row[1]): tuple(int(value or 0) for value in row[2:])
+            for row in db.execute(raw_stmt.group_by(day, SPLedgerEntry.reason_code)).all()
+        }
+        actual = {
+            (_as_date(row[0]), row[1]): tuple(int(value or 0) for value in row[2:])
+            for row in db.execute(
+                rollup_stmt.group_by(SPLedgerDailyRollup.day, SPLedgerDailyRollup.reason_code)
+            ).all()
+        }
+
+        empty = (0,) * len(SP_LEDGER_ROLLUP_TOTALS)
+        mismatches: list[dict[str, Any]] = []
+        for key in sorted(set(expected) | set(actual)):
+            if expected.get(key, empty) == actual.get(key, empty):
+                continue
+            mismatches.append(
+                {
+                    "day": key[0].isoformat(),
+                    "reason_code": key[1],
+                    "expected": dict(zip(SP_LEDGER_ROLLUP_TOTALS, expected.get(key, empty))),
+                    "actual": dict(zip(SP_LEDGER_ROLLUP_TOTALS, actual.get(key, empty))),
+                }
+            )
+            if repair:
+                db.execute(
+                    delete(SPLedgerDailyRollup).where(
+                        SPLedgerDailyRollup.day == key[0],
+                        SPLedgerDailyRollup.reason_code == key[1],
+                    )
+                )
+                if key in expected:
+                    db.add(
+                        SPLedgerDailyRollup(
+                            day=key[0],
+                            reason_code=key[1],
+                            **dict(zip(SP_LEDGER_ROLLUP_TOTALS, expected[key])),
+                        )
+                    )
+        if repair:
+            db.flush()
+        return {
+            "status": "ready" if not mismatches else ("repaired" if repair else "drift"),
+            "since": since.isoformat() if since is not None else None,
+            "until": until.isoformat(),
+            "checked_row_count": len(set(expected) | set(actual)),
+            "mismatch_count": len(mismatches),
+            "mismatches": mismatches,
+        }
+
     def health_snapshot(self) -> dict[str, object]:
         return {
             "default_balance": self.settings.sp_default_balance,
@@ -262,25 +393,25 @@ class EconomyService:
             return account
 
         if initial_bonus != 0:
-            db.add(
-                SPLedgerEntry(
-                    user_sub=user_sub,
-                    world_id=None,
-                    actor_id=None,
-                    delta=initial_bonus,
-                    paid_delta=0,
-                    bonus_delta=initial_bonus,
-                    reason_code="bonus_grant_signup",
-                    reference_type="bonus_grant_signup",
-                    reference_id=user_sub,
-                    balance_after=initial_bonus,
-                    paid_balance_after=0,
-                    bonus_balance_after=initial_bonus,
-                    created_by_sub=None,
-                    note="Initial bonus SP grant",
-                )
+            entry = SPLedgerEntry(
+                user_sub=user_sub,
+                world_id=None,
+                actor_id=None,
+                delta=initial_bonus,
+                paid_delta=0,
+                bonus_delta=initial_bonus,
+                reason_code="bonus_grant_signup",
+                reference_type="bonus_grant_signup",
+                reference_id=user_sub,
+                balance_after=initial_bonus,
+                paid_balance_after=0,
+                bonus_balance_after=initial_bonus,
+                created_by_sub=None,
+                note="Initial bonus SP grant",
             )
+            db.add(entry)
             db.flush()
+            self._record_ledger_rollup(db, entry)
         return account
 
     def _apply_single_bucket_delta(
@@ -397,6 +528,7 @@ class EconomyService:
         )
         db.add(entry)
         db.flush()
+        self._record_ledger_rollup(db, entry)
         return SPMutationResult(
             ledger_entry=entry,
             balance_after=account.balance,
@@ -407,6 +539,38 @@ class EconomyService:
             bonus_delta=bonus_delta,
         )
 
+    @staticmethod
+    def _record_ledger_rollup(db: Session, entry: SPLedgerEntry) -> None:
+        """Adds ``entry`` to its day/reason/shard rollup row in the caller's transaction.
+
+        The shard comes from the user, so writes for different users rarely wait on one row lock.
+        """
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        now = datetime.now(timezone.utc)
+        statement = insert(SPLedgerDailyRollup).values(
+            day=_as_utc(entry.created_at).date(),
+            reason_code=entry.reason_code,
+            shard=zlib.crc32(entry.user_sub.encode("utf-8")) % SP_LEDGER_ROLLUP_SHARDS,
+            entry_count=1,
+            delta_total=entry.delta,
+            paid_delta_total=entry.paid_delta,
+            bonus_delta_total=entry.bonus_delta,
+            created_at=now,
+            updated_at=now,
+        )
+        db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["day", "reason_code", "shard"],
+                set_={
+                    **{
+                        name: getattr(SPLedgerDailyRollup, name) + getattr(statement.excluded, name)
+                        for name in SP_LEDGER_ROLLUP_TOTALS
+                    },
+                    "updated_at": statement.excluded.updated_at,
+                },
+            )
+        )
+
     @staticmethod
     def _normalize_account_balance(account: SPAccount) -> None:
         if account.paid_balance == 0 and account.bonus_balance == 0 and account.balance:
@@ -433,3 +597,25 @@ class EconomyService:
             "note": entry.note,
             "created_at": entry.created_at.isoformat(),
         }
+
+
+def _ledger_day(db: Session) -> Any:
+    if db.get_bind().dialect.name == "postgresql":
+        return cast(func.timezone("UTC", SPLedgerEntry.created_at), Date)
+    return func.date(SPLedgerEntry.created_at)
+
+
+def _day_start(value: date) -> datetime:
+    return datetime.combine(value, time.min, tzinfo=timezone.utc)
+
+
+def _as_date(value: date | str) -> date:
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -51,11 +51,22 @@ def main() -> None:
             "nightly",
             "canary-probe",
             "shared-world-health",
+            "sp-ledger-rollups",
         ],
     )
     parser.add_argument("--dataset", help="Dataset id to run for the dataset command, or to override smoke")
     parser.add_argument("--detail", action="store_true", help="Print detailed run payloads for aggregate commands")
     parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-validate every shared-world row instead of only rows written since the last cached check",
+    )
+    parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="Rewrite SP ledger rollup rows that disagree with the raw ledger entries",
+    )
     args = parser.parse_args()
 
     os.environ["OTEL_METRICS_PORT"] = "0"
@@ -107,7 +118,9 @@ def main() -> None:
                 progress_callback=_print_release_progress,
             )
         elif args.command == "shared-world-health":
-            payload = shared_world_health(db)
+            payload = shared_world_health(db, full=args.full)
+        elif args.command == "sp-ledger-rollups":
+            payload = container.economy_service.reconcile_ledger_rollups(db, repair=args.repair)
         else:
             payload = container.observability_service.probe_canary_health().__dict__
         db.commit()
@@ -115,6 +128,9 @@ def main() -> None:
     if args.command == "shared-world-health" and payload.get("status") != "ready":
         print(json.dumps(payload, ensure_ascii=False, indent=2))
         raise SystemExit(1)
+    if args.command == "sp-ledger-rollups" and payload.get("status") == "drift":
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        raise SystemExit(1)
     if args.command == "pack-regressions":
         _print_pack_regression_summary(payload)
     else:
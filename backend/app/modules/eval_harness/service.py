@@ -6,7 +6,7 @@ import subprocess
 import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from contextlib import nullcontext
 from typing import Callable, Literal
@@ -33,7 +33,12 @@ from app.modules.admin_ops.service import create_observability_snapshot
 from app.modules.economy_sp.service import ALLOWED_SP_REASON_CODES
 from app.modules.gm_council.service import CouncilRequest, GMCouncilService
 from app.modules.graph_projection.service import ProjectionService
-from app.modules.llm_harness.service import ModelRouter, PromptRouteOverride, TurnResolutionOutcome
+from app.modules.llm_harness.service import (
+    ModelRouter,
+    PromptRouteOverride,
+    ProviderCircuitBreakers,
+    TurnResolutionOutcome,
+)
 from app.modules.observability.service import CanaryProbeResult, ObservabilityService
 from app.modules.world_pack.service import (
     PackRegistry,
@@ -51,7 +56,7 @@ from app.modules.world_memory.service import (
 from app.modules.world_state.consequence import normalize_consequence_tags
 from app.modules.world_state.rules import normalize_world_tags
 from app.modules.world_state.service import default_next_choices, important_inventory_affordances, narrative_state_bands
-from app.modules.world_state.health import shared_world_health
+from app.modules.world_state.health import cached_shared_world_health, shared_world_health
 
 
 def _bundled_pack_regression_datasets() -> list[str]:
@@ -191,6 +196,7 @@ class EvalHarnessService:
         self.observability_service = observability_service
         self.pack_registry = pack_registry
         self.session_factory = session_factory
+        self.circuit_breakers = ProviderCircuitBreakers(settings)
         self.datasets = self._load_datasets(settings.eval_dataset_dir)
         self._release_progress_lock = threading.Lock()
         self._release_progress: dict[str, object] = {
@@ -258,6 +264,7 @@ class EvalHarnessService:
             route_overrides=release_config.routes,
             config_name=release_config.name,
             observability_service=self.observability_service,
+            circuit_breakers=self.circuit_breakers,
         )
 
     def runtime_router(self) -> ModelRouter:
@@ -1028,7 +1035,8 @@ class EvalHarnessService:
             select(ReleaseGateReport).order_by(ReleaseGateReport.created_at.desc(), ReleaseGateReport.id.desc()).limit(1)
         ).scalar_one_or_none()
         if report is None:
-            shared_health = shared_world_health(db)
+            # A read path: report the stored per-world results instead of refreshing them.
+            shared_health = cached_shared_world_health(db)
             all_checks = {
                 "smoke": {"present": False, "current_passed": False, "candidate_passed": False, "run_id": None},
                 "failure_injection": {"present": False, "current_passed": False, "candidate_passed": False, "run_id": None},
@@ -1313,6 +1321,7 @@ class EvalHarnessService:
                     route_overrides=current_config.routes,
                     config_name=current_config.name,
                     observability_service=self.observability_service,
+                    circuit_breakers=self.circuit_breakers,
                 ),
             )
             candidate_service = GMCouncilService(
@@ -1325,6 +1334,7 @@ class EvalHarnessService:
                     route_overrides=candidate_config.routes,
                     config_name=candidate_config.name,
                     observability_service=self.observability_service,
+                    circuit_breakers=self.circuit_breakers,
                 ),
             )
             configs_identical = (
@@ -1816,7 +1826,9 @@ class EvalHarnessService:
             "runtime_role": runtime_role,
             "canary_health": canary_probe.__dict__,
             "world_packs": pack_registry.health_summary(),
-            "shared_world_health": shared_world_health(db),
+            "shared_world_health": shared_world_health(
+                db, full_check_max_age=timedelta(hours=self.settings.release_health_full_check_hours)
+            ),
             "projection_lag_seconds": projection_lag_seconds,
             "outbox_pending_count": pending_outbox_count,
             "outbox_failed_count": failed_outbox_count,
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.modules.llm_harness.service import CouncilRoleRun
+
+
+@dataclass
+class CouncilNodeResult:
+    value: Any = None
+    role_runs: list[CouncilRoleRun] = field(default_factory=list)
+    halt: Any | None = None
+
+
+@dataclass(frozen=True)
+class CouncilRoleNode:
+    role: str
+    depends_on: tuple[str, ...]
+    run: Callable[[Mapping[str, CouncilNodeResult]], CouncilNodeResult]
+    speculative: bool = False
+    # Called when the scheduler stops waiting on a running speculative role.
+    on_abandon: Callable[[], None] | None = None
+
+
+@dataclass(frozen=True)
+class CouncilNodeTiming:
+    role: str
+    started_ms: int
+    finished_ms: int
+
+    @property
+    def duration_ms(self) -> int:
+        return max(self.finished_ms - self.started_ms, 0)
+
+
+@dataclass(frozen=True)
+class CouncilScheduleReport:
+    results: dict[str, CouncilNodeResult]
+    timings: dict[str, CouncilNodeTiming]
+    halted_by: str | None
+    critical_path: list[str]
+    critical_path_ms: int
+    wall_ms: int
+
+    @property
+    def halt(self) -> Any | None:
+        if self.halted_by is None:
+            return None
+        return self.results[self.halted_by].halt
+
+    def role_runs(self) -> list[CouncilRoleRun]:
+        role_runs = [role_run for result in self.results.values() for role_run in result.role_runs]
+        return sorted(role_runs, key=lambda item: item.stage_index)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "critical_path": list(self.critical_path),
+            "critical_path_ms": self.critical_path_ms,
+            "wall_ms": self.wall_ms,
+            "halted_by": self.halted_by,
+            "roles": [
+                {
+                    "role": timing.role,
+                    "started_ms": timing.started_ms,
+                    "finished_ms": timing.finished_ms,
+                    "duration_ms": timing.duration_ms,
+                }
+                for timing in sorted(self.timings.values(), key=lambda item: (item.started_ms, item.role))
+            ],
+        }
+
+
+def _topological_order(nodes: list[CouncilRoleNode]) -> list[str]:
+    by_role = {node.role: node for node in nodes}
+    if len(by_role) != len(nodes):
+        raise ValueError("Council role graph contains duplicate roles")
+    for node in nodes:
+        unknown = [dependency for dependency in node.depends_on if dependency not in by_role]
+        if unknown:
+            raise ValueError(f"Council role {node.role} depends on unknown roles {unknown}")
+    order: list[str] = []
+    visiting: set[str] = set()
+
+    def visit(role: str) -> None:
+        if role in order:
+            return
+        if role in visiting:
+            raise ValueError(f"Council role graph has a cycle through {role}")
+        visiting.add(role)
+        for dependency in by_role[role].depends_on:
+            visit(dependency)
+        visiting.discard(role)
+        order.append(role)
+
+    for node in nodes:
+        visit(node.role)
+    return order
+
+
+class CouncilRoleScheduler:
+    """Runs a council role graph, starting each role as soon as its dependencies resolve.
+
+    A role that returns a ``halt`` stops new roles from being scheduled; roles already in
+    flight are drained so their role runs are still recorded. Speculative roles are the
+    exception: once the graph halts nobody can consume them, so they are abandoned rather
+    than waited on, and their ``on_abandon`` hook tells them to stop spending. A role that
+    raises cancels everything not yet started and waits for the roles in flight before the
+    error propagates. When several roles halt, the one
+    declared earliest in the graph wins, which keeps rejection reporting deterministic.
+    """
+
+    def __init__(self, *, max_workers: int = 4, thread_name_prefix: str = "gm-council-role") -> None:
+        self.max_workers = max(max_workers, 1)
+        self.thread_name_prefix = thread_name_prefix
+
+    def run(self, nodes: list[CouncilRoleNode]) -> CouncilScheduleReport:
+        order = _topological_order(nodes)
+        by_role = {node.role: node for node in nodes}
+        declared_index = {node.role: index for index, node in enumerate(nodes)}
+        results: dict[str, CouncilNodeResult] = {}
+        timings: dict[str, CouncilNodeTiming] = {}
+        started_at = time.perf_counter()
+        pending = list(order)
+        running: dict[Future[CouncilNodeResult], tuple[str, int]] = {}
+        halted: list[str] = []
+
+        def offset_ms() -> int:
+            return max(int((time.perf_counter() - started_at) * 1000), 0)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.thread_name_prefix)
+        try:
+            while pending or running:
+                if not halted:
+                    ready = [
+                        role
+                        for role in pending
+                        if all(dependency in results for dependency in by_role[role].depends_on)
+                    ]
+                    for role in ready:
+                        pending.remove(role)
+                        future = executor.submit(copy_context().run, by_role[role].run, dict(results))
+                        running[future] = (role, offset_ms())
+                elif all(by_role[role].speculative for role, _ in running.values()):
+                    self._abandon(by_role, running)
+                    break
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    role, role_started_ms = running.pop(future)
+                    result = future.result()
+                    results[role] = result
+                    timings[role] = CouncilNodeTiming(role=role, started_ms=role_started_ms, finished_ms=offset_ms())
+                    if result.halt is not None:
+                        halted.append(role)
+        except BaseException:
+            # Roles run under the caller's context vars (turn progress, trace); let the ones
+            # already running finish before the error propagates so none outlive the turn.
+            self._abandon(by_role, running)
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        critical_path, critical_path_ms = self._critical_path(by_role, timings)
+        return CouncilScheduleReport(
+            results=results,
+            timings=timings,
+            halted_by=min(halted, key=lambda role: declared_index[role]) if halted else None,
+            critical_path=critical_path,
+            critical_path_ms=critical_path_ms,
+            wall_ms=offset_ms(),
+        )
+
+    @staticmethod
+    def _abandon(
+        by_role: dict[str, CouncilRoleNode],
+        running: dict[Future[CouncilNodeResult], tuple[str, int]],
+    ) -> None:
+        for role, _ in running.values():
+            node = by_role[role]
+            if node.speculative and node.on_abandon is not None:
+                node.on_abandon()
+
+    @staticmethod
+    def _critical_path(
+        by_role: dict[str, CouncilRoleNode],
+        timings: dict[str, CouncilNodeTiming],
+    ) -> tuple[list[str], int]:
+        longest: dict[str, tuple[int, list[str]]] = {}
+
+        def path_to(role: str) -> tuple[int, list[str]]:
+            if role in longest:
+                return longest[role]
+            best_ms, best_path = 0, []
+            for dependency in by_role[role].depends_on:
+                if dependency not in timings:
+                    continue
+                dependency_ms, dependency_path = path_to(dependency)
+                if not best_path or (dependency_ms, len(dependency_path)) > (best_ms, len(best_path)):
+                    best_ms, best_path = dependency_ms, dependency_path
+            longest[role] = (best_ms + timings[role].duration_ms, [*best_path, role])
+            return longest[role]
+
+        if not timings:
+            return [], 0
+        total_ms, path = max((path_to(role) for role in timings), key=lambda item: (item[0], len(item[1])))
+        return path, total_ms
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
-from contextvars import copy_context
+import threading
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -20,8 +20,15 @@ from app.modules.llm_harness.service import (
     PublicGmTurnPayload,
     TurnResolutionOutcome,
     TurnResolutionPayload,
+    abandon_prompts_when,
 )
-from app.modules.session.progress import emit_turn_event, emit_turn_progress
+from app.modules.gm_council.scheduler import (
+    CouncilNodeResult,
+    CouncilRoleNode,
+    CouncilRoleScheduler,
+    CouncilScheduleReport,
+)
+from app.modules.session.progress import emit_turn_event, emit_turn_progress, hold_turn_progress, replay_turn_progress
 from app.modules.world_state.branch import BranchSignal, normalize_branch_signals
 from app.modules.world_state.consequence import ConsequenceTag, OutcomeBand, normalize_consequence_tags
 from app.modules.world_state.rules import WorldTag, infer_world_tags, normalize_world_tags
@@ -948,9 +955,23 @@ def _assert_public_llm_payload(value: Any, *, path: str = "input") -> None:
             _assert_public_llm_payload(item, path=f"{path}[{index}]")
 
 
+def _council_halt(result: PromptExecutionOutcome[Any], rejection_role: str) -> dict[str, Any]:
+    final_payload = result.final_payload
+    rejected = final_payload is not None and getattr(final_payload, "approval_status", None) == "rejected"
+    return {
+        "final_lane": result.final_lane,
+        "failure_reason": final_payload.reason if rejected else result.failure_reason,
+        "rejection_role": rejection_role,
+    }
+
+
+def _outcome_tokens(result: PromptExecutionOutcome[Any]) -> int:
+    return sum(attempt.total_tokens or 0 for attempt in result.attempts)
+
+
 def _public_turn_failure_kind(result: Any) -> str:
     attempts = list(getattr(result, "attempts", []) or [])
-    if any(getattr(attempt, "status", "") == "provider_error" for attempt in attempts):
+    if any(getattr(attempt, "status", "") in {"provider_error", "circuit_open"} for attempt in attempts):
         return "provider_error"
     if any(getattr(attempt, "output_schema_status", "") == "invalid" for attempt in attempts):
         return "schema_hard_invalid"
@@ -1232,10 +1253,62 @@ class GMCouncilService:
         ("safety_guard", 7, "council.safety_guard", True),
         ("narrative", 8, "council.narrative", True),
     ]
+    COUNCIL_MAX_WORKERS = 4
 
     def __init__(self, settings: Settings, model_router: ModelRouter) -> None:
         self.settings = settings
         self.model_router = model_router
+        self._speculation_lock = threading.Lock()
+        self._speculation_counts = {
+            "hits": 0,
+            "misses": 0,
+            "saved_ms": 0,
+            "runs": 0,
+            "tokens": 0,
+            "committed_tokens": 0,
+        }
+
+    def _record_speculative_run(self, result: PromptExecutionOutcome[Any]) -> None:
+        # Counted when the call returns, whether or not the turn is still waiting for it, so runs
+        # abandoned after a halt are paid for in the stats too.
+        with self._speculation_lock:
+            self._speculation_counts["runs"] += 1
+            self._speculation_counts["tokens"] += _outcome_tokens(result)
+
+    def _record_speculation(self, report: CouncilScheduleReport, *, hit: bool) -> dict[str, Any]:
+        saved_ms = 0
+        timings = report.timings
+        if hit and all(role in timings for role in ("narrative_speculative", "rules_arbiter", "safety_guard")):
+            # The narrative would otherwise have started only after safety finished, so the
+            # overlap with the validators is the latency the speculation removed.
+            validation_ms = timings["safety_guard"].finished_ms - timings["rules_arbiter"].started_ms
+            saved_ms = max(min(timings["narrative_speculative"].duration_ms, validation_ms), 0)
+        with self._speculation_lock:
+            self._speculation_counts["hits" if hit else "misses"] += 1
+            self._speculation_counts["saved_ms"] += saved_ms
+            if hit:
+                committed = report.results["narrative_speculative"].value[1]
+                self._speculation_counts["committed_tokens"] += _outcome_tokens(committed)
+        return {"hit": hit, "saved_ms": saved_ms}
+
+    def speculation_stats(self) -> dict[str, Any]:
+        with self._speculation_lock:
+            hits = self._speculation_counts["hits"]
+            misses = self._speculation_counts["misses"]
+            saved_ms = self._speculation_counts["saved_ms"]
+            runs = self._speculation_counts["runs"]
+            discarded_tokens = self._speculation_counts["tokens"] - self._speculation_counts["committed_tokens"]
+        attempts = hits + misses
+        return {
+            "enabled": self.settings.council_speculative_narrative_enabled,
+            "attempts": attempts,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / attempts, 4) if attempts else None,
+            "saved_ms_total": saved_ms,
+            "discarded_runs": max(runs - hits, 0),
+            "discarded_tokens": max(discarded_tokens, 0),
+        }
 
     @staticmethod
     def _deterministic_attempt(*, prompt_id: str, lane: str, payload: BaseModel) -> PromptExecutionAttempt:
@@ -2052,7 +2125,6 @@ class GMCouncilService:
         )
 
     def resolve_turn(self, request: CouncilRequest) -> TurnResolutionOutcome:
-        role_runs: list[CouncilRoleRun] = []
         quests = request.session_state.get("quests") or []
         inventory = request.session_state.get("inventory") or []
         known_facts = request.session_state.get("known_facts") or []
@@ -2086,82 +2158,45 @@ class GMCouncilService:
         play_language = _play_language_context(player_profile)
 
         intent_input = self._intent_input_payload(request)
-        if request.prepared_intent_payload is not None and request.prepared_intent_role_run is not None:
-            intent_payload = request.prepared_intent_payload
-            role_runs.append(request.prepared_intent_role_run)
-        elif request.input_mode == "choice" and request.selected_choice:
-            emit_turn_progress(
-                phase="intent_interpretation",
-                status="started",
-                stage_index=1,
-                elapsed_ms=0,
-                detail="deterministic_choice",
-            )
-            intent_result = self._choice_intent_outcome(request=request, input_payload=intent_input)
-            emit_turn_progress(
-                phase="intent_interpretation",
-                status="completed",
-                stage_index=1,
-                elapsed_ms=0,
-                detail="deterministic_choice",
-            )
-            role_runs.append(
-                self._role_run(
-                    council_role="intent_interpreter",
+
+        def run_intent(results: Mapping[str, CouncilNodeResult]) -> CouncilNodeResult:
+            del results
+            if request.prepared_intent_payload is not None and request.prepared_intent_role_run is not None:
+                return CouncilNodeResult(
+                    value=request.prepared_intent_payload,
+                    role_runs=[request.prepared_intent_role_run],
+                )
+            if request.input_mode == "choice" and request.selected_choice:
+                emit_turn_progress(
+                    phase="intent_interpretation",
+                    status="started",
                     stage_index=1,
-                    prompt_id="council.intent_interpreter",
-                    approval_status="prepared" if intent_result.succeeded else "failed",
-                    result=intent_result,
+                    elapsed_ms=0,
+                    detail="deterministic_choice",
                 )
-            )
-            if not intent_result.succeeded:
-                if request.input_mode == "free_text" and "__force_" not in request.input_text:
-                    intent_result = self._free_text_intent_fallback_outcome(
-                        request=request,
-                        input_payload=intent_input,
-                        failed_result=intent_result,
-                    )
-                    role_runs[-1] = self._role_run(
-                        council_role="intent_interpreter",
-                        stage_index=1,
-                        prompt_id="council.intent_interpreter",
-                        approval_status="prepared",
-                        result=intent_result,
-                    )
-                else:
-                    return TurnResolutionOutcome(
-                        role_runs=role_runs,
-                        final_lane=intent_result.final_lane,
-                        final_payload=None,
-                        failure_reason=intent_result.failure_reason,
-                        rejection_role="intent_interpreter",
-                    )
-            intent_payload = intent_result.final_payload
-            assert intent_payload is not None
-            intent_payload.consequence_tags = self._canonical_intent_consequence_tags(
-                input_mode=request.input_mode,
-                input_text=request.input_text,
-                selected_choice=request.selected_choice,
-                action_kind=intent_payload.canonical_action_kind,
-                raw_tags=list(intent_payload.consequence_tags),
-            )
-        else:
-            intent_result = self.model_router.execute_structured_prompt(
-                prompt_id="council.intent_interpreter",
-                response_model=CouncilIntentInterpreterPayload,
-                input_payload=intent_input,
-                world_id=request.world_id,
-                turn_id=request.turn_id,
-                graph_context_status=request.graph_context_status,
-            )
-            role_runs.append(
-                self._role_run(
-                    council_role="intent_interpreter",
+                intent_result = self._choice_intent_outcome(request=request, input_payload=intent_input)
+                emit_turn_progress(
+                    phase="intent_interpretation",
+                    status="completed",
                     stage_index=1,
+                    elapsed_ms=0,
+                    detail="deterministic_choice",
+                )
+            else:
+                intent_result = self.model_router.execute_structured_prompt(
                     prompt_id="council.intent_interpreter",
-                    approval_status="prepared" if intent_result.succeeded else "failed",
-                    result=intent_result,
+                    response_model=CouncilIntentInterpreterPayload,
+                    input_payload=intent_input,
+                    world_id=request.world_id,
+                    turn_id=request.turn_id,
+                    graph_context_status=request.graph_context_status,
                 )
+            role_run = self._role_run(
+                council_role="intent_interpreter",
+                stage_index=1,
+                prompt_id="council.intent_interpreter",
+                approval_status="prepared" if intent_result.succeeded else "failed",
+                result=intent_result,
             )
             if not intent_result.succeeded:
                 if request.input_mode == "free_text" and "__force_" not in request.input_text:
@@ -2170,7 +2205,7 @@ class GMCouncilService:
                         input_payload=intent_input,
                         failed_result=intent_result,
                     )
-                    role_runs[-1] = self._role_run(
+                    role_run = self._role_run(
                         council_role="intent_interpreter",
                         stage_index=1,
                         prompt_id="council.intent_interpreter",
@@ -2178,12 +2213,9 @@ class GMCouncilService:
                         result=intent_result,
                     )
                 else:
-                    return TurnResolutionOutcome(
-                        role_runs=role_runs,
-                        final_lane=intent_result.final_lane,
-                        final_payload=None,
-                        failure_reason=intent_result.failure_reason,
-                        rejection_role="intent_interpreter",
+                    return CouncilNodeResult(
+                        role_runs=[role_run],
+                        halt=_council_halt(intent_result, "intent_interpreter"),
                     )
             intent_payload = intent_result.final_payload
             assert intent_payload is not None
@@ -2194,100 +2226,48 @@ class GMCouncilService:
                 action_kind=intent_payload.canonical_action_kind,
                 raw_tags=list(intent_payload.consequence_tags),
             )
+            return CouncilNodeResult(value=intent_payload, role_runs=[role_run])
 
-        memory_input = {
-            "world_id": request.world_id,
-            "input_text": request.input_text,
-            "intent_summary": intent_payload.intent_summary,
-            "player_name": request.player_name,
-            "player_profile": player_profile,
-            "narrative_preferences": narrative_preferences,
-            "play_language": play_language,
-            "npc_name": request.npc_name,
-            "relevant_memories": request.relevant_memories,
-            "relation_context": request.relation_context,
-            "quests": quests,
-            "factions": request.session_state.get("factions") or [],
-            "inventory": inventory,
-            "known_facts": known_facts,
-            "skills": skills,
-            "location": request.session_state.get("location"),
-            "active_quest_stage": active_quest.get("stage_key") if isinstance(active_quest, dict) else None,
-            "usable_reward_items": usable_reward_items,
-            "used_reward_items": used_reward_items,
-            "important_inventory_affordances": [item.get("summary", "") for item in important_inventory_affordances if item.get("summary")],
-            "consequence_flags": intent_payload.consequence_flags,
-            "relationship_summaries": relationship_summaries,
-            "recognized_titles": recognized_titles,
-            "active_consequence_threads": active_consequence_threads,
-            "recent_consequence_history": recent_consequence_history,
-            "current_scene": current_scene,
-            "current_chapter": current_chapter,
-            "recent_scene_history": recent_scene_history,
-            "recent_branch_echoes": recent_branch_echoes,
-            "route_pressures": route_pressures,
-            "plaza_figures": plaza_figures,
-            "recent_world_beats": recent_world_beats,
-            "ambient_murmurs": ambient_murmurs,
-            "shared_world_context": shared_world_context,
-        }
-
-        npc_input = {
-            "world_id": request.world_id,
-            "input_text": request.input_text,
-            "intent_summary": intent_payload.intent_summary,
-            "player_name": request.player_name,
-            "player_profile": player_profile,
-            "narrative_preferences": narrative_preferences,
-            "play_language": play_language,
-            "npc_name": request.npc_name,
-            "relevant_memories": request.relevant_memories,
-            "relation_context": request.relation_context,
-            "focus_memories": request.relevant_memories,
-            "state_summary": _joined_state_summary(
-                [
-                    ("quests", quests),
-                    ("factions", request.session_state.get("factions") or []),
-                    ("inventory", inventory),
-                    ("known_facts", known_facts),
-                    ("skills", skills),
-                    ("scene", current_scene),
-                    ("chapter", current_chapter),
-                    ("location", current_location),
-                    ("world_beats", recent_world_beats),
-                ]
-            ),
-            "active_quest_stage": active_quest.get("stage_key") if isinstance(active_quest, dict) else None,
-            "usable_reward_items": usable_reward_items,
-            "used_reward_items": used_reward_items,
-            "factions": request.session_state.get("factions") or [],
-            "consequence_summary": intent_payload.consequence_summary,
-            "relationship_summaries": relationship_summaries,
-            "recognized_titles": recognized_titles,
-            "active_consequence_threads": active_consequence_threads,
-            "recent_consequence_history": recent_consequence_history,
-            "current_location": current_location,
-            "local_figures": local_figures,
-            "nearby_routes": nearby_routes,
-            "recent_travel_history": recent_travel_history,
-            "recent_branch_echoes": recent_branch_echoes,
-            "route_pressures": route_pressures,
-            "plaza_figures": plaza_figures,
-            "recent_world_beats": recent_world_beats,
-            "ambient_murmurs": ambient_murmurs,
-            "shared_world_context": shared_world_context,
-            "known_facts": known_facts,
-            "skills": skills,
-        }
+        def run_memory_manager(results: Mapping[str, CouncilNodeResult]) -> CouncilNodeResult:
+            intent_payload: CouncilIntentInterpreterPayload = results["intent_interpreter"].value
+            memory_input = {
+                "world_id": request.world_id,
+                "input_text": request.input_text,
+                "intent_summary": intent_payload.intent_summary,
+                "player_name": request.player_name,
+                "player_profile": player_profile,
+                "narrative_preferences": narrative_preferences,
+                "play_language": play_language,
+                "npc_name": request.npc_name,
+                "relevant_memories": request.relevant_memories,
+                "relation_context": request.relation_context,
+                "quests": quests,
+                "factions": request.session_state.get("factions") or [],
+                "inventory": inventory,
+                "known_facts": known_facts,
+                "skills": skills,
+                "location": request.session_state.get("location"),
+                "active_quest_stage": active_quest.get("stage_key") if isinstance(active_quest, dict) else None,
+                "usable_reward_items": usable_reward_items,
+                "used_reward_items": used_reward_items,
+                "important_inventory_affordances": [item.get("summary", "") for item in important_inventory_affordances if item.get("summary")],
+                "consequence_flags": intent_payload.consequence_flags,
+                "relationship_summaries": relationship_summaries,
+                "recognized_titles": recognized_titles,
+                "active_consequence_threads": active_consequence_threads,
+                "recent_consequence_history": recent_consequence_history,
+                "current_scene": current_scene,
+                "current_chapter": current_chapter,
+                "recent_scene_history": recent_scene_history,
+                "recent_branch_echoes": recent_branch_echoes,
+                "route_pressures": route_pressures,
+                "plaza_figures": plaza_figures,
+                "recent_world_beats": recent_world_beats,
+                "ambient_murmurs": ambient_murmurs,
+                "shared_world_context": shared_world_context,
+            }
 
-        # Prewarm provider initialization before worker threads enter the router.
-        _ = self.model_router.provider
-        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="gm-council-role") as executor:
-            memory_context = copy_context()
-            npc_context = copy_context()
-            memory_future = executor.submit(
-                memory_context.run,
-                self.model_router.execute_structured_prompt,
+            memory_result = self.model_router.execute_structured_prompt(
                 prompt_id="council.memory_manager",
                 response_model=CouncilMemoryManagerPayload,
                 input_payload=memory_input,
@@ -2295,9 +2275,71 @@ class GMCouncilService:
                 turn_id=request.turn_id,
                 graph_context_status=request.graph_context_status,
             )
-            npc_future = executor.submit(
-                npc_context.run,
-                self.model_router.execute_structured_prompt,
+            return CouncilNodeResult(
+                value=memory_result.final_payload,
+                role_runs=[
+                    self._role_run(
+                        council_role="memory_manager",
+                        stage_index=2,
+                        prompt_id="council.memory_manager",
+                        approval_status="prepared" if memory_result.succeeded else "failed",
+                        result=memory_result,
+                    )
+                ],
+                halt=None if memory_result.succeeded else _council_halt(memory_result, "memory_manager"),
+            )
+
+        def run_npc_manager(results: Mapping[str, CouncilNodeResult]) -> CouncilNodeResult:
+            intent_payload: CouncilIntentInterpreterPayload = results["intent_interpreter"].value
+            npc_input = {
+                "world_id": request.world_id,
+                "input_text": request.input_text,
+                "intent_summary": intent_payload.intent_summary,
+                "player_name": request.player_name,
+                "player_profile": player_profile,
+                "narrative_preferences": narrative_preferences,
+                "play_language": play_language,
+                "npc_name": request.npc_name,
+                "relevant_memories": request.relevant_memories,
+                "relation_context": request.relation_context,
+                "focus_memories": request.relevant_memories,
+                "state_summary": _joined_state_summary(
+                    [
+                        ("quests", quests),
+                        ("factions", request.session_state.get("factions") or []),
+                        ("inventory", inventory),
+                        ("known_facts", known_facts),
+                        ("skills", skills),
+                        ("scene", current_scene),
+                        ("chapter", current_chapter),
+                        ("location", current_location),
+                        ("world_beats", recent_world_beats),
+                    ]
+                ),
+                "active_quest_stage": active_quest.get("stage_key") if isinstance(active_quest, dict) else None,
+                "usable_reward_items": usable_reward_items,
+                "used_reward_items": used_reward_items,
+                "factions": request.session_state.get("factions") or [],
+                "consequence_summary": intent_payload.consequence_summary,
+                "relationship_summaries": relationship_summaries,
+                "recognized_titles": recognized_titles,
+                "active_consequence_threads": active_consequence_threads,
+                "recent_consequence_history": recent_consequence_history,
+                "current_location": current_location,
+                "local_figures": local_figures,
+                "nearby_routes": nearby_routes,
+                "recent_travel_history": recent_travel_history,
+                "recent_branch_echoes": recent_branch_echoes,
+                "route_pressures": route_pressures,
+                "plaza_figures": plaza_figures,
+                "recent_world_beats": recent_world_beats,
+                "ambient_murmurs": ambient_murmurs,
+                "shared_world_context": shared_world_context,
+                "known_facts": known_facts,
+                "skills": skills,
+            }
+
+            npc_result = self.model_router.execute_structured_prompt(
                 prompt_id="council.npc_manager",
                 response_model=CouncilNPCManagerPayload,
                 input_payload=npc_input,
@@ -2305,503 +2347,575 @@ class GMCouncilService:
                 turn_id=request.turn_id,
                 graph_context_status=request.graph_context_status,
             )
-            memory_result = memory_future.result()
-            npc_result = npc_future.result()
-
-        role_runs.append(
-            self._role_run(
-                council_role="memory_manager",
-                stage_index=2,
-                prompt_id="council.memory_manager",
-                approval_status="prepared" if memory_result.succeeded else "failed",
-                result=memory_result,
-            )
-        )
-        role_runs.append(
-            self._role_run(
-                council_role="npc_manager",
-                stage_index=3,
-                prompt_id="council.npc_manager",
-                approval_status="prepared" if npc_result.succeeded else "failed",
-                result=npc_result,
-            )
-        )
-        if not memory_result.succeeded:
-            return TurnResolutionOutcome(
-                role_runs=role_runs,
-                final_lane=memory_result.final_lane,
-                final_payload=None,
-                failure_reason=memory_result.failure_reason,
-                rejection_role="memory_manager",
-            )
-        if not npc_result.succeeded:
-            return TurnResolutionOutcome(
-                role_runs=role_runs,
-                final_lane=npc_result.final_lane,
-                final_payload=None,
-                failure_reason=npc_result.failure_reason,
-                rejection_role="npc_manager",
+            return CouncilNodeResult(
+                value=npc_result.final_payload,
+                role_runs=[
+                    self._role_run(
+                        council_role="npc_manager",
+                        stage_index=3,
+                        prompt_id="council.npc_manager",
+                        approval_status="prepared" if npc_result.succeeded else "failed",
+                        result=npc_result,
+                    )
+                ],
+                halt=None if npc_result.succeeded else _council_halt(npc_result, "npc_manager"),
             )
 
-        memory_payload = memory_result.final_payload
-        assert memory_payload is not None
-        npc_payload = npc_result.final_payload
-        assert npc_payload is not None
-
-        situation_input = {
-            "world_id": request.world_id,
-            "input_text": request.input_text,
-            "player_name": request.player_name,
-            "player_profile": player_profile,
-            "narrative_preferences": narrative_preferences,
-            "play_language": play_language,
-            "npc_name": request.npc_name,
-            "intent_summary": intent_payload.intent_summary,
-            "selected_choice": request.selected_choice or {},
-            "fail_forward": intent_payload.fail_forward,
-            "consequence_summary": intent_payload.consequence_summary,
-            "consequence_tags": intent_payload.consequence_tags,
-            "memory_summary": memory_payload.memory_summary,
-            "relation_summary": memory_payload.relation_summary,
-            "state_summary": memory_payload.state_summary,
-            "reaction_outline": npc_payload.reaction_outline,
-            "focus_memories": npc_payload.focus_memories,
-            "default_choice_templates": default_choice_templates,
-            "important_inventory_affordances": important_inventory_affordances,
-            "relationship_summaries": relationship_summaries,
-            "active_consequence_threads": active_consequence_threads,
-            "recent_consequence_history": recent_consequence_history,
-            "current_scene": current_scene,
-            "current_chapter": current_chapter,
-            "recent_scene_history": recent_scene_history,
-            "current_location": current_location,
-            "local_figures": local_figures,
-            "nearby_routes": nearby_routes,
-            "recent_travel_history": recent_travel_history,
-            "recent_world_beats": recent_world_beats,
-            "ambient_murmurs": ambient_murmurs,
-            "shared_world_context": shared_world_context,
-        }
-        situation_result = self.model_router.execute_structured_prompt(
-            prompt_id="council.situation_mapper",
-            response_model=CouncilSituationMapperPayload,
-            input_payload=situation_input,
-            world_id=request.world_id,
-            turn_id=request.turn_id,
-            graph_context_status=request.graph_context_status,
-        )
-        role_runs.append(
-            self._role_run(
+        def run_situation_mapper(results: Mapping[str, CouncilNodeResult]) -> CouncilNodeResult:
+            intent_payload: CouncilIntentInterpreterPayload = results["intent_interpreter"].value
+            memory_payload: CouncilMemoryManagerPayload = results["memory_manager"].value
+            npc_payload: CouncilNPCManagerPayload = results["npc_manager"].value
+            situation_input = {
+                "world_id": request.world_id,
+                "input_text": request.input_text,
+                "player_name": request.player_name,
+                "player_profile": player_profile,
+                "narrative_preferences": narrative_preferences,
+                "play_language": play_language,
+                "npc_name": request.npc_name,
+                "intent_summary": intent_payload.intent_summary,
+                "selected_choice": request.selected_choice or {},
+                "fail_forward": intent_payload.fail_forward,
+                "consequence_summary": intent_payload.consequence_summary,
+                "consequence_tags": intent_payload.consequence_tags,
+                "memory_summary": memory_payload.memory_summary,
+                "relation_summary": memory_payload.relation_summary,
+                "state_summary": memory_payload.state_summary,
+                "reaction_outline": npc_payload.reaction_outline,
+                "focus_memories": npc_payload.focus_memories,
+                "default_choice_templates": default_choice_templates,
+                "important_inventory_affordances": important_inventory_affordances,
+                "relationship_summaries": relationship_summaries,
+                "active_consequence_threads": active_consequence_threads,
+                "recent_consequence_history": recent_consequence_history,
+                "current_scene": current_scene,
+                "current_chapter": current_chapter,
+                "recent_scene_history": recent_scene_history,
+                "current_location": current_location,
+                "local_figures": local_figures,
+                "nearby_routes": nearby_routes,
+                "recent_travel_history": recent_travel_history,
+                "recent_world_beats": recent_world_beats,
+                "ambient_murmurs": ambient_murmurs,
+                "shared_world_context": shared_world_context,
+            }
+            situation_result = self.model_router.execute_structured_prompt(
+                prompt_id="council.situation_mapper",
+                response_model=CouncilSituationMapperPayload,
+                input_payload=situation_input,
+                world_id=request.world_id,
+                turn_id=request.turn_id,
+                graph_context_status=request.graph_context_status,
+            )
+            role_run = self._role_run(
                 council_role="situation_mapper",
                 stage_index=4,
                 prompt_id="council.situation_mapper",
                 approval_status="prepared" if situation_result.succeeded else "failed",
                 result=situation_result,
             )
-        )
-        deterministic_fallback_used = False
-        if situation_result.succeeded and situation_result.final_payload is not None:
-            situation_payload = situation_result.final_payload
-        else:
+            if situation_result.succeeded and situation_result.final_payload is not None:
+                return CouncilNodeResult(value=(situation_result.final_payload, False), role_runs=[role_run])
             situation_payload = self._fallback_situation_frame(
                 request=request,
                 intent_payload=intent_payload,
                 memory_payload=memory_payload,
                 npc_payload=npc_payload,
             )
-            deterministic_fallback_used = True
-        game_frame = situation_payload.model_dump()
-
-        world_progress_input = {
-            "world_id": request.world_id,
-            "input_text": request.input_text,
-            "player_name": request.player_name,
-            "player_profile": player_profile,
-            "narrative_preferences": narrative_preferences,
-            "play_language": play_language,
-            "npc_name": request.npc_name,
-            "memory_summary": memory_payload.memory_summary,
-            "relation_summary": memory_payload.relation_summary,
-            "state_summary": memory_payload.state_summary,
-            "reaction_outline": npc_payload.reaction_outline,
-            "focus_memories": npc_payload.focus_memories,
-            "intent_summary": intent_payload.intent_summary,
-            "selected_choice": request.selected_choice or {},
-            "fail_forward": intent_payload.fail_forward,
-            "consequence_summary": intent_payload.consequence_summary,
-            "consequence_tags": intent_payload.consequence_tags,
-            "game_frame": game_frame,
-            "default_choice_templates": default_choice_templates,
-            "relationship_summaries": relationship_summaries,
-            "recognized_titles": recognized_titles,
-            "active_consequence_threads": active_consequence_threads,
-            "recent_consequence_history": recent_consequence_history,
-            "active_quest_stage": active_quest.get("stage_key") if isinstance(active_quest, dict) else None,
-            "world_pack": request.session_state.get("world_pack") or {},
-            "pack_generation_context": request.session_state.get("pack_generation_context") or {},
-            "current_scene": current_scene,
-            "current_chapter": current_chapter,
-            "recent_scene_history": recent_scene_history,
-            "recent_branch_echoes": recent_branch_echoes,
-            "route_pressures": route_pressures,
-            "current_location": current_location,
-            "local_figures": local_figures,
-            "nearby_routes": nearby_routes,
-            "recent_travel_history": recent_travel_history,
-            "plaza_figures": plaza_figures,
-            "recent_world_beats": recent_world_beats,
-            "ambient_murmurs": ambient_murmurs,
-            "shared_world_context": shared_world_context,
-            "resource_constraints": request.session_state.get("resource_constraints") or [],
-            "world_broadcast_constraints": request.session_state.get("world_broadcast_constraints") or [],
-            "known_facts": known_facts,
-            "skills": skills,
-        }
-        world_progress_result = self.model_router.execute_structured_prompt(
-            prompt_id="council.world_progress",
-            response_model=CouncilWorldProgressPayload,
-            input_payload=world_progress_input,
-            world_id=request.world_id,
-            turn_id=request.turn_id,
-            graph_context_status=request.graph_context_status,
-        )
-        role_runs.append(
-            self._role_run(
+            return CouncilNodeResult(value=(situation_payload, True), role_runs=[role_run])
+
+        def run_world_progress(results: Mapping[str, CouncilNodeResult]) -> CouncilNodeResult:
+            intent_payload: CouncilIntentInterpreterPayload = results["intent_interpreter"].value
+            memory_payload: CouncilMemoryManagerPayload = results["memory_manager"].value
+            npc_payload: CouncilNPCManagerPayload = results["npc_manager"].value
+            game_frame = results["situation_mapper"].value[0].model_dump()
+            world_progress_input = {
+                "world_id": request.world_id,
+                "input_text": request.input_text,
+                "player_name": request.player_name,
+                "player_profile": player_profile,
+                "narrative_preferences": narrative_preferences,
+                "play_language": play_language,
+                "npc_name": request.npc_name,
+                "memory_summary": memory_payload.memory_summary,
+                "relation_summary": memory_payload.relation_summary,
+                "state_summary": memory_payload.state_summary,
+                "reaction_outline": npc_payload.reaction_outline,
+                "focus_memories": npc_payload.focus_memories,
+                "intent_summary": intent_payload.intent_summary,
+                "selected_choice": request.selected_choice or {},
+                "fail_forward": intent_payload.fail_forward,
+                "consequence_summary": intent_payload.consequence_summary,
+                "consequence_tags": intent_payload.consequence_tags,
+                "game_frame": game_frame,
+                "default_choice_templates": default_choice_templates,
+                "relationship_summaries": relationship_summaries,
+                "recognized_titles": recognized_titles,
+                "active_consequence_threads": active_consequence_threads,
+                "recent_consequence_history": recent_consequence_history,
+                "active_quest_stage": active_quest.get("stage_key") if isinstance(active_quest, dict) else None,
+                "world_pack": request.session_state.get("world_pack") or {},
+                "pack_generation_context": request.session_state.get("pack_generation_context") or {},
+                "current_scene": current_scene,
+                "current_chapter": current_chapter,
+                "recent_scene_history": recent_scene_history,
+                "recent_branch_echoes": recent_branch_echoes,
+                "route_pressures": route_pressures,
+                "current_location": current_location,
+                "local_figures": local_figures,
+                "nearby_routes": nearby_routes,
+                "recent_travel_history": recent_travel_history,
+                "plaza_figures": plaza_figures,
+                "recent_world_beats": recent_world_beats,
+                "ambient_murmurs": ambient_murmurs,
+                "shared_world_context": shared_world_context,
+                "resource_constraints": request.session_state.get("resource_constraints") or [],
+                "world_broadcast_constraints": request.session_state.get("world_broadcast_constraints") or [],
+                "known_facts": known_facts,
+                "skills": skills,
+            }
+            world_progress_result = self.model_router.execute_structured_prompt(
+                prompt_id="council.world_progress",
+                response_model=CouncilWorldProgressPayload,
+                input_payload=world_progress_input,
+                world_id=request.world_id,
+                turn_id=request.turn_id,
+                graph_context_status=request.graph_context_status,
+            )
+            role_run = self._role_run(
                 council_role="world_progress",
                 stage_index=5,
                 prompt_id="council.world_progress",
                 approval_status="prepared" if world_progress_result.succeeded else "failed",
                 result=world_progress_result,
             )
-        )
-        if not world_progress_result.succeeded:
-            fallback_payload = self._world_progress_fallback_payload(
-                request=request,
-                intent_payload=intent_payload,
-                world_progress_input=world_progress_input,
-                failure_reason=world_progress_result.failure_reason,
-            )
-            if fallback_payload is None:
-                return TurnResolutionOutcome(
-                    role_runs=role_runs,
-                    final_lane=world_progress_result.final_lane,
-                    final_payload=None,
+            fallback_used = False
+            if not world_progress_result.succeeded:
+                fallback_payload = self._world_progress_fallback_payload(
+                    request=request,
+                    intent_payload=intent_payload,
+                    world_progress_input=world_progress_input,
                     failure_reason=world_progress_result.failure_reason,
-                    rejection_role="world_progress",
                 )
-            world_progress_payload = fallback_payload
-            deterministic_fallback_used = True
-        else:
-            world_progress_payload = world_progress_result.final_payload
-            assert world_progress_payload is not None
-
-        world_progress_payload.consequence_tags = normalize_consequence_tags(list(world_progress_payload.consequence_tags))
-        world_progress_payload.branch_signals = normalize_branch_signals(list(world_progress_payload.branch_signals))
-        world_progress_payload.world_tags = self._choice_world_tags(
-            session_state=request.session_state,
-            selected_choice=request.selected_choice,
-            action_kind=intent_payload.canonical_action_kind,
-            raw_world_tags=list(world_progress_payload.world_tags),
-        )
-        if intent_payload.fail_forward or "overreach" in set(world_progress_payload.consequence_tags):
-            world_progress_payload.world_tags = ["none"]
-        world_progress_payload.outcome_band = self._outcome_band_from_tags(list(world_progress_payload.consequence_tags))
-        world_progress_payload.scene_move = self._scene_move_for_context(
-            session_state=request.session_state,
-            selected_choice=request.selected_choice,
-            action_kind=intent_payload.canonical_action_kind,
-            consequence_tags=list(world_progress_payload.consequence_tags),
-            raw_scene_move=world_progress_payload.scene_move,
-        )
-        world_progress_payload.risk_level = self._risk_level_for_context(
-            input_text=request.input_text,
-            consequence_tags=list(world_progress_payload.consequence_tags),
-            raw_risk_level=world_progress_payload.risk_level,
-        )
-        high_risk = world_progress_payload.risk_level == "high"
-
-        rules_input = {
-            "world_id": request.world_id,
-            "input_text": request.input_text,
-            "world_tags": world_progress_payload.world_tags,
-            "risk_level": world_progress_payload.risk_level,
-            "quests": quests,
-            "factions": request.session_state.get("factions") or [],
-            "inventory": inventory,
-            "known_facts": known_facts,
-            "skills": skills,
-            "input_mode": request.input_mode,
-            "play_language": play_language,
-            "consequence_flags": intent_payload.consequence_flags,
-            "recognized_titles": recognized_titles,
-            "shared_world_context": shared_world_context,
-            "resource_constraints": request.session_state.get("resource_constraints") or [],
-            "world_broadcast_constraints": request.session_state.get("world_broadcast_constraints") or [],
-        }
-        requires_llm_validation = "__force_" in request.input_text
-        if high_risk or requires_llm_validation:
-            rules_result = self.model_router.execute_structured_prompt(
-                prompt_id="council.rules_arbiter",
-                response_model=CouncilRulesArbiterPayload,
-                input_payload=rules_input,
-                world_id=request.world_id,
-                turn_id=request.turn_id,
-                graph_context_status=request.graph_context_status,
-                allow_pro_fallback=True,
-                force_pro_after_success=high_risk,
-            )
-        else:
-            emit_turn_progress(
-                phase="rules_arbiter",
-                status="started",
-                stage_index=6,
-                elapsed_ms=0,
-                detail="deterministic_validator",
-            )
-            rules_payload = CouncilRulesArbiterPayload(
-                approval_status="approved",
-                normalized_world_tags=normalize_world_tags(world_progress_payload.world_tags),
-                risk_level=world_progress_payload.risk_level,
-                reason="Deterministic same-world validator approved a low/medium risk turn.",
-            )
-            rules_result = PromptExecutionOutcome(
-                attempts=[
-                    self._deterministic_attempt(
-                        prompt_id="council.rules_arbiter",
-                        lane="deterministic_validator",
-                        payload=rules_payload,
+                if fallback_payload is None:
+                    return CouncilNodeResult(
+                        role_runs=[role_run],
+                        halt=_council_halt(world_progress_result, "world_progress"),
                     )
-                ],
-                final_lane="deterministic_validator",
-                final_payload=rules_payload,
+                world_progress_payload = fallback_payload
+                fallback_used = True
+            else:
+                world_progress_payload = world_progress_result.final_payload
+                assert world_progress_payload is not None
+
+            world_progress_payload.consequence_tags = normalize_consequence_tags(list(world_progress_payload.consequence_tags))
+            world_progress_payload.branch_signals = normalize_branch_signals(list(world_progress_payload.branch_signals))
+            world_progress_payload.world_tags = self._choice_world_tags(
+                session_state=request.session_state,
+                selected_choice=request.selected_choice,
+                action_kind=intent_payload.canonical_action_kind,
+                raw_world_tags=list(world_progress_payload.world_tags),
             )
-            emit_turn_progress(
-                phase="rules_arbiter",
-                status="completed",
-                stage_index=6,
-                elapsed_ms=0,
-                detail="deterministic_validator",
+            if intent_payload.fail_forward or "overreach" in set(world_progress_payload.consequence_tags):
+                world_progress_payload.world_tags = ["none"]
+            world_progress_payload.outcome_band = self._outcome_band_from_tags(list(world_progress_payload.consequence_tags))
+            world_progress_payload.scene_move = self._scene_move_for_context(
+                session_state=request.session_state,
+                selected_choice=request.selected_choice,
+                action_kind=intent_payload.canonical_action_kind,
+                consequence_tags=list(world_progress_payload.consequence_tags),
+                raw_scene_move=world_progress_payload.scene_move,
             )
-        if (
-            not rules_result.succeeded
-            and "__force_rules_reject__" not in request.input_text
-            and "threaten_local" not in world_progress_payload.world_tags
-            and any(tag in world_progress_payload.world_tags for tag in ("aid_local", "promise_followup", "investigate", "none"))
-        ):
-            fallback_rules_payload = CouncilRulesArbiterPayload(
-                approval_status="approved",
-                normalized_world_tags=normalize_world_tags(world_progress_payload.world_tags),
-                risk_level=world_progress_payload.risk_level,
-                reason=(
-                    "Rules arbiter schema failure normalized after canonical world_tags "
-                    f"{', '.join(world_progress_payload.world_tags)} passed deterministic same-world checks."
-                ),
+            world_progress_payload.risk_level = self._risk_level_for_context(
+                input_text=request.input_text,
+                consequence_tags=list(world_progress_payload.consequence_tags),
+                raw_risk_level=world_progress_payload.risk_level,
             )
-            rules_result = PromptExecutionOutcome(
-                attempts=[
-                    *rules_result.attempts,
-                    self._deterministic_attempt(
-                        prompt_id="council.rules_arbiter",
-                        lane="deterministic_validator",
-                        payload=fallback_rules_payload,
+            return CouncilNodeResult(value=(world_progress_payload, fallback_used), role_runs=[role_run])
+
+        def run_rules_arbiter(results: Mapping[str, CouncilNodeResult]) -> CouncilNodeResult:
+            intent_payload: CouncilIntentInterpreterPayload = results["intent_interpreter"].value
+            world_progress_payload: CouncilWorldProgressPayload = results["world_progress"].value[0]
+            high_risk = world_progress_payload.risk_level == "high"
+            rules_input = {
+                "world_id": request.world_id,
+                "input_text": request.input_text,
+                "world_tags": world_progress_payload.world_tags,
+                "risk_level": world_progress_payload.risk_level,
+                "quests": quests,
+                "factions": request.session_state.get("factions") or [],
+                "inventory": inventory,
+                "known_facts": known_facts,
+                "skills": skills,
+                "input_mode": request.input_mode,
+                "play_language": play_language,
+                "consequence_flags": intent_payload.consequence_flags,
+                "recognized_titles": recognized_titles,
+                "shared_world_context": shared_world_context,
+                "resource_constraints": request.session_state.get("resource_constraints") or [],
+                "world_broadcast_constraints": request.session_state.get("world_broadcast_constraints") or [],
+            }
+            requires_llm_validation = "__force_" in request.input_text
+            if high_risk or requires_llm_validation:
+                rules_result = self.model_router.execute_structured_prompt(
+                    prompt_id="council.rules_arbiter",
+                    response_model=CouncilRulesArbiterPayload,
+                    input_payload=rules_input,
+                    world_id=request.world_id,
+                    turn_id=request.turn_id,
+                    graph_context_status=request.graph_context_status,
+                    allow_pro_fallback=True,
+                    force_pro_after_success=high_risk,
+                )
+            else:
+                emit_turn_progress(
+                    phase="rules_arbiter",
+                    status="started",
+                    stage_index=6,
+                    elapsed_ms=0,
+                    detail="deterministic_validator",
+                )
+                rules_payload = CouncilRulesArbiterPayload(
+                    approval_status="approved",
+                    normalized_world_tags=normalize_world_tags(world_progress_payload.world_tags),
+                    risk_level=world_progress_payload.risk_level,
+                    reason="Deterministic same-world validator approved a low/medium risk turn.",
+                )
+                rules_result = PromptExecutionOutcome(
+                    attempts=[
+                        self._deterministic_attempt(
+                            prompt_id="council.rules_arbiter",
+                            lane="deterministic_validator",
+                            payload=rules_payload,
+                        )
+                    ],
+                    final_lane="deterministic_validator",
+                    final_payload=rules_payload,
+                )
+                emit_turn_progress(
+                    phase="rules_arbiter",
+                    status="completed",
+                    stage_index=6,
+                    elapsed_ms=0,
+                    detail="deterministic_validator",
+                )
+            if (
+                not rules_result.succeeded
+                and "__force_rules_reject__" not in request.input_text
+                and "threaten_local" not in world_progress_payload.world_tags
+                and any(tag in world_progress_payload.world_tags for tag in ("aid_local", "promise_followup", "investigate", "none"))
+            ):
+                fallback_rules_payload = CouncilRulesArbiterPayload(
+                    approval_status="approved",
+                    normalized_world_tags=normalize_world_tags(world_progress_payload.world_tags),
+                    risk_level=world_progress_payload.risk_level,
+                    reason=(
+                        "Rules arbiter schema failure normalized after canonical world_tags "
+                        f"{', '.join(world_progress_payload.world_tags)} passed deterministic same-world checks."
                     ),
-                ],
-                final_lane="deterministic_validator",
-                final_payload=fallback_rules_payload,
-            )
-        if (
-            rules_result.final_payload is not None
-            and rules_result.final_payload.approval_status == "rejected"
-            and "__force_rules_reject__" not in request.input_text
-            and "threaten_local" not in world_progress_payload.world_tags
-            and any(tag in world_progress_payload.world_tags for tag in ("aid_local", "promise_followup", "investigate"))
-        ):
-            rules_result.final_payload.approval_status = "approved"
-            rules_result.final_payload.reason = (
-                "Rules arbiter false negative normalized after canonical world_tags "
-                f"{', '.join(world_progress_payload.world_tags)} passed deterministic same-world checks."
+                )
+                rules_result = PromptExecutionOutcome(
+                    attempts=[
+                        *rules_result.attempts,
+                        self._deterministic_attempt(
+                            prompt_id="council.rules_arbiter",
+                            lane="deterministic_validator",
+                            payload=fallback_rules_payload,
+                        ),
+                    ],
+                    final_lane="deterministic_validator",
+                    final_payload=fallback_rules_payload,
+                )
+            if (
+                rules_result.final_payload is not None
+                and rules_result.final_payload.approval_status == "rejected"
+                and "__force_rules_reject__" not in request.input_text
+                and "threaten_local" not in world_progress_payload.world_tags
+                and any(tag in world_progress_payload.world_tags for tag in ("aid_local", "promise_followup", "investigate"))
+            ):
+                rules_result.final_payload.approval_status = "approved"
+                rules_result.final_payload.reason = (
+                    "Rules arbiter false negative normalized after canonical world_tags "
+                    f"{', '.join(world_progress_payload.world_tags)} passed deterministic same-world checks."
+                )
+            rules_approval = (
+                rules_result.final_payload.approval_status if rules_result.final_payload is not None else "failed"
             )
-        rules_approval = (
-            rules_result.final_payload.approval_status if rules_result.final_payload is not None else "failed"
-        )
-        role_runs.append(
-            self._role_run(
+            role_run = self._role_run(
                 council_role="rules_arbiter",
                 stage_index=6,
                 prompt_id="council.rules_arbiter",
                 approval_status=rules_approval,
                 result=rules_result,
             )
-        )
-        if not rules_result.succeeded or rules_approval == "rejected":
-            final_payload = rules_result.final_payload
-            return TurnResolutionOutcome(
-                role_runs=role_runs,
-                final_lane=rules_result.final_lane,
-                final_payload=None,
-                failure_reason=(
-                    final_payload.reason
-                    if final_payload is not None and final_payload.approval_status == "rejected"
-                    else rules_result.failure_reason
-                ),
-                rejection_role="rules_arbiter",
+            if not rules_result.succeeded or rules_approval == "rejected":
+                return CouncilNodeResult(role_runs=[role_run], halt=_council_halt(rules_result, "rules_arbiter"))
+            return CouncilNodeResult(value=rules_result.final_payload, role_runs=[role_run])
+
+        def run_safety_guard(results: Mapping[str, CouncilNodeResult]) -> CouncilNodeResult:
+            world_progress_payload: CouncilWorldProgressPayload = results["world_progress"].value[0]
+            rules_payload: CouncilRulesArbiterPayload = results["rules_arbiter"].value
+            high_risk = world_progress_payload.risk_level == "high"
+            requires_llm_validation = "__force_" in request.input_text
+            safety_input = {
+                "world_id": request.world_id,
+                "input_text": request.input_text,
+                "event_world_id": request.world_id,
+                "event_payload": world_progress_payload.event_payload,
+                "world_tags": rules_payload.normalized_world_tags,
+                "risk_level": rules_payload.risk_level,
+                "input_mode": request.input_mode,
+                "play_language": play_language,
+                "recognized_titles": recognized_titles,
+                "shared_world_context": shared_world_context,
+                "resource_constraints": request.session_state.get("resource_constraints") or [],
+                "world_broadcast_constraints": request.session_state.get("world_broadcast_constraints") or [],
+            }
+            if high_risk or requires_llm_validation:
+                safety_result = self.model_router.execute_structured_prompt(
+                    prompt_id="council.safety_guard",
+                    response_model=CouncilSafetyGuardPayload,
+                    input_payload=safety_input,
+                    world_id=request.world_id,
+                    turn_id=request.turn_id,
+                    graph_context_status=request.graph_context_status,
+                    allow_pro_fallback=True,
+                    force_pro_after_success=high_risk,
+                )
+            else:
+                emit_turn_progress(
+                    phase="safety_guard",
+                    status="started",
+                    stage_index=7,
+                    elapsed_ms=0,
+                    detail="deterministic_validator",
+                )
+                safety_payload = CouncilSafetyGuardPayload(
+                    approval_status="approved",
+                    reason="Deterministic safety validator approved a low/medium risk turn.",
+                    violations=[],
+                )
+                safety_result = PromptExecutionOutcome(
+                    attempts=[
+                        self._deterministic_attempt(
+                            prompt_id="council.safety_guard",
+                            lane="deterministic_validator",
+                            payload=safety_payload,
+                        )
+                    ],
+                    final_lane="deterministic_validator",
+                    final_payload=safety_payload,
+                )
+                emit_turn_progress(
+                    phase="safety_guard",
+                    status="completed",
+                    stage_index=7,
+                    elapsed_ms=0,
+                    detail="deterministic_validator",
+                )
+            safety_approval = (
+                safety_result.final_payload.approval_status if safety_result.final_payload is not None else "failed"
             )
-
-        rules_payload = rules_result.final_payload
-        assert rules_payload is not None
-
-        safety_input = {
-            "world_id": request.world_id,
-            "input_text": request.input_text,
-            "event_world_id": request.world_id,
-            "event_payload": world_progress_payload.event_payload,
-            "world_tags": rules_payload.normalized_world_tags,
-            "risk_level": rules_payload.risk_level,
-            "input_mode": request.input_mode,
-            "play_language": play_language,
-            "recognized_titles": recognized_titles,
-            "shared_world_context": shared_world_context,
-            "resource_constraints": request.session_state.get("resource_constraints") or [],
-            "world_broadcast_constraints": request.session_state.get("world_broadcast_constraints") or [],
-        }
-        if high_risk or requires_llm_validation:
-            safety_result = self.model_router.execute_structured_prompt(
+            role_run = self._role_run(
+                council_role="safety_guard",
+                stage_index=7,
                 prompt_id="council.safety_guard",
-                response_model=CouncilSafetyGuardPayload,
-                input_payload=safety_input,
+                approval_status=safety_approval,
+                result=safety_result,
+            )
+            if not safety_result.succeeded or safety_approval == "rejected":
+                return CouncilNodeResult(role_runs=[role_run], halt=_council_halt(safety_result, "safety_guard"))
+            return CouncilNodeResult(value=safety_result.final_payload, role_runs=[role_run])
+
+        def narrative_input_for(results: Mapping[str, CouncilNodeResult], world_tags: list[str]) -> dict[str, Any]:
+            intent_payload: CouncilIntentInterpreterPayload = results["intent_interpreter"].value
+            memory_payload: CouncilMemoryManagerPayload = results["memory_manager"].value
+            npc_payload: CouncilNPCManagerPayload = results["npc_manager"].value
+            game_frame = results["situation_mapper"].value[0].model_dump()
+            world_progress_payload: CouncilWorldProgressPayload = results["world_progress"].value[0]
+            return {
+                "world_id": request.world_id,
+                "input_text": request.input_text,
+                "player_name": request.player_name,
+                "narrative_preferences": narrative_preferences,
+                "play_language": play_language,
+                "npc_name": request.npc_name,
+                "approved_event_package": world_progress_payload.event_payload,
+                "reaction_outline": npc_payload.reaction_outline,
+                "npc_reaction_outline": npc_payload.reaction_outline,
+                "memory_highlights": memory_payload.focus_memories[:5],
+                "world_tags": world_tags,
+                "resolution_summary": world_progress_payload.resolution_summary,
+                "consequence_summary": intent_payload.consequence_summary,
+                "game_frame": game_frame,
+                "intent_summary": intent_payload.intent_summary,
+                "selected_choice": request.selected_choice or {},
+                "consequence_tags": world_progress_payload.consequence_tags,
+                "outcome_band": world_progress_payload.outcome_band,
+                "current_scene_summary": str(current_scene.get("summary") or ""),
+                "current_chapter_summary": str(current_chapter.get("summary") or ""),
+                "recognized_titles": recognized_titles,
+                "same_world_context_summary": _joined_state_summary(
+                    [
+                        ("location", current_location),
+                        ("recent_world_beats", recent_world_beats[:5] if isinstance(recent_world_beats, list) else recent_world_beats),
+                        ("ambient_murmurs", ambient_murmurs[:5] if isinstance(ambient_murmurs, list) else ambient_murmurs),
+                        ("resource_constraints", request.session_state.get("resource_constraints") or []),
+                        ("world_broadcast_constraints", request.session_state.get("world_broadcast_constraints") or []),
+                    ]
+                ),
+            }
+
+        def execute_narrative(
+            narrative_input: dict[str, Any],
+            *,
+            high_risk: bool,
+        ) -> PromptExecutionOutcome[CouncilNarrativePayload]:
+            return self.model_router.execute_structured_prompt(
+                prompt_id="council.narrative",
+                response_model=CouncilNarrativePayload,
+                input_payload=narrative_input,
                 world_id=request.world_id,
                 turn_id=request.turn_id,
                 graph_context_status=request.graph_context_status,
                 allow_pro_fallback=True,
                 force_pro_after_success=high_risk,
             )
-        else:
-            emit_turn_progress(
-                phase="safety_guard",
-                status="started",
-                stage_index=7,
-                elapsed_ms=0,
-                detail="deterministic_validator",
-            )
-            safety_payload = CouncilSafetyGuardPayload(
-                approval_status="approved",
-                reason="Deterministic safety validator approved a low/medium risk turn.",
-                violations=[],
-            )
-            safety_result = PromptExecutionOutcome(
-                attempts=[
-                    self._deterministic_attempt(
-                        prompt_id="council.safety_guard",
-                        lane="deterministic_validator",
-                        payload=safety_payload,
+
+        def run_speculative_narrative(results: Mapping[str, CouncilNodeResult]) -> CouncilNodeResult:
+            world_progress_payload: CouncilWorldProgressPayload = results["world_progress"].value[0]
+            high_risk = world_progress_payload.risk_level == "high"
+            # Deterministic validators finish in microseconds, so there is only latency to hide when
+            # rules/safety go through the model (the same condition those roles use).
+            if not high_risk and "__force_" not in request.input_text:
+                return CouncilNodeResult()
+            # Rules/safety only approve or normalize tags, so the provisional world tags are what the
+            # validators will hand the narrative in the common case.
+            narrative_input = narrative_input_for(results, normalize_world_tags(world_progress_payload.world_tags))
+            if speculation_abandoned.is_set():
+                return CouncilNodeResult()
+            # A validator halt abandons the speculation; the call then stops at its next lane or retry.
+            with hold_turn_progress() as held_progress, abandon_prompts_when(speculation_abandoned):
+                narrative_result = execute_narrative(narrative_input, high_risk=high_risk)
+            self._record_speculative_run(narrative_result)
+            return CouncilNodeResult(value=(narrative_input, narrative_result, held_progress))
+
+        def run_narrative(results: Mapping[str, CouncilNodeResult]) -> CouncilNodeResult:
+            world_progress_payload: CouncilWorldProgressPayload = results["world_progress"].value[0]
+            rules_payload: CouncilRulesArbiterPayload = results["rules_arbiter"].value
+            high_risk = world_progress_payload.risk_level == "high"
+            narrative_input = narrative_input_for(results, rules_payload.normalized_world_tags)
+            role_runs: list[CouncilRoleRun] = []
+            speculation_hit: bool | None = None
+            speculative = results.get("narrative_speculative")
+            if speculative is not None and speculative.value is not None:
+                speculative_input, speculative_result, speculative_progress = speculative.value
+                speculation_hit = speculative_input == narrative_input and speculative_result.succeeded
+                if not speculation_hit:
+                    role_runs.append(
+                        self._role_run(
+                            council_role="narrative",
+                            stage_index=8,
+                            prompt_id="council.narrative",
+                            approval_status="speculation_discarded",
+                            result=speculative_result,
+                        )
                     )
-                ],
-                final_lane="deterministic_validator",
-                final_payload=safety_payload,
-            )
-            emit_turn_progress(
-                phase="safety_guard",
-                status="completed",
-                stage_index=7,
-                elapsed_ms=0,
-                detail="deterministic_validator",
+            if speculation_hit:
+                narrative_result = speculative_result
+                # The speculative call's progress, "started" included, was held back until the
+                # validators agreed with the speculated input.
+                replay_turn_progress(speculative_progress)
+            else:
+                narrative_result = execute_narrative(narrative_input, high_risk=high_risk)
+            role_runs.append(
+                self._role_run(
+                    council_role="narrative",
+                    stage_index=8,
+                    prompt_id="council.narrative",
+                    approval_status="approved" if narrative_result.succeeded else "failed",
+                    result=narrative_result,
+                )
             )
-        safety_approval = (
-            safety_result.final_payload.approval_status if safety_result.final_payload is not None else "failed"
-        )
-        role_runs.append(
-            self._role_run(
-                council_role="safety_guard",
-                stage_index=7,
-                prompt_id="council.safety_guard",
-                approval_status=safety_approval,
-                result=safety_result,
+            if not narrative_result.succeeded:
+                return CouncilNodeResult(role_runs=role_runs, halt=_council_halt(narrative_result, "narrative"))
+            narrative_payload = narrative_result.final_payload
+            assert narrative_payload is not None
+            emit_turn_event(
+                "turn.narrative.delta",
+                {
+                    "turn_id": request.turn_id,
+                    "delta": narrative_payload.narrative,
+                    "final": False,
+                    "replace": True,
+                },
             )
-        )
-        if not safety_result.succeeded or safety_approval == "rejected":
-            final_payload = safety_result.final_payload
-            return TurnResolutionOutcome(
+            return CouncilNodeResult(
+                value=(narrative_payload, narrative_result.final_lane, speculation_hit),
                 role_runs=role_runs,
-                final_lane=safety_result.final_lane,
-                final_payload=None,
-                failure_reason=(
-                    final_payload.reason
-                    if final_payload is not None and final_payload.approval_status == "rejected"
-                    else safety_result.failure_reason
-                ),
-                rejection_role="safety_guard",
             )
 
-        narrative_input = {
-            "world_id": request.world_id,
-            "input_text": request.input_text,
-            "player_name": request.player_name,
-            "narrative_preferences": narrative_preferences,
-            "play_language": play_language,
-            "npc_name": request.npc_name,
-            "approved_event_package": world_progress_payload.event_payload,
-            "reaction_outline": npc_payload.reaction_outline,
-            "npc_reaction_outline": npc_payload.reaction_outline,
-            "memory_highlights": memory_payload.focus_memories[:5],
-            "world_tags": rules_payload.normalized_world_tags,
-            "resolution_summary": world_progress_payload.resolution_summary,
-            "consequence_summary": intent_payload.consequence_summary,
-            "game_frame": game_frame,
-            "intent_summary": intent_payload.intent_summary,
-            "selected_choice": request.selected_choice or {},
-            "consequence_tags": world_progress_payload.consequence_tags,
-            "outcome_band": world_progress_payload.outcome_band,
-            "current_scene_summary": str(current_scene.get("summary") or ""),
-            "current_chapter_summary": str(current_chapter.get("summary") or ""),
-            "recognized_titles": recognized_titles,
-            "same_world_context_summary": _joined_state_summary(
-                [
-                    ("location", current_location),
-                    ("recent_world_beats", recent_world_beats[:5] if isinstance(recent_world_beats, list) else recent_world_beats),
-                    ("ambient_murmurs", ambient_murmurs[:5] if isinstance(ambient_murmurs, list) else ambient_murmurs),
-                    ("resource_constraints", request.session_state.get("resource_constraints") or []),
-                    ("world_broadcast_constraints", request.session_state.get("world_broadcast_constraints") or []),
-                ]
-            ),
-        }
-        narrative_result = self.model_router.execute_structured_prompt(
-            prompt_id="council.narrative",
-            response_model=CouncilNarrativePayload,
-            input_payload=narrative_input,
-            world_id=request.world_id,
-            turn_id=request.turn_id,
-            graph_context_status=request.graph_context_status,
-            allow_pro_fallback=True,
-            force_pro_after_success=high_risk,
-        )
-        role_runs.append(
-            self._role_run(
-                council_role="narrative",
-                stage_index=8,
-                prompt_id="council.narrative",
-                approval_status="approved" if narrative_result.succeeded else "failed",
-                result=narrative_result,
+        speculate = self.settings.council_speculative_narrative_enabled
+        speculation_abandoned = threading.Event()
+        narrative_dependencies = ("rules_arbiter", "safety_guard", "narrative_speculative") if speculate else (
+            "rules_arbiter",
+            "safety_guard",
+        )
+        role_graph = [
+            CouncilRoleNode("intent_interpreter", (), run_intent),
+            CouncilRoleNode("memory_manager", ("intent_interpreter",), run_memory_manager),
+            CouncilRoleNode("npc_manager", ("intent_interpreter",), run_npc_manager),
+            CouncilRoleNode("situation_mapper", ("memory_manager", "npc_manager"), run_situation_mapper),
+            CouncilRoleNode("world_progress", ("situation_mapper",), run_world_progress),
+            CouncilRoleNode("rules_arbiter", ("world_progress",), run_rules_arbiter),
+            CouncilRoleNode("safety_guard", ("rules_arbiter",), run_safety_guard),
+            CouncilRoleNode("narrative", narrative_dependencies, run_narrative),
+        ]
+        if speculate:
+            role_graph.append(
+                CouncilRoleNode(
+                    "narrative_speculative",
+                    ("world_progress",),
+                    run_speculative_narrative,
+                    speculative=True,
+                    on_abandon=speculation_abandoned.set,
+                )
             )
-        )
-        if not narrative_result.succeeded:
+
+        # Prewarm provider initialization before worker threads enter the router.
+        _ = self.model_router.provider
+        report = CouncilRoleScheduler(max_workers=self.COUNCIL_MAX_WORKERS).run(role_graph)
+        schedule = report.summary()
+        if speculate and "narrative" in report.results and report.results["narrative"].halt is None:
+            speculation_hit = report.results["narrative"].value[2]
+            if speculation_hit is not None:
+                schedule["speculation"] = self._record_speculation(report, hit=speculation_hit)
+        role_runs = report.role_runs()
+        if report.halt is not None:
+            speculative = report.results.get("narrative_speculative")
+            if speculative is not None and speculative.value is not None:
+                # The halt made a finished speculative narrative useless; keep its spend on the turn.
+                role_runs.append(
+                    self._role_run(
+                        council_role="narrative",
+                        stage_index=8,
+                        prompt_id="council.narrative",
+                        approval_status="speculation_discarded",
+                        result=speculative.value[1],
+                    )
+                )
             return TurnResolutionOutcome(
                 role_runs=role_runs,
-                final_lane=narrative_result.final_lane,
                 final_payload=None,
-                failure_reason=narrative_result.failure_reason,
-                rejection_role="narrative",
+                council_schedule=schedule,
+                **report.halt,
             )
 
-        narrative_payload = narrative_result.final_payload
-        assert narrative_payload is not None
-        emit_turn_event(
-            "turn.narrative.delta",
-            {
-                "turn_id": request.turn_id,
-                "delta": narrative_payload.narrative,
-                "final": False,
-            },
-        )
+        intent_payload: CouncilIntentInterpreterPayload = report.results["intent_interpreter"].value
+        situation_fallback_used = report.results["situation_mapper"].value[1]
+        world_progress_payload, world_progress_fallback_used = report.results["world_progress"].value
+        rules_payload: CouncilRulesArbiterPayload = report.results["rules_arbiter"].value
+        narrative_payload, narrative_lane, _ = report.results["narrative"].value
 
         final_payload = TurnResolutionPayload(
             narrative=narrative_payload.narrative,
@@ -2837,9 +2951,10 @@ class GMCouncilService:
         )
         return TurnResolutionOutcome(
             role_runs=role_runs,
-            final_lane=narrative_result.final_lane,
+            final_lane=narrative_lane,
             final_payload=final_payload,
-            deterministic_fallback_used=deterministic_fallback_used,
+            deterministic_fallback_used=situation_fallback_used or world_progress_fallback_used,
+            council_schedule=schedule,
         )
 
     @staticmethod
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import copy
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Literal
+
+
+TrimStrategy = Literal["oldest_first", "lowest_salience"]
+
+# Characters outside Latin/Cyrillic/general punctuation (CJK, kana, hangul, emoji) are
+# tokenized at roughly one token per character; everything else at about four per token.
+_WIDE_CHARACTERS = re.compile(r"[^\u0000-\u2e7f]")
+_SALIENCE_KEYS = ("salience", "importance", "relevance", "score", "weight")
+
+
+def estimate_tokens(value: Any) -> int:
+    text = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+    wide_count = len(_WIDE_CHARACTERS.findall(text))
+    return wide_count + (len(text) - wide_count + 3) // 4
+
+
+@dataclass(frozen=True)
+class ContextTrimRule:
+    """Shrinks every list stored under ``key`` (at any depth) down to ``keep`` items."""
+
+    key: str
+    strategy: TrimStrategy
+    keep: int = 0
+
+
+# Ordered from the context the turn can most easily lose to the context it needs most.
+# Session-state history lists are stored newest first, so "oldest" means the tail.
+DEFAULT_CONTEXT_TRIM_POLICY: tuple[ContextTrimRule, ...] = (
+    ContextTrimRule("ambient_murmurs", "oldest_first", keep=1),
+    ContextTrimRule("recent_branch_echoes", "oldest_first"),
+    ContextTrimRule("recent_travel_history", "oldest_first"),
+    ContextTrimRule("recent_consequence_history", "oldest_first", keep=1),
+    ContextTrimRule("recent_world_beats", "oldest_first", keep=1),
+    ContextTrimRule("recent_scene_history", "oldest_first", keep=1),
+    ContextTrimRule("related_memory_snippets", "oldest_first"),
+    ContextTrimRule("relevant_memories", "lowest_salience", keep=2),
+    ContextTrimRule("recent_memories", "lowest_salience", keep=2),
+    ContextTrimRule("memory_highlights", "lowest_salience", keep=2),
+    ContextTrimRule("known_facts", "lowest_salience", keep=3),
+    ContextTrimRule("relationship_summaries", "lowest_salience", keep=2),
+    ContextTrimRule("plaza_figures", "lowest_salience", keep=2),
+    ContextTrimRule("local_figures", "lowest_salience", keep=2),
+    ContextTrimRule("nearby_routes", "oldest_first", keep=2),
+    ContextTrimRule("visible_exits", "oldest_first", keep=2),
+    ContextTrimRule("active_consequence_threads", "lowest_salience", keep=1),
+    ContextTrimRule("quests", "lowest_salience", keep=2),
+    ContextTrimRule("active_quests", "lowest_salience", keep=2),
+)
+
+
+@dataclass(frozen=True)
+class ContextTrimResult:
+    payload: dict[str, Any]
+    budget_tokens: int
+    estimated_tokens_before: int
+    estimated_tokens_after: int
+    decisions: list[dict[str, Any]]
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(self.estimated_tokens_before - self.estimated_tokens_after, 0)
+
+    @property
+    def trimmed(self) -> bool:
+        return bool(self.decisions)
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "budget_tokens": self.budget_tokens,
+            "estimated_tokens_before": self.estimated_tokens_before,
+            "estimated_tokens_after": self.estimated_tokens_after,
+            "tokens_saved": self.tokens_saved,
+            "over_budget": self.estimated_tokens_after > self.budget_tokens,
+            "decisions": list(self.decisions),
+        }
+
+
+def _salience(item: Any) -> float | None:
+    if not isinstance(item, dict):
+        return None
+    for key in _SALIENCE_KEYS:
+        value = item.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return None
+
+
+def _drop_index(items: list[Any], strategy: TrimStrategy) -> int:
+    if strategy == "lowest_salience":
+        scored = [(score, index) for index, item in enumerate(items) if (score := _salience(item)) is not None]
+        if scored:
+            # Later entries lose ties so the freshest equally-salient context survives.
+            return min(scored, key=lambda pair: (pair[0], -pair[1]))[1]
+    return len(items) - 1
+
+
+def _lists_for_key(value: Any, key: str, path: tuple[str, ...] = ()) -> list[tuple[str, list[Any]]]:
+    found: list[tuple[str, list[Any]]] = []
+    if isinstance(value, dict):
+        for child_key, child in value.items():
+            child_path = (*path, str(child_key))
+            if child_key == key and isinstance(child, list):
+                found.append((".".join(child_path), child))
+            elif isinstance(child, dict):
+                found.extend(_lists_for_key(child, key, child_path))
+    return found
+
+
+def trim_context_payload(
+    payload: dict[str, Any],
+    *,
+    budget_tokens: int,
+    policy: tuple[ContextTrimRule, ...] = DEFAULT_CONTEXT_TRIM_POLICY,
+) -> ContextTrimResult:
+    """Drops low-priority context until ``payload`` fits ``budget_tokens``.
+
+    Rules are applied in policy order and each rule is exhausted (down to its ``keep``
+    floor) before the next one is touched. The input payload is never mutated.
+    """
+
+    estimated_before = estimate_tokens(payload)
+    if budget_tokens <= 0 or estimated_before <= budget_tokens:
+        return ContextTrimResult(payload, budget_tokens, estimated_before, estimated_before, [])
+
+    trimmed = copy.deepcopy(payload)
+    remaining = estimated_before
+    decisions: list[dict[str, Any]] = []
+    for rule in policy:
+        if remaining <= budget_tokens:
+            break
+        for path, items in _lists_for_key(trimmed, rule.key):
+            dropped = 0
+            dropped_tokens = 0
+            while remaining > budget_tokens and len(items) > rule.keep:
+                item = items.pop(_drop_index(items, rule.strategy))
+                # One extra token approximates the separator the item occupied.
+                item_tokens = estimate_tokens(item) + 1
+                remaining -= item_tokens
+                dropped += 1
+                dropped_tokens += item_tokens
+            if dropped:
+                decisions.append(
+                    {
+                        "section": path,
+                        "strategy": rule.strategy,
+                        "dropped_items": dropped,
+                        "kept_items": len(items),
+                        "estimated_tokens": dropped_tokens,
+                    }
+                )
+            if remaining <= budget_tokens:
+                break
+    if not decisions:
+        return ContextTrimResult(payload, budget_tokens, estimated_before, estimated_before, [])
+    return ContextTrimResult(trimmed, budget_tokens, estimated_before, estimate_tokens(trimmed), decisions)
@@ -5,7 +5,10 @@ import json
 import re
 import threading
 import time
+from collections import deque
+from collections.abc import Iterator
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Generic, Literal, TypeVar
@@ -20,7 +23,15 @@ from app.core.config import Settings
 from app.core.prompts import PromptDefinition, PromptRegistry
 from app.models.entities import AdminPromptOverride, AdminRuntimeConfig, LLMContextCacheEntry, World
 from app.modules.observability.service import ObservabilityService
-from app.modules.session.progress import elapsed_ms_since, emit_turn_progress, phase_for_prompt
+from app.modules.llm_harness.context_budget import ContextTrimResult, trim_context_payload
+from app.modules.llm_harness.streaming import IncrementalJSONFieldExtractor, iter_sse_data
+from app.modules.session.progress import (
+    elapsed_ms_since,
+    emit_turn_event,
+    emit_turn_progress,
+    phase_for_prompt,
+    turn_progress_bound,
+)
 from app.modules.world_pack.service import PackRegistry, world_pack_metadata
 from app.modules.world_state.branch import BranchSignal, normalize_branch_signals
 from app.modules.world_state.consequence import ConsequenceTag, OutcomeBand, normalize_consequence_tags
@@ -37,6 +48,27 @@ except ImportError:  # pragma: no cover - dependency is installed in runtime ima
 
 T = TypeVar("T", bound=BaseModel)
 
+_prompt_abandon_signal: ContextVar[threading.Event | None] = ContextVar("llm_prompt_abandon_signal", default=None)
+
+
+@contextmanager
+def abandon_prompts_when(signal: threading.Event) -> Iterator[None]:
+    """Model calls made inside stop before their next lane or retry once ``signal`` is set.
+
+    A provider call already on the wire still finishes; nothing after it is started.
+    """
+
+    token = _prompt_abandon_signal.set(signal)
+    try:
+        yield
+    finally:
+        _prompt_abandon_signal.reset(token)
+
+
+def prompts_abandoned() -> bool:
+    signal = _prompt_abandon_signal.get()
+    return signal is not None and signal.is_set()
+
 
 @dataclass(frozen=True)
 class PromptRouteOverride:
@@ -67,6 +99,8 @@ class PromptExecutionAttempt:
     langfuse_observation_id: str | None = None
     langfuse_trace_url: str | None = None
     langfuse_status: str = "disabled"
+    context_trimming: dict[str, Any] | None = None
+    latency_ms: int | None = None
 
 
 @dataclass(frozen=True)
@@ -775,6 +809,7 @@ class TurnResolutionOutcome:
     failure_reason: str | None = None
     rejection_role: str | None = None
     deterministic_fallback_used: bool = False
+    council_schedule: dict[str, Any] | None = None
 
     @property
     def succeeded(self) -> bool:
@@ -794,6 +829,17 @@ class TurnResolutionOutcome:
 
 class BaseModelProvider:
     provider_name = "base"
+    retry_budget: RetryBudget | None = None
+
+    def _retry_allowed(self, attempt_index: int) -> bool:
+        if attempt_index > 0 and prompts_abandoned():
+            return False
+        if self.retry_budget is None:
+            return True
+        if attempt_index == 0:
+            self.retry_budget.deposit()
+            return True
+        return self.retry_budget.try_spend()
 
     def generate(
         self,
@@ -1988,12 +2034,13 @@ class StubModelProvider(BaseModelProvider):
 class GeminiDeveloperAPIProvider(BaseModelProvider):
     provider_name = "gemini_developer_api"
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, retry_budget: RetryBudget | None = None) -> None:
         if genai is None or genai_types is None:  # pragma: no cover - import is validated in runtime image
             raise RuntimeError("google-genai is not installed")
         if not settings.gemini_api_key:
             raise ValueError("GEMINI_API_KEY is required when MODEL_PROVIDER=gemini_developer_api")
         self.settings = settings
+        self.retry_budget = retry_budget
         try:
             # The SDK expects timeout in milliseconds, while repo config is expressed in seconds.
             timeout_ms = max(int(settings.gemini_timeout_seconds * 1000), 1)
@@ -2020,7 +2067,9 @@ class GeminiDeveloperAPIProvider(BaseModelProvider):
             ]
         )
         last_error: Exception | None = None
-        for _ in range(max(self.settings.gemini_max_retries, 1)):
+        for attempt_index in range(max(self.settings.gemini_max_retries, 1)):
+            if not self._retry_allowed(attempt_index):
+                break
             try:
                 response = self.client.models.generate_content(
                     model=model_id,
@@ -2104,12 +2153,14 @@ class OpenAICompatibleProvider(BaseModelProvider):
         "recent_world_beats",
         "ambient_murmurs",
     )
+    STREAMED_TEXT_FIELDS = ("narrative",)
 
     def __init__(
         self,
         settings: Settings,
         *,
         session_factory: sessionmaker[Session] | None = None,
+        retry_budget: RetryBudget | None = None,
     ) -> None:
         if not settings.openai_compat_api_key:
             raise ValueError("OPENAI_COMPAT_API_KEY is required when MODEL_PROVIDER=openai_compatible")
@@ -2117,6 +2168,7 @@ class OpenAICompatibleProvider(BaseModelProvider):
             raise ValueError("OPENAI_COMPAT_BASE_URL is required when MODEL_PROVIDER=openai_compatible")
         self.settings = settings
         self.session_factory = session_factory
+        self.retry_budget = retry_budget
         self._cache_client: Any | None = None
         self._cache_client_lock = threading.Lock()
         self.client = httpx.Client(
@@ -2163,12 +2215,18 @@ class OpenAICompatibleProvider(BaseModelProvider):
         if response_format is not None:
             body["response_format"] = response_format
 
+        stream_fields = self._stream_fields(response_model)
         last_error: Exception | None = None
-        for _ in range(max(self.settings.openai_compat_max_retries, 1)):
+        for attempt_index in range(max(self.settings.openai_compat_max_retries, 1)):
+            if not self._retry_allowed(attempt_index):
+                break
             try:
-                response = self.client.post("/chat/completions", json=body)
-                response.raise_for_status()
-                payload = response.json()
+                if stream_fields:
+                    payload = self._stream_chat_completion(body, fields=stream_fields, prompt_id=prompt.prompt_id)
+                else:
+                    response = self.client.post("/chat/completions", json=body)
+                    response.raise_for_status()
+                    payload = response.json()
                 response_text = self._response_text(payload)
                 return ProviderResponse(
                     raw_output=json.loads(response_text),
@@ -2185,6 +2243,72 @@ class OpenAICompatibleProvider(BaseModelProvider):
         assert last_error is not None
         raise last_error
 
+    def _stream_fields(self, response_model: type[BaseModel]) -> tuple[str, ...]:
+        # Streaming only pays off when a player is listening for progress on this turn. A speculative
+        # council narrative streams too: its deltas are held and replayed once the draft is kept.
+        if not self.settings.openai_compat_streaming_enabled or not turn_progress_bound():
+            return ()
+        return tuple(field for field in self.STREAMED_TEXT_FIELDS if field in response_model.model_fields)
+
+    def _stream_chat_completion(
+        self,
+        body: dict[str, Any],
+        *,
+        fields: tuple[str, ...],
+        prompt_id: str,
+    ) -> dict[str, Any]:
+        """Runs a ``stream: true`` completion, forwarding partial text fields as they decode.
+
+        The returned payload mirrors a non-streamed ``/chat/completions`` body so the regular
+        response, usage and cache-token readers apply unchanged.
+        """
+
+        extractor = IncrementalJSONFieldExtractor(fields)
+        content_parts: list[str] = []
+        response_id: str | None = None
+        usage: dict[str, Any] | None = None
+        first_delta = True
+        stream_body = {**body, "stream": True, "stream_options": {"include_usage": True}}
+        with self.client.stream("POST", "/chat/completions", json=stream_body) as response:
+            response.raise_for_status()
+            for chunk in iter_sse_data(response.iter_lines()):
+                response_id = response_id or self._response_id(chunk)
+                if isinstance(chunk.get("usage"), dict):
+                    usage = chunk["usage"]
+                content = self._stream_chunk_content(chunk)
+                if not content:
+                    continue
+                content_parts.append(content)
+                for field, delta in extractor.feed(content):
+                    emit_turn_event(
+                        f"turn.{field}.delta",
+                        {
+                            "delta": delta,
+                            "final": False,
+                            # A retried or fallback generation restarts the text rather than appending to it.
+                            "replace": first_delta,
+                            "prompt_id": prompt_id,
+                        },
+                    )
+                    first_delta = False
+        payload: dict[str, Any] = {"choices": [{"message": {"content": "".join(content_parts)}}]}
+        if response_id is not None:
+            payload["id"] = response_id
+        if usage is not None:
+            payload["usage"] = usage
+        return payload
+
+    @staticmethod
+    def _stream_chunk_content(chunk: dict[str, Any]) -> str:
+        choices = chunk.get("choices")
+        if not isinstance(choices, list) or not choices or not isinstance(choices[0], dict):
+            return ""
+        delta = choices[0].get("delta")
+        if not isinstance(delta, dict):
+            return ""
+        content = delta.get("content")
+        return content if isinstance(content, str) else ""
+
     def _messages(
         self,
         *,
@@ -2568,6 +2692,182 @@ class OpenAICompatibleProvider(BaseModelProvider):
         return max(prompt_tokens - cache_hit_tokens, 0)
 
 
+class ProviderCircuitOpenError(RuntimeError):
+    pass
+
+
+class RetryBudget:
+    """Token bucket shared by every provider retry loop.
+
+    First attempts deposit ``ratio`` tokens and each retry spends one, so retries stay a
+    bounded fraction of traffic instead of multiplying load while a provider is degraded.
+    """
+
+    def __init__(self, *, ratio: float, capacity: float) -> None:
+        self.ratio = max(ratio, 0.0)
+        self.capacity = max(capacity, 0.0)
+        self._tokens = self.capacity
+        self._spent = 0
+        self._denied = 0
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._spent += 1
+                return True
+            self._denied += 1
+            return False
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "tokens": round(self._tokens, 3),
+                "capacity": self.capacity,
+                "ratio": self.ratio,
+                "retries_spent": self._spent,
+                "retries_denied": self._denied,
+            }
+
+
+class ProviderCircuitBreaker:
+    """Rolling-window breaker for one (provider, model_id) pair."""
+
+    def __init__(self, settings: Settings, *, provider_name: str, model_id: str) -> None:
+        self.settings = settings
+        self.provider_name = provider_name
+        self.model_id = model_id
+        self.state: Literal["closed", "open", "half_open"] = "closed"
+        self.opened_at: float | None = None
+        self.last_trip_reason: str | None = None
+        self.trip_count = 0
+        self.rejected_count = 0
+        self._window: deque[tuple[bool, float]] = deque(maxlen=max(settings.llm_circuit_window_size, 1))
+        self._half_open_in_flight = 0
+
+    def allow(self, now: float) -> bool:
+        if self.state == "open":
+            if self.opened_at is not None and now - self.opened_at >= self.settings.llm_circuit_open_seconds:
+                self.state = "half_open"
+                self._half_open_in_flight = 0
+            else:
+                self.rejected_count += 1
+                return False
+        if self.state == "half_open":
+            if self._half_open_in_flight >= max(self.settings.llm_circuit_half_open_probes, 1):
+                self.rejected_count += 1
+                return False
+            self._half_open_in_flight += 1
+        return True
+
+    def record(self, *, succeeded: bool, latency_seconds: float, now: float) -> None:
+        slow = latency_seconds >= self.settings.llm_circuit_slow_call_seconds
+        if self.state == "half_open":
+            self._half_open_in_flight = max(self._half_open_in_flight - 1, 0)
+            if succeeded and not slow:
+                self.state = "closed"
+                self.opened_at = None
+                self._window.clear()
+            else:
+                self._trip(now, "half_open_probe_failed" if not succeeded else "half_open_probe_slow")
+            return
+        self._window.append((succeeded, latency_seconds))
+        if self.state != "closed" or len(self._window) < max(self.settings.llm_circuit_min_requests, 1):
+            return
+        total = len(self._window)
+        error_rate = sum(1 for ok, _ in self._window if not ok) / total
+        slow_rate = (
+            sum(1 for _, latency in self._window if latency >= self.settings.llm_circuit_slow_call_seconds) / total
+        )
+        if error_rate >= self.settings.llm_circuit_error_rate_threshold:
+            self._trip(now, "error_rate")
+        elif slow_rate >= self.settings.llm_circuit_slow_call_rate_threshold:
+            self._trip(now, "slow_call_rate")
+
+    def _trip(self, now: float, reason: str) -> None:
+        self.state = "open"
+        self.opened_at = now
+        self.last_trip_reason = reason
+        self.trip_count += 1
+        self._window.clear()
+
+    def snapshot(self, now: float) -> dict[str, Any]:
+        total = len(self._window)
+        failures = sum(1 for ok, _ in self._window if not ok)
+        latencies = sorted(latency for _, latency in self._window)
+        return {
+            "provider_name": self.provider_name,
+            "model_id": self.model_id,
+            "state": self.state,
+            "window_requests": total,
+            "error_rate": round(failures / total, 4) if total else 0.0,
+            "p95_latency_ms": int(latencies[min(int(total * 0.95), total - 1)] * 1000) if total else None,
+            "open_for_seconds": round(now - self.opened_at, 3) if self.opened_at is not None else None,
+            "last_trip_reason": self.last_trip_reason,
+            "trip_count": self.trip_count,
+            "rejected_count": self.rejected_count,
+        }
+
+
+class ProviderCircuitBreakers:
+    """Process-wide breaker registry keyed by (provider_name, model_id) plus the shared retry budget."""
+
+    def __init__(self, settings: Settings, *, clock: Any = time.monotonic) -> None:
+        self.settings = settings
+        self.clock = clock
+        self.retry_budget = RetryBudget(
+            ratio=settings.llm_retry_budget_ratio,
+            capacity=settings.llm_retry_budget_capacity,
+        )
+        self._breakers: dict[tuple[str, str], ProviderCircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def _breaker(self, provider_name: str, model_id: str) -> ProviderCircuitBreaker:
+        key = (provider_name, model_id)
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = ProviderCircuitBreaker(self.settings, provider_name=provider_name, model_id=model_id)
+            self._breakers[key] = breaker
+        return breaker
+
+    def allow(self, provider_name: str, model_id: str) -> bool:
+        if not self.settings.llm_circuit_breaker_enabled:
+            return True
+        with self._lock:
+            return self._breaker(provider_name, model_id).allow(self.clock())
+
+    def record(self, provider_name: str, model_id: str, *, succeeded: bool, latency_seconds: float) -> None:
+        if not self.settings.llm_circuit_breaker_enabled:
+            return
+        with self._lock:
+            self._breaker(provider_name, model_id).record(
+                succeeded=succeeded,
+                latency_seconds=latency_seconds,
+                now=self.clock(),
+            )
+
+    def state(self, provider_name: str, model_id: str) -> str:
+        with self._lock:
+            breaker = self._breakers.get((provider_name, model_id))
+            return breaker.state if breaker is not None else "closed"
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            now = self.clock()
+            items = [breaker.snapshot(now) for _, breaker in sorted(self._breakers.items())]
+        return {
+            "enabled": self.settings.llm_circuit_breaker_enabled,
+            "open_count": sum(1 for item in items if item["state"] != "closed"),
+            "items": items,
+            "retry_budget": self.retry_budget.snapshot(),
+        }
+
+
 class ModelRouter:
     def __init__(
         self,
@@ -2579,6 +2879,7 @@ class ModelRouter:
         route_overrides: dict[str, PromptRouteOverride] | None = None,
         config_name: str = "settings",
         observability_service: ObservabilityService | None = None,
+        circuit_breakers: ProviderCircuitBreakers | None = None,
     ) -> None:
         self.settings = settings
         self.prompt_registry = prompt_registry
@@ -2587,6 +2888,7 @@ class ModelRouter:
         self.route_overrides = route_overrides or {}
         self.config_name = config_name
         self.observability_service = observability_service
+        self.circuit_breakers = circuit_breakers or ProviderCircuitBreakers(settings)
         self._provider: BaseModelProvider | None = None
         self._provider_lock = threading.Lock()
 
@@ -2607,6 +2909,8 @@ class ModelRouter:
         prompt = self._resolve_prompt_for_world(resolved_prompt_id, world_id)
         requested_lane = route.default_lane if route is not None else prompt.model_lane
         input_context_hash = self._input_context_hash(prompt, input_payload)
+        context_trim = self._apply_context_budget(prompt, input_payload)
+        context_trimming = context_trim.to_record() if context_trim.trimmed else None
         attempts: list[PromptExecutionAttempt] = []
         failure_reason: str | None = None
 
@@ -2627,6 +2931,9 @@ class ModelRouter:
         with context_manager:
             lanes = self._lane_sequence(requested_lane, allow_pro_fallback or force_pro_after_success)
             for lane_index, lane in enumerate(lanes):
+                if prompts_abandoned():
+                    failure_reason = "prompt abandoned before the next lane"
+                    break
                 model_id = self._model_id_for_lane(lane, route)
                 langfuse_context = (
                     self.observability_service.langfuse_observation(
@@ -2661,20 +2968,20 @@ class ModelRouter:
                             detail=lane,
                         )
                     try:
-                        provider_input_payload = self._provider_input_payload(input_payload)
+                        provider_input_payload = self._provider_input_payload(context_trim.payload)
                         provider_response = self._forced_eval_response(
                             prompt_id=prompt.prompt_id,
                             lane=lane,
                             input_payload=input_payload,
-                        ) or self.provider.generate(
+                        ) or self._generate_with_circuit_breaker(
                             prompt=prompt,
                             response_model=response_model,
                             model_id=model_id,
                             lane=lane,
                             input_payload=provider_input_payload,
-                            temperature=self._temperature_for_lane(lane),
                         )
                     except Exception as exc:
+                        error_status = "circuit_open" if isinstance(exc, ProviderCircuitOpenError) else "provider_error"
                         elapsed_ms = elapsed_ms_since(lane_started_at)
                         if stage_index is not None:
                             emit_turn_progress(
@@ -2682,13 +2989,13 @@ class ModelRouter:
                                 status="completed",
                                 stage_index=stage_index,
                                 elapsed_ms=elapsed_ms,
-                                detail="provider_error",
+                                detail=error_status,
                             )
                         failure_reason = f"{lane} provider execution failed: {exc}"
                         _update_langfuse_observation(
                             langfuse_link,
-                            output={"status": "provider_error", "reason": str(exc)},
-                            metadata={"status": "provider_error", "failure_reason": failure_reason},
+                            output={"status": error_status, "reason": str(exc)},
+                            metadata={"status": error_status, "failure_reason": failure_reason},
                         )
                         attempt = PromptExecutionAttempt(
                             prompt_id=prompt.prompt_id,
@@ -2697,9 +3004,9 @@ class ModelRouter:
                             model_id=model_id,
                             input_hash=input_context_hash,
                             input_context_hash=input_context_hash,
-                            status="provider_error",
+                            status=error_status,
                             output_schema_status="invalid",
-                            output_payload={"status": "provider_error", "reason": str(exc)},
+                            output_payload={"status": error_status, "reason": str(exc)},
                             provider_name=self.provider.provider_name,
                             provider_response_id=None,
                             prompt_tokens=None,
@@ -2711,6 +3018,8 @@ class ModelRouter:
                             langfuse_observation_id=langfuse_link.observation_id,
                             langfuse_trace_url=langfuse_link.trace_url,
                             langfuse_status=langfuse_link.status,
+                            context_trimming=context_trimming,
+                            latency_ms=elapsed_ms,
                         )
                         attempts.append(attempt)
                         self._record_attempt(
@@ -2790,6 +3099,8 @@ class ModelRouter:
                             langfuse_observation_id=langfuse_link.observation_id,
                             langfuse_trace_url=langfuse_link.trace_url,
                             langfuse_status=langfuse_link.status,
+                            context_trimming=context_trimming,
+                            latency_ms=elapsed_ms,
                         )
                         attempts.append(attempt)
                         self._record_attempt(
@@ -2854,6 +3165,8 @@ class ModelRouter:
                         langfuse_observation_id=langfuse_link.observation_id,
                         langfuse_trace_url=langfuse_link.trace_url,
                         langfuse_status=langfuse_link.status,
+                        context_trimming=context_trimming,
+                        latency_ms=elapsed_ms,
                     )
                     attempts.append(attempt)
                     self._record_attempt(
@@ -2877,6 +3190,18 @@ class ModelRouter:
             failure_reason=failure_reason or "No LLM lane executed",
         )
 
+    def _apply_context_budget(self, prompt: PromptDefinition, input_payload: dict[str, Any]) -> ContextTrimResult:
+        budget_tokens = prompt.context_token_budget or self.settings.llm_context_token_budget
+        if not self.settings.llm_context_budget_enabled:
+            budget_tokens = 0
+        result = trim_context_payload(input_payload, budget_tokens=budget_tokens)
+        if result.trimmed and self.observability_service is not None:
+            self.observability_service.record_llm_context_trim(
+                prompt_id=prompt.prompt_id,
+                tokens_saved=result.tokens_saved,
+            )
+        return result
+
     def _resolve_prompt_for_world(self, prompt_id: str, world_id: str) -> PromptDefinition:
         prompt = self.prompt_registry.get(prompt_id)
         admin_overlay = self._admin_prompt_overlay(prompt_id)
@@ -2919,11 +3244,61 @@ class ModelRouter:
 
     def _build_provider(self) -> BaseModelProvider:
         if self.settings.model_provider == "openai_compatible":
-            return OpenAICompatibleProvider(self.settings, session_factory=self.session_factory)
+            return OpenAICompatibleProvider(
+                self.settings,
+                session_factory=self.session_factory,
+                retry_budget=self.circuit_breakers.retry_budget,
+            )
         if self.settings.model_provider == "gemini_developer_api":
-            return GeminiDeveloperAPIProvider(self.settings)
+            return GeminiDeveloperAPIProvider(self.settings, retry_budget=self.circuit_breakers.retry_budget)
         return StubModelProvider()
 
+    def _generate_with_circuit_breaker(
+        self,
+        *,
+        prompt: PromptDefinition,
+        response_model: type[T],
+        model_id: str,
+        lane: str,
+        input_payload: dict[str, Any],
+    ) -> ProviderResponse:
+        provider = self.provider
+        if not self.circuit_breakers.allow(provider.provider_name, model_id):
+            raise ProviderCircuitOpenError(f"circuit open for {provider.provider_name}/{model_id}")
+        started_at = time.perf_counter()
+        try:
+            response = provider.generate(
+                prompt=prompt,
+                response_model=response_model,
+                model_id=model_id,
+                lane=lane,
+                input_payload=input_payload,
+                temperature=self._temperature_for_lane(lane),
+            )
+        except Exception:
+            self._record_circuit_outcome(provider.provider_name, model_id, succeeded=False, started_at=started_at)
+            raise
+        self._record_circuit_outcome(provider.provider_name, model_id, succeeded=True, started_at=started_at)
+        return response
+
+    def _record_circuit_outcome(self, provider_name: str, model_id: str, *, succeeded: bool, started_at: float) -> None:
+        previous_state = self.circuit_breakers.state(provider_name, model_id)
+        self.circuit_breakers.record(
+            provider_name,
+            model_id,
+            succeeded=succeeded,
+            latency_seconds=time.perf_counter() - started_at,
+        )
+        current_state = self.circuit_breakers.state(provider_name, model_id)
+        if current_state != previous_state and self.observability_service is not None:
+            self.observability_service.record_llm_circuit_transition(
+                provider_name=provider_name,
+                model_id=model_id,
+                previous_state=previous_state,
+                state=current_state,
+                open_count=int(self.circuit_breakers.snapshot()["open_count"]),
+            )
+
     @property
     def provider(self) -> BaseModelProvider:
         if self._provider is None:
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class IncrementalJSONFieldExtractor:
+    """Pulls top-level string fields out of a JSON object while it is still being streamed.
+
+    Only string values of the requested top-level keys are surfaced; everything else is
+    scanned for structure and skipped. Escapes are decoded as they complete, so a chunk
+    boundary inside ``\\u`` sequences or surrogate pairs never leaks half a character.
+    The completed document is still parsed and validated separately.
+    """
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        self.fields = frozenset(fields)
+        self._values: dict[str, list[str]] = {}
+        self._depth = 0
+        self._in_string = False
+        self._string_is_key = False
+        self._expect_key = False
+        self._escape: str | None = None
+        self._pending_high_surrogate: int | None = None
+        self._key_chars: list[str] = []
+        self._current_key: str | None = None
+        self._capturing: str | None = None
+
+    def feed(self, chunk: str) -> list[tuple[str, str]]:
+        deltas: list[tuple[str, str]] = []
+        for char in chunk:
+            if self._in_string:
+                decoded = self._string_char(char)
+                if decoded and self._capturing is not None:
+                    if deltas and deltas[-1][0] == self._capturing:
+                        deltas[-1] = (self._capturing, deltas[-1][1] + decoded)
+                    else:
+                        deltas.append((self._capturing, decoded))
+                continue
+            self._structural_char(char)
+        for field_name, text in deltas:
+            self._values.setdefault(field_name, []).append(text)
+        return deltas
+
+    def text(self, field_name: str) -> str:
+        return "".join(self._values.get(field_name, []))
+
+    def _structural_char(self, char: str) -> None:
+        if char == '"':
+            self._in_string = True
+            self._string_is_key = self._depth == 1 and self._expect_key
+            if self._string_is_key:
+                self._key_chars = []
+            elif self._depth == 1 and self._current_key in self.fields:
+                self._capturing = self._current_key
+            return
+        if char in "{[":
+            self._depth += 1
+            self._expect_key = char == "{" and self._depth == 1
+            return
+        if char in "}]":
+            self._depth = max(self._depth - 1, 0)
+            return
+        if self._depth != 1:
+            return
+        if char == ",":
+            self._expect_key = True
+            self._current_key = None
+        elif char == ":":
+            self._expect_key = False
+
+    def _string_char(self, char: str) -> str:
+        if self._escape is not None:
+            return self._escaped_char(char)
+        if char == "\\":
+            self._escape = ""
+            return ""
+        if char == '"':
+            self._close_string()
+            return ""
+        return self._emit(char)
+
+    def _escaped_char(self, char: str) -> str:
+        assert self._escape is not None
+        if self._escape == "":
+            if char == "u":
+                self._escape = "u"
+                return ""
+            self._escape = None
+            return self._emit(_SIMPLE_ESCAPES.get(char, char))
+        self._escape += char
+        if len(self._escape) < 5:
+            return ""
+        try:
+            code_point = int(self._escape[1:], 16)
+        except ValueError:
+            code_point = 0xFFFD
+        self._escape = None
+        if 0xD800 <= code_point <= 0xDBFF:
+            self._pending_high_surrogate = code_point
+            return ""
+        if 0xDC00 <= code_point <= 0xDFFF and self._pending_high_surrogate is not None:
+            high = self._pending_high_surrogate
+            self._pending_high_surrogate = None
+            return self._emit(chr(0x10000 + ((high - 0xD800) << 10) + (code_point - 0xDC00)))
+        return self._emit(chr(code_point))
+
+    def _emit(self, text: str) -> str:
+        if self._pending_high_surrogate is not None:
+            self._pending_high_surrogate = None
+            text = "\ufffd" + text
+        if self._string_is_key:
+            self._key_chars.append(text)
+            return ""
+        return text
+
+    def _close_string(self) -> None:
+        self._in_string = False
+        if self._string_is_key:
+            self._current_key = "".join(self._key_chars)
+            self._string_is_key = False
+        self._capturing = None
+
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Yields the JSON payload of each ``data:`` line in an OpenAI-style event stream."""
+
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if not data:
+            continue
+        if data == "[DONE]":
+            return
+        payload = json.loads(data)
+        if isinstance(payload, dict):
+            yield payload
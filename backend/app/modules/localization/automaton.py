@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+
+class TermAutomaton:
+    """Aho-Corasick automaton over a fixed set of terms.
+
+    ``iter_matches`` reports every occurrence of every term in one scan of the text;
+    ``leftmost_longest`` reduces those to the non-overlapping matches a replacement or
+    tokenizing pass wants.
+    """
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Terminal term at each state, plus the nearest terminal state along the failure chain.
+        self._term: list[str | None] = [None]
+        self._output_link: list[int] = [0]
+        self.terms: frozenset[str] = frozenset(term for term in terms if term)
+        for term in self.terms:
+            self._insert(term)
+        self._link()
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        goto, fail, terms, output_link = self._goto, self._fail, self._term, self._output_link
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            match_state = state if terms[state] is not None else output_link[state]
+            while match_state:
+                term = terms[match_state]
+                assert term is not None
+                yield index - len(term) + 1, term
+                match_state = output_link[match_state]
+
+    def leftmost_longest(self, text: str) -> list[tuple[int, str]]:
+        longest_from: dict[int, str] = {}
+        for start, term in self.iter_matches(text):
+            current = longest_from.get(start)
+            if current is None or len(term) > len(current):
+                longest_from[start] = term
+        matches: list[tuple[int, str]] = []
+        cursor = 0
+        for start in sorted(longest_from):
+            if start < cursor:
+                continue
+            term = longest_from[start]
+            matches.append((start, term))
+            cursor = start + len(term)
+        return matches
+
+    def _insert(self, term: str) -> None:
+        state = 0
+        for char in term:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._term.append(None)
+                self._output_link.append(0)
+                self._goto[state][char] = next_state
+            state = next_state
+        self._term[state] = term
+
+    def _link(self) -> None:
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                failed = self._fail[next_state]
+                self._output_link[next_state] = failed if self._term[failed] is not None else self._output_link[failed]
+                queue.append(next_state)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from threading import Lock
+
+from app.modules.localization.automaton import TermAutomaton
+
+
+GlossaryEntries = tuple[tuple[str, str], ...]
+
+
+class GlossaryMatcher:
+    """Applies a localization glossary in a single scan of the text.
+
+    Source terms are replaced by their localized text and localized terms are matched as
+    themselves, so an already-localized name is never rewritten by a shorter source term it
+    happens to contain. Matches are chosen leftmost-longest through an Aho-Corasick
+    automaton. Whenever a localized term is emitted, a proper prefix of that term sitting
+    directly in front of it (``ゲート守ゲート守リッカ``) is collapsed into the term.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str]]) -> None:
+        replacements: dict[str, str] = {}
+        localized_terms: list[str] = []
+        # Longest sources claim first; among equal sources the earliest glossary entry wins.
+        for source_text, localized_text in sorted(entries, key=lambda item: len(item[0]), reverse=True):
+            if localized_text:
+                localized_terms.append(localized_text)
+            if not source_text or not localized_text or source_text == localized_text:
+                continue
+            replacements.setdefault(source_text, localized_text)
+        for localized_text in localized_terms:
+            replacements.setdefault(localized_text, localized_text)
+        self._collapsible = frozenset(localized_terms)
+        self._replacements = replacements
+        self._automaton = TermAutomaton(replacements)
+
+    @property
+    def empty(self) -> bool:
+        return not self._replacements
+
+    def apply(self, text: str) -> str:
+        if not text or self.empty:
+            return text
+        matches = self._automaton.leftmost_longest(text)
+        if not matches:
+            return text
+
+        pieces: list[str] = []
+        cursor = 0
+        for start, pattern in matches:
+            if start > cursor:
+                pieces.append(text[cursor:start])
+            replacement = self._replacements[pattern]
+            if replacement in self._collapsible:
+                _trim_duplicated_prefix(pieces, replacement)
+            pieces.append(replacement)
+            cursor = start + len(pattern)
+        pieces.append(text[cursor:])
+        return "".join(pieces)
+
+
+def _trim_duplicated_prefix(pieces: list[str], term: str) -> None:
+    """Drops the longest proper prefix of ``term`` that ends the text emitted so far."""
+
+    tail_chars = len(term) - 1
+    tail: list[str] = []
+    collected = 0
+    for piece in reversed(pieces):
+        if collected >= tail_chars:
+            break
+        tail.append(piece)
+        collected += len(piece)
+    tail_text = "".join(reversed(tail))[-tail_chars:] if tail_chars else ""
+    for length in range(len(tail_text), 0, -1):
+        if tail_text.endswith(term[:length]):
+            _drop_trailing_chars(pieces, length)
+            return
+
+
+def _drop_trailing_chars(pieces: list[str], count: int) -> None:
+    while count and pieces:
+        last = pieces.pop()
+        if len(last) > count:
+            pieces.append(last[:-count])
+            return
+        count -= len(last)
+
+
+class GlossaryMatcherCache:
+    """Keeps compiled matchers per (world, target language, glossary version)."""
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self.max_entries = max(max_entries, 1)
+        self._matchers: OrderedDict[tuple[Hashable, ...], GlossaryMatcher] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, *, world_id: str, target_language: str, entries: GlossaryEntries) -> GlossaryMatcher:
+        # The entry tuple itself is the glossary version: any added, removed or retranslated
+        # term produces a different key and therefore a freshly compiled automaton.
+        key = (world_id, target_language, entries)
+        with self._lock:
+            matcher = self._matchers.get(key)
+            if matcher is not None:
+                self._matchers.move_to_end(key)
+                return matcher
+        matcher = GlossaryMatcher(entries)
+        with self._lock:
+            self._matchers[key] = matcher
+            self._matchers.move_to_end(key)
+            while len(self._matchers) > self.max_entries:
+                self._matchers.popitem(last=False)
+        return matcher
+
+    def clear(self) -> None:
+        with self._lock:
+            self._matchers.clear()
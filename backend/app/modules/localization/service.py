@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, as_completed
+from contextvars import copy_context
 from dataclasses import dataclass
 import hashlib
 import logging
 import re
+from threading import Lock
 from typing import Any
 
 from pydantic import BaseModel, Field, model_validator
@@ -13,13 +17,43 @@ from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from app.models.entities import PlayLocalizedTextCache
+from app.modules.llm_harness.context_budget import estimate_tokens
 from app.modules.llm_harness.service import ModelRouter
+from app.modules.localization.glossary import GlossaryMatcher, GlossaryMatcherCache
 from app.modules.world_pack.service import get_pack_registry, normalize_language_tag, template_world_id
 
 
 PROMPT_ID = "play.localization"
+WORLD_SHARED_SCOPE = "world"
+# Pack-authored and world-public text reads the same for every player in a world, so one
+# translation per world and language is shared; everything else stays actor-scoped.
+WORLD_SHARED_SOURCE_KINDS = frozenset(
+    {
+        "location.name",
+        "location.description",
+        "scene.location.name",
+        "scene.location.description",
+        "scene.focus_actor.display_name",
+        "route.summary",
+        "route.destination_name",
+        "local_figure.display_name",
+        "local_figure.summary",
+        "npc_location.display_name",
+        "npc_location.location_name",
+        "faction.name",
+        "faction.description",
+        "suggested_action.label",
+        "suggested_action.summary",
+        "suggested_action.risk_hint",
+        "recent_world_beats",
+        "ambient_murmurs",
+        "recent_offstage_beats",
+        "offstage_murmurs",
+    }
+)
 
 logger = logging.getLogger(__name__)
+_glossary_matchers = GlossaryMatcherCache()
 
 _PLAYER_VISIBLE_CONTROL_TOKEN_RE = re.compile(r"\s*\[(?:[a-z][a-z0-9_]*(?:\s*,\s*)?)+\]\s*", re.IGNORECASE)
 
@@ -61,6 +95,49 @@ class PlayLocalizationPayload(BaseModel):
         return self
 
 
+@dataclass(frozen=True)
+class _SectionMemo:
+    fingerprint: str
+    translations: dict[str, str]
+
+
+class SessionStateLocalizationMemo:
+    """Remembers localized session-state sections per (world, actor, session, language).
+
+    Each top-level state section is keyed by a fingerprint of its source text, so a poll
+    only re-localizes the sections whose text changed since the last localized state.
+    """
+
+    def __init__(self, max_scopes: int = 512) -> None:
+        self.max_scopes = max(max_scopes, 1)
+        self._scopes: OrderedDict[tuple[str, ...], dict[str, _SectionMemo]] = OrderedDict()
+        self._lock = Lock()
+
+    def sections(self, scope: tuple[str, ...]) -> dict[str, _SectionMemo]:
+        with self._lock:
+            sections = self._scopes.get(scope)
+            if sections is None:
+                return {}
+            self._scopes.move_to_end(scope)
+            return dict(sections)
+
+    def remember(self, scope: tuple[str, ...], sections: dict[str, _SectionMemo]) -> None:
+        if not sections:
+            return
+        with self._lock:
+            self._scopes[scope] = {**self._scopes.get(scope, {}), **sections}
+            self._scopes.move_to_end(scope)
+            while len(self._scopes) > self.max_scopes:
+                self._scopes.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._scopes.clear()
+
+
+session_state_localization_memo = SessionStateLocalizationMemo()
+
+
 @dataclass(frozen=True)
 class _TextTarget:
     path: tuple[Any, ...]
@@ -68,24 +145,64 @@ class _TextTarget:
     source_key: str
     source_text: str
     source_hash: str
+    world_shared: bool = False
 
 
-def localize_session_state(db: Session, model_router: ModelRouter, state: dict[str, Any]) -> dict[str, Any]:
-    payload = deepcopy(state)
-    player_profile = payload.get("player_profile") if isinstance(payload.get("player_profile"), dict) else {}
-    actor_id = str((player_profile or {}).get("actor_id") or payload.get("actor_id") or "").strip()
+def localize_session_state(
+    db: Session,
+    model_router: ModelRouter,
+    state: dict[str, Any],
+    *,
+    batch_executor: Executor | None = None,
+) -> dict[str, Any]:
+    player_profile = state.get("player_profile") if isinstance(state.get("player_profile"), dict) else {}
+    actor_id = str((player_profile or {}).get("actor_id") or state.get("actor_id") or "").strip()
     play_language = (player_profile or {}).get("play_language") if isinstance(player_profile, dict) else {}
     context = _localization_context(
-        world_id=str(payload.get("world_id") or ""),
+        world_id=str(state.get("world_id") or ""),
         actor_id=actor_id,
         play_language=play_language if isinstance(play_language, dict) else {},
     )
     if context is None:
-        return payload
+        return dict(state)
 
     targets: list[_TextTarget] = []
-    _collect_session_state_targets(payload, targets)
-    return _apply_localization(db, model_router, payload, context, targets)
+    _collect_session_state_targets(state, targets)
+    fingerprints = _section_fingerprints(targets)
+    scope = (context["world_id"], context["actor_id"], str(state.get("session_id") or ""), context["target_language"])
+    memo = session_state_localization_memo.sections(scope)
+    translations: dict[str, str] = {}
+    pending: list[_TextTarget] = []
+    for target in targets:
+        section = _section_name(target)
+        remembered = memo.get(section)
+        if remembered is not None and remembered.fingerprint == fingerprints[section]:
+            localized = remembered.translations.get(target.source_key)
+            if localized:
+                translations[target.source_key] = localized
+            continue
+        pending.append(target)
+    deduped = _dedupe_targets(pending)
+    if deduped:
+        translations.update(_translate_targets(db, model_router, context, deduped, batch_executor=batch_executor))
+        session_state_localization_memo.remember(
+            scope,
+            {
+                section: _SectionMemo(
+                    fingerprint=fingerprint,
+                    translations={
+                        target.source_key: translations[target.source_key]
+                        for target in targets
+                        if _section_name(target) == section
+                    },
+                )
+                for section, fingerprint in fingerprints.items()
+                if section not in memo or memo[section].fingerprint != fingerprint
+                # Sections with untranslated text stay out of the memo so the next poll retries them.
+                if all(target.source_key in translations for target in pending if _section_name(target) == section)
+            },
+        )
+    return _with_translations(state, targets, translations)
 
 
 def localize_turn_payload(
@@ -97,15 +214,33 @@ def localize_turn_payload(
     actor_id: str,
     play_language: dict[str, Any],
     generate_missing: bool = True,
+    on_cached: Callable[[dict[str, Any]], None] | None = None,
+    batch_executor: Executor | None = None,
 ) -> dict[str, Any]:
-    localized = deepcopy(payload)
+    """Localizes a player-facing turn payload.
+
+    ``on_cached`` receives a copy of the payload with only cached translations applied,
+    and only when missing segments still have to be generated, so callers can deliver the
+    cached part before the localization model call returns. ``batch_executor`` is the shared
+    pool missing-translation batches run on; without one they run one after another.
+    """
+
     context = _localization_context(world_id=world_id, actor_id=actor_id, play_language=play_language)
     if context is None:
-        return localized
+        return dict(payload)
 
     targets: list[_TextTarget] = []
-    _collect_turn_payload_targets(localized, targets)
-    return _apply_localization(db, model_router, localized, context, targets, generate_missing=generate_missing)
+    _collect_turn_payload_targets(payload, targets)
+    return _apply_localization(
+        db,
+        model_router,
+        payload,
+        context,
+        targets,
+        generate_missing=generate_missing,
+        on_cached=on_cached,
+        batch_executor=batch_executor,
+    )
 
 
 def _localization_context(
@@ -134,30 +269,195 @@ def _apply_localization(
     targets: list[_TextTarget],
     *,
     generate_missing: bool = True,
+    on_cached: Callable[[dict[str, Any]], None] | None = None,
+    batch_executor: Executor | None = None,
 ) -> dict[str, Any]:
     deduped = _dedupe_targets(targets)
     if not deduped:
-        return payload
+        return dict(payload)
+
+    def publish_cached(cached: dict[str, str]) -> None:
+        if on_cached is not None:
+            on_cached(_with_translations(payload, targets, cached))
+
+    translations = _translate_targets(
+        db,
+        model_router,
+        context,
+        deduped,
+        generate_missing=generate_missing,
+        before_generate=publish_cached,
+        batch_executor=batch_executor,
+    )
+    return _with_translations(payload, targets, translations)
+
 
+def _translate_targets(
+    db: Session,
+    model_router: ModelRouter,
+    context: dict[str, str],
+    targets: list[_TextTarget],
+    *,
+    generate_missing: bool = True,
+    before_generate: Callable[[dict[str, str]], None] | None = None,
+    batch_executor: Executor | None = None,
+) -> dict[str, str]:
     glossary = _glossary(db, context=context)
+    matcher = _glossary_matcher(glossary, context=context)
     cached = {
-        key: _apply_glossary_replacements(value, glossary)
-        for key, value in _cached_texts(db, context=context, targets=deduped).items()
+        key: _apply_glossary_matcher(value, matcher)
+        for key, value in _cached_texts(db, context=context, targets=targets).items()
     }
-    missing = [target for target in deduped if target.source_key not in cached]
+    missing = [target for target in targets if target.source_key not in cached]
+    if not missing or not generate_missing:
+        return cached
+    if before_generate is not None:
+        before_generate(cached)
+    generated = _generate_missing_in_batches(
+        db,
+        model_router,
+        context=context,
+        targets=missing,
+        glossary=glossary,
+        matcher=matcher,
+        batch_executor=batch_executor,
+    )
+    return {**cached, **generated}
+
+
+def _generate_missing_in_batches(
+    db: Session,
+    model_router: ModelRouter,
+    *,
+    context: dict[str, str],
+    targets: list[_TextTarget],
+    glossary: list[dict[str, str]],
+    matcher: GlossaryMatcher,
+    batch_executor: Executor | None = None,
+) -> dict[str, str]:
+    """Generates missing translations in token-bounded batches with partial success.
+
+    ``targets`` is the deduplicated list left after the cache lookup, cut into batches in
+    order. Batches run concurrently on ``batch_executor``, the app-wide pool that bounds
+    localization model calls across requests. Each batch is stored as soon as it returns, and
+    a batch that fails only loses its own strings; they stay uncached and are retried next
+    request.
+    """
+
+    settings = model_router.settings
+    batches = list(
+        _target_batches(
+            targets,
+            max_tokens=settings.localization_batch_max_tokens,
+            max_items=settings.localization_batch_max_items,
+        )
+    )
+
+    def generate(batch: list[_TextTarget]) -> tuple[dict[str, str], str]:
+        # The glossary and matcher are resolved up front, so workers never touch ``db``.
+        return _generate_missing(
+            db,
+            model_router,
+            context=context,
+            targets=batch,
+            glossary=_batch_glossary(glossary, batch),
+            matcher=matcher,
+        )
+
     generated: dict[str, str] = {}
-    model_id = ""
-    if missing and generate_missing:
-        generated, model_id = _generate_missing(db, model_router, context=context, targets=missing, glossary=glossary)
-        if generated:
-            _store_generated(db, context=context, targets=missing, generated=generated, model_id=model_id)
+    failed_batches = 0
+
+    def keep(batch: list[_TextTarget], batch_generated: dict[str, str], model_id: str) -> None:
+        nonlocal failed_batches
+        if not batch_generated:
+            failed_batches += 1
+            return
+        _store_generated(db, context=context, targets=batch, generated=batch_generated, model_id=model_id)
+        generated.update(batch_generated)
+
+    if batch_executor is None or len(batches) == 1:
+        for batch in batches:
+            keep(batch, *generate(batch))
+    else:
+        futures = {batch_executor.submit(copy_context().run, generate, batch): batch for batch in batches}
+        for future in as_completed(futures):
+            keep(futures[future], *future.result())
+    if failed_batches and len(batches) > 1:
+        logger.warning(
+            "play.localization kept %s of %s batches: world_id=%s target_language=%s targets=%s",
+            len(batches) - failed_batches,
+            len(batches),
+            context["world_id"],
+            context["target_language"],
+            len(targets),
+        )
+    return generated
+
 
-    translations = {**cached, **generated}
+def _target_batches(targets: list[_TextTarget], *, max_tokens: int, max_items: int) -> Iterator[list[_TextTarget]]:
+    """Cuts ``targets`` into consecutive batches under ``max_tokens`` estimated tokens and ``max_items`` items.
+
+    A single target larger than the budget still gets a batch of its own.
+    """
+
+    batch: list[_TextTarget] = []
+    batch_tokens = 0
     for target in targets:
-        localized = translations.get(target.source_key)
-        if localized:
-            _set_path(payload, target.path, localized)
-    return payload
+        # Key and kind travel with the text and are echoed back, so they count too.
+        tokens = estimate_tokens(target.source_text) + estimate_tokens(target.source_key) + estimate_tokens(target.source_kind)
+        if batch and (batch_tokens + tokens > max_tokens or len(batch) >= max_items):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(target)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+
+def _batch_glossary(glossary: list[dict[str, str]], batch: list[_TextTarget]) -> list[dict[str, str]]:
+    """Glossary entries whose source term occurs in the batch; the rest only inflate the prompt."""
+
+    text = "\n".join(target.source_text for target in batch).casefold()
+    selected: list[dict[str, str]] = []
+    for entry in glossary:
+        term = str(entry.get("source_text") or "").strip().casefold()
+        if term and term in text:
+            selected.append(entry)
+    return selected
+
+
+def _with_translations(source: dict[str, Any], targets: list[_TextTarget], translations: dict[str, str]) -> dict[str, Any]:
+    """Returns ``source`` with translations applied, copying only the containers on changed paths."""
+
+    localized = dict(source)
+    copied = {id(localized)}
+    for target in targets:
+        text = translations.get(target.source_key)
+        if not text:
+            continue
+        container: Any = localized
+        for part in target.path[:-1]:
+            child = container[part]
+            if id(child) not in copied:
+                child = list(child) if isinstance(child, list) else dict(child)
+                container[part] = child
+                copied.add(id(child))
+            container = child
+        container[target.path[-1]] = text
+    return localized
+
+
+def _section_name(target: _TextTarget) -> str:
+    return str(target.path[0])
+
+
+def _section_fingerprints(targets: list[_TextTarget]) -> dict[str, str]:
+    digests: dict[str, Any] = {}
+    for target in targets:
+        digest = digests.setdefault(_section_name(target), hashlib.sha256())
+        digest.update(repr(target.path).encode("utf-8"))
+        digest.update(target.source_key.encode("utf-8"))
+    return {section: digest.hexdigest() for section, digest in digests.items()}
 
 
 def _dedupe_targets(targets: list[_TextTarget]) -> list[_TextTarget]:
@@ -183,18 +483,30 @@ def _cached_texts(
         db.execute(
             select(PlayLocalizedTextCache).where(
                 PlayLocalizedTextCache.world_id == context["world_id"],
-                PlayLocalizedTextCache.actor_id_scope == context["actor_id"],
+                PlayLocalizedTextCache.actor_id_scope.in_((context["actor_id"], WORLD_SHARED_SCOPE)),
                 PlayLocalizedTextCache.target_language == context["target_language"],
-                PlayLocalizedTextCache.source_key.in_(keys),
                 PlayLocalizedTextCache.source_hash.in_(hashes),
             )
         ).scalars()
     )
-    return {
-        row.source_key: row.localized_text
-        for row in rows
-        if row.source_key in keys and row.source_hash in hashes and row.localized_text
-    }
+    actor_texts: dict[str, str] = {}
+    shared_texts: dict[tuple[str, str], str] = {}
+    for row in rows:
+        if not row.localized_text:
+            continue
+        if row.actor_id_scope == WORLD_SHARED_SCOPE:
+            shared_texts[(row.source_hash, row.source_kind)] = row.localized_text
+            shared_texts.setdefault((row.source_hash, ""), row.localized_text)
+        elif row.source_key in keys:
+            actor_texts[row.source_key] = row.localized_text
+    cached: dict[str, str] = {}
+    for target in targets:
+        localized = actor_texts.get(target.source_key)
+        if localized is None and target.world_shared:
+            localized = shared_texts.get((target.source_hash, target.source_kind)) or shared_texts.get((target.source_hash, ""))
+        if localized:
+            cached[target.source_key] = localized
+    return cached
 
 
 def _generate_missing(
@@ -204,9 +516,12 @@ def _generate_missing(
     context: dict[str, str],
     targets: list[_TextTarget],
     glossary: list[dict[str, str]] | None = None,
+    matcher: GlossaryMatcher | None = None,
 ) -> tuple[dict[str, str], str]:
     if glossary is None:
         glossary = _glossary(db, context=context)
+    if matcher is None:
+        matcher = _glossary_matcher(glossary, context=context)
     input_payload = {
         "target_language": context["target_language"],
         "items": [
@@ -251,7 +566,7 @@ def _generate_missing(
         return {}, ""
     allowed_keys = {target.source_key for target in targets}
     localized = {
-        item.key: _apply_glossary_replacements(item.localized_text.strip(), glossary)
+        item.key: _apply_glossary_matcher(item.localized_text.strip(), matcher)
         for item in outcome.final_payload.items
         if item.key in allowed_keys and item.localized_text.strip()
     }
@@ -270,37 +585,27 @@ def _generate_missing(
 
 
 def _apply_glossary_replacements(value: str, glossary: list[dict[str, str]]) -> str:
-    localized = value
-    entries = sorted(
-        (
-            (
-                str(entry.get("source_text") or "").strip(),
-                str(entry.get("localized_text") or "").strip(),
-            )
-            for entry in glossary
-            if isinstance(entry, dict)
-        ),
-        key=lambda item: len(item[0]),
-        reverse=True,
-    )
-    for source_text, localized_text in entries:
-        if not source_text or not localized_text or source_text == localized_text:
-            continue
-        localized = localized.replace(source_text, localized_text)
-    return _strip_player_visible_control_tokens(_collapse_glossary_prefix_duplication(localized, entries))
+    return _apply_glossary_matcher(value, _glossary_matcher(glossary))
 
 
-def _collapse_glossary_prefix_duplication(value: str, entries: list[tuple[str, str]]) -> str:
-    collapsed = value
-    for _source_text, localized_text in entries:
-        if not localized_text:
-            continue
-        for split_at in range(1, len(localized_text)):
-            prefix = localized_text[:split_at]
-            if not prefix or not localized_text[split_at:]:
-                continue
-            collapsed = collapsed.replace(f"{prefix}{localized_text}", localized_text)
-    return collapsed
+def _apply_glossary_matcher(value: str, matcher: GlossaryMatcher) -> str:
+    return _strip_player_visible_control_tokens(matcher.apply(value))
+
+
+def _glossary_matcher(glossary: list[dict[str, str]], *, context: dict[str, str] | None = None) -> GlossaryMatcher:
+    entries = tuple(
+        (
+            str(entry.get("source_text") or "").strip(),
+            str(entry.get("localized_text") or "").strip(),
+        )
+        for entry in glossary
+        if isinstance(entry, dict)
+    )
+    return _glossary_matchers.get(
+        world_id=(context or {}).get("world_id", ""),
+        target_language=(context or {}).get("target_language", ""),
+        entries=entries,
+    )
 
 
 def _strip_player_visible_control_tokens(value: str) -> str:
@@ -328,28 +633,41 @@ def _store_generated(
     model_id: str,
 ) -> None:
     target_by_key = {target.source_key: target for target in targets}
+    shared_rows: list[PlayLocalizedTextCache] = []
+    actor_rows: list[PlayLocalizedTextCache] = []
+    stored_shared: set[tuple[str, str]] = set()
     for key, localized_text in generated.items():
         target = target_by_key.get(key)
         if target is None:
             continue
-        db.add(
-            PlayLocalizedTextCache(
-                world_id=context["world_id"],
-                actor_id_scope=context["actor_id"],
-                target_language=context["target_language"],
-                source_kind=target.source_kind,
-                source_key=target.source_key,
-                source_hash=target.source_hash,
-                source_text=target.source_text,
-                localized_text=localized_text,
-                model_id=model_id or "unknown",
-                prompt_id=PROMPT_ID,
-            )
+        if target.world_shared:
+            shared_key = (target.source_kind, target.source_hash)
+            if shared_key in stored_shared:
+                continue
+            stored_shared.add(shared_key)
+        row = PlayLocalizedTextCache(
+            world_id=context["world_id"],
+            actor_id_scope=WORLD_SHARED_SCOPE if target.world_shared else context["actor_id"],
+            target_language=context["target_language"],
+            source_kind=target.source_kind,
+            source_key=target.source_hash if target.world_shared else target.source_key,
+            source_hash=target.source_hash,
+            source_text=target.source_text,
+            localized_text=localized_text,
+            model_id=model_id or "unknown",
+            prompt_id=PROMPT_ID,
         )
-    try:
-        db.commit()
-    except (IntegrityError, OperationalError):
-        db.rollback()
+        (shared_rows if target.world_shared else actor_rows).append(row)
+    # Shared rows commit on their own: another player may have stored the same world text
+    # first, and losing that race must not discard this actor's private translations.
+    for rows in (shared_rows, actor_rows):
+        if not rows:
+            continue
+        db.add_all(rows)
+        try:
+            db.commit()
+        except (IntegrityError, OperationalError):
+            db.rollback()
 
 
 def _glossary(db: Session, *, context: dict[str, str], limit: int = 80) -> list[dict[str, str]]:
@@ -359,7 +677,7 @@ def _glossary(db: Session, *, context: dict[str, str], limit: int = 80) -> list[
             select(PlayLocalizedTextCache)
             .where(
                 PlayLocalizedTextCache.world_id == context["world_id"],
-                PlayLocalizedTextCache.actor_id_scope == context["actor_id"],
+                PlayLocalizedTextCache.actor_id_scope.in_((context["actor_id"], WORLD_SHARED_SCOPE)),
                 PlayLocalizedTextCache.target_language == context["target_language"],
             )
             .order_by(PlayLocalizedTextCache.updated_at.desc(), PlayLocalizedTextCache.id.desc())
@@ -605,6 +923,7 @@ def _register_field(
             source_key=stable_key[:180],
             source_text=source_text,
             source_hash=source_hash,
+            world_shared=source_kind in WORLD_SHARED_SOURCE_KINDS,
         )
     )
 
@@ -636,10 +955,3 @@ def _get_path(root: Any, path: tuple[Any, ...]) -> Any:
                 return None
             value = value.get(part)
     return value
-
-
-def _set_path(root: Any, path: tuple[Any, ...], replacement: str) -> None:
-    value = root
-    for part in path[:-1]:
-        value = value[part]
-    value[path[-1]] = replacement
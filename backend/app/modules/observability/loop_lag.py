@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+
+from app.modules.observability.service import ObservabilityService
+
+
+class EventLoopLagMonitor:
+    """Measures how late the event loop wakes a sleeping probe task.
+
+    Anything that blocks the loop (synchronous DB or LLM calls inside ``async`` code) delays
+    every WebSocket and HTTP request on the worker; the probe sees the same delay as its
+    sleep overshooting ``interval_seconds``.
+    """
+
+    def __init__(self, observability_service: ObservabilityService, *, interval_seconds: float) -> None:
+        self.observability_service = observability_service
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.interval_seconds <= 0 or self.running:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._probe(), name="event-loop-lag-probe")
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled_at = loop.time()
+            await asyncio.sleep(self.interval_seconds)
+            self.observability_service.record_event_loop_lag(loop.time() - scheduled_at - self.interval_seconds)
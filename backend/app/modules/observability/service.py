@@ -75,6 +75,11 @@ class ObservabilityService:
             "shared_world_drift_count": 0.0,
             "shared_world_axis_drift_count": 0.0,
             "shared_world_memory_gap_count": 0.0,
+            "llm_circuit_open_count": 0.0,
+            "event_loop_lag_seconds": 0.0,
+            "event_loop_lag_max_seconds": 0.0,
+            "world_scheduler_backlog": 0.0,
+            "world_scheduler_scheduled_worlds": 0.0,
         }
         self._langfuse_last_error: str | None = None
         self._resource = Resource.create(
@@ -107,6 +112,9 @@ class ObservabilityService:
         self.llm_schema_valid = self.meter.create_counter("llm_schema_valid_count")
         self.llm_fallbacks = self.meter.create_counter("llm_fallback_count")
         self.release_gate_checks = self.meter.create_counter("release_gate_check_count")
+        self.llm_context_tokens_saved = self.meter.create_counter("llm_context_tokens_saved", unit="token")
+        self.event_loop_lag = self.meter.create_histogram("event_loop_lag", unit="s")
+        self.world_scheduler_tick_duration = self.meter.create_histogram("world_scheduler_tick_duration", unit="s")
 
         for name in (
             "projection_lag_seconds",
@@ -118,6 +126,11 @@ class ObservabilityService:
             "shared_world_drift_count",
             "shared_world_axis_drift_count",
             "shared_world_memory_gap_count",
+            "llm_circuit_open_count",
+            "event_loop_lag_seconds",
+            "event_loop_lag_max_seconds",
+            "world_scheduler_backlog",
+            "world_scheduler_scheduled_worlds",
         ):
             self.meter.create_observable_gauge(name, callbacks=[self._make_observer(name)])
 
@@ -516,6 +529,51 @@ class ObservabilityService:
         if used_fallback:
             self.llm_fallbacks.add(1, attributes)
 
+    def record_llm_context_trim(self, *, prompt_id: str, tokens_saved: int) -> None:
+        self.llm_context_tokens_saved.add(
+            tokens_saved,
+            {"prompt_id": prompt_id, "runtime_role": self.settings.app_runtime_role},
+        )
+
+    def record_event_loop_lag(self, lag_seconds: float) -> None:
+        lag_seconds = max(lag_seconds, 0.0)
+        with self._lock:
+            self._metric_state["event_loop_lag_seconds"] = lag_seconds
+            self._metric_state["event_loop_lag_max_seconds"] = max(self._metric_state["event_loop_lag_max_seconds"], lag_seconds)
+        self.event_loop_lag.record(lag_seconds, {"runtime_role": self.settings.app_runtime_role})
+
+    def record_world_scheduler_tick(self, *, duration_seconds: float, backlog: int, scheduled_worlds: int) -> None:
+        with self._lock:
+            self._metric_state["world_scheduler_backlog"] = float(backlog)
+            self._metric_state["world_scheduler_scheduled_worlds"] = float(scheduled_worlds)
+        self.world_scheduler_tick_duration.record(
+            max(duration_seconds, 0.0),
+            {"runtime_role": self.settings.app_runtime_role},
+        )
+
+    def record_llm_circuit_transition(
+        self,
+        *,
+        provider_name: str,
+        model_id: str,
+        previous_state: str,
+        state: str,
+        open_count: int,
+    ) -> None:
+        with self._lock:
+            self._metric_state["llm_circuit_open_count"] = float(open_count)
+        with self.span(
+            "llm.circuit_breaker",
+            attributes={
+                "provider_name": provider_name,
+                "model_id": model_id,
+                "circuit.previous_state": previous_state,
+                "circuit.state": state,
+                "runtime_role": self.settings.app_runtime_role,
+            },
+        ):
+            pass
+
     def record_projection_processing(
         self,
         *,
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.modules.session.progress import elapsed_ms_since
+
+
+ContextLoader = Callable[[Session, Mapping[str, Any]], Any]
+
+
+class ReadOnlyPrefetchSessionError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class ContextSource:
+    """One piece of turn context that can be loaded independently of the turn's own Session.
+
+    ``load`` receives a private, short-lived Session plus the values of the sources named in
+    ``after``. The Session is read-only: a flush raises, and it is closed without committing.
+    Optional sources that fail resolve to ``None`` instead of failing the prefetch.
+    ``model_call`` marks sources that wait on an LLM; they run on the prefetcher's model pool.
+    """
+
+    name: str
+    load: ContextLoader
+    after: tuple[str, ...] = ()
+    optional: bool = False
+    model_call: bool = False
+
+
+@dataclass
+class ContextPrefetchResult:
+    values: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, BaseException] = field(default_factory=dict)
+    elapsed_ms: dict[str, int] = field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+    def trace(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "source": name,
+                "status": "failed" if name in self.errors else "completed",
+                "elapsed_ms": elapsed_ms,
+            }
+            for name, elapsed_ms in self.elapsed_ms.items()
+        ]
+
+
+class ContextPrefetcher:
+    """Runs context sources concurrently, each on its own Session, honouring ``after`` edges.
+
+    Sources are only submitted once their dependencies have finished, so no worker ever blocks
+    waiting for another source and a shared pool cannot deadlock under concurrent turns.
+    Model-call sources go to ``model_executor`` when one is given, so seconds-long LLM calls
+    from busy turns never hold the workers other turns need for their database loads.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        executor: ThreadPoolExecutor,
+        model_executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.executor = executor
+        self.model_executor = model_executor or executor
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        if self.model_executor is not self.executor:
+            self.model_executor.shutdown(wait=True, cancel_futures=True)
+
+    def run(self, sources: Sequence[ContextSource]) -> ContextPrefetchResult:
+        by_name = {source.name: source for source in sources}
+        if len(by_name) != len(sources):
+            raise ValueError("Context source names must be unique")
+        for source in sources:
+            missing = [name for name in source.after if name not in by_name]
+            if missing:
+                raise ValueError(f"Context source {source.name!r} depends on unknown sources {missing}")
+
+        result = ContextPrefetchResult()
+        pending = dict(by_name)
+        running: dict[Future[Any], ContextSource] = {}
+        first_error: BaseException | None = None
+        while (pending and first_error is None) or running:
+            for name, source in list(pending.items()):
+                if first_error is not None:
+                    break
+                if any(dependency not in result.elapsed_ms for dependency in source.after):
+                    continue
+                pending.pop(name)
+                failed = [dependency for dependency in source.after if dependency in result.errors]
+                if failed:
+                    error = RuntimeError(f"Context source {name!r} skipped because {failed} failed")
+                    first_error = self._record(result, source, None, 0, error)
+                    continue
+                upstream = {dependency: result.values[dependency] for dependency in source.after}
+                executor = self.model_executor if source.model_call else self.executor
+                future = executor.submit(copy_context().run, self._load, source, upstream)
+                running[future] = source
+            if not running:
+                if pending and first_error is None:
+                    raise ValueError(f"Context sources form a cycle: {sorted(pending)}")
+                continue
+            done, _not_done = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                source = running.pop(future)
+                value, elapsed_ms, error = future.result()
+                first_error = first_error or self._record(result, source, value, elapsed_ms, error)
+        if first_error is not None:
+            raise first_error
+        return result
+
+    @staticmethod
+    def _record(
+        result: ContextPrefetchResult,
+        source: ContextSource,
+        value: Any,
+        elapsed_ms: int,
+        error: BaseException | None,
+    ) -> BaseException | None:
+        result.values[source.name] = value
+        result.elapsed_ms[source.name] = elapsed_ms
+        if error is None:
+            return None
+        result.errors[source.name] = error
+        return None if source.optional else error
+
+    def _load(self, source: ContextSource, upstream: Mapping[str, Any]) -> tuple[Any, int, BaseException | None]:
+        started_at = time.perf_counter()
+        try:
+            with self.session_factory() as db:
+                event.listen(db, "before_flush", _reject_flush)
+                value = source.load(db, upstream)
+        except Exception as exc:
+            return None, elapsed_ms_since(started_at), exc
+        return value, elapsed_ms_since(started_at), None
+
+
+def _reject_flush(session: Session, flush_context: Any, instances: Any) -> None:
+    raise ReadOnlyPrefetchSessionError("Context prefetch sessions are read-only")
@@ -42,6 +42,32 @@ def bind_turn_progress(callback: TurnProgressCallback | None) -> Iterator[None]:
         _turn_progress_callback.reset(token)
 
 
+@contextmanager
+def hold_turn_progress() -> Iterator[list[dict[str, object]]]:
+    """Binds a callback that holds progress back until the caller decides whether it counts.
+
+    Every update, ``started`` and streamed deltas included, is collected in the yielded list
+    for ``replay_turn_progress``, so work that may be thrown away never shows up as a stage
+    running out of order. Without a bound callback nothing is collected.
+    """
+
+    held: list[dict[str, object]] = []
+    with bind_turn_progress(held.append if _turn_progress_callback.get() is not None else None):
+        yield held
+
+
+def replay_turn_progress(payloads: list[dict[str, object]]) -> None:
+    callback = _turn_progress_callback.get()
+    if callback is None:
+        return
+    for payload in payloads:
+        callback(payload)
+
+
+def turn_progress_bound() -> bool:
+    return _turn_progress_callback.get() is not None
+
+
 def emit_turn_progress(
     *,
     phase: str,
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 import time
 import re
-from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Mapping
 from contextlib import contextmanager
-from contextvars import copy_context
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Iterable, Iterator
+from threading import Lock
+from typing import Any, Generic, Iterable, Iterator, TypeVar
 
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.container import AppContainer
@@ -32,7 +34,7 @@ from app.models.entities import (
     Turn,
     new_id,
 )
-from app.modules.world_pack.service import normalize_language_tag, resolve_world_pack
+from app.modules.world_pack.service import normalize_language_tag, pack_content_hash, resolve_world_pack
 from app.modules.world_state.ambient import list_local_figures, list_npc_locations
 from app.modules.actor.service import (
     ensure_relationship,
@@ -46,11 +48,14 @@ from app.modules.actor.service import (
 from app.modules.economy_sp.service import InsufficientSPError, SPMutationResult
 from app.modules.gm_council.service import CouncilRequest
 from app.modules.identity.oidc import UserIdentity
+from app.modules.localization.automaton import TermAutomaton
+from app.modules.session.prefetch import ContextSource
 from app.modules.session.progress import elapsed_ms_since, emit_turn_progress
-from app.modules.world_memory.service import build_retrieval_query_text, retrieval_trace_to_dict
+from app.modules.world_memory.service import MemoryRetrievalResult, build_retrieval_query_text, retrieval_trace_to_dict
 from app.modules.world_state.branch import BranchCommitDraft, BranchPressureEngine, ensure_route_pressures
 from app.modules.world_state.consequence import fallback_consequence_tags, scene_tone_for_band
 from app.modules.world_state.entity_generation import materialize_entity_drafts
+from app.modules.world_state.reference_version import world_reference_version
 from app.modules.world_state.rules import normalize_world_tags
 from app.modules.world_state.shared_consequence import SharedConsequenceResult, apply_shared_consequence_rules
 from app.modules.world_state.timeline import (
@@ -85,6 +90,8 @@ from app.modules.world_state.service import (
     materialize_state_drafts,
     quest_offer_repeats_resolution,
     record_quest_resolution_hint,
+    seeded_locations_by_key,
+    similar_live_quest_template_ids,
     travel_to_location,
     use_reward_item,
 )
@@ -143,6 +150,9 @@ def _evaluate_and_create_dynamic_quest_offers(
         pack_generation_context=pack_generation_context,
         current_location=current_location if isinstance(current_location, dict) else None,
         shared_world_context=shared_world_context if isinstance(shared_world_context, dict) else None,
+        similar_template_ids=similar_live_quest_template_ids(
+            db, world_id=world_id, session_state=session_state, offer=primary_offer
+        ),
     )
     followup_gate = evaluate_quest_emergence_gate(
         session_state=session_state,
@@ -155,6 +165,9 @@ def _evaluate_and_create_dynamic_quest_offers(
         pack_generation_context=pack_generation_context,
         current_location=current_location if isinstance(current_location, dict) else None,
         shared_world_context=shared_world_context if isinstance(shared_world_context, dict) else None,
+        similar_template_ids=similar_live_quest_template_ids(
+            db, world_id=world_id, session_state=session_state, offer=followup_offer
+        ),
     )
     gate_payload = {
         "primary": primary_gate,
@@ -848,6 +861,11 @@ def _persist_role_runs(
                     total_tokens=attempt.total_tokens,
                     prompt_cache_hit_tokens=attempt.prompt_cache_hit_tokens,
                     prompt_cache_miss_tokens=attempt.prompt_cache_miss_tokens,
+                    context_tokens_saved=(
+                        int(attempt.context_trimming["tokens_saved"]) if attempt.context_trimming is not None else None
+                    ),
+                    context_trimming=attempt.context_trimming,
+                    latency_ms=attempt.latency_ms,
                     input_hash=attempt.input_hash,
                     input_context_hash=attempt.input_context_hash,
                     schema_version=attempt.schema_version,
@@ -1276,10 +1294,34 @@ class CanonicalAliasMatch:
     language: str
 
 
+class _PublicAliasMatcher:
+    """Finds the normalized aliases a claim contains, or is contained in, in one scan each way."""
+
+    def __init__(self, aliases: list[str]) -> None:
+        self._aliases = aliases
+        self._order = {alias: position for position, alias in enumerate(aliases)}
+        self._automaton = TermAutomaton(aliases)
+        self._joined = "\0".join(aliases)
+        self._starts: list[int] = []
+        offset = 0
+        for alias in aliases:
+            self._starts.append(offset)
+            offset += len(alias) + 1
+
+    def related(self, normalized_claim: str) -> list[str]:
+        found = {alias for _start, alias in self._automaton.iter_matches(normalized_claim)}
+        position = self._joined.find(normalized_claim)
+        while position != -1:
+            found.add(self._aliases[bisect_right(self._starts, position) - 1])
+            position = self._joined.find(normalized_claim, position + 1)
+        return sorted(found, key=self._order.__getitem__)
+
+
 @dataclass
 class CanonicalPublicAliasIndex:
     locations: dict[str, list[CanonicalAliasMatch]] = field(default_factory=dict)
     location_aliases_by_key: dict[str, list[str]] = field(default_factory=dict)
+    _matcher: _PublicAliasMatcher | None = field(default=None, repr=False, compare=False)
 
     def add_location_alias(self, *, canonical_key: str, canonical_name: str, surface_text: str, language: str) -> None:
         text = str(surface_text or "").strip()
@@ -1298,6 +1340,8 @@ class CanonicalPublicAliasIndex:
         )
         normalized = _normalize_public_claim_text(text)
         if normalized:
+            if normalized not in self.locations:
+                self._matcher = None
             self.locations.setdefault(normalized, []).append(match)
         aliases = self.location_aliases_by_key.setdefault(canonical_key, [])
         if not _text_mentions_public_alias(text, aliases):
@@ -1308,9 +1352,8 @@ class CanonicalPublicAliasIndex:
         if not normalized_claim:
             return None
         candidates: list[CanonicalAliasMatch] = []
-        for normalized_alias, matches in self.locations.items():
-            if normalized_alias in normalized_claim or normalized_claim in normalized_alias:
-                candidates.extend(matches)
+        for normalized_alias in self.compiled()._matcher.related(normalized_claim):  # type: ignore[union-attr]
+            candidates.extend(self.locations[normalized_alias])
         if not candidates:
             return None
         deduped: dict[tuple[str, str], CanonicalAliasMatch] = {}
@@ -1328,6 +1371,56 @@ class CanonicalPublicAliasIndex:
     def aliases_for_location(self, canonical_key: str) -> list[str]:
         return _unique_public_aliases(self.location_aliases_by_key.get(canonical_key) or [])
 
+    def compiled(self) -> "CanonicalPublicAliasIndex":
+        if self._matcher is None:
+            self._matcher = _PublicAliasMatcher(list(self.locations))
+        return self
+
+    def copy(self) -> "CanonicalPublicAliasIndex":
+        # The matcher is shared until an alias with a new normalized form is added.
+        return CanonicalPublicAliasIndex(
+            locations={alias: list(matches) for alias, matches in self.locations.items()},
+            location_aliases_by_key={key: list(aliases) for key, aliases in self.location_aliases_by_key.items()},
+            _matcher=self._matcher,
+        )
+
+
+_CachedT = TypeVar("_CachedT")
+
+
+class _WorldVersionedCache(Generic[_CachedT]):
+    """One derived value per world, dropped as soon as the caller's version tuple moves."""
+
+    def __init__(self, max_worlds: int = 64) -> None:
+        self.max_worlds = max(max_worlds, 1)
+        self._entries: OrderedDict[str, tuple[tuple[Any, ...], _CachedT]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, world_id: str, version: tuple[Any, ...]) -> _CachedT | None:
+        with self._lock:
+            entry = self._entries.get(world_id)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(world_id)
+            return entry[1]
+
+    def put(self, world_id: str, version: tuple[Any, ...], value: _CachedT) -> None:
+        with self._lock:
+            self._entries[world_id] = (version, value)
+            self._entries.move_to_end(world_id)
+            while len(self._entries) > self.max_worlds:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Pack-derived location aliases per world, rebuilt when the pack or localization cache changes.
+_world_public_alias_indexes: _WorldVersionedCache[tuple[CanonicalPublicAliasIndex, str]] = _WorldVersionedCache()
+# Planner reference directories per world, also keyed by the world's reference version.
+_world_reference_directories: _WorldVersionedCache[tuple[dict[str, Any], ...]] = _WorldVersionedCache()
+
 
 def _name_matches_claim(name: str, claim: str) -> bool:
     name = name.strip()
@@ -1420,87 +1513,124 @@ def _public_glossary_aliases_for_text(db: Session, world_id: str, text: str) ->
     source = str(text or "").strip()
     if not source:
         return []
-    aliases: list[tuple[str, str]] = []
-    try:
-        pack, _template = resolve_world_pack(db, world_id)
-    except Exception:
-        pack = None
-    if pack is not None:
-        aliases.append((pack.manifest.source_language, source))
-        for item in pack.localization.glossary:
-            source_text = str(item.source_text or "").strip()
-            localized_text = str(item.localized_text or "").strip()
-            if source_text == source or localized_text == source:
-                aliases.extend(
-                    [
-                        (pack.manifest.source_language, source_text),
-                        (item.target_language, localized_text),
-                    ]
-                )
-    rows = db.execute(
-        select(PlayLocalizedTextCache).where(
-            PlayLocalizedTextCache.world_id == world_id,
-            PlayLocalizedTextCache.source_text == source,
-        )
-    ).scalars()
-    for row in rows:
-        aliases.extend([("unknown", row.source_text), (row.target_language, row.localized_text)])
-    rows = db.execute(
-        select(PlayLocalizedTextCache).where(
-            PlayLocalizedTextCache.world_id == world_id,
-            PlayLocalizedTextCache.localized_text == source,
+    return _public_glossary_aliases_for_texts(db, world_id, [source]).get(source, [])
+
+
+def _public_glossary_aliases_for_texts(
+    db: Session,
+    world_id: str,
+    texts: Iterable[str],
+    *,
+    pack: Any | None = None,
+) -> dict[str, list[tuple[str, str]]]:
+    sources = list(dict.fromkeys(str(text or "").strip() for text in texts if str(text or "").strip()))
+    if not sources:
+        return {}
+    if pack is None:
+        try:
+            pack, _template = resolve_world_pack(db, world_id)
+        except Exception:
+            pack = None
+    rows = list(
+        db.execute(
+            select(PlayLocalizedTextCache).where(
+                PlayLocalizedTextCache.world_id == world_id,
+                or_(
+                    PlayLocalizedTextCache.source_text.in_(sources),
+                    PlayLocalizedTextCache.localized_text.in_(sources),
+                ),
+            )
+        ).scalars()
+    )
+    aliases_by_source: dict[str, list[tuple[str, str]]] = {}
+    for source in sources:
+        aliases: list[tuple[str, str]] = []
+        if pack is not None:
+            aliases.append((pack.manifest.source_language, source))
+            for item in pack.localization.glossary:
+                source_text = str(item.source_text or "").strip()
+                localized_text = str(item.localized_text or "").strip()
+                if source_text == source or localized_text == source:
+                    aliases.extend(
+                        [
+                            (pack.manifest.source_language, source_text),
+                            (item.target_language, localized_text),
+                        ]
+                    )
+        for column in ("source_text", "localized_text"):
+            for row in rows:
+                if getattr(row, column) == source:
+                    aliases.extend([("unknown", row.source_text), (row.target_language, row.localized_text)])
+        deduped: list[tuple[str, str]] = []
+        seen: set[tuple[str, str]] = set()
+        for language, alias in aliases:
+            alias_text = str(alias or "").strip()
+            if not alias_text:
+                continue
+            key = (str(language or "unknown"), _normalize_public_claim_text(alias_text))
+            if key in seen:
+                continue
+            deduped.append((str(language or "unknown"), alias_text))
+            seen.add(key)
+        aliases_by_source[source] = deduped
+    return aliases_by_source
+
+
+def _localized_text_cache_version(db: Session, world_id: str) -> tuple[Any, ...]:
+    row = db.execute(
+        select(func.count(PlayLocalizedTextCache.id), func.max(PlayLocalizedTextCache.updated_at)).where(
+            PlayLocalizedTextCache.world_id == world_id
         )
-    ).scalars()
-    for row in rows:
-        aliases.extend([("unknown", row.source_text), (row.target_language, row.localized_text)])
-    deduped: list[tuple[str, str]] = []
-    seen: set[tuple[str, str]] = set()
-    for language, alias in aliases:
-        text = str(alias or "").strip()
-        if not text:
-            continue
-        key = (str(language or "unknown"), _normalize_public_claim_text(text))
-        if key in seen:
-            continue
-        deduped.append((str(language or "unknown"), text))
-        seen.add(key)
-    return deduped
+    ).one()
+    return (int(row[0] or 0), row[1])
 
 
-def _build_canonical_public_alias_index(db: Session, world_id: str, session_state: dict[str, Any]) -> CanonicalPublicAliasIndex:
-    index = CanonicalPublicAliasIndex()
+def _world_public_alias_index(db: Session, world_id: str) -> tuple[CanonicalPublicAliasIndex, str]:
     try:
         pack, template = resolve_world_pack(db, world_id)
-        source_language = pack.manifest.source_language
     except Exception:
-        pack = None
-        template = None
-        source_language = "en"
-
-    if template is not None:
-        for location_key, pack_location in template.locations.items():
-            location_name = str(pack_location.name or location_key)
-            index.add_location_alias(
-                canonical_key=location_key,
-                canonical_name=location_name,
-                surface_text=location_name,
-                language=source_language,
-            )
-            for language, aliases in _normalize_aliases_by_language(pack_location.public_aliases).items():
-                for alias in aliases:
-                    index.add_location_alias(
-                        canonical_key=location_key,
-                        canonical_name=location_name,
-                        surface_text=alias,
-                        language=language,
-                    )
-            for language, alias in _public_glossary_aliases_for_text(db, world_id, location_name):
+        return CanonicalPublicAliasIndex(), "en"
+    # The content hash, not the object ids: CPython reuses ids once a reload frees the old pack.
+    version = (pack_content_hash(pack, template.template_id), *_localized_text_cache_version(db, world_id))
+    cached = _world_public_alias_indexes.get(world_id, version)
+    if cached is not None:
+        return cached
+
+    source_language = pack.manifest.source_language
+    index = CanonicalPublicAliasIndex()
+    location_names = {location_key: str(pack_location.name or location_key) for location_key, pack_location in template.locations.items()}
+    glossary_aliases = _public_glossary_aliases_for_texts(db, world_id, location_names.values(), pack=pack)
+    for location_key, pack_location in template.locations.items():
+        location_name = location_names[location_key]
+        index.add_location_alias(
+            canonical_key=location_key,
+            canonical_name=location_name,
+            surface_text=location_name,
+            language=source_language,
+        )
+        for language, aliases in _normalize_aliases_by_language(pack_location.public_aliases).items():
+            for alias in aliases:
                 index.add_location_alias(
                     canonical_key=location_key,
                     canonical_name=location_name,
                     surface_text=alias,
                     language=language,
                 )
+        for language, alias in glossary_aliases.get(location_name.strip(), []):
+            index.add_location_alias(
+                canonical_key=location_key,
+                canonical_name=location_name,
+                surface_text=alias,
+                language=language,
+            )
+    index.compiled()
+    _world_public_alias_indexes.put(world_id, version, (index, source_language))
+    return index, source_language
+
+
+def _build_canonical_public_alias_index(db: Session, world_id: str, session_state: dict[str, Any]) -> CanonicalPublicAliasIndex:
+    world_index, source_language = _world_public_alias_index(db, world_id)
+    index = world_index.copy()
 
     for route in session_state.get("nearby_routes") or []:
         if not isinstance(route, dict):
@@ -1531,7 +1661,7 @@ def _build_canonical_public_alias_index(db: Session, world_id: str, session_stat
 
 def _location_public_aliases(db: Session, world_id: str, *, location_key: str, location_name: str) -> list[str]:
     aliases: list[Any] = [location_name]
-    location = get_location_by_key(db, world_id, location_key) if location_key else None
+    location = seeded_locations_by_key(db, world_id).get(location_key) if location_key else None
     if location is not None:
         state = dict(location.state or {})
         aliases.extend([location.name, state.get("source_name"), *_flatten_public_aliases(state.get("public_aliases"))])
@@ -1697,8 +1827,12 @@ def _destination_opportunities_for_route(db: Session, *, world_id: str, destinat
 
 
 def _public_alias_map_for_text(db: Session, world_id: str, text: str) -> dict[str, list[str]]:
+    return _public_alias_map(_public_glossary_aliases_for_text(db, world_id, text))
+
+
+def _public_alias_map(glossary_aliases: Iterable[tuple[str, str]]) -> dict[str, list[str]]:
     aliases_by_language: dict[str, list[str]] = {}
-    for language, alias in _public_glossary_aliases_for_text(db, world_id, text):
+    for language, alias in glossary_aliases:
         alias_text = str(alias or "").strip()
         language_key = str(language or "unknown").strip() or "unknown"
         if not alias_text:
@@ -1715,25 +1849,28 @@ def _enrich_public_figures_with_aliases(
     world_id: str,
     figures: Iterable[dict[str, Any]],
 ) -> list[dict[str, Any]]:
+    figure_list = [figure for figure in figures if isinstance(figure, dict)]
+    source_names = [_public_figure_source_name(figure) for figure in figure_list]
+    glossary_aliases = _public_glossary_aliases_for_texts(db, world_id, source_names)
     enriched_figures: list[dict[str, Any]] = []
-    for figure in figures:
-        if not isinstance(figure, dict):
-            continue
-        source_name = str(figure.get("source_name") or figure.get("display_name") or figure.get("name") or "").strip()
+    for figure, source_name in zip(figure_list, source_names):
         if not source_name:
             enriched_figures.append(dict(figure))
             continue
-        aliases = _public_alias_map_for_text(db, world_id, source_name)
         enriched_figures.append(
             {
                 **figure,
                 "source_name": source_name,
-                "public_aliases": aliases,
+                "public_aliases": _public_alias_map(glossary_aliases.get(source_name, [])),
             }
         )
     return enriched_figures
 
 
+def _public_figure_source_name(figure: dict[str, Any]) -> str:
+    return str(figure.get("source_name") or figure.get("display_name") or figure.get("name") or "").strip()
+
+
 def _enrich_public_turn_session_state(
     db: Session,
     *,
@@ -1873,74 +2010,116 @@ def _build_world_reference_directory(
 
     The planner contract also accepts the thing/event categories, but those have no
     canonical entity table to resolve against here; such references simply do not
-    resolve and are dropped (no hallucinated card), which is the intended fail-safe."""
-    directory: list[dict[str, Any]] = []
+    resolve and are dropped (no hallucinated card), which is the intended fail-safe.
+
+    The directory is memoized per world until the world's reference version (NPC
+    placement, generated entities), the pack or the localization cache changes."""
+    try:
+        pack, template = resolve_world_pack(db, world_id)
+    except Exception:
+        pack, template = None, None
+    reference_version = world_reference_version(db, world_id)
+    if reference_version is None:
+        # This session has roster writes other sessions cannot see yet; build without caching.
+        directory = _compile_world_reference_directory(db, world_id=world_id, pack=pack, template=template)
+        return [{**entry, "aliases": list(entry["aliases"])} for entry in directory]
+    version = (
+        reference_version,
+        pack_content_hash(pack, template.template_id) if pack is not None and template is not None else None,
+        *_localized_text_cache_version(db, world_id),
+    )
+    directory = _world_reference_directories.get(world_id, version)
+    if directory is None:
+        directory = _compile_world_reference_directory(db, world_id=world_id, pack=pack, template=template)
+        _world_reference_directories.put(world_id, version, directory)
+    return [{**entry, "aliases": list(entry["aliases"])} for entry in directory]
+
+
+def _compile_world_reference_directory(
+    db: Session,
+    *,
+    world_id: str,
+    pack: Any | None,
+    template: Any | None,
+) -> tuple[dict[str, Any], ...]:
+    npcs = [npc for npc in list_npc_locations(db, world_id) if isinstance(npc, dict)]
+    factions = list(
+        db.execute(
+            select(Faction).where(Faction.world_id == world_id, Faction.status == "active")
+        ).scalars()
+    )
+    place_aliases: dict[str, list[Any]] = {}
+    locations_by_key = seeded_locations_by_key(db, world_id) if template is not None else {}
+    for location_key, pack_location in (template.locations.items() if template is not None else ()):
+        location_name = str(pack_location.name or location_key).strip()
+        if not location_name:
+            continue
+        aliases: list[Any] = [location_name]
+        location = locations_by_key.get(location_key)
+        if location is not None:
+            state = dict(location.state or {})
+            aliases.extend([location.name, state.get("source_name"), *_flatten_public_aliases(state.get("public_aliases"))])
+        aliases.extend([pack_location.name, *_flatten_public_aliases(pack_location.public_aliases)])
+        place_aliases[location_key] = aliases
 
-    npc_figures = _enrich_public_figures_with_aliases(
+    glossary_aliases = _public_glossary_aliases_for_texts(
         db,
-        world_id=world_id,
-        figures=[npc for npc in list_npc_locations(db, world_id) if isinstance(npc, dict)],
+        world_id,
+        [
+            *(_public_figure_source_name(npc) for npc in npcs),
+            *(str(alias or "") for aliases in place_aliases.values() for alias in aliases),
+            *(str(faction.name or "") for faction in factions),
+        ],
+        pack=pack,
     )
-    for npc in npc_figures:
-        name = str(npc.get("source_name") or npc.get("display_name") or "").strip()
+
+    def glossary_texts(value: Any) -> list[str]:
+        return [alias for _language, alias in glossary_aliases.get(str(value or "").strip(), [])]
+
+    directory: list[dict[str, Any]] = []
+    for npc in npcs:
+        name = _public_figure_source_name(npc)
         if not name:
             continue
+        figure = {**npc, "source_name": name, "public_aliases": _public_alias_map(glossary_aliases.get(name, []))}
         directory.append(
             {
                 "name": name,
                 "category": "person",
-                "aliases": _public_figure_aliases(npc),
+                "aliases": _public_figure_aliases(figure),
                 "summary": str(npc.get("summary") or "").strip(),
                 "actor_id": npc.get("actor_id"),
                 "location_id": npc.get("location_id"),
             }
         )
 
-    try:
-        _pack, template = resolve_world_pack(db, world_id)
-    except Exception:
-        template = None
-    if template is not None:
-        for location_key, pack_location in template.locations.items():
-            location_name = str(pack_location.name or location_key).strip()
-            if not location_name:
-                continue
-            location = get_location_by_key(db, world_id, location_key)
-            aliases = _location_public_aliases(
-                db, world_id, location_key=location_key, location_name=location_name
-            )
-            directory.append(
-                {
-                    "name": location_name,
-                    "category": "place",
-                    "aliases": aliases,
-                    "summary": str(pack_location.description or "").strip(),
-                    "location_id": location.id if location is not None else None,
-                }
-            )
+    for location_key, aliases in place_aliases.items():
+        pack_location = template.locations[location_key]
+        location = locations_by_key.get(location_key)
+        directory.append(
+            {
+                "name": str(aliases[0]),
+                "category": "place",
+                "aliases": _unique_public_aliases([*aliases, *(text for alias in aliases for text in glossary_texts(alias))]),
+                "summary": str(pack_location.description or "").strip(),
+                "location_id": location.id if location is not None else None,
+            }
+        )
 
-    factions = list(
-        db.execute(
-            select(Faction).where(Faction.world_id == world_id, Faction.status == "active")
-        ).scalars()
-    )
     for faction in factions:
         name = str(faction.name or "").strip()
         if not name:
             continue
-        aliases = _unique_public_aliases(
-            [name, *[alias for _language, alias in _public_glossary_aliases_for_text(db, world_id, name)]]
-        )
         directory.append(
             {
                 "name": name,
                 "category": "faction",
-                "aliases": aliases,
+                "aliases": _unique_public_aliases([name, *glossary_texts(name)]),
                 "summary": str(faction.description or "").strip(),
             }
         )
 
-    return directory
+    return tuple(directory)
 
 
 def _match_reference_directory_entry(
@@ -2523,6 +2702,62 @@ def _consistency_interventions_from_addressed_absent(
     return interventions
 
 
+def _public_turn_context_sources(
+    container: AppContainer,
+    *,
+    world_id: str,
+    input_text: str,
+    session_state: dict[str, Any],
+    fallback_location_id: str,
+    planner_request: CouncilRequest,
+) -> list[ContextSource]:
+    def load_memory_retrieval(db: Session, upstream: Mapping[str, Any]) -> tuple[str, MemoryRetrievalResult]:
+        detected_route = _match_visible_route_by_public_text(
+            db,
+            world_id=world_id,
+            session_state=session_state,
+            claim_text="",
+            player_action_text=input_text,
+            alias_index=upstream["alias_index"],
+        )
+        location_id = _visible_route_destination_id(detected_route or {}) or fallback_location_id
+        retrieval = container.memory_service.search(
+            db,
+            world_id=world_id,
+            query_text=_retrieval_query_for_public_turn(
+                input_text=input_text,
+                session_state=session_state,
+                detected_route=detected_route,
+            ),
+            actor_id=None,
+            location_id=location_id,
+        )
+        return location_id, retrieval
+
+    return [
+        ContextSource(
+            "alias_index",
+            lambda db, _upstream: _build_canonical_public_alias_index(db, world_id, session_state),
+        ),
+        ContextSource(
+            "world_directory",
+            lambda db, _upstream: _build_world_reference_directory(db, world_id=world_id, session_state=session_state),
+        ),
+        ContextSource("memory_retrieval", load_memory_retrieval, after=("alias_index",)),
+        # fail-open: a planner failure degrades to baseline-only context.
+        ContextSource(
+            "context_plan",
+            lambda _db, upstream: container.council_service.plan_context(
+                planner_request,
+                world_directory=upstream["world_directory"],
+            ),
+            after=("world_directory",),
+            optional=True,
+            model_call=True,
+        ),
+    ]
+
+
 def _resolve_public_ai_gm_turn_for_session(
     db: Session,
     container: AppContainer,
@@ -2561,21 +2796,6 @@ def _resolve_public_ai_gm_turn_for_session(
         actor_id=player_actor.id,
         session_state=session_state,
     )
-    alias_index = _build_canonical_public_alias_index(db, game_session.world_id, session_state)
-    detected_route = _match_visible_route_by_public_text(
-        db,
-        world_id=game_session.world_id,
-        session_state=session_state,
-        claim_text="",
-        player_action_text=input_text,
-        alias_index=alias_index,
-    )
-    retrieval_location_id = _visible_route_destination_id(detected_route or {}) or prepared.location_id
-    world_directory = _build_world_reference_directory(
-        db,
-        world_id=game_session.world_id,
-        session_state=session_state,
-    )
     planner_request = CouncilRequest(
         world_id=game_session.world_id,
         turn_id=turn.id,
@@ -2589,36 +2809,23 @@ def _resolve_public_ai_gm_turn_for_session(
         graph_context_status="public_context",
         session_state=session_state,
     )
-    # Run the baseline semantic retrieval and the context planner concurrently so the
-    # planner's lite_lane latency is largely hidden behind the baseline embedding search.
+    # Prefetch the public turn context concurrently, each source on its own read-only session.
+    # The context planner's lite_lane latency is largely hidden behind the baseline embedding search.
     _ = container.model_router.provider
-    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="public-turn-context") as executor:
-        retrieval_context = copy_context()
-        planner_context = copy_context()
-        retrieval_future = executor.submit(
-            retrieval_context.run,
-            container.memory_service.search,
-            db,
+    prefetch = container.context_prefetcher.run(
+        _public_turn_context_sources(
+            container,
             world_id=game_session.world_id,
-            query_text=_retrieval_query_for_public_turn(
-                input_text=input_text,
-                session_state=session_state,
-                detected_route=detected_route,
-            ),
-            actor_id=None,
-            location_id=retrieval_location_id,
-        )
-        planner_future = executor.submit(
-            planner_context.run,
-            container.council_service.plan_context,
-            planner_request,
-            world_directory=world_directory,
+            input_text=input_text,
+            session_state=session_state,
+            fallback_location_id=prepared.location_id,
+            planner_request=planner_request,
         )
-        retrieval = retrieval_future.result()
-        try:
-            context_plan = planner_future.result()
-        except Exception:
-            context_plan = None
+    )
+    world_directory = prefetch["world_directory"]
+    retrieval_location_id, retrieval = prefetch["memory_retrieval"]
+    context_plan = prefetch["context_plan"]
+    context_prefetch_trace = prefetch.trace()
 
     planner_role_run = context_plan.role_run if context_plan is not None else None
     referenced_context: list[dict[str, Any]] = []
@@ -2685,6 +2892,7 @@ def _resolve_public_ai_gm_turn_for_session(
                 "failure_reason_code": resolution.failure_reason or "repair_failed",
                 "rejection_role": resolution.rejection_role,
                 "retrieval_trace": retrieval_trace_to_dict(retrieval.trace),
+                "context_prefetch": context_prefetch_trace,
                 "council_trace": [
                     {
                         "role": item.council_role,
@@ -2753,6 +2961,7 @@ def _resolve_public_ai_gm_turn_for_session(
                     "failure_reason_code": "repair_failed",
                     "rejected_claims": dry_run_harness_result["rejected_claims"],
                     "retrieval_trace": retrieval_trace_to_dict(retrieval.trace),
+                    "context_prefetch": context_prefetch_trace,
                     "council_trace": [
                         {
                             "role": item.council_role,
@@ -3066,6 +3275,7 @@ def _resolve_public_ai_gm_turn_for_session(
         "player_action_text": input_text,
         "used_fallback": resolution.used_fallback,
         "retrieval_trace": retrieval_trace_to_dict(retrieval.trace),
+        "context_prefetch": context_prefetch_trace,
         "narrative": payload.narrative,
         "npc_reaction": payload.npc_reaction,
         "graph_context_status": "public_context",
@@ -3445,6 +3655,7 @@ def _resolve_narrative_turn_for_session(
                 "retrieval_trace": retrieval_trace_to_dict(retrieval.trace),
                 "failure_reason": resolution.failure_reason,
                 "rejection_role": resolution.rejection_role,
+                "council_schedule": resolution.council_schedule,
                 "council_trace": [
                     {
                         "role": item.council_role,
@@ -3804,6 +4015,7 @@ def _resolve_narrative_turn_for_session(
         "skipped_shared_resources": skipped_resources,
         "scene_move": getattr(payload, "scene_move", None),
         "scene_pressure": getattr(payload, "scene_pressure", None),
+        "council_schedule": resolution.council_schedule,
         "council_trace": [
             {
                 "role": item.council_role,
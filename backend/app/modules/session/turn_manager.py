@@ -77,10 +77,14 @@ class TurnResolutionManager:
             event_name = payload.get("event")
             if isinstance(event_name, str) and event_name:
                 event_data = payload.get("data")
+                event_data = dict(event_data) if isinstance(event_data, dict) else {}
+                if event_name == "turn.narrative.delta":
+                    # Provider streams do not know the turn they belong to.
+                    event_data["turn_id"] = event_data.get("turn_id") or self.turn_id
                 await realtime_hub.emit_with_world_context(
                     self.session_id,
                     event_name,
-                    event_data if isinstance(event_data, dict) else {},
+                    event_data,
                     self.world_context,
                 )
                 continue
@@ -40,6 +40,7 @@ from app.modules.world_state.service import (
     ensure_world,
 )
 from app.modules.world_state.shared_consequence import ensure_shared_world_seed
+from app.modules.world_state.snapshot import bump_world_state_version
 from app.modules.world_state.timeline import canonicalize_event
 
 
@@ -439,6 +440,7 @@ def _cleanup_existing_pack_preprocess_artifacts(
         db.execute(delete(Turn).where(Turn.world_id == world_id, Turn.id.in_(turn_ids)))
     if session_ids:
         db.execute(delete(GameSession).where(GameSession.world_id == world_id, GameSession.id.in_(session_ids)))
+    bump_world_state_version(db, world_id)
     db.flush()
 
 
@@ -9,6 +9,7 @@ import shutil
 import tarfile
 import tempfile
 from typing import Any, Literal, Mapping
+import weakref
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
@@ -1406,7 +1407,22 @@ def template_world_id(template: WorldTemplateDefinition) -> str:
     return str((template.world or {}).get("world_id") or template.template_id).strip()
 
 
+# Loaded packs are immutable until the registry reloads them into new objects, so the content
+# hash the turn gate compares on every request is computed once per pack object and template.
+_pack_content_hashes: dict[tuple[int, str], tuple[weakref.ref[LoadedWorldPack], str]] = {}
+
+
 def pack_content_hash(pack: LoadedWorldPack, template_id: str) -> str:
+    key = (id(pack), template_id)
+    cached = _pack_content_hashes.get(key)
+    if cached is not None and cached[0]() is pack:
+        return cached[1]
+    digest = _compute_pack_content_hash(pack, template_id)
+    _pack_content_hashes[key] = (weakref.ref(pack, lambda _ref: _pack_content_hashes.pop(key, None)), digest)
+    return digest
+
+
+def _compute_pack_content_hash(pack: LoadedWorldPack, template_id: str) -> str:
     template = pack.template(template_id)
     payload = {
         "manifest": {
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from contextlib import nullcontext
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
-from sqlalchemy import func, or_, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
@@ -28,6 +28,7 @@ from app.models.entities import (
 from app.modules.actor.service import adjust_relationship_strength, normalize_play_language
 from app.modules.llm_harness.service import CouncilRoleRun, ModelRouter, PromptExecutionOutcome
 from app.modules.world_memory.service import MemoryService, build_retrieval_query_text
+from app.modules.world_state.reference_version import bump_world_reference_version
 from app.modules.world_state.consequence import relationship_band, relationship_summary, thread_summary, thread_title
 from app.modules.world_state.branch import BranchPressureEngine
 from app.modules.world_state.scene import SceneFrameEngine
@@ -727,6 +728,12 @@ def _pick_murmur_thread_type(session_state: dict[str, Any]) -> Literal["rumor",
     return "rumor" if "promise" in thread_types else "scrutiny"
 
 
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
 def _memory_payload(memory: Memory) -> dict[str, Any]:
     return {
         "id": memory.id,
@@ -753,44 +760,91 @@ class AmbientWorldPassService:
 
     def due_world_ids(self, db: Session) -> list[str]:
         now = datetime.now(timezone.utc)
-        sessions = list(
-            db.execute(
-                select(GameSession)
-                .where(GameSession.status == "active")
-                .order_by(GameSession.updated_at.desc(), GameSession.id.asc())
-            ).scalars()
+        return [world_id for world_id, due_at in self._idle_pass_due_rows(db) if due_at <= now]
+
+    def active_world_ids(self, db: Session) -> list[str]:
+        return sorted(
+            set(db.execute(select(GameSession.world_id).where(GameSession.status == "active").distinct()).scalars())
         )
-        due_worlds: list[str] = []
-        seen_worlds: set[str] = set()
-        for game_session in sessions:
-            if game_session.world_id in seen_worlds:
-                continue
-            seen_worlds.add(game_session.world_id)
-            last_turn = db.execute(
-                select(Turn)
-                .where(Turn.world_id == game_session.world_id, Turn.action_type != "system")
-                .order_by(Turn.created_at.desc(), Turn.id.desc())
-                .limit(1)
-            ).scalar_one_or_none()
-            last_activity_at = last_turn.created_at if last_turn is not None else game_session.created_at
-            if (now - last_activity_at).total_seconds() < self.settings.world_idle_grace_seconds:
-                continue
-            last_tick = db.execute(
-                select(WorldTick)
-                .where(
-                    WorldTick.world_id == game_session.world_id,
-                    WorldTick.tick_kind == "idle_world_pass",
-                    WorldTick.status == "completed",
-                )
-                .order_by(WorldTick.completed_at.desc(), WorldTick.created_at.desc(), WorldTick.id.desc())
-                .limit(1)
-            ).scalar_one_or_none()
-            if last_tick is not None:
-                last_tick_at = last_tick.completed_at or last_tick.created_at
-                if (now - last_tick_at).total_seconds() < self.settings.world_idle_interval_seconds:
-                    continue
-            due_worlds.append(game_session.world_id)
-        return due_worlds
+
+    def idle_pass_due_at(self, db: Session, world_id: str) -> datetime | None:
+        """When the world's next idle pass is due, or ``None`` once it has no active session."""
+
+        rows = self._idle_pass_due_rows(db, world_id=world_id)
+        return rows[0][1] if rows else None
+
+    def idle_pass_due_times(self, db: Session) -> dict[str, datetime]:
+        """Next idle-pass due time for every world with an active session, in one query."""
+
+        return dict(self._idle_pass_due_rows(db))
+
+    def _idle_pass_due_rows(self, db: Session, *, world_id: str | None = None) -> list[tuple[str, datetime]]:
+        """Due times per active world, ordered like the most recently updated active session.
+
+        Each world's due time is the later of its last non-system turn (or, without turns, the
+        creation of its most recently updated active session) plus the grace period, and its
+        last completed idle pass plus the interval. All three inputs come from one grouped query
+        with window functions, so the cost no longer grows with one round trip per world.
+        """
+
+        session_rank = func.row_number().over(
+            partition_by=GameSession.world_id,
+            order_by=(GameSession.updated_at.desc(), GameSession.id.asc()),
+        )
+        session_filters = [GameSession.status == "active"]
+        turn_filters = [Turn.action_type != "system"]
+        tick_filters = [WorldTick.tick_kind == "idle_world_pass", WorldTick.status == "completed"]
+        if world_id is not None:
+            session_filters.append(GameSession.world_id == world_id)
+            turn_filters.append(Turn.world_id == world_id)
+            tick_filters.append(WorldTick.world_id == world_id)
+        sessions = (
+            select(
+                GameSession.world_id,
+                GameSession.id,
+                GameSession.created_at,
+                GameSession.updated_at,
+                session_rank.label("session_rank"),
+            )
+            .where(*session_filters)
+            .subquery()
+        )
+        last_turns = (
+            select(Turn.world_id, func.max(Turn.created_at).label("last_turn_at"))
+            .where(*turn_filters)
+            .group_by(Turn.world_id)
+            .subquery()
+        )
+        tick_rank = func.row_number().over(
+            partition_by=WorldTick.world_id,
+            order_by=(WorldTick.completed_at.desc(), WorldTick.created_at.desc(), WorldTick.id.desc()),
+        )
+        ticks = (
+            select(
+                WorldTick.world_id,
+                func.coalesce(WorldTick.completed_at, WorldTick.created_at).label("last_tick_at"),
+                tick_rank.label("tick_rank"),
+            )
+            .where(*tick_filters)
+            .subquery()
+        )
+        rows = db.execute(
+            select(sessions.c.world_id, sessions.c.created_at, last_turns.c.last_turn_at, ticks.c.last_tick_at)
+            .select_from(sessions)
+            .outerjoin(last_turns, last_turns.c.world_id == sessions.c.world_id)
+            .outerjoin(ticks, and_(ticks.c.world_id == sessions.c.world_id, ticks.c.tick_rank == 1))
+            .where(sessions.c.session_rank == 1)
+            .order_by(sessions.c.updated_at.desc(), sessions.c.id.asc())
+        ).all()
+        grace = timedelta(seconds=self.settings.world_idle_grace_seconds)
+        interval = timedelta(seconds=self.settings.world_idle_interval_seconds)
+        due_rows: list[tuple[str, datetime]] = []
+        for row_world_id, session_created_at, last_turn_at, last_tick_at in rows:
+            due_at = _as_utc(last_turn_at or session_created_at) + grace
+            if last_tick_at is not None:
+                due_at = max(due_at, _as_utc(last_tick_at) + interval)
+            due_rows.append((row_world_id, due_at))
+        return due_rows
 
     def run_due_idle_world_passes(self, db: Session) -> list[IdleWorldPassResult]:
         results: list[IdleWorldPassResult] = []
@@ -1767,6 +1821,7 @@ class AmbientWorldPassService:
                 routine_state = _routine_state_with_defaults(participant.profile)
                 routine_state["active_location_id"] = destination.id
                 participant.profile.routine_state = routine_state
+                bump_world_reference_version(db, world_id)
                 moved = True
                 effective_location_id = destination.id
                 if destination.id == observer_location_id:
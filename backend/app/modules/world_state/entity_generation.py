@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 
 from app.models.entities import Actor, Faction, Location, LocationRoute, WorldResourceLock, route_id
 from app.modules.world_pack.service import resolve_world_pack
+from app.modules.world_state.reference_version import bump_world_reference_version
 
 
 GeneratedEntityType = Literal["npc", "location", "community"]
@@ -245,7 +246,7 @@ def materialize_entity_draft(
         source_event_id=source_event_id,
     )
     if entity_type == "npc":
-        return _materialize_npc(
+        materialized = _materialize_npc(
             db,
             world_id=world_id,
             display_name=display_name,
@@ -254,8 +255,8 @@ def materialize_entity_draft(
             community_id=community_id,
             metadata=metadata,
         )
-    if entity_type == "location":
-        return _materialize_location(
+    elif entity_type == "location":
+        materialized = _materialize_location(
             db,
             world_id=world_id,
             display_name=display_name,
@@ -265,14 +266,18 @@ def materialize_entity_draft(
             current_location_id=current_location_id,
             metadata=metadata,
         )
-    return _materialize_community(
-        db,
-        world_id=world_id,
-        display_name=display_name,
-        description=description,
-        location_key=location_key,
-        metadata=metadata,
-    )
+    else:
+        materialized = _materialize_community(
+            db,
+            world_id=world_id,
+            display_name=display_name,
+            description=description,
+            location_key=location_key,
+            metadata=metadata,
+        )
+    if materialized.created:
+        bump_world_reference_version(db, world_id)
+    return materialized
 
 
 def _materialize_npc(
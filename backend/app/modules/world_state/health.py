@@ -1,41 +1,87 @@
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal
+from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.entities import (
+    ActorKnowledgeEntry,
     ActorTitleProgress,
+    ConsequenceThread,
     Event,
     Memory,
     SharedConsequenceApplication,
     SharedHistoryRecord,
     World,
     WorldAxisState,
+    WorldBroadcastEvent,
+    WorldHealthCheck,
+    WorldTimelineEntry,
 )
-from app.modules.world_pack.service import resolve_world_pack
+from app.modules.world_pack.service import get_pack_registry, world_pack_metadata
 from app.modules.world_state.timeline import stale_active_lock_count
 
 
-def shared_world_health(db: Session) -> dict[str, Any]:
-    """Validate rebuildable shared-world state against pack rules and same-world event links."""
-    world_summaries: list[dict[str, Any]] = []
-    totals = {
-        "world_count": 0,
-        "axis_drift_count": 0,
-        "memory_gap_count": 0,
-        "event_integrity_gap_count": 0,
-        "stale_resource_lock_count": 0,
-    }
+# Incremental checks re-inspect rows stamped slightly before the previous high-water mark, so
+# a transaction that committed after that check started is still seen. Re-inspection is
+# idempotent: gaps are keyed by entity and replayed applications are remembered by key.
+HEALTH_WATERMARK_OVERLAP = timedelta(minutes=5)
+# Event-link checks report at most this many violations per world; sample mode inspects at
+# most EVENT_INTEGRITY_SAMPLE_SIZE rows per link type.
+EVENT_INTEGRITY_GAP_LIMIT = 200
+EVENT_INTEGRITY_SAMPLE_SIZE = 1000
+_IN_CHUNK = 500
+
+# (entity_type, model, key columns, source event column) for every shared row that must point
+# at an event of its own world.
+_EVENT_LINKS: tuple[tuple[str, Any, tuple[Any, ...], Any], ...] = (
+    ("world_axis", WorldAxisState, (WorldAxisState.axis_id,), WorldAxisState.last_event_id),
+    ("memory", Memory, (Memory.id,), Memory.source_event_id),
+    ("shared_history", SharedHistoryRecord, (SharedHistoryRecord.id,), SharedHistoryRecord.source_event_id),
+    (
+        "title_progress",
+        ActorTitleProgress,
+        (ActorTitleProgress.actor_id, ActorTitleProgress.title_rule_id),
+        ActorTitleProgress.source_event_id,
+    ),
+    ("actor_knowledge", ActorKnowledgeEntry, (ActorKnowledgeEntry.id,), ActorKnowledgeEntry.source_event_id),
+    ("consequence_thread", ConsequenceThread, (ConsequenceThread.id,), ConsequenceThread.source_event_id),
+    ("consequence_thread_last_event", ConsequenceThread, (ConsequenceThread.id,), ConsequenceThread.last_event_id),
+    ("timeline_entry", WorldTimelineEntry, (WorldTimelineEntry.id,), WorldTimelineEntry.source_event_id),
+    ("broadcast", WorldBroadcastEvent, (WorldBroadcastEvent.id,), WorldBroadcastEvent.source_event_id),
+)
+
+
+def shared_world_health(
+    db: Session,
+    *,
+    full: bool = False,
+    full_check_max_age: timedelta | None = None,
+) -> dict[str, Any]:
+    """Validate rebuildable shared-world state against pack rules and same-world event links.
 
+    Each world's result is cached in ``world_health_checks``; by default only rows written
+    since the cached high-water mark are inspected. ``full=True`` re-validates everything.
+    ``full_check_max_age`` re-validates only the worlds whose last full check is older than
+    that; release gates use it, since raw SQL edits and deletions leave no timestamp behind.
+    The caller commits to keep the refreshed cache.
+    """
+    world_summaries: list[dict[str, Any]] = []
+    templates: dict[tuple[str, str], tuple[Any, Any]] = {}
     worlds = list(db.execute(select(World).order_by(World.id.asc())).scalars())
     for world in worlds:
         state = dict(world.state or {})
         if not state.get("pack_id") or not state.get("world_template_id"):
             continue
         try:
-            summary = _world_health(db, world)
+            summary = refresh_world_health(
+                db, world, full=full, full_check_max_age=full_check_max_age, templates=templates
+            )
         except Exception as exc:
             summary = {
                 "world_id": world.id,
@@ -60,9 +106,48 @@ def shared_world_health(db: Session) -> dict[str, Any]:
                         "detail": str(exc),
                     }
                 ],
+                "event_integrity_truncated": False,
             }
         world_summaries.append(summary)
-        totals["world_count"] += 1
+    return _combine_world_health(world_summaries)
+
+
+def cached_shared_world_health(db: Session) -> dict[str, Any]:
+    """``shared_world_health`` assembled from the stored per-world results; runs no check.
+
+    For read paths that must not write. Worlds that were never checked are listed in
+    ``unchecked_world_ids`` and keep the status from reading ``ready``.
+    """
+    cached = {
+        row.world_id: dict(row.summary or {})
+        for row in db.execute(select(WorldHealthCheck)).scalars()
+    }
+    world_summaries: list[dict[str, Any]] = []
+    unchecked_world_ids: list[str] = []
+    for world in db.execute(select(World).order_by(World.id.asc())).scalars():
+        state = dict(world.state or {})
+        if not state.get("pack_id") or not state.get("world_template_id"):
+            continue
+        if world.id in cached:
+            world_summaries.append(cached[world.id])
+        else:
+            unchecked_world_ids.append(world.id)
+    health = _combine_world_health(world_summaries)
+    health["unchecked_world_ids"] = unchecked_world_ids
+    if unchecked_world_ids and health["status"] == "ready":
+        health["status"] = "unchecked"
+    return health
+
+
+def _combine_world_health(world_summaries: list[dict[str, Any]]) -> dict[str, Any]:
+    totals = {
+        "world_count": len(world_summaries),
+        "axis_drift_count": 0,
+        "memory_gap_count": 0,
+        "event_integrity_gap_count": 0,
+        "stale_resource_lock_count": 0,
+    }
+    for summary in world_summaries:
         totals["axis_drift_count"] += int(summary["axis_drift_count"])
         totals["memory_gap_count"] += int(summary["memory_gap_count"])
         totals["event_integrity_gap_count"] += int(summary["event_integrity_gap_count"])
@@ -82,11 +167,59 @@ def shared_world_health(db: Session) -> dict[str, Any]:
     }
 
 
-def _world_health(db: Session, world: World) -> dict[str, Any]:
-    pack, template = resolve_world_pack(db, world.id)
-    axis_drift = _axis_drift(db, world_id=world.id, template=template)
-    memory_gaps = _memory_gaps(db, world_id=world.id, template=template)
-    event_integrity_gaps = _event_integrity_gaps(db, world_id=world.id)
+def refresh_world_health(
+    db: Session,
+    world: World,
+    *,
+    full: bool = False,
+    full_check_max_age: timedelta | None = None,
+    templates: dict[tuple[str, str], tuple[Any, Any]] | None = None,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """Bring the world's cached health result up to date and return its summary.
+
+    Falls back to a full check when there is no cached result, the world's pack binding
+    changed since it was taken, the last full check is older than ``full_check_max_age``, or
+    the cached event-link gaps were cut short by the limit (an incremental pass only re-opens
+    the gaps it stored, so the rest would be lost).
+    """
+    started = now or datetime.now(timezone.utc)
+    metadata = world_pack_metadata(world)
+    pack, template = _resolve_template(metadata, templates)
+    row = db.get(WorldHealthCheck, world.id)
+    incremental = (
+        not full
+        and row is not None
+        and row.pack_id == pack.manifest.pack_id
+        and row.world_template_id == template.template_id
+        and not (row.summary or {}).get("event_integrity_truncated")
+        and (full_check_max_age is None or _as_utc(row.last_full_check_at) > started - full_check_max_age)
+    )
+    since = _as_utc(row.checked_through) - HEALTH_WATERMARK_OVERLAP if incremental and row is not None else None
+    replay_state = dict(row.replay_state or {}) if incremental and row is not None else {}
+    previous = dict(row.summary or {}) if incremental and row is not None else {}
+
+    fetched = _applications_since(db, world_id=world.id, template=template, since=since)
+    replayed = {tuple(key) for key in replay_state.get("recent_applications") or []}
+    applications = [
+        application for application in fetched if (application.source_event_id, application.rule_id) not in replayed
+    ]
+    expected = _replay_axis_values(template, applications, dict(replay_state.get("expected") or {}))
+    axis_drift = _axis_drift(db, world_id=world.id, expected=expected)
+    memory_gaps = _memory_gaps(
+        db,
+        world_id=world.id,
+        template=template,
+        applications=applications,
+        previous=previous.get("memory_gaps") or [],
+    )
+    event_integrity_gaps, event_integrity_truncated = _event_integrity_gaps(
+        db,
+        world_id=world.id,
+        since=since,
+        previous=previous.get("event_integrity_gaps") or [],
+        limit=EVENT_INTEGRITY_GAP_LIMIT,
+    )
     stale_locks = stale_active_lock_count(db, world_id=world.id)
     history_levels = sorted(
         {
@@ -97,7 +230,7 @@ def _world_health(db: Session, world: World) -> dict[str, Any]:
             if level
         }
     )
-    return {
+    summary = {
         "world_id": world.id,
         "pack_id": pack.manifest.pack_id,
         "pack_display_name": pack.manifest.display_name,
@@ -120,25 +253,112 @@ def _world_health(db: Session, world: World) -> dict[str, Any]:
         "axis_drift": axis_drift,
         "memory_gaps": memory_gaps,
         "event_integrity_gaps": event_integrity_gaps,
+        "event_integrity_truncated": event_integrity_truncated,
+        "check_mode": "incremental" if incremental else "full",
+        "checked_through": started.isoformat(),
     }
+    recent_cutoff = started - HEALTH_WATERMARK_OVERLAP
+    _store_world_health(
+        db,
+        row,
+        world_id=world.id,
+        summary=summary,
+        checked_through=started,
+        replay_state={
+            "expected": expected,
+            "recent_applications": sorted(
+                {
+                    (application.source_event_id, application.rule_id)
+                    for application in fetched
+                    if _as_utc(application.created_at) >= recent_cutoff
+                }
+            ),
+        },
+    )
+    return summary
 
 
-def _axis_drift(db: Session, *, world_id: str, template: Any) -> list[dict[str, Any]]:
-    rules = {rule.id: rule for rule in template.consequence_rules}
-    rule_order = {rule.id: index for index, rule in enumerate(template.consequence_rules)}
-    axis_definitions = {axis.id: axis for axis in template.world_axes}
-    expected = {
-        axis_id: float(axis.initial_value)
-        for axis_id, axis in axis_definitions.items()
+def _resolve_template(
+    metadata: dict[str, Any],
+    templates: dict[tuple[str, str], tuple[Any, Any]] | None,
+) -> tuple[Any, Any]:
+    key = (metadata["pack_id"], metadata["world_template_id"])
+    if templates is not None and key in templates:
+        return templates[key]
+    pack = get_pack_registry().get_pack(key[0])
+    resolved = (pack, pack.template(key[1]))
+    if templates is not None:
+        templates[key] = resolved
+    return resolved
+
+
+def _store_world_health(
+    db: Session,
+    row: WorldHealthCheck | None,
+    *,
+    world_id: str,
+    summary: dict[str, Any],
+    checked_through: datetime,
+    replay_state: dict[str, Any],
+) -> None:
+    values = {
+        "pack_id": summary["pack_id"],
+        "world_template_id": summary["world_template_id"],
+        "status": "ready" if _summary_drift_count(summary) == 0 else "drift_detected",
+        "check_mode": summary["check_mode"],
+        "checked_through": checked_through,
+        "replay_state": replay_state,
+        "summary": summary,
     }
+    if summary["check_mode"] == "full":
+        values["last_full_check_at"] = checked_through
+    if row is not None:
+        for key, value in values.items():
+            setattr(row, key, value)
+        return
+    values.setdefault("last_full_check_at", checked_through)
+    try:
+        with db.begin_nested():
+            db.add(WorldHealthCheck(world_id=world_id, **values))
+    except IntegrityError:
+        # A concurrent check cached this world first; its result is just as current.
+        return
+
+
+def _summary_drift_count(summary: dict[str, Any]) -> int:
+    return (
+        int(summary["axis_drift_count"])
+        + int(summary["memory_gap_count"])
+        + int(summary["event_integrity_gap_count"])
+        + int(summary["stale_resource_lock_count"])
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def _applications_since(
+    db: Session,
+    *,
+    world_id: str,
+    template: Any,
+    since: datetime | None,
+) -> list[SharedConsequenceApplication]:
+    rule_order = {rule.id: index for index, rule in enumerate(template.consequence_rules)}
+    statement = select(SharedConsequenceApplication).where(SharedConsequenceApplication.world_id == world_id)
+    if since is not None:
+        statement = statement.where(SharedConsequenceApplication.created_at >= since)
     application_rows = list(
         db.execute(
-            select(SharedConsequenceApplication)
-            .where(SharedConsequenceApplication.world_id == world_id)
-            .order_by(SharedConsequenceApplication.created_at.asc(), SharedConsequenceApplication.source_event_id.asc(), SharedConsequenceApplication.rule_id.asc())
+            statement.order_by(
+                SharedConsequenceApplication.created_at.asc(),
+                SharedConsequenceApplication.source_event_id.asc(),
+                SharedConsequenceApplication.rule_id.asc(),
+            )
         ).scalars()
     )
-    applications = sorted(
+    return sorted(
         application_rows,
         key=lambda application: (
             application.created_at,
@@ -146,6 +366,17 @@ def _axis_drift(db: Session, *, world_id: str, template: Any) -> list[dict[str,
             rule_order.get(application.rule_id, len(rule_order)),
         ),
     )
+
+
+def _replay_axis_values(
+    template: Any,
+    applications: Iterable[SharedConsequenceApplication],
+    expected: dict[str, float],
+) -> dict[str, float]:
+    rules = {rule.id: rule for rule in template.consequence_rules}
+    axis_definitions = {axis.id: axis for axis in template.world_axes}
+    for axis_id, axis in axis_definitions.items():
+        expected[axis_id] = float(expected.get(axis_id, axis.initial_value))
     for application in applications:
         rule = rules.get(application.rule_id)
         if rule is None:
@@ -156,7 +387,10 @@ def _axis_drift(db: Session, *, world_id: str, template: Any) -> list[dict[str,
                 continue
             before = expected.get(axis_id, float(axis.initial_value))
             expected[axis_id] = min(max(before + float(delta), float(axis.min_value)), float(axis.max_value))
+    return {axis_id: value for axis_id, value in expected.items() if axis_id in axis_definitions}
 
+
+def _axis_drift(db: Session, *, world_id: str, expected: dict[str, float]) -> list[dict[str, Any]]:
     drift: list[dict[str, Any]] = []
     rows = list(db.execute(select(WorldAxisState).where(WorldAxisState.world_id == world_id)).scalars())
     for row in rows:
@@ -184,35 +418,39 @@ def _axis_drift(db: Session, *, world_id: str, template: Any) -> list[dict[str,
     return drift
 
 
-def _memory_gaps(db: Session, *, world_id: str, template: Any) -> list[dict[str, Any]]:
+def _memory_gaps(
+    db: Session,
+    *,
+    world_id: str,
+    template: Any,
+    applications: Iterable[SharedConsequenceApplication],
+    previous: Iterable[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Gaps among new memory-producing applications, plus earlier gaps that are still open."""
     rules = {rule.id: rule for rule in template.consequence_rules}
-    gaps: list[dict[str, Any]] = []
-    applications = list(
-        db.execute(
-            select(SharedConsequenceApplication)
-            .where(SharedConsequenceApplication.world_id == world_id)
-            .order_by(SharedConsequenceApplication.created_at.asc(), SharedConsequenceApplication.source_event_id.asc(), SharedConsequenceApplication.rule_id.asc())
-        ).scalars()
-    )
+    candidates: dict[tuple[str, str], dict[str, Any]] = {
+        (str(gap["source_event_id"]), str(gap["rule_id"])): dict(gap) for gap in previous
+    }
     for application in applications:
         rule = rules.get(application.rule_id)
         if rule is None or not _rule_expects_memory(rule):
             continue
-        memory_count = db.execute(
-            select(Memory.id).where(
-                Memory.world_id == world_id,
-                Memory.source_event_id == application.source_event_id,
-            ).limit(1)
-        ).scalar_one_or_none()
-        if memory_count is None:
-            gaps.append(
-                {
-                    "source_event_id": application.source_event_id,
-                    "rule_id": application.rule_id,
-                    "action_tag": application.action_tag,
-                }
-            )
-    return gaps
+        candidates[(application.source_event_id, application.rule_id)] = {
+            "source_event_id": application.source_event_id,
+            "rule_id": application.rule_id,
+            "action_tag": application.action_tag,
+        }
+    remembered: set[str] = set()
+    event_ids = sorted({source_event_id for source_event_id, _ in candidates})
+    for chunk in _chunks(event_ids):
+        remembered.update(
+            db.execute(
+                select(Memory.source_event_id)
+                .where(Memory.world_id == world_id, Memory.source_event_id.in_(chunk))
+                .distinct()
+            ).scalars()
+        )
+    return [gap for (source_event_id, _), gap in candidates.items() if source_event_id not in remembered]
 
 
 def _rule_expects_memory(rule: Any) -> bool:
@@ -221,40 +459,129 @@ def _rule_expects_memory(rule: Any) -> bool:
     return any(str(draft.get("text") or draft.get("summary") or "").strip() for draft in rule.npc_memory_drafts)
 
 
-def _event_integrity_gaps(db: Session, *, world_id: str) -> list[dict[str, Any]]:
-    gaps: list[dict[str, Any]] = []
-    event_worlds = {
-        event_id: event_world_id
-        for event_id, event_world_id in db.execute(select(Event.id, Event.world_id)).all()
+def world_event_integrity(
+    db: Session,
+    *,
+    world_id: str,
+    mode: Literal["full", "sample"] = "full",
+    limit: int = EVENT_INTEGRITY_GAP_LIMIT,
+    sample_size: int = EVENT_INTEGRITY_SAMPLE_SIZE,
+) -> dict[str, Any]:
+    """Event-link violations for one world, at most ``limit`` of them.
+
+    ``sample`` mode checks at most ``sample_size`` rows per link type, starting from a random
+    key, so the answer arrives in bounded time however large the world has grown.
+    """
+    gaps, truncated = _event_integrity_gaps(
+        db,
+        world_id=world_id,
+        limit=limit,
+        sample_size=sample_size if mode == "sample" else None,
+    )
+    return {
+        "world_id": world_id,
+        "mode": mode,
+        "limit": limit,
+        "sample_size": sample_size if mode == "sample" else None,
+        "gap_count": len(gaps),
+        "truncated": truncated,
+        "gaps": gaps,
     }
 
-    def check(entity_type: str, entity_id: str, source_event_id: str | None) -> None:
-        if not source_event_id:
-            return
-        event_world_id = event_worlds.get(source_event_id)
-        if event_world_id != world_id:
+
+def _event_integrity_gaps(
+    db: Session,
+    *,
+    world_id: str,
+    since: datetime | None = None,
+    previous: Iterable[dict[str, Any]] = (),
+    limit: int = EVENT_INTEGRITY_GAP_LIMIT,
+    sample_size: int | None = None,
+    sample_pivot: str | None = None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Links from shared rows to events that are missing or belong to another world.
+
+    Each link type is one anti-join against ``events`` scoped to the world, so only violating
+    rows leave the database. With ``since`` only rows written after it are inspected, plus the
+    rows behind ``previous`` gaps so repaired links drop out. Returns the gaps and whether
+    ``limit`` cut them short.
+    """
+    reopened: dict[str, list[str]] = {}
+    for gap in previous:
+        reopened.setdefault(str(gap["entity_type"]), []).append(str(gap["entity_id"]))
+    pivot = sample_pivot if sample_pivot is not None else str(uuid4())
+
+    gaps: list[dict[str, Any]] = []
+    truncated = False
+    for entity_type, model, key_columns, source_column in _EVENT_LINKS:
+        remaining = limit - len(gaps)
+        if remaining <= 0:
+            truncated = True
+            break
+        scope = [model.world_id == world_id, source_column.is_not(None)]
+        if since is not None:
+            scope.append(
+                or_(
+                    model.updated_at >= since,
+                    *(_key_in(key_columns, chunk) for chunk in _chunks(reopened.get(entity_type) or [])),
+                )
+            )
+        if sample_size is not None:
+            sampled = _sampled_keys(db, model, key_columns, world_id=world_id, size=sample_size, pivot=pivot)
+            if not sampled:
+                continue
+            scope.append(_key_in(key_columns, sampled))
+        rows = db.execute(
+            select(*key_columns, source_column, Event.world_id)
+            .select_from(model)
+            .outerjoin(Event, Event.id == source_column)
+            .where(*scope, or_(Event.id.is_(None), Event.world_id != world_id))
+            .order_by(*key_columns)
+            .limit(remaining + 1)
+        ).all()
+        if len(rows) > remaining:
+            truncated = True
+            rows = rows[:remaining]
+        for row in rows:
+            source_event_id, event_world_id = row[-2], row[-1]
             gaps.append(
                 {
                     "entity_type": entity_type,
-                    "entity_id": entity_id,
+                    "entity_id": ":".join(str(value) for value in row[:-2]),
                     "source_event_id": source_event_id,
                     "expected_world_id": world_id,
                     "actual_event_world_id": event_world_id,
                     "reason": "missing_event" if event_world_id is None else "cross_world_event",
                 }
             )
+    return gaps, truncated
+
+
+def _sampled_keys(
+    db: Session,
+    model: Any,
+    key_columns: tuple[Any, ...],
+    *,
+    world_id: str,
+    size: int,
+    pivot: str,
+) -> list[Any]:
+    """Up to ``size`` keys of the world's rows, read in key order from ``pivot`` and wrapping."""
+    statement = select(*key_columns).where(model.world_id == world_id).order_by(*key_columns)
+    keys = list(db.execute(statement.where(key_columns[0] >= pivot).limit(size)).all())
+    if len(keys) < size:
+        keys.extend(db.execute(statement.where(key_columns[0] < pivot).limit(size - len(keys))).all())
+    if len(key_columns) == 1:
+        return [key[0] for key in keys]
+    return [tuple(key) for key in keys]
+
+
+def _key_in(key_columns: tuple[Any, ...], keys: list[Any]) -> Any:
+    if len(key_columns) == 1:
+        return key_columns[0].in_(keys)
+    return tuple_(*key_columns).in_([key if isinstance(key, tuple) else tuple(str(key).split(":", 1)) for key in keys])
+
 
-    for axis in db.execute(select(WorldAxisState).where(WorldAxisState.world_id == world_id)).scalars():
-        check("world_axis", axis.axis_id, axis.last_event_id)
-    for memory in db.execute(select(Memory).where(Memory.world_id == world_id)).scalars():
-        check("memory", memory.id, memory.source_event_id)
-    for history in db.execute(select(SharedHistoryRecord).where(SharedHistoryRecord.world_id == world_id)).scalars():
-        check("shared_history", history.id, history.source_event_id)
-    for progress in db.execute(select(ActorTitleProgress).where(ActorTitleProgress.world_id == world_id)).scalars():
-        check("title_progress", f"{progress.actor_id}:{progress.title_rule_id}", progress.source_event_id)
-
-    grouped: dict[tuple[str, str], dict[str, Any]] = {}
-    for gap in gaps:
-        key = (str(gap["entity_type"]), str(gap["entity_id"]))
-        grouped[key] = gap
-    return list(grouped.values())
+def _chunks(values: list[Any]) -> Iterable[list[Any]]:
+    for index in range(0, len(values), _IN_CHUNK):
+        yield values[index : index + _IN_CHUNK]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from app.models.entities import QuestTemplate, QuestTemplateSimilarityBucket
+
+
+QUEST_NGRAM_SIZES = (2, 3)
+QUEST_MINHASH_PERMUTATIONS = 128
+# 64 bands of two rows keep recall at the 0.30 merge threshold above 99% per n-gram size. That
+# low threshold costs precision (weakly related pairs still collide now and then), which the
+# exact check on the candidates absorbs.
+QUEST_LSH_BAND_ROWS = 2
+# Grams are hashed once with blake2b (stable across processes, unlike hash()) and then permuted
+# with seeded affine maps modulo a Mersenne prime.
+_MERSENNE_PRIME = (1 << 61) - 1
+_PERMUTATIONS = tuple(
+    (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+    for rng in [random.Random(0x51A7)]
+    for _ in range(QUEST_MINHASH_PERMUTATIONS)
+)
+
+
+def quest_similarity_text(*values: Any) -> str:
+    text = " ".join(str(value or "") for value in values)
+    return re.sub(r"[\W_]+", "", text.lower(), flags=re.UNICODE)
+
+
+def quest_ngrams(text: str, *, size: int = 3) -> set[str]:
+    if not text:
+        return set()
+    if len(text) <= size:
+        return {text}
+    return {text[index : index + size] for index in range(0, len(text) - size + 1)}
+
+
+def quest_text_similarity(left: str, right: str) -> float:
+    scores: list[float] = []
+    for size in QUEST_NGRAM_SIZES:
+        left_grams = quest_ngrams(left, size=size)
+        right_grams = quest_ngrams(right, size=size)
+        if left_grams and right_grams:
+            scores.append(len(left_grams & right_grams) / len(left_grams | right_grams))
+    return max(scores, default=0.0)
+
+
+def _stable_hash(value: str, *, digest_size: int = 8) -> bytes:
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=digest_size).digest()
+
+
+@lru_cache(maxsize=4096)
+def quest_minhash_signature(text: str) -> tuple[tuple[int, ...], ...]:
+    """One MinHash row per n-gram size in ``QUEST_NGRAM_SIZES``; empty rows for empty text."""
+
+    signature: list[tuple[int, ...]] = []
+    for size in QUEST_NGRAM_SIZES:
+        hashes = [int.from_bytes(_stable_hash(gram), "big") & _MERSENNE_PRIME for gram in quest_ngrams(text, size=size)]
+        if not hashes:
+            signature.append(())
+            continue
+        signature.append(
+            tuple(min([(a * value + b) % _MERSENNE_PRIME for value in hashes]) for a, b in _PERMUTATIONS)
+        )
+    return tuple(signature)
+
+
+@lru_cache(maxsize=4096)
+def quest_lsh_keys(title: str, text: str) -> frozenset[str]:
+    """LSH bucket keys for normalized ``title`` / ``title + description`` text.
+
+    Besides the MinHash bands there is one exact-title key, so offers whose normalized titles
+    match always land in a shared bucket just as the exact check treats them as duplicates.
+    """
+
+    keys: set[str] = set()
+    if title:
+        keys.add("t." + _stable_hash(title, digest_size=12).hex())
+    for size, row in zip(QUEST_NGRAM_SIZES, quest_minhash_signature(text)):
+        for band in range(0, len(row), QUEST_LSH_BAND_ROWS):
+            rows = ",".join(str(value) for value in row[band : band + QUEST_LSH_BAND_ROWS])
+            keys.add(f"{size}.{band // QUEST_LSH_BAND_ROWS}." + _stable_hash(rows).hex())
+    return frozenset(keys)
+
+
+def quest_offer_lsh_keys(*, title: str, description: str) -> frozenset[str]:
+    return quest_lsh_keys(quest_similarity_text(title), quest_similarity_text(title, description))
+
+
+def _template_source_digest(title: str, description: str) -> str:
+    return _stable_hash(f"{title}\x1f{description}", digest_size=12).hex()
+
+
+def quest_template_similarity(title: str, description: str) -> tuple[dict[str, Any], frozenset[str]]:
+    """The ``similarity_signature`` payload and LSH bucket keys for a template's text."""
+
+    text = quest_similarity_text(title, description)
+    signature = {
+        "source": _template_source_digest(title, description),
+        "minhash": [list(row) for row in quest_minhash_signature(text)],
+    }
+    return signature, quest_lsh_keys(quest_similarity_text(title), text)
+
+
+def index_quest_template(db: Session, template: QuestTemplate) -> None:
+    """Stores the template's MinHash signature and replaces its LSH bucket rows.
+
+    Every write of a template's title or description goes through here; a no-op while both
+    are unchanged, so seeding helpers can call it on every pass. The caller flushes.
+    """
+
+    current = template.similarity_signature if isinstance(template.similarity_signature, dict) else {}
+    if current.get("source") == _template_source_digest(template.title, template.description):
+        return
+    signature, keys = quest_template_similarity(template.title, template.description)
+    template.similarity_signature = signature
+    if current:
+        db.execute(
+            delete(QuestTemplateSimilarityBucket).where(
+                QuestTemplateSimilarityBucket.world_id == template.world_id,
+                QuestTemplateSimilarityBucket.quest_template_id == template.id,
+            )
+        )
+    db.add_all(
+        QuestTemplateSimilarityBucket(world_id=template.world_id, band_key=key, quest_template_id=template.id)
+        for key in sorted(keys)
+    )
+
+
+def similar_quest_template_ids(
+    db: Session,
+    *,
+    world_id: str,
+    title: str,
+    description: str,
+    template_ids: Iterable[str] | None = None,
+) -> set[str]:
+    """Ids of the world's templates sharing at least one LSH bucket with the incoming offer.
+
+    The result is a candidate set: callers still run the exact similarity check on it, which
+    touches a handful of near-duplicates instead of every live quest. ``template_ids``
+    narrows the lookup to, say, the actor's live quests; the read never writes buckets.
+    """
+
+    keys = quest_offer_lsh_keys(title=title, description=description)
+    if not keys:
+        return set()
+    statement = select(QuestTemplateSimilarityBucket.quest_template_id).where(
+        QuestTemplateSimilarityBucket.world_id == world_id,
+        QuestTemplateSimilarityBucket.band_key.in_(sorted(keys)),
+    )
+    if template_ids is not None:
+        scoped_ids = sorted(set(template_ids))
+        if not scoped_ids:
+            return set()
+        statement = statement.where(QuestTemplateSimilarityBucket.quest_template_id.in_(scoped_ids))
+    return set(db.execute(statement.distinct()).scalars())
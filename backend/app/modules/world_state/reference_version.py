@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.entities import World
+
+
+PENDING_REFERENCE_BUMPS = "world_reference_version_bumps"
+
+
+def world_reference_version(db: Session, world_id: str) -> int | None:
+    """Version of the world's public entity roster (NPC placement, locations, factions).
+
+    ``None`` while this session holds an unpublished bump for the world: it sees roster rows
+    no other transaction can, so it must neither read nor populate caches keyed by the version.
+    """
+
+    if world_id in db.info.get(PENDING_REFERENCE_BUMPS, ()):
+        return None
+    return int(db.execute(select(World.reference_version).where(World.id == world_id)).scalar_one_or_none() or 0)
+
+
+def bump_world_reference_version(db: Session, world_id: str) -> None:
+    """Marks caches derived from the entity roster stale.
+
+    Called wherever an NPC is created or relocated and wherever a location or faction enters
+    the world. The bump is recorded on the session and applied after the root transaction
+    commits (see ``install_session_state_versioning``), so turns never hold the world row lock
+    while they run; the increment happens in SQL so concurrent writers never lose a bump.
+    """
+
+    db.info.setdefault(PENDING_REFERENCE_BUMPS, set()).add(world_id)
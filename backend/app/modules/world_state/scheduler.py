@@ -1,63 +1,429 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import logging
+import os
+import random
+import socket
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Literal
+from uuid import uuid4
 
-from app.core.container import build_container
+from sqlalchemy.orm import Session
 
+from app.core.container import AppContainer, build_container
+from app.modules.llm_harness.service import abandon_prompts_when
+from app.modules.world_state.ambient import IdleWorldPassResult
+from app.modules.world_state.world_pass_lease import (
+    claim_world_pass_lease,
+    release_world_pass_lease,
+    renew_world_pass_lease,
+)
 
-def run_once(*, world_id: str | None = None) -> list[dict[str, object]]:
-    container = build_container()
-    with container.session_factory() as db:
+
+logger = logging.getLogger(__name__)
+
+
+def _result_payload(result: IdleWorldPassResult) -> dict[str, object]:
+    return {
+        "world_id": result.tick.world_id,
+        "tick_id": result.tick.id,
+        "status": result.tick.status,
+        "summary": result.tick.summary,
+    }
+
+
+def run_once(*, world_id: str | None = None, container: AppContainer | None = None) -> list[dict[str, object]]:
+    container = container or build_container()
+    scheduler = AmbientWorldScheduler(container)
+    try:
         if world_id:
-            result = container.ambient_world_service.run_idle_world_pass(db, world_id=world_id)
-            payload = [] if result is None else [
-                {
-                    "world_id": world_id,
-                    "tick_id": result.tick.id,
-                    "status": result.tick.status,
-                    "summary": result.tick.summary,
-                }
+            # A forced pass skips the due check but still takes the lease, so it never overlaps
+            # a resident scheduler running the same world.
+            outcome = scheduler._run_leased_pass(world_id, require_due=False)
+            return [] if outcome.payload is None else [outcome.payload]
+        with container.session_factory() as db:
+            world_ids = container.ambient_world_service.due_world_ids(db)
+        return scheduler.run_worlds(world_ids)
+    finally:
+        scheduler.close()
+
+
+@dataclass
+class SchedulerTickReport:
+    results: list[dict[str, object]] = field(default_factory=list)
+    failed_worlds: list[str] = field(default_factory=list)
+    duration_seconds: float = 0.0
+    backlog: int = 0
+    scheduled_worlds: int = 0
+
+
+@dataclass
+class _PassOutcome:
+    world_id: str
+    status: Literal["completed", "pending", "inactive", "leased", "failed"]
+    payload: dict[str, object] | None = None
+    due_at: datetime | None = None
+    # When the pass ended on its worker; a later tick may collect it well after that.
+    finished_at: datetime | None = None
+
+
+def _default_lease_holder() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+class AmbientWorldScheduler:
+    """Resident idle-world scheduler that keeps one container for its whole lifetime.
+
+    Worlds sit in a heap ordered by when their next idle pass is due, so a tick only touches
+    the worlds at the top of the heap. Active worlds are discovered by a periodic rescan. Each
+    world's due time gets a random delay of up to ``jitter_ratio`` of the idle interval, so
+    worlds that went idle together do not keep firing in the same tick.
+
+    Due passes run concurrently on a bounded thread pool, each with its own database session.
+    A tick never waits on them: it collects the passes that finished since the last tick and
+    submits new ones, keeping at most ``world_scheduler_max_passes_per_tick`` outstanding. The
+    pass timeout counts from when a pass starts on a worker, not from when it was queued.
+    Before a pass starts, the scheduler claims an expiring per-world lease, and the pass commits
+    only after renewing that lease in its own transaction. A pass that outlives its lease stops
+    making model calls and is rolled back, so several replicas can share one database and never
+    commit the same world's pass concurrently; a crashed replica's leases simply expire. A pass
+    that fails or overruns the timeout is retried with exponential backoff. After
+    ``world_pass_max_retries`` consecutive failures the world waits a full idle interval
+    instead.
+    """
+
+    def __init__(
+        self,
+        container: AppContainer,
+        *,
+        clock: Callable[[], datetime] | None = None,
+        perf_counter: Callable[[], float] = time.perf_counter,
+        rng: random.Random | None = None,
+        refresh_seconds: float | None = None,
+        holder: str | None = None,
+    ) -> None:
+        settings = container.settings
+        self.container = container
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self.perf_counter = perf_counter
+        self.rng = rng or random.Random()
+        self.holder = holder or _default_lease_holder()
+        self.interval_seconds = max(float(settings.world_idle_interval_seconds), 1.0)
+        self.jitter_ratio = max(settings.world_scheduler_jitter_ratio, 0.0)
+        self.refresh_seconds = max(float(refresh_seconds or settings.world_scheduler_refresh_seconds), 1.0)
+        self.max_passes_per_tick = max(settings.world_scheduler_max_passes_per_tick, 1)
+        self.pass_timeout_seconds = max(settings.world_pass_timeout_seconds, 0.001)
+        # A lease must outlive the timeout, or another replica could start a pass still running here.
+        self.lease_seconds = max(float(settings.world_pass_lease_seconds), self.pass_timeout_seconds)
+        self.retry_base_seconds = max(settings.world_pass_retry_base_seconds, 0.0)
+        self.max_retries = max(settings.world_pass_max_retries, 0)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(settings.world_scheduler_max_workers, 1),
+            thread_name_prefix="world-pass",
+        )
+        self._heap: list[tuple[float, str]] = []
+        # Latest due time per world; heap entries that no longer match it are stale and skipped.
+        self._due_at: dict[str, float] = {}
+        self._failures: dict[str, int] = {}
+        # Submitted passes not yet collected by a tick.
+        self._pending: dict[str, Future[_PassOutcome]] = {}
+        # Worlds whose pass is still running on a worker, including passes past their timeout,
+        # and when each pass started there.
+        self._in_flight: set[str] = set()
+        self._started_at: dict[str, float] = {}
+        self._in_flight_lock = threading.Lock()
+        self._next_refresh_at: float | None = None
+        self._stopped = threading.Event()
+        # Set whenever a pass starts or finishes, so the loop wakes to time it out or collect it.
+        self._wake = threading.Event()
+
+    @property
+    def scheduled_worlds(self) -> int:
+        return len(self._due_at)
+
+    def tick(self) -> SchedulerTickReport:
+        started_at = self.perf_counter()
+        report = SchedulerTickReport()
+        report.results = self._collect(report.failed_worlds)
+        now = self.clock().timestamp()
+        if self._next_refresh_at is None or now >= self._next_refresh_at:
+            self._refresh(now)
+        batch: list[str] = []
+        while self._heap and len(self._pending) + len(batch) < self.max_passes_per_tick:
+            due_at, world_id = self._heap[0]
+            if self._due_at.get(world_id) != due_at:
+                heapq.heappop(self._heap)
+                continue
+            if due_at > now:
+                break
+            heapq.heappop(self._heap)
+            batch.append(world_id)
+        self._submit(batch, report.failed_worlds)
+        now = self.clock().timestamp()
+        report.backlog = sum(
+            1 for world_id, due_at in self._due_at.items() if due_at <= now and world_id not in self._pending
+        )
+        report.scheduled_worlds = self.scheduled_worlds
+        report.duration_seconds = max(self.perf_counter() - started_at, 0.0)
+        self.container.observability_service.record_world_scheduler_tick(
+            duration_seconds=report.duration_seconds,
+            backlog=report.backlog,
+            scheduled_worlds=report.scheduled_worlds,
+        )
+        return report
+
+    def run_worlds(self, world_ids: list[str], *, failed: list[str] | None = None) -> list[dict[str, object]]:
+        """Runs the given worlds' passes on the pool and waits until each finishes or times out."""
+
+        self._submit(world_ids, failed)
+        results: list[dict[str, object]] = []
+        while self._pending:
+            wait(self._pending.values(), timeout=self._seconds_until_timeout(), return_when=FIRST_COMPLETED)
+            results.extend(self._collect(failed))
+        return results
+
+    def _submit(self, world_ids: list[str], failed: list[str] | None) -> None:
+        now = self.clock()
+        for world_id in dict.fromkeys(world_ids):
+            if world_id in self._pending:
+                continue
+            with self._in_flight_lock:
+                running = world_id in self._in_flight
+                if not running:
+                    self._in_flight.add(world_id)
+            if running:
+                # A pass that overran its timeout still holds this world; try again later.
+                self._retry(world_id, now, failed)
+                continue
+            future = self._executor.submit(self._run_leased_pass, world_id)
+            future.add_done_callback(lambda _future: self._wake.set())
+            self._pending[world_id] = future
+
+    def _collect(self, failed: list[str] | None) -> list[dict[str, object]]:
+        """Reschedules every pending world whose pass finished or overran, by its outcome."""
+
+        now = self.clock()
+        elapsed_at = self.perf_counter()
+        with self._in_flight_lock:
+            started_at = dict(self._started_at)
+        results: list[dict[str, object]] = []
+        for world_id, future in list(self._pending.items()):
+            if not future.done():
+                started = started_at.get(world_id)
+                # Passes still queued behind slower ones keep their place and do not time out.
+                if started is not None and elapsed_at - started >= self.pass_timeout_seconds:
+                    del self._pending[world_id]
+                    logger.warning("Idle world pass timed out: world_id=%s timeout=%.1fs", world_id, self.pass_timeout_seconds)
+                    self._retry(world_id, now, failed)
+                continue
+            del self._pending[world_id]
+            outcome = future.result()
+            if outcome.status == "failed":
+                self._retry(world_id, now, failed)
+                continue
+            self._failures.pop(world_id, None)
+            finished_at = outcome.finished_at or now
+            if outcome.status == "inactive":
+                self._due_at.pop(world_id, None)
+            elif outcome.status == "pending" and outcome.due_at is not None:
+                # Activity since the world was queued moved its due time; follow it.
+                self._schedule(world_id, self._jittered(outcome.due_at))
+            elif outcome.status == "leased":
+                # Another replica holds the world; it runs the pass, so look again an interval later.
+                self._schedule(world_id, self._jittered(finished_at + timedelta(seconds=self.interval_seconds)))
+            else:
+                if outcome.payload is not None:
+                    results.append(outcome.payload)
+                if outcome.due_at is None:
+                    self._due_at.pop(world_id, None)
+                else:
+                    # A pass that produced no tick leaves the due time in the past; wait an interval.
+                    due_at = max(outcome.due_at, finished_at + timedelta(seconds=self.interval_seconds))
+                    self._schedule(world_id, self._jittered(due_at))
+        return results
+
+    def _seconds_until_timeout(self) -> float:
+        """Time until the earliest running pass overruns; a full timeout while none has started."""
+
+        now = self.perf_counter()
+        with self._in_flight_lock:
+            deadlines = [
+                self._started_at[world_id] + self.pass_timeout_seconds
+                for world_id in self._pending
+                if world_id in self._started_at
             ]
+        if not deadlines:
+            return self.pass_timeout_seconds
+        return max(min(deadlines) - now, 0.0)
+
+    def seconds_until_next_tick(self) -> float:
+        now = self.clock().timestamp()
+        wake_at = self._next_refresh_at if self._next_refresh_at is not None else now
+        while self._heap and self._due_at.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        if self._heap:
+            wake_at = min(wake_at, self._heap[0][0])
+        delay = min(max(wake_at - now, 0.0), self.refresh_seconds)
+        if self._pending:
+            delay = min(delay, self._seconds_until_timeout())
+        return delay
+
+    def run_forever(
+        self,
+        *,
+        sleep: Callable[[float], object] | None = None,
+        on_tick: Callable[[SchedulerTickReport], None] | None = None,
+    ) -> None:
+        wait_for = sleep or self._sleep
+        try:
+            while not self._stopped.is_set():
+                report = self.tick()
+                if on_tick is not None:
+                    on_tick(report)
+                wait_for(self.seconds_until_next_tick())
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+    def close(self) -> None:
+        # Passes past their timeout keep running; their leases are released when they finish.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _sleep(self, seconds: float) -> None:
+        self._wake.wait(seconds)
+        self._wake.clear()
+
+    def _schedule(self, world_id: str, due_at: float) -> None:
+        self._due_at[world_id] = due_at
+        heapq.heappush(self._heap, (due_at, world_id))
+
+    def _jittered(self, due_at: datetime) -> float:
+        return due_at.timestamp() + self.rng.uniform(0.0, self.jitter_ratio * self.interval_seconds)
+
+    def _retry(self, world_id: str, now: datetime, failed: list[str] | None) -> None:
+        failures = self._failures.get(world_id, 0) + 1
+        if failures > self.max_retries:
+            self._failures.pop(world_id, None)
+            delay = self.interval_seconds
         else:
-            payload = [
-                {
-                    "world_id": result.tick.world_id,
-                    "tick_id": result.tick.id,
-                    "status": result.tick.status,
-                    "summary": result.tick.summary,
-                }
-                for result in container.ambient_world_service.run_due_idle_world_passes(db)
-            ]
-        db.commit()
-    return payload
+            self._failures[world_id] = failures
+            delay = min(self.retry_base_seconds * 2 ** (failures - 1), self.interval_seconds)
+        self._schedule(world_id, (now + timedelta(seconds=delay)).timestamp())
+        if failed is not None:
+            failed.append(world_id)
+
+    def _release_in_flight(self, world_id: str) -> None:
+        with self._in_flight_lock:
+            self._in_flight.discard(world_id)
+            self._started_at.pop(world_id, None)
+
+    def _refresh(self, now: float) -> None:
+        self._next_refresh_at = now + self.refresh_seconds
+        with self.container.session_factory() as db:
+            for world_id, due_at in self.container.ambient_world_service.idle_pass_due_times(db).items():
+                if world_id not in self._due_at:
+                    self._schedule(world_id, self._jittered(due_at))
+
+    def _run_leased_pass(self, world_id: str, *, require_due: bool = True) -> _PassOutcome:
+        """Runs on a pool worker: claims the lease, re-checks the due time and runs one pass."""
 
+        ambient = self.container.ambient_world_service
+        claimed = False
+        # Set once the lease claimed below runs out, which abandons the pass's remaining model calls.
+        lease_lost = threading.Event()
+        lease_timer = threading.Timer(self.lease_seconds, lease_lost.set)
+        lease_timer.daemon = True
+        with self._in_flight_lock:
+            self._started_at[world_id] = self.perf_counter()
+        self._wake.set()
+        try:
+            with self.container.session_factory() as db:
+                try:
+                    now = self.clock()
+                    if require_due:
+                        due_at = ambient.idle_pass_due_at(db, world_id)
+                        if due_at is None:
+                            return _PassOutcome(world_id, "inactive")
+                        if due_at > now:
+                            return _PassOutcome(world_id, "pending", due_at=due_at)
+                    claimed = claim_world_pass_lease(
+                        db, world_id=world_id, holder=self.holder, lease_seconds=self.lease_seconds, now=now
+                    )
+                    db.commit()
+                    if not claimed:
+                        return _PassOutcome(world_id, "leased", finished_at=now)
+                    lease_timer.start()
+                    with abandon_prompts_when(lease_lost):
+                        result = ambient.run_idle_world_pass(db, world_id=world_id)
+                    if not renew_world_pass_lease(
+                        db, world_id=world_id, holder=self.holder, lease_seconds=self.lease_seconds, now=self.clock()
+                    ):
+                        # Another replica may already be running this world; keep its pass, not ours.
+                        db.rollback()
+                        logger.warning("Idle world pass outlived its lease and was discarded: world_id=%s", world_id)
+                        return _PassOutcome(world_id, "failed")
+                    db.commit()
+                    return _PassOutcome(
+                        world_id,
+                        "completed",
+                        payload=None if result is None else _result_payload(result),
+                        due_at=ambient.idle_pass_due_at(db, world_id),
+                        finished_at=self.clock(),
+                    )
+                except Exception:
+                    db.rollback()
+                    logger.exception("Idle world pass failed: world_id=%s", world_id)
+                    return _PassOutcome(world_id, "failed")
+                finally:
+                    lease_timer.cancel()
+                    if claimed:
+                        self._release_lease(db, world_id)
+        finally:
+            self._release_in_flight(world_id)
 
-def loop(interval_seconds: int) -> None:
-    while True:
-        payload = run_once()
-        if payload:
-            print(json.dumps(payload, ensure_ascii=False, indent=2), flush=True)
-        time.sleep(interval_seconds)
+    def _release_lease(self, db: Session, world_id: str) -> None:
+        try:
+            release_world_pass_lease(db, world_id=world_id, holder=self.holder)
+            db.commit()
+        except Exception:
+            db.rollback()
+            logger.exception("Releasing idle world pass lease failed; it expires on its own: world_id=%s", world_id)
+
+
+def loop(refresh_seconds: int | None = None) -> None:
+    scheduler = AmbientWorldScheduler(build_container(), refresh_seconds=refresh_seconds)
+
+    def report(tick: SchedulerTickReport) -> None:
+        if tick.results:
+            print(json.dumps(tick.results, ensure_ascii=False, indent=2), flush=True)
+
+    scheduler.run_forever(on_tick=report)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="GESTALOKA idle world scheduler")
     parser.add_argument("command", choices=["once", "loop"])
     parser.add_argument("--world-id", default=None)
-    parser.add_argument("--interval", type=int, default=None)
+    parser.add_argument("--interval", type=int, default=None, help="Seconds between scans for newly active worlds")
     args = parser.parse_args()
 
-    container = build_container()
-    interval_seconds = args.interval or container.settings.world_idle_interval_seconds
-
     if args.command == "once":
         payload = run_once(world_id=args.world_id)
         print(json.dumps(payload, ensure_ascii=False, indent=2))
         return
 
-    loop(interval_seconds)
+    loop(args.interval)
 
 
 if __name__ == "__main__":
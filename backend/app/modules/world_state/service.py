@@ -97,7 +97,17 @@ from app.modules.world_state.scene import (
     list_scene_frames_debug,
 )
 from app.modules.world_state.shared_consequence import ensure_shared_world_seed, pack_scoped_entity_id
+from app.modules.world_state.quest_similarity import (
+    index_quest_template,
+    quest_lsh_keys,
+    quest_offer_lsh_keys,
+    quest_similarity_text,
+    quest_text_similarity,
+    similar_quest_template_ids,
+)
+from app.modules.world_state.reference_version import bump_world_reference_version
 from app.modules.world_state.rules import WorldTag, standing_band
+from app.modules.world_state.snapshot import session_state_snapshot_cache, session_state_snapshot_key
 
 
 FOLLOWUP_STANDING_DELTA = 0.10
@@ -412,6 +422,7 @@ def ensure_seeded_locations(db: Session, world_id: str) -> dict[str, Location]:
             )
             db.add(location)
             db.flush()
+            bump_world_reference_version(db, world_id)
         else:
             location.name = str(payload.get("name") or location.name)
             location.description = str(payload.get("description") or location.description)
@@ -608,6 +619,7 @@ def ensure_starter_faction(db: Session, world_id: str) -> Faction:
         with db.begin_nested():
             db.add(faction)
             db.flush()
+        bump_world_reference_version(db, world_id)
         return faction
     except IntegrityError:
         existing = db.execute(stmt).scalars().first()
@@ -685,6 +697,7 @@ def _ensure_seeded_quest_template(
             quest_seed.get("reward_description") or quest_template.reward_description or default_reward_description
         )
         quest_template.state = dict(quest_seed.get("state") or quest_template.state or default_state or {})
+        index_quest_template(db, quest_template)
         db.flush()
         return quest_template
 
@@ -703,6 +716,8 @@ def _ensure_seeded_quest_template(
     )
     db.add(quest_template)
     db.flush()
+    index_quest_template(db, quest_template)
+    db.flush()
     return quest_template
 
 
@@ -998,6 +1013,19 @@ def get_location_by_key(db: Session, world_id: str, location_key: str) -> Locati
     return locations.get(location_key)
 
 
+def seeded_locations_by_key(db: Session, world_id: str) -> dict[str, Location]:
+    """Read-only counterpart of ensure_seeded_locations: one query, no seeding writes."""
+
+    location_ids = {
+        _location_id_for_key(world_id, location_key, str(payload.get("id") or location_key)): location_key
+        for location_key, payload in _seed_locations(db, world_id).items()
+    }
+    rows = db.execute(
+        select(Location).where(Location.world_id == world_id, Location.id.in_(location_ids))
+    ).scalars()
+    return {location_ids[location.id]: location for location in rows}
+
+
 def get_location_route(
     db: Session,
     *,
@@ -1503,43 +1531,20 @@ def quest_display_state(*, player_profile: dict[str, Any] | None, quest_journal:
     }
 
 
-def _quest_similarity_text(*values: Any) -> str:
-    text = " ".join(str(value or "") for value in values)
-    return re.sub(r"[\W_]+", "", text.lower(), flags=re.UNICODE)
-
-
-def _quest_ngrams(text: str, *, size: int = 3) -> set[str]:
-    if not text:
-        return set()
-    if len(text) <= size:
-        return {text}
-    return {text[index : index + size] for index in range(0, len(text) - size + 1)}
-
-
-def _quest_text_similarity(left: str, right: str) -> float:
-    scores: list[float] = []
-    for size in (2, 3):
-        left_grams = _quest_ngrams(left, size=size)
-        right_grams = _quest_ngrams(right, size=size)
-        if left_grams and right_grams:
-            scores.append(len(left_grams & right_grams) / len(left_grams | right_grams))
-    return max(scores, default=0.0)
-
-
 def _quest_offer_is_similar(template: QuestTemplate, *, title: str, description: str) -> bool:
-    existing_title = _quest_similarity_text(template.title)
-    incoming_title = _quest_similarity_text(title)
+    existing_title = quest_similarity_text(template.title)
+    incoming_title = quest_similarity_text(title)
     if existing_title and incoming_title and existing_title == incoming_title:
         return True
-    existing = _quest_similarity_text(template.title, template.description)
-    incoming = _quest_similarity_text(title, description)
-    return _quest_text_similarity(existing, incoming) >= QUEST_SIMILARITY_THRESHOLD
+    existing = quest_similarity_text(template.title, template.description)
+    incoming = quest_similarity_text(title, description)
+    return quest_text_similarity(existing, incoming) >= QUEST_SIMILARITY_THRESHOLD
 
 
 def quest_offer_repeats_resolution(*, offer: dict[str, Any] | None, resolution_summary: str | None) -> bool:
     if not isinstance(offer, dict) or not offer:
         return False
-    resolution = _quest_similarity_text(resolution_summary)
+    resolution = quest_similarity_text(resolution_summary)
     if not resolution:
         return False
     fields = [
@@ -1549,11 +1554,11 @@ def quest_offer_repeats_resolution(*, offer: dict[str, Any] | None, resolution_s
         offer.get("offered_summary"),
     ]
     for value in fields:
-        candidate = _quest_similarity_text(value)
-        if candidate and (candidate == resolution or _quest_text_similarity(candidate, resolution) >= 0.75):
+        candidate = quest_similarity_text(value)
+        if candidate and (candidate == resolution or quest_text_similarity(candidate, resolution) >= 0.75):
             return True
-    combined = _quest_similarity_text(*fields)
-    return bool(combined and _quest_text_similarity(combined, resolution) >= 0.75)
+    combined = quest_similarity_text(*fields)
+    return bool(combined and quest_text_similarity(combined, resolution) >= 0.75)
 
 
 def _quest_gate_result(
@@ -1635,11 +1640,11 @@ def _text_has_any(text: str, fragments: tuple[str, ...]) -> bool:
 
 
 def _word_overlap(left: str, right: str) -> float:
-    left_normalized = _quest_similarity_text(left)
-    right_normalized = _quest_similarity_text(right)
+    left_normalized = quest_similarity_text(left)
+    right_normalized = quest_similarity_text(right)
     if not left_normalized or not right_normalized:
         return 0.0
-    return _quest_text_similarity(left_normalized, right_normalized)
+    return quest_text_similarity(left_normalized, right_normalized)
 
 
 def _offer_has_player_attention_basis(
@@ -1751,12 +1756,12 @@ def _offer_is_single_next_action(offer: dict[str, Any]) -> bool:
     has_thread_basis = _offer_has_uncertainty(offer) and (
         _has_basis_key(offer, "objective") or _has_basis_key(offer, "why_now") or len(description) >= 40
     )
-    return not has_thread_basis or len(_quest_similarity_text(title, description)) < 28
+    return not has_thread_basis or len(quest_similarity_text(title, description)) < 28
 
 
 def _offer_is_too_abstract(offer: dict[str, Any]) -> bool:
     text = _quest_offer_text(offer)
-    compact = _quest_similarity_text(text)
+    compact = quest_similarity_text(text)
     if len(compact) < 18:
         return True
     broad_phrases = (
@@ -1792,16 +1797,23 @@ def _offer_is_too_conclusive(offer: dict[str, Any]) -> bool:
     return _text_has_any(text, conclusive_phrases)
 
 
-def _offer_similar_to_existing_live_quest(offer: dict[str, Any], session_state: dict[str, Any]) -> bool:
+def _offer_similar_to_existing_live_quest(
+    offer: dict[str, Any],
+    session_state: dict[str, Any],
+    similar_template_ids: set[str] | None = None,
+) -> bool:
     title = str(offer.get("title") or "").strip()
     description = str(offer.get("description") or offer.get("summary") or "").strip()
     if not title or not description:
         return False
+    incoming_keys = quest_offer_lsh_keys(title=title, description=description) if similar_template_ids is None else None
     for quest in [*(session_state.get("quests") or []), *(session_state.get("quest_journal") or [])]:
         if not isinstance(quest, dict):
             continue
         if str(quest.get("status") or "") not in {"offered", "active", "paused"}:
             continue
+        if similar_template_ids is not None and quest.get("quest_template_id") not in similar_template_ids:
+            continue
         existing_title = str(quest.get("title") or "").strip()
         existing_description = str(
             quest.get("description")
@@ -1810,15 +1822,58 @@ def _offer_similar_to_existing_live_quest(offer: dict[str, Any], session_state:
             or quest.get("offered_summary")
             or ""
         ).strip()
-        existing_text = _quest_similarity_text(existing_title, existing_description)
-        incoming_text = _quest_similarity_text(title, description)
-        if existing_title and title and _quest_similarity_text(existing_title) == _quest_similarity_text(title):
+        existing_text = quest_similarity_text(existing_title, existing_description)
+        # Without the bucket table (see ``similar_quest_template_ids``), memoized bucket keys still
+        # let unrelated quests skip the n-gram comparison.
+        if incoming_keys is not None and not incoming_keys & quest_lsh_keys(
+            quest_similarity_text(existing_title), existing_text
+        ):
+            continue
+        incoming_text = quest_similarity_text(title, description)
+        if existing_title and title and quest_similarity_text(existing_title) == quest_similarity_text(title):
             return True
-        if existing_text and incoming_text and _quest_text_similarity(existing_text, incoming_text) >= 0.60:
+        if existing_text and incoming_text and quest_text_similarity(existing_text, incoming_text) >= 0.60:
             return True
     return False
 
 
+def similar_live_quest_template_ids(
+    db: Session,
+    *,
+    world_id: str,
+    session_state: dict[str, Any],
+    offer: dict[str, Any] | None,
+) -> set[str] | None:
+    """Live quest templates in ``session_state`` whose LSH buckets the offer shares.
+
+    Feed the result to ``evaluate_quest_emergence_gate`` so its duplicate check reads the
+    bucket table instead of hashing every live quest. ``None`` when the offer has no text.
+    """
+
+    if not isinstance(offer, dict):
+        return None
+    title = str(offer.get("title") or "").strip()
+    description = str(offer.get("description") or offer.get("summary") or "").strip()
+    if not title or not description:
+        return None
+    live_template_ids = {
+        str(quest["quest_template_id"])
+        for quest in [*(session_state.get("quests") or []), *(session_state.get("quest_journal") or [])]
+        if isinstance(quest, dict)
+        and quest.get("quest_template_id")
+        and str(quest.get("status") or "") in {"offered", "active", "paused"}
+    }
+    if not live_template_ids:
+        return set()
+    return similar_quest_template_ids(
+        db,
+        world_id=world_id,
+        title=title,
+        description=description,
+        template_ids=live_template_ids,
+    )
+
+
 def evaluate_quest_emergence_gate(
     *,
     session_state: dict[str, Any],
@@ -1831,6 +1886,7 @@ def evaluate_quest_emergence_gate(
     pack_generation_context: dict[str, Any] | None = None,
     current_location: dict[str, Any] | None = None,
     shared_world_context: dict[str, Any] | None = None,
+    similar_template_ids: set[str] | None = None,
 ) -> dict[str, Any]:
     if not isinstance(offer, dict) or not offer:
         return _quest_gate_result(
@@ -1871,7 +1927,7 @@ def evaluate_quest_emergence_gate(
         ),
         "uncertainty": _offer_has_uncertainty(offer),
         "first_step": _offer_has_first_step(offer),
-        "similar_to_existing_live_quest": _offer_similar_to_existing_live_quest(offer, session_state),
+        "similar_to_existing_live_quest": _offer_similar_to_existing_live_quest(offer, session_state, similar_template_ids),
         "repeats_resolution": quest_offer_repeats_resolution(offer=offer, resolution_summary=resolution_summary),
         "is_followup": is_followup,
         "followup_of_assignment_id": followup_of_assignment_id,
@@ -2046,8 +2102,15 @@ def create_dynamic_quest_offer(
             )
         ).all()
     )
+    candidate_ids = similar_quest_template_ids(
+        db,
+        world_id=world_id,
+        title=title,
+        description=description,
+        template_ids=[template.id for _assignment, template in live_rows],
+    )
     for assignment, template in live_rows:
-        if _quest_offer_is_similar(template, title=title, description=description):
+        if template.id in candidate_ids and _quest_offer_is_similar(template, title=title, description=description):
             if assignment.status != "offered":
                 return []
             return [
@@ -2146,6 +2209,7 @@ def create_dynamic_quest_offer(
     )
     db.add(template)
     db.flush()
+    index_quest_template(db, template)
     assignment = QuestAssignment(
         world_id=world_id,
         owner_actor_id=actor_id,
@@ -2302,8 +2366,21 @@ def record_quest_resolution_hint(
         ).all()
     )
     active_rows = [(assignment, template) for assignment, template in rows if assignment.status == "active"]
+    candidate_ids = (
+        similar_quest_template_ids(
+            db,
+            world_id=world_id,
+            title=title,
+            description=summary,
+            template_ids=[template.id for _assignment, template in rows],
+        )
+        if title
+        else set()
+    )
     for assignment, template in rows:
-        title_matches = bool(title and _quest_offer_is_similar(template, title=title, description=summary))
+        title_matches = bool(
+            template.id in candidate_ids and _quest_offer_is_similar(template, title=title, description=summary)
+        )
         single_active_summary_hint = assignment.status == "active" and not title and bool(summary) and len(active_rows) == 1
         if not title_matches and not single_active_summary_hint:
             continue
@@ -4037,6 +4114,42 @@ def build_session_state(
     actor_id: str,
     location_id: str | None,
     include_internal: bool = False,
+) -> dict[str, Any]:
+    snapshots = session_state_snapshot_cache(db)
+    snapshot_key = (
+        session_state_snapshot_key(
+            db,
+            world_id=world_id,
+            actor_id=actor_id,
+            location_id=location_id,
+            include_internal=include_internal,
+        )
+        if snapshots is not None
+        else None
+    )
+    if snapshots is not None and snapshot_key is not None:
+        cached = snapshots.get(snapshot_key)
+        if cached is not None:
+            return cached
+    state = _build_session_state(
+        db,
+        world_id=world_id,
+        actor_id=actor_id,
+        location_id=location_id,
+        include_internal=include_internal,
+    )
+    if snapshots is not None and snapshot_key is not None:
+        snapshots.put(snapshot_key, state)
+    return state
+
+
+def _build_session_state(
+    db: Session,
+    *,
+    world_id: str,
+    actor_id: str,
+    location_id: str | None,
+    include_internal: bool,
 ) -> dict[str, Any]:
     world_info = _world_pack_state(db, world_id)
     player_profile_row = get_player_profile(db, world_id, actor_id)
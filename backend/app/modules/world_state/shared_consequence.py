@@ -26,6 +26,7 @@ from app.modules.world_pack.service import PackConsequenceRule, SharedWorldActio
 from app.modules.world_state.history import canonize_history_candidates
 from app.modules.world_state.rules import standing_band
 from app.modules.world_state.entity_generation import pack_seed_entity_key
+from app.modules.world_state.reference_version import bump_world_reference_version
 
 
 ACTION_TAG_VALUES = {
@@ -209,6 +210,7 @@ def ensure_shared_world_seed(db: Session, *, world_id: str, actor_id: str | None
                 with db.begin_nested():
                     db.add(faction)
                     db.flush()
+                bump_world_reference_version(db, world_id)
             except IntegrityError:
                 faction = db.execute(stmt).scalar_one_or_none()
                 if faction is None:
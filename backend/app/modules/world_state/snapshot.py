@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import copy
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Protocol
+
+from sqlalchemy import and_, event, inspect, select, update
+from sqlalchemy.orm import ORMExecuteState, Session, sessionmaker
+
+from app.models.entities import (
+    Actor,
+    ActorKnowledgeEntry,
+    ActorTitleProgress,
+    ChapterTrack,
+    CharacterSheet,
+    ConsequenceThread,
+    Event,
+    Faction,
+    FactionStanding,
+    Item,
+    Location,
+    LocationRoute,
+    NPCProfile,
+    PlayerProfile,
+    QuestAssignment,
+    QuestTemplate,
+    Relationship,
+    RoutePressure,
+    SceneFrame,
+    SharedConsequenceApplication,
+    SharedHistoryRecord,
+    World,
+    WorldAxisState,
+    WorldBroadcastDelivery,
+    WorldBroadcastEvent,
+    WorldTick,
+    WorldTimelineCounter,
+    WorldTimelineEntry,
+)
+from app.modules.world_state.reference_version import PENDING_REFERENCE_BUMPS
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - only needed when a shared tier URL is configured
+    redis = None
+
+
+# Rows read by build_session_state, with the columns naming the actors whose state they belong to.
+ACTOR_SCOPED_STATE: dict[type, tuple[str, ...]] = {
+    Actor: ("id",),
+    PlayerProfile: ("actor_id",),
+    CharacterSheet: ("actor_id",),
+    QuestAssignment: ("owner_actor_id",),
+    SceneFrame: ("owner_actor_id", "focus_actor_id"),
+    ChapterTrack: ("owner_actor_id",),
+    RoutePressure: ("owner_actor_id",),
+    ConsequenceThread: ("owner_actor_id", "counterpart_actor_id"),
+    ActorKnowledgeEntry: ("actor_id",),
+    FactionStanding: ("actor_id",),
+    Item: ("owner_actor_id",),
+    ActorTitleProgress: ("actor_id",),
+    Relationship: ("from_actor_id", "to_actor_id"),
+    WorldBroadcastDelivery: ("actor_id",),
+}
+# Rows every actor in the world can see (NPC placement, places, routes, factions, world beats).
+WORLD_SCOPED_STATE: tuple[type, ...] = (
+    Actor,
+    NPCProfile,
+    Location,
+    LocationRoute,
+    Faction,
+    WorldAxisState,
+    SharedConsequenceApplication,
+    SharedHistoryRecord,
+    QuestTemplate,
+    Event,
+    WorldTimelineEntry,
+    WorldBroadcastEvent,
+    WorldTick,
+)
+
+_SNAPSHOT_CACHE = "session_state_snapshot_cache"
+_WRITES_PENDING = "session_state_writes_pending"
+_PENDING_WORLD_BUMPS = "session_state_world_bumps"
+_PENDING_ACTOR_BUMPS = "session_state_actor_bumps"
+
+
+def install_session_state_versioning(session_factory: sessionmaker[Session]) -> None:
+    """Keeps worlds.state_version / actors.state_version in step with ORM writes.
+
+    Every flush that touches a row in ``ACTOR_SCOPED_STATE`` or ``WORLD_SCOPED_STATE`` records
+    the owning actor or world; once the root transaction commits, their versions (and any
+    pending ``bump_world_reference_version``) are bumped in a short transaction of their own.
+    Bumping inside the writer's transaction would hold the world row lock until commit and queue
+    every turn in a shared world behind it. Cached snapshots keyed by the old versions may be
+    served for the instant between the commit and the bump, never afterwards. Bulk Core DML
+    bypasses the flush and must call ``bump_world_state_version`` /
+    ``bump_actor_state_versions`` itself.
+    """
+
+    if event.contains(session_factory, "after_flush", _record_state_scopes):
+        return
+    event.listen(session_factory, "after_flush", _record_state_scopes)
+    event.listen(session_factory, "do_orm_execute", _mark_dml_pending)
+    event.listen(session_factory, "after_commit", _publish_state_versions)
+    event.listen(session_factory, "after_transaction_end", _clear_pending_writes)
+
+
+def bump_world_state_version(db: Session, world_id: str) -> None:
+    db.info.setdefault(_PENDING_WORLD_BUMPS, set()).add(world_id)
+
+
+def bump_actor_state_versions(db: Session, actor_ids: set[str]) -> None:
+    if not actor_ids:
+        return
+    db.info.setdefault(_PENDING_ACTOR_BUMPS, set()).update(actor_ids)
+
+
+def session_writes_pending(db: Session) -> bool:
+    return bool(db.info.get(_WRITES_PENDING)) or _has_net_changes(db)
+
+
+def _has_net_changes(session: Session) -> bool:
+    # Re-assigning an equal value (seeding helpers do this on every call) leaves an instance
+    # in ``dirty`` without anything to write; only real changes count.
+    return bool(
+        session.new
+        or session.deleted
+        or any(session.is_modified(instance, include_collections=False) for instance in session.dirty)
+    )
+
+
+def _changed_state_scopes(session: Session) -> tuple[set[str], set[str]]:
+    world_ids: set[str] = set()
+    actor_ids: set[str] = set()
+    for instance in [*session.new, *session.dirty, *session.deleted]:
+        if instance in session.dirty and not session.is_modified(instance, include_collections=False):
+            continue
+        state = inspect(instance)
+        actor_columns = ACTOR_SCOPED_STATE.get(type(instance), ())
+        for column in actor_columns:
+            history = state.attrs[column].history
+            actor_ids.update(value for value in (*history.added, *history.unchanged, *history.deleted) if value)
+        if isinstance(instance, WORLD_SCOPED_STATE):
+            world_id = getattr(instance, "world_id", None)
+            if world_id:
+                world_ids.add(world_id)
+    return world_ids, actor_ids
+
+
+def _record_state_scopes(session: Session, flush_context: Any) -> None:
+    if not _has_net_changes(session):
+        return
+    session.info[_WRITES_PENDING] = True
+    world_ids, actor_ids = _changed_state_scopes(session)
+    for world_id in world_ids:
+        bump_world_state_version(session, world_id)
+    bump_actor_state_versions(session, actor_ids)
+
+
+def _publish_state_versions(session: Session) -> None:
+    if session.in_nested_transaction():
+        return  # a released SAVEPOINT; the root transaction may still roll back
+    world_ids = session.info.pop(_PENDING_WORLD_BUMPS, set())
+    actor_ids = session.info.pop(_PENDING_ACTOR_BUMPS, set())
+    reference_world_ids = session.info.pop(PENDING_REFERENCE_BUMPS, set())
+    if not (world_ids or actor_ids or reference_world_ids):
+        return
+    # Sorted so concurrent publishers take the version row locks in the same order.
+    with session.get_bind().begin() as connection:
+        if actor_ids:
+            connection.execute(
+                update(Actor).where(Actor.id.in_(sorted(actor_ids))).values(state_version=Actor.state_version + 1)
+            )
+        if world_ids:
+            connection.execute(
+                update(World).where(World.id.in_(sorted(world_ids))).values(state_version=World.state_version + 1)
+            )
+        if reference_world_ids:
+            connection.execute(
+                update(World)
+                .where(World.id.in_(sorted(reference_world_ids)))
+                .values(reference_version=World.reference_version + 1)
+            )
+
+
+def _mark_dml_pending(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info[_WRITES_PENDING] = True
+
+
+def _clear_pending_writes(session: Session, transaction: Any) -> None:
+    if transaction.parent is None:
+        # Runs after ``_publish_state_versions`` on commit; on rollback the bumps are dropped.
+        for key in (_WRITES_PENDING, _PENDING_WORLD_BUMPS, _PENDING_ACTOR_BUMPS, PENDING_REFERENCE_BUMPS):
+            session.info.pop(key, None)
+
+
+@dataclass(frozen=True)
+class SessionStateSnapshotKey:
+    world_id: str
+    actor_id: str
+    location_id: str | None
+    include_internal: bool
+    canonical_sequence: int
+    world_version: tuple[int, int]
+    actor_state_version: int
+
+    def shared_key(self) -> str:
+        return ":".join(
+            [
+                "session-state",
+                self.world_id,
+                self.actor_id,
+                self.location_id or "-",
+                "internal" if self.include_internal else "public",
+                str(self.canonical_sequence),
+                *(str(item) for item in self.world_version),
+                str(self.actor_state_version),
+            ]
+        )
+
+
+def session_state_snapshot_key(
+    db: Session,
+    *,
+    world_id: str,
+    actor_id: str,
+    location_id: str | None,
+    include_internal: bool,
+) -> SessionStateSnapshotKey | None:
+    """One-query version probe; ``None`` when the snapshot must be rebuilt and not stored.
+
+    A session holding uncommitted writes sees versions no other transaction can, so it
+    neither reads nor populates the cache.
+    """
+
+    if session_writes_pending(db):
+        return None
+    row = db.execute(
+        select(
+            WorldTimelineCounter.next_sequence,
+            World.state_version,
+            World.reference_version,
+            Actor.state_version,
+        )
+        .select_from(World)
+        .join(Actor, and_(Actor.id == actor_id, Actor.world_id == World.id))
+        .outerjoin(WorldTimelineCounter, WorldTimelineCounter.world_id == World.id)
+        .where(World.id == world_id)
+    ).one_or_none()
+    if row is None:
+        return None
+    return SessionStateSnapshotKey(
+        world_id=world_id,
+        actor_id=actor_id,
+        location_id=location_id,
+        include_internal=include_internal,
+        canonical_sequence=int(row[0] or 0),
+        world_version=(int(row[1] or 0), int(row[2] or 0)),
+        actor_state_version=int(row[3] or 0),
+    )
+
+
+class SharedSnapshotTier(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, *, ttl_seconds: float) -> None: ...
+
+
+class RedisSnapshotTier:
+    """Shared tier for multi-worker deployments. Versioned keys never need invalidation."""
+
+    def __init__(self, url: str) -> None:
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            return self._client.get(key)
+        except redis.RedisError:
+            return None
+
+    def set(self, key: str, value: bytes, *, ttl_seconds: float) -> None:
+        try:
+            self._client.set(key, value, px=max(int(ttl_seconds * 1000), 1))
+        except redis.RedisError:
+            return
+
+
+def build_shared_snapshot_tier(url: str) -> SharedSnapshotTier | None:
+    if not url:
+        return None
+    if redis is None:
+        raise RuntimeError(
+            "SESSION_STATE_SNAPSHOT_SHARED_URL is set but the redis package is not installed; "
+            "install the backend with its redis extra"
+        )
+    return RedisSnapshotTier(url)
+
+
+class SessionStateSnapshotCache:
+    """Process-local snapshots of build_session_state with an optional shared tier behind it.
+
+    Entries are keyed by ``SessionStateSnapshotKey`` so a newer world or actor version simply
+    misses; ``ttl_seconds`` only bounds state derived from wall-clock windows. Snapshots are
+    copied on the way in and out because callers decorate the state they get back. Each
+    container owns one and attaches it to its session factory (``install_session_state_snapshots``).
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = True,
+        max_entries: int = 1024,
+        ttl_seconds: float = 30.0,
+        shared_tier: SharedSnapshotTier | None = None,
+    ) -> None:
+        self.enabled = enabled
+        self.max_entries = max(max_entries, 1)
+        self.ttl_seconds = ttl_seconds
+        self.shared_tier = shared_tier
+        self._entries: OrderedDict[SessionStateSnapshotKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: SessionStateSnapshotKey) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry[1])
+            if entry is not None:
+                self._entries.pop(key, None)
+        if self.shared_tier is None:
+            return None
+        payload = self.shared_tier.get(key.shared_key())
+        if payload is None:
+            return None
+        # JSON only: the shared tier is another process's memory, so its bytes are data, never code.
+        try:
+            state = json.loads(payload)
+        except ValueError:
+            return None
+        if not isinstance(state, dict):
+            return None
+        self._store(key, state, stored_at=now)
+        return copy.deepcopy(state)
+
+    def put(self, key: SessionStateSnapshotKey, state: dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+        snapshot = copy.deepcopy(state)
+        self._store(key, snapshot, stored_at=time.monotonic())
+        if self.shared_tier is not None:
+            payload = json.dumps(snapshot, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            self.shared_tier.set(key.shared_key(), payload, ttl_seconds=self.ttl_seconds)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, key: SessionStateSnapshotKey, state: dict[str, Any], *, stored_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (stored_at, state)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def install_session_state_snapshots(session_factory: sessionmaker[Session], cache: SessionStateSnapshotCache) -> None:
+    """Serves build_session_state for sessions from ``session_factory`` out of ``cache``.
+
+    Sessions from any other factory (scripts, bare engines) build their state uncached.
+    """
+
+    session_factory.configure(info={**(session_factory.kw.get("info") or {}), _SNAPSHOT_CACHE: cache})
+
+
+def session_state_snapshot_cache(db: Session) -> SessionStateSnapshotCache | None:
+    cache = db.info.get(_SNAPSHOT_CACHE)
+    return cache if cache is not None and cache.enabled else None
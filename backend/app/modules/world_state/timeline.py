@@ -5,14 +5,35 @@ from datetime import datetime, timedelta, timezone
 import hashlib
 from typing import Any
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Select,
+    String,
+    cast,
+    exists,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
 
 from app.models.entities import (
     Actor,
     Event,
     LocationRoute,
     Session as GameSession,
+    World,
     WorldBroadcastDelivery,
     WorldBroadcastEvent,
     WorldResourceLock,
@@ -21,9 +42,11 @@ from app.models.entities import (
 )
 from app.modules.world_pack.service import resolve_world_pack
 from app.modules.world_state.shared_consequence import resolve_shared_action_tag, pack_scoped_entity_id
+from app.modules.world_state.snapshot import bump_actor_state_versions
 
 
 LOCK_LEASE_SECONDS = 120
+_SEQUENCE_FALLBACK_KEY = "timeline_sequence_in_transaction"
 
 
 @dataclass(frozen=True)
@@ -59,7 +82,7 @@ def canonicalize_event(
         if existing is not None:
             return existing
 
-    sequence = _next_sequence(db, event.world_id)
+    sequence = timeline_sequences.allocate(db, event.world_id)
     entry = WorldTimelineEntry(
         world_id=event.world_id,
         sequence=sequence,
@@ -81,7 +104,86 @@ def canonicalize_event(
     return entry
 
 
-def _next_sequence(db: Session, world_id: str) -> int:
+class TimelineSequenceAllocator:
+    """Hands out canonical timeline sequences, each reserved in its own short transaction.
+
+    A sequence is reserved by bumping the world's counter row in a separate committed
+    transaction, so the row lock is released at once instead of being held until the turn that
+    asked for it commits. Nothing is cached between calls: API and scheduler processes all
+    reserve from the same counter at the moment they allocate, so sequences increase in
+    allocation order across processes and ``canonical_sequence`` ordering and paging follow it.
+    A turn that allocated earlier can still commit later, and a rolled-back turn leaves a gap,
+    so readers may rely on the order of sequences but never on their contiguity.
+
+    Only dialects in ``reserve_dialects`` reserve separately. SQLite serializes every writer
+    anyway, and a second connection there would wait on the caller's own write lock. Other
+    dialects keep locking the counter inside the caller's transaction. So does a world the
+    caller created in its still-open transaction, because other connections cannot see it yet.
+    """
+
+    def __init__(self, *, reserve_dialects: tuple[str, ...] = ("postgresql",)) -> None:
+        self.reserve_dialects = reserve_dialects
+
+    def allocate(self, db: Session, world_id: str) -> int:
+        bind = db.get_bind()
+        if bind.dialect.name not in self.reserve_dialects or _uses_in_transaction_sequence(db, world_id):
+            return _next_sequence_in_transaction(db, world_id)
+        sequence = _reserve_sequence(bind.engine, world_id)
+        if sequence is None:
+            _mark_in_transaction_sequence(db, world_id)
+            return _next_sequence_in_transaction(db, world_id)
+        return sequence
+
+
+timeline_sequences = TimelineSequenceAllocator()
+
+
+def _reserve_sequence(engine: Engine, world_id: str) -> int | None:
+    """Claims the world's next sequence in a committed transaction; ``None`` if the world is not visible."""
+
+    for _attempt in range(2):
+        with engine.begin() as connection:
+            if not connection.execute(select(exists().where(World.id == world_id))).scalar():
+                return None
+            end = connection.execute(
+                update(WorldTimelineCounter)
+                .where(WorldTimelineCounter.world_id == world_id)
+                .values(next_sequence=WorldTimelineCounter.next_sequence + 1)
+                .returning(WorldTimelineCounter.next_sequence)
+            ).scalar_one_or_none()
+            if end is not None:
+                return int(end) - 1
+            max_sequence = connection.execute(
+                select(func.max(Event.canonical_sequence)).where(Event.world_id == world_id)
+            ).scalar_one()
+            sequence = int(max_sequence or 0) + 1
+            try:
+                with connection.begin_nested():
+                    connection.execute(
+                        insert(WorldTimelineCounter).values(world_id=world_id, next_sequence=sequence + 1)
+                    )
+            except IntegrityError:
+                # Another writer created the counter first; bump it on the next attempt.
+                continue
+            return sequence
+    return None
+
+
+def _uses_in_transaction_sequence(db: Session, world_id: str) -> bool:
+    marker = db.info.get(_SEQUENCE_FALLBACK_KEY)
+    return marker is not None and marker[0] is db.get_transaction() and world_id in marker[1]
+
+
+def _mark_in_transaction_sequence(db: Session, world_id: str) -> None:
+    # The caller's transaction now holds the counter row; a second connection would wait on it.
+    transaction = db.get_transaction()
+    marker = db.info.get(_SEQUENCE_FALLBACK_KEY)
+    if marker is None or marker[0] is not transaction:
+        marker = db.info[_SEQUENCE_FALLBACK_KEY] = (transaction, set())
+    marker[1].add(world_id)
+
+
+def _next_sequence_in_transaction(db: Session, world_id: str) -> int:
     stmt = select(WorldTimelineCounter).where(WorldTimelineCounter.world_id == world_id)
     if db.bind is not None and db.bind.dialect.name == "postgresql":
         stmt = stmt.with_for_update()
@@ -167,38 +269,49 @@ def reserve_resources(
     resources: list[ResourceRef],
     lease_seconds: int = LOCK_LEASE_SECONDS,
 ) -> ResourceReservationResult:
+    """Reserves every planned resource with a fixed number of round trips.
+
+    Resources are handled in ``(resource_type, resource_id)`` order, so two turns asking for
+    overlapping sets always try them in the same order. All advisory locks are tried in one
+    statement and all active lock rows are read in one query. New ``WorldResourceLock`` rows
+    go out in one bulk insert on a single flush. Results keep the caller's planning order.
+    """
+
     now = datetime.now(timezone.utc)
     expires_at = now + timedelta(seconds=lease_seconds)
-    held: list[WorldResourceLock] = []
-    constraints: list[dict[str, Any]] = []
-    for resource in resources:
-        if not _try_resource_advisory_lock(db, world_id=world_id, resource=resource):
-            constraints.append(
-                {
-                    "resource_type": resource.resource_type,
-                    "resource_id": resource.resource_id,
-                    "holder_turn_id": None,
-                    "holder_session_id": None,
-                    "constraint_summary": resource.summary,
-                    "expires_at": expires_at.isoformat(),
-                }
-            )
+    planned = list({(resource.resource_type, resource.resource_id): resource for resource in resources}.values())
+    ordered = sorted(planned, key=lambda resource: (resource.resource_type, resource.resource_id))
+    advisory = _try_resource_advisory_locks(db, world_id=world_id, resources=ordered)
+    lockable = [resource for resource in ordered if advisory[_resource_key(resource)]]
+    active = _active_locks(db, world_id=world_id, resources=lockable, now=now)
+    held_by_key: dict[tuple[str, str], WorldResourceLock] = {}
+    constraints_by_key: dict[tuple[str, str], dict[str, Any]] = {}
+    created: list[WorldResourceLock] = []
+    for resource in ordered:
+        key = _resource_key(resource)
+        if not advisory[key]:
+            constraints_by_key[key] = {
+                "resource_type": resource.resource_type,
+                "resource_id": resource.resource_id,
+                "holder_turn_id": None,
+                "holder_session_id": None,
+                "constraint_summary": resource.summary,
+                "expires_at": expires_at.isoformat(),
+            }
             continue
-        existing = _active_lock(db, world_id=world_id, resource=resource, now=now)
+        existing = active.get(key)
         if existing is not None and existing.holder_turn_id != turn_id:
-            constraints.append(
-                {
-                    "resource_type": resource.resource_type,
-                    "resource_id": resource.resource_id,
-                    "holder_turn_id": existing.holder_turn_id,
-                    "holder_session_id": existing.holder_session_id,
-                    "constraint_summary": existing.constraint_summary or resource.summary,
-                    "expires_at": existing.expires_at.isoformat(),
-                }
-            )
+            constraints_by_key[key] = {
+                "resource_type": resource.resource_type,
+                "resource_id": resource.resource_id,
+                "holder_turn_id": existing.holder_turn_id,
+                "holder_session_id": existing.holder_session_id,
+                "constraint_summary": existing.constraint_summary or resource.summary,
+                "expires_at": existing.expires_at.isoformat(),
+            }
             continue
         if existing is not None:
-            held.append(existing)
+            held_by_key[key] = existing
             continue
         lock = WorldResourceLock(
             world_id=world_id,
@@ -211,17 +324,41 @@ def reserve_resources(
             expires_at=expires_at,
             constraint_summary=resource.summary,
         )
-        db.add(lock)
-        db.flush()
-        held.append(lock)
-    return ResourceReservationResult(held=held, constraints=constraints)
+        created.append(lock)
+        held_by_key[key] = lock
+    db.add_all(created)
+    # One flush writes the expired rows and sends the new locks as a single bulk insert.
+    db.flush()
+    planned_keys = [_resource_key(resource) for resource in planned]
+    return ResourceReservationResult(
+        held=[held_by_key[key] for key in planned_keys if key in held_by_key],
+        constraints=[constraints_by_key[key] for key in planned_keys if key in constraints_by_key],
+    )
 
 
-def _try_resource_advisory_lock(db: Session, *, world_id: str, resource: ResourceRef) -> bool:
-    if db.bind is None or db.bind.dialect.name != "postgresql":
-        return True
-    lock_key = _resource_advisory_lock_key(world_id, resource)
-    return bool(db.execute(select(func.pg_try_advisory_xact_lock(lock_key))).scalar_one())
+def _resource_key(resource: ResourceRef) -> tuple[str, str]:
+    return resource.resource_type, resource.resource_id
+
+
+def _try_resource_advisory_locks(
+    db: Session,
+    *,
+    world_id: str,
+    resources: list[ResourceRef],
+) -> dict[tuple[str, str], bool]:
+    """Tries every transaction-scoped advisory lock in one ``SELECT``, left to right."""
+
+    if not resources or db.bind is None or db.bind.dialect.name != "postgresql":
+        return {_resource_key(resource): True for resource in resources}
+    row = db.execute(
+        select(
+            *(
+                func.pg_try_advisory_xact_lock(_resource_advisory_lock_key(world_id, resource)).label(f"lock_{index}")
+                for index, resource in enumerate(resources)
+            )
+        )
+    ).one()
+    return {_resource_key(resource): bool(acquired) for resource, acquired in zip(resources, row)}
 
 
 def _resource_advisory_lock_key(world_id: str, resource: ResourceRef) -> int:
@@ -273,7 +410,7 @@ def create_timeline_constraint(
 ) -> WorldTimelineEntry | None:
     if not constraints:
         return None
-    sequence = _next_sequence(db, world_id)
+    sequence = timeline_sequences.allocate(db, world_id)
     entry = WorldTimelineEntry(
         world_id=world_id,
         sequence=sequence,
@@ -306,7 +443,7 @@ def create_timeline_entry(
 ) -> WorldTimelineEntry:
     entry = WorldTimelineEntry(
         world_id=world_id,
-        sequence=_next_sequence(db, world_id),
+        sequence=timeline_sequences.allocate(db, world_id),
         entry_kind=entry_kind,
         source_event_id=source_event_id,
         scope_kind=scope_kind,
@@ -331,39 +468,39 @@ def sync_active_broadcast_deliveries(
 ) -> list[WorldBroadcastDelivery]:
     if location_id is None:
         return []
-    broadcasts = list(
-        db.execute(
-            select(WorldBroadcastEvent).where(
+    broadcast_ids = [
+        broadcast_id
+        for broadcast_id, affected_location_ids in db.execute(
+            select(WorldBroadcastEvent.id, WorldBroadcastEvent.affected_location_ids).where(
                 WorldBroadcastEvent.world_id == world_id,
                 WorldBroadcastEvent.status == "active",
             )
-        ).scalars()
+        ).all()
+        if location_id in {str(item) for item in affected_location_ids or []}
+    ]
+    if not broadcast_ids:
+        return []
+    _insert_missing_deliveries(
+        db,
+        select(
+            WorldBroadcastEvent.id.label("broadcast_event_id"),
+            literal(session_id, String).label("session_id"),
+            literal(actor_id, String).label("actor_id"),
+        ).where(WorldBroadcastEvent.world_id == world_id, WorldBroadcastEvent.id.in_(broadcast_ids)),
+        world_id=world_id,
+        reason="active_broadcast_scope_match",
     )
-    deliveries: list[WorldBroadcastDelivery] = []
-    for broadcast in broadcasts:
-        affected = {str(item) for item in broadcast.affected_location_ids or []}
-        if location_id not in affected:
-            continue
-        existing = db.execute(
+    by_broadcast = {
+        delivery.broadcast_event_id: delivery
+        for delivery in db.execute(
             select(WorldBroadcastDelivery).where(
                 WorldBroadcastDelivery.world_id == world_id,
-                WorldBroadcastDelivery.broadcast_event_id == broadcast.id,
                 WorldBroadcastDelivery.session_id == session_id,
+                WorldBroadcastDelivery.broadcast_event_id.in_(broadcast_ids),
             )
-        ).scalar_one_or_none()
-        if existing is None:
-            existing = WorldBroadcastDelivery(
-                world_id=world_id,
-                broadcast_event_id=broadcast.id,
-                session_id=session_id,
-                actor_id=actor_id,
-                status="pending",
-                payload={"reason": "active_broadcast_scope_match"},
-            )
-            db.add(existing)
-            db.flush()
-        deliveries.append(existing)
-    return deliveries
+        ).scalars()
+    }
+    return [by_broadcast[broadcast_id] for broadcast_id in broadcast_ids if broadcast_id in by_broadcast]
 
 
 def pending_broadcast_constraints(
@@ -490,41 +627,102 @@ def deliver_broadcast_to_active_sessions(db: Session, *, broadcast: WorldBroadca
     affected = {str(item) for item in broadcast.affected_location_ids or []}
     if not affected:
         return []
-    rows = list(
-        db.execute(
-            select(GameSession, Actor)
-            .join(Actor, (Actor.id == GameSession.player_actor_id) & (Actor.world_id == GameSession.world_id))
-            .where(
-                GameSession.world_id == broadcast.world_id,
-                GameSession.status == "active",
-                Actor.current_location_id.in_(affected),
-            )
-        ).all()
+    recipients = (
+        select(GameSession.id.label("session_id"), Actor.id.label("actor_id"))
+        .join(Actor, (Actor.id == GameSession.player_actor_id) & (Actor.world_id == GameSession.world_id))
+        .where(
+            GameSession.world_id == broadcast.world_id,
+            GameSession.status == "active",
+            Actor.current_location_id.in_(sorted(affected)),
+        )
+        .subquery()
     )
-    deliveries: list[WorldBroadcastDelivery] = []
-    for session, actor in rows:
-        existing = db.execute(
+    _insert_missing_deliveries(
+        db,
+        select(
+            literal(broadcast.id, String).label("broadcast_event_id"),
+            recipients.c.session_id,
+            recipients.c.actor_id,
+        ),
+        world_id=broadcast.world_id,
+        reason="broadcast_created",
+    )
+    return list(
+        db.execute(
             select(WorldBroadcastDelivery).where(
                 WorldBroadcastDelivery.world_id == broadcast.world_id,
                 WorldBroadcastDelivery.broadcast_event_id == broadcast.id,
-                WorldBroadcastDelivery.session_id == session.id,
+                WorldBroadcastDelivery.session_id.in_(select(recipients.c.session_id)),
             )
-        ).scalar_one_or_none()
-        if existing is not None:
-            deliveries.append(existing)
-            continue
-        delivery = WorldBroadcastDelivery(
-            world_id=broadcast.world_id,
-            broadcast_event_id=broadcast.id,
-            session_id=session.id,
-            actor_id=actor.id,
-            status="pending",
-            payload={"reason": "broadcast_created"},
+        ).scalars()
+    )
+
+
+def _insert_missing_deliveries(db: Session, recipients: Select[Any], *, world_id: str, reason: str) -> None:
+    """Fans ``recipients`` (broadcast_event_id, session_id, actor_id) out in one INSERT ... SELECT.
+
+    Sessions that already have the delivery are skipped by ``ON CONFLICT DO NOTHING`` on the
+    (world, broadcast, session) unique key. Ids are generated by the database, so no row passes
+    through the ORM. The rows bypass the flush, so the recipients' snapshot versions are bumped
+    here, using the actor ids the insert returns.
+    """
+
+    dialect = db.get_bind().dialect.name
+    insert_for_dialect = postgresql_insert if dialect == "postgresql" else sqlite_insert
+    now = datetime.now(timezone.utc)
+    source = recipients.subquery()
+    statement = (
+        insert_for_dialect(WorldBroadcastDelivery)
+        .from_select(
+            [
+                "id",
+                "world_id",
+                "broadcast_event_id",
+                "session_id",
+                "actor_id",
+                "status",
+                "payload",
+                "created_at",
+                "updated_at",
+            ],
+            select(
+                _sql_new_id(dialect),
+                literal(world_id, String),
+                source.c.broadcast_event_id,
+                source.c.session_id,
+                source.c.actor_id,
+                literal("pending", String),
+                literal({"reason": reason}, JSON),
+                literal(now, DateTime(timezone=True)),
+                literal(now, DateTime(timezone=True)),
+            )
+            # SQLite needs a WHERE before ON CONFLICT to tell the upsert from a join constraint.
+            .where(true()),
         )
-        db.add(delivery)
-        db.flush()
-        deliveries.append(delivery)
-    return deliveries
+        .on_conflict_do_nothing(index_elements=["world_id", "broadcast_event_id", "session_id"])
+        .returning(WorldBroadcastDelivery.actor_id)
+    )
+    bump_actor_state_versions(db, set(db.execute(statement).scalars()))
+
+
+def _sql_new_id(dialect: str) -> ColumnElement[str]:
+    """A random UUID4 string computed by the database, matching ``new_id`` for Python-side rows."""
+
+    if dialect == "postgresql":
+        return cast(func.gen_random_uuid(), String)
+    hex_bytes = lambda size: func.lower(func.hex(func.randomblob(size)))  # noqa: E731
+    return (
+        hex_bytes(4)
+        + "-"
+        + hex_bytes(2)
+        + "-4"
+        + func.substr(hex_bytes(2), 2)
+        + "-"
+        + func.substr("89ab", 1 + func.abs(func.random()) % 4, 1)
+        + func.substr(hex_bytes(2), 2)
+        + "-"
+        + hex_bytes(6)
+    )
 
 
 def affected_locations_for_broadcast(db: Session, *, world_id: str, origin_location_id: str | None) -> list[str]:
@@ -548,26 +746,42 @@ def affected_locations_for_broadcast(db: Session, *, world_id: str, origin_locat
     return sorted(locations)
 
 
-def _active_lock(db: Session, *, world_id: str, resource: ResourceRef, now: datetime) -> WorldResourceLock | None:
-    row = db.execute(
+def _active_locks(
+    db: Session,
+    *,
+    world_id: str,
+    resources: list[ResourceRef],
+    now: datetime,
+) -> dict[tuple[str, str], WorldResourceLock]:
+    """Latest active lock per resource from one query; a latest lock past its expiry is marked expired.
+
+    Expired rows are only changed in memory, and the caller's flush writes them.
+    """
+
+    if not resources:
+        return {}
+    rows = db.execute(
         select(WorldResourceLock)
         .where(
             WorldResourceLock.world_id == world_id,
-            WorldResourceLock.resource_type == resource.resource_type,
-            WorldResourceLock.resource_id == resource.resource_id,
             WorldResourceLock.status == "active",
+            tuple_(WorldResourceLock.resource_type, WorldResourceLock.resource_id).in_(
+                [_resource_key(resource) for resource in resources]
+            ),
         )
         .order_by(WorldResourceLock.expires_at.desc(), WorldResourceLock.id.desc())
-        .limit(1)
-    ).scalar_one_or_none()
-    if row is None:
-        return None
-    if _aware_datetime(row.expires_at) <= now:
-        row.status = "expired"
-        row.released_at = now
-        db.flush()
-        return None
-    return row
+    ).scalars()
+    latest: dict[tuple[str, str], WorldResourceLock] = {}
+    for row in rows:
+        latest.setdefault((row.resource_type, row.resource_id), row)
+    active: dict[tuple[str, str], WorldResourceLock] = {}
+    for key, row in latest.items():
+        if _aware_datetime(row.expires_at) <= now:
+            row.status = "expired"
+            row.released_at = now
+            continue
+        active[key] = row
+    return active
 
 
 def _aware_datetime(value: datetime) -> datetime:
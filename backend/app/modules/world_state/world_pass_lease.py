@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import exists, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.entities import WorldPassLease
+
+
+def claim_world_pass_lease(
+    db: Session,
+    *,
+    world_id: str,
+    holder: str,
+    lease_seconds: float,
+    now: datetime | None = None,
+) -> bool:
+    """Claims the world's idle-pass lease for ``holder`` until ``lease_seconds`` from now.
+
+    Succeeds when no lease row exists yet, when the previous lease has expired, or when
+    ``holder`` already owns it. The conditional update is atomic, so two scheduler replicas
+    racing for the same world never both win; a losing insert surfaces as an integrity error
+    inside a savepoint. The caller commits before starting the pass so other replicas see it.
+    """
+
+    now = now or datetime.now(timezone.utc)
+    expires_at = now + timedelta(seconds=lease_seconds)
+    claimed = db.execute(
+        update(WorldPassLease)
+        .where(
+            WorldPassLease.world_id == world_id,
+            or_(WorldPassLease.holder == holder, WorldPassLease.expires_at <= now),
+        )
+        .values(holder=holder, acquired_at=now, expires_at=expires_at, attempts=WorldPassLease.attempts + 1)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if claimed:
+        return True
+    if db.execute(select(exists().where(WorldPassLease.world_id == world_id))).scalar():
+        return False
+    try:
+        with db.begin_nested():
+            db.add(WorldPassLease(world_id=world_id, holder=holder, acquired_at=now, expires_at=expires_at, attempts=1))
+    except IntegrityError:
+        return False
+    return True
+
+
+def release_world_pass_lease(db: Session, *, world_id: str, holder: str, now: datetime | None = None) -> None:
+    """Expires the lease if ``holder`` still owns it, letting any replica claim the world again."""
+
+    db.execute(
+        update(WorldPassLease)
+        .where(WorldPassLease.world_id == world_id, WorldPassLease.holder == holder)
+        .values(expires_at=now or datetime.now(timezone.utc))
+        .execution_options(synchronize_session=False)
+    )
+
+
+def renew_world_pass_lease(
+    db: Session,
+    *,
+    world_id: str,
+    holder: str,
+    lease_seconds: float,
+    now: datetime | None = None,
+) -> bool:
+    """Extends the lease for ``lease_seconds`` from now if ``holder`` still owns it unexpired.
+
+    A pass calls this in its own transaction right before committing and discards its work
+    when it returns ``False``. The update locks the lease row until that commit, so no other
+    replica can claim the world between the check and the commit.
+    """
+
+    now = now or datetime.now(timezone.utc)
+    return bool(
+        db.execute(
+            update(WorldPassLease)
+            .where(
+                WorldPassLease.world_id == world_id,
+                WorldPassLease.holder == holder,
+                WorldPassLease.expires_at > now,
+            )
+            .values(expires_at=now + timedelta(seconds=lease_seconds))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+    )
@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 
 from app.core.container import build_container
+from app.modules.admin_ops.llm_usage import compact_llm_usage_rollups
 
 
 def main() -> None:
@@ -11,7 +12,8 @@ def main() -> None:
         with container.session_factory() as db:
             projected = container.projection_service.process_pending(db)
             embedded = container.memory_service.process_pending(db)
-            if projected or embedded:
+            rolled_up = compact_llm_usage_rollups(db)
+            if projected or embedded or rolled_up:
                 db.commit()
             else:
                 db.rollback()
@@ -650,11 +650,12 @@ function applyResolvedTurnResponse(response: TurnResponse) {
     const rawTurnId = data.turn_id;
     const turnId = typeof rawTurnId === "string" && rawTurnId.trim() ? rawTurnId : streamingTurnId || "pending";
     const final = data.final === true;
+    const replace = final || data.replace === true;
     setStreamingTurnId(turnId);
     setAnimatedTurnId(turnId);
     setTurnNarrativeStreaming(true);
     setStreamingStoryItem((current) => {
-      const nextNarrative = final || !current || current.turn_id !== turnId
+      const nextNarrative = replace || !current || current.turn_id !== turnId
         ? rawDelta
         : `${current.narrative}${rawDelta}`;
       return {
@@ -664,6 +665,16 @@ function applyResolvedTurnResponse(response: TurnResponse) {
     });
   }
 
+  function applyLocalizationPartial(data: Record<string, unknown>) {
+    // Cached translations arrive before the localization model call returns; show them in place
+    // of the source-language draft until turn.resolved brings the complete text.
+    const narrative = data.narrative;
+    if (typeof narrative !== "string" || narrative.length === 0) {
+      return;
+    }
+    applyNarrativeDelta({ turn_id: data.turn_id, delta: narrative, replace: true });
+  }
+
   useEffect(() => {
     if (!session || !token) {
       if (socketRef.current) {
@@ -695,6 +706,9 @@ function applyResolvedTurnResponse(response: TurnResponse) {
       if (parsed.event === "turn.narrative.delta") {
         applyNarrativeDelta(parsed.data as Record<string, unknown>);
       }
+      if (parsed.event === "turn.localization.partial") {
+        applyLocalizationPartial(parsed.data as Record<string, unknown>);
+      }
       if (parsed.event === "turn.progress") {
         const phase = typeof parsed.data.phase === "string" ? parsed.data.phase : "";
         const status = typeof parsed.data.status === "string" ? parsed.data.status : "";
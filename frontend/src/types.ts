@@ -864,6 +864,14 @@ export type RebuildSummary = {
   edge_count: number;
 };
 
+export type SPLedgerReasonTotal = {
+  reason_code: string;
+  entry_count: number;
+  delta_total: number;
+  paid_delta_total: number;
+  bonus_delta_total: number;
+};
+
 export type SPOverview = {
   default_balance: number;
   initial_bonus_sp: number;
@@ -874,6 +882,7 @@ export type SPOverview = {
   total_bonus_sp: number;
   total_accounts: number;
   total_ledger_entries: number;
+  ledger_by_reason: SPLedgerReasonTotal[];
   recent_adjustments: SPLedgerItem[];
 };
 
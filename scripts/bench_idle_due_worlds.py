@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from sqlalchemy import create_engine, insert, select  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.core.config import Settings  # noqa: E402
+from app.models.base import Base  # noqa: E402
+from app.models.entities import Actor, Session as GameSession, Turn, World, WorldTick  # noqa: E402
+from app.modules.world_state.ambient import AmbientWorldPassService  # noqa: E402
+
+
+def populate(db: Session, *, worlds: int, sessions: int, turns: int, ticks: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+
+    def minutes_ago() -> datetime:
+        return now - timedelta(minutes=rng.randint(0, 120))
+
+    world_rows, actor_rows, session_rows, turn_rows, tick_rows = [], [], [], [], []
+    for world_index in range(worlds):
+        world_id = f"bench-world-{world_index:04d}"
+        actor_id = f"{world_id}-actor"
+        world_rows.append({"id": world_id, "name": world_id, "state": {}, "created_at": now, "updated_at": now})
+        actor_rows.append(
+            {"id": actor_id, "world_id": world_id, "actor_type": "player", "display_name": "p", "created_at": now, "updated_at": now}
+        )
+        for session_index in range(sessions):
+            session_id = f"{world_id}-s{session_index:03d}"
+            stamp = minutes_ago()
+            session_rows.append(
+                {
+                    "id": session_id,
+                    "world_id": world_id,
+                    "player_actor_id": actor_id,
+                    "status": "active" if rng.random() < 0.8 else "closed",
+                    "created_at": stamp,
+                    "updated_at": max(stamp, minutes_ago()),
+                }
+            )
+            for turn_index in range(turns):
+                turn_rows.append(
+                    {
+                        "id": f"{session_id}-t{turn_index}",
+                        "world_id": world_id,
+                        "session_id": session_id,
+                        "actor_id": actor_id,
+                        "input_text": "look around",
+                        "resolved_output": {},
+                        "model_lane": "stub",
+                        "action_type": "system" if rng.random() < 0.2 else "narrative",
+                        "created_at": minutes_ago(),
+                        "updated_at": now,
+                    }
+                )
+        for tick_index in range(ticks):
+            tick_rows.append(
+                {
+                    "id": f"{world_id}-k{tick_index}",
+                    "world_id": world_id,
+                    "tick_kind": "idle_world_pass",
+                    "status": "completed" if rng.random() < 0.8 else "failed",
+                    "created_at": minutes_ago(),
+                    "completed_at": minutes_ago() if rng.random() < 0.9 else None,
+                    "updated_at": now,
+                }
+            )
+    for model, rows in ((World, world_rows), (Actor, actor_rows), (GameSession, session_rows), (Turn, turn_rows), (WorldTick, tick_rows)):
+        db.execute(insert(model), rows)
+    db.commit()
+
+
+def per_world_due_rows(db: Session, settings: Settings) -> list[tuple[str, datetime]]:
+    """The per-world loop the grouped query replaced: two lookups for every active world."""
+
+    rows: list[tuple[str, datetime]] = []
+    seen: set[str] = set()
+    for game_session in db.execute(
+        select(GameSession)
+        .where(GameSession.status == "active")
+        .order_by(GameSession.updated_at.desc(), GameSession.id.asc())
+    ).scalars():
+        if game_session.world_id in seen:
+            continue
+        seen.add(game_session.world_id)
+        last_turn = db.execute(
+            select(Turn)
+            .where(Turn.world_id == game_session.world_id, Turn.action_type != "system")
+            .order_by(Turn.created_at.desc(), Turn.id.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+        activity_at = last_turn.created_at if last_turn is not None else game_session.created_at
+        due_at = activity_at.replace(tzinfo=timezone.utc) + timedelta(seconds=settings.world_idle_grace_seconds)
+        last_tick = db.execute(
+            select(WorldTick)
+            .where(
+                WorldTick.world_id == game_session.world_id,
+                WorldTick.tick_kind == "idle_world_pass",
+                WorldTick.status == "completed",
+            )
+            .order_by(WorldTick.completed_at.desc(), WorldTick.created_at.desc(), WorldTick.id.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+        if last_tick is not None:
+            tick_at = (last_tick.completed_at or last_tick.created_at).replace(tzinfo=timezone.utc)
+            due_at = max(due_at, tick_at + timedelta(seconds=settings.world_idle_interval_seconds))
+        rows.append((game_session.world_id, due_at))
+    return rows
+
+
+def timed(label: str, repeat: int, run) -> dict[str, object]:  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    duration = time.perf_counter() - started
+    print(f"{label}: {duration * 1000 / repeat:.3f} ms per scan", flush=True)
+    return {"name": label, "ms_per_scan": round(duration * 1000 / repeat, 4)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark due-world detection for idle world passes.")
+    parser.add_argument("--worlds", type=int, default=500)
+    parser.add_argument("--sessions", type=int, default=50, help="Sessions per world")
+    parser.add_argument("--turns", type=int, default=2, help="Turns per session")
+    parser.add_argument("--ticks", type=int, default=4, help="Idle world ticks per world")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    settings = Settings()
+    service = AmbientWorldPassService(settings, model_router=None, memory_service=None)  # type: ignore[arg-type]
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        with factory() as db:
+            populate(db, worlds=args.worlds, sessions=args.sessions, turns=args.turns, ticks=args.ticks, seed=args.seed)
+            expected = per_world_due_rows(db, settings)
+            actual = list(service.idle_pass_due_times(db).items())
+            mismatches = sum(1 for left, right in zip(expected, actual) if left != right) + abs(len(expected) - len(actual))
+            print(
+                f"worlds={args.worlds} sessions_per_world={args.sessions} due_rows={len(expected)} mismatches={mismatches}",
+                flush=True,
+            )
+            results = [
+                timed("per_world_loop", args.repeat, lambda: per_world_due_rows(db, settings)),
+                timed("grouped_query", args.repeat, lambda: service.idle_pass_due_times(db)),
+            ]
+        engine.dispose()
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(
+            json.dumps(
+                {"worlds": args.worlds, "sessions_per_world": args.sessions, "mismatches": mismatches, "results": results},
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from app.modules.localization.glossary import GlossaryMatcher  # noqa: E402
+
+
+def build_glossary(size: int) -> list[tuple[str, str]]:
+    districts = ["Nexus", "Lift Tower", "Archive", "Harbor", "Ember", "Verdant", "Signal", "Tidal"]
+    roles = ["Gate", "Concourse", "Liaison", "Historian", "Warden", "Market", "Relay", "Spire", "Annex", "Ward"]
+    entries: list[tuple[str, str]] = []
+    for index in range(size):
+        district = districts[index % len(districts)]
+        role = roles[(index // len(districts)) % len(roles)]
+        entries.append((f"{district} {role} {index}", f"{district[:2]}区{role[:2]}・第{index}番"))
+    return entries
+
+
+def build_texts(entries: list[tuple[str, str]], count: int) -> list[str]:
+    texts: list[str] = []
+    for index in range(count):
+        source_a, localized_a = entries[index % len(entries)]
+        source_b, localized_b = entries[(index * 7 + 3) % len(entries)]
+        texts.append(
+            f"{source_a}の気配を読み、{localized_b[:2]}{localized_b}へ向かう。"
+            f"途中で{source_b}の記録を確かめ、{localized_a}に戻る。" * 3
+        )
+    return texts
+
+
+def sequential_replace(value: str, entries: list[tuple[str, str]]) -> str:
+    """The per-entry ``str.replace`` pass the compiled matcher replaced."""
+
+    ordered = sorted(entries, key=lambda item: len(item[0]), reverse=True)
+    localized = value
+    for source_text, localized_text in ordered:
+        if source_text and localized_text and source_text != localized_text:
+            localized = localized.replace(source_text, localized_text)
+    for _source_text, localized_text in ordered:
+        for split_at in range(1, len(localized_text)):
+            localized = localized.replace(f"{localized_text[:split_at]}{localized_text}", localized_text)
+    return localized
+
+
+def timed(label: str, repeat: int, run) -> dict[str, object]:  # type: ignore[no-untyped-def]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    duration = time.perf_counter() - started
+    print(f"{label}: {duration * 1000 / repeat:.3f} ms per batch", flush=True)
+    return {"name": label, "ms_per_batch": round(duration * 1000 / repeat, 4)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark glossary application for play localization.")
+    parser.add_argument("--entries", type=int, default=96)
+    parser.add_argument("--texts", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+    if args.entries < 80:
+        parser.error("--entries must be at least 80 to reflect a full glossary")
+
+    entries = build_glossary(args.entries)
+    texts = build_texts(entries, args.texts)
+    matcher = GlossaryMatcher(entries)
+    mismatches = sum(1 for text in texts if matcher.apply(text) != sequential_replace(text, entries))
+    print(f"glossary entries={len(entries)} texts={len(texts)} mismatches={mismatches}", flush=True)
+
+    results = [
+        timed("sequential_replace", args.repeat, lambda: [sequential_replace(text, entries) for text in texts]),
+        timed("compiled_matcher", args.repeat, lambda: [matcher.apply(text) for text in texts]),
+        timed("compile_once", args.repeat, lambda: GlossaryMatcher(entries)),
+    ]
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(
+            json.dumps({"entries": len(entries), "texts": len(texts), "mismatches": mismatches, "results": results}, indent=2),
+            encoding="utf-8",
+        )
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from sqlalchemy import create_engine, delete, func, select  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.models.base import Base  # noqa: E402
+from app.models.entities import (  # noqa: E402
+    Actor,
+    Event,
+    Session as GameSession,
+    Turn,
+    World,
+    WorldTimelineCounter,
+    WorldTimelineEntry,
+)
+from app.modules.session.service import _finalize_event_timeline_and_broadcast  # noqa: E402
+from app.modules.world_state import timeline  # noqa: E402
+from app.modules.world_state.reference_version import bump_world_reference_version  # noqa: E402
+from app.modules.world_state.snapshot import install_session_state_versioning  # noqa: E402
+from app.modules.world_state.timeline import TimelineSequenceAllocator  # noqa: E402
+
+
+WORLD_ID = "bench-timeline-world"
+
+
+def seed(factory: sessionmaker) -> dict[str, str]:
+    with factory() as db:
+        db.add(World(id=WORLD_ID, name=WORLD_ID))
+        db.flush()
+        actor = Actor(world_id=WORLD_ID, actor_type="player", display_name="bench")
+        db.add(actor)
+        db.flush()
+        game_session = GameSession(world_id=WORLD_ID, player_actor_id=actor.id)
+        db.add(game_session)
+        db.flush()
+        turn = Turn(world_id=WORLD_ID, session_id=game_session.id, actor_id=actor.id, input_text="bench", model_lane="stub")
+        db.add(turn)
+        db.commit()
+        return {"actor_id": actor.id, "session_id": game_session.id, "turn_id": turn.id}
+
+
+def cleanup(factory: sessionmaker) -> None:
+    with factory() as db:
+        for model in (WorldTimelineEntry, Event, WorldTimelineCounter, Turn, GameSession, Actor, World):
+            db.execute(delete(model).where(model.world_id == WORLD_ID if model is not World else World.id == WORLD_ID))
+        db.commit()
+
+
+def run_writers(
+    factory: sessionmaker,
+    refs: dict[str, str],
+    *,
+    threads: int,
+    turns: int,
+    hold_seconds: float,
+) -> tuple[float, list[int], int]:
+    """Every simulated turn runs the turn's timeline write and holds the transaction a while.
+
+    The write is the one resolved turns commit: the event row, ``_finalize_event_timeline_and_broadcast``
+    and an NPC move's reference bump, with the world version bumps the app applies after commit.
+    """
+
+    sequences: list[int] = []
+    errors: list[BaseException] = []
+    guard = threading.Lock()
+
+    def writer() -> None:
+        for _ in range(turns):
+            try:
+                with factory() as db:
+                    event = Event(
+                        world_id=WORLD_ID,
+                        session_id=refs["session_id"],
+                        turn_id=refs["turn_id"],
+                        event_type="player.turn.resolved",
+                        source_actor_id=refs["actor_id"],
+                        narrative="bench",
+                        payload={"action_type": "talk", "consequence_summary": "bench"},
+                    )
+                    db.add(event)
+                    db.flush()
+                    _finalize_event_timeline_and_broadcast(db, event=event)
+                    bump_world_reference_version(db, WORLD_ID)
+                    sequence = int(event.canonical_sequence)
+                    time.sleep(hold_seconds)
+                    db.commit()
+                with guard:
+                    sequences.append(sequence)
+            except BaseException as exc:
+                with guard:
+                    errors.append(exc)
+
+    workers = [threading.Thread(target=writer) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started, sequences, len(errors)
+
+
+def bench_database(label: str, engine: Engine, args: argparse.Namespace) -> tuple[list[dict[str, object]], int]:
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    install_session_state_versioning(factory)
+    strategies = [("counter_row_lock", TimelineSequenceAllocator(reserve_dialects=()))]
+    if engine.dialect.name != "sqlite":
+        # On SQLite a separate reservation would wait on the writer lock its own turn already holds.
+        strategies.append(("reserved_sequences", TimelineSequenceAllocator(reserve_dialects=(engine.dialect.name,))))
+    results: list[dict[str, object]] = []
+    mismatches = 0
+    default_allocator = timeline.timeline_sequences
+    for name, allocator in strategies:
+        cleanup(factory)
+        refs = seed(factory)
+        timeline.timeline_sequences = allocator
+        try:
+            duration, sequences, errors = run_writers(
+                factory, refs, threads=args.threads, turns=args.turns, hold_seconds=args.hold_ms / 1000
+            )
+        finally:
+            timeline.timeline_sequences = default_allocator
+        with factory() as db:
+            stored = db.execute(select(func.count(func.distinct(Event.canonical_sequence))).where(Event.world_id == WORLD_ID)).scalar_one()
+            # Every committed turn bumps the world once after commit; none of the bumps may be lost.
+            reference_version = db.execute(select(World.reference_version).where(World.id == WORLD_ID)).scalar_one()
+        expected = args.threads * args.turns
+        bad = (
+            errors
+            + abs(expected - len(set(sequences)))
+            + abs(expected - int(stored))
+            + abs(expected - int(reference_version or 0))
+        )
+        mismatches += bad
+        print(
+            f"{label} {name}: {expected / duration:.1f} turns/s over {duration * 1000:.0f} ms, "
+            f"errors={errors} duplicates_or_missing={bad - errors}",
+            flush=True,
+        )
+        results.append(
+            {
+                "database": label,
+                "name": name,
+                "turns_per_second": round(expected / duration, 2),
+                "duration_ms": round(duration * 1000, 2),
+                "errors": errors,
+            }
+        )
+    cleanup(factory)
+    return results, mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark canonical timeline sequence allocation under contention.")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--turns", type=int, default=20, help="Turns per thread")
+    parser.add_argument("--hold-ms", type=float, default=5.0, help="Time each turn keeps its transaction open")
+    parser.add_argument("--database-url", default="", help="Also run against this database, e.g. PostgreSQL")
+    parser.add_argument("--output", default="")
+    args = parser.parse_args()
+
+    results: list[dict[str, object]] = []
+    mismatches = 0
+    with tempfile.TemporaryDirectory() as directory:
+        # SQLite has one writer lock for the whole file and keeps the in-transaction counter.
+        engine = create_engine(
+            f"sqlite:///{Path(directory) / 'bench.db'}",
+            connect_args={"check_same_thread": False, "timeout": 60},
+            pool_size=args.threads + 2,
+        )
+        sqlite_results, sqlite_mismatches = bench_database("sqlite", engine, args)
+        results.extend(sqlite_results)
+        mismatches += sqlite_mismatches
+        engine.dispose()
+    if args.database_url:
+        engine = create_engine(args.database_url, pool_size=args.threads * 2 + 2)
+        other_results, other_mismatches = bench_database(engine.dialect.name, engine, args)
+        results.extend(other_results)
+        mismatches += other_mismatches
+        engine.dispose()
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(
+            json.dumps({"threads": args.threads, "turns": args.turns, "mismatches": mismatches, "results": results}, indent=2),
+            encoding="utf-8",
+        )
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,8 @@ from app.main import create_app
 from app.models.base import Base
 from app.models.entities import PackPreprocessRun
 from app.modules.world_pack.service import pack_content_hash, template_world_id
+from app.modules.localization.service import session_state_localization_memo
+from app.modules.session.service import _world_reference_directories
 import app.modules.observability.service as observability_module
 
 
@@ -187,6 +189,9 @@ def test_settings(tmp_path: Path) -> Settings:
 @pytest.fixture()
 def container(test_settings: Settings):
     observability_module.propagate_attributes = _fake_propagate_attributes
+    # Every test gets a fresh database, so localized sections remembered for an earlier one are stale.
+    session_state_localization_memo.clear()
+    _world_reference_directories.clear()
     built = build_container(test_settings)
     built.observability_service._langfuse_client = _FakeLangfuseClient(
         base_url=test_settings.langfuse_base_url,
@@ -216,7 +221,8 @@ def container(test_settings: Settings):
                     )
                 )
         db.commit()
-    return built
+    yield built
+    built.close()
 
 
 @pytest.fixture()
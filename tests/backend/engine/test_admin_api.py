@@ -8,7 +8,12 @@ from fastapi import HTTPException
 from sqlalchemy import delete, select
 
 from app.api.deps import get_current_ops_user
-from app.models.entities import AdminAppUser, AdminPromptOverride, AdminRuntimeConfig, LLMRun, Turn
+from app.models.entities import AdminAppUser, AdminPromptOverride, AdminRuntimeConfig, LLMRun, RollupWatermark, Turn
+from app.modules.admin_ops.llm_usage import (
+    LLM_USAGE_WATERMARK,
+    compact_llm_usage_rollups,
+    llm_usage_rolled_through,
+)
 from app.modules.identity.oidc import UserIdentity
 from tests.backend.turn_async_helpers import post_turn_and_wait
 
@@ -153,6 +158,7 @@ def test_admin_llm_usage_returns_model_timeline(client, container, auth_headers)
                     total_tokens=150,
                     prompt_cache_hit_tokens=20,
                     prompt_cache_miss_tokens=80,
+                    context_tokens_saved=25,
                     input_hash="hash-a",
                     input_context_hash="context-a",
                     schema_version="1",
@@ -218,6 +224,8 @@ def test_admin_llm_usage_returns_model_timeline(client, container, auth_headers)
     assert payload["totals"]["cache_miss_tokens"] == 110
     assert payload["totals"]["cache_hit_rate"] == pytest.approx(30 / 140)
     assert payload["totals"]["missing_usage_count"] == 1
+    assert payload["totals"]["context_tokens_saved"] == 25
+    assert payload["totals"]["context_trimmed_run_count"] == 1
     assert len(payload["models"]) == 3
     assert payload["models"][0]["model_id"] == "model-a"
     assert payload["models"][0]["total_tokens"] == 150
@@ -226,3 +234,91 @@ def test_admin_llm_usage_returns_model_timeline(client, container, auth_headers)
     daily_response = client.get("/admin/llm-usage?range=30d", headers=auth_headers)
     assert daily_response.status_code == 200
     assert daily_response.json()["bucket"] == "day"
+
+
+def test_admin_llm_usage_reads_rollups_for_compacted_hours(client, container, auth_headers):
+    session_response = client.post(
+        "/sessions",
+        json={
+            "world_id": "gestaloka_world_reference",
+            "world_name": "GESTALOKA: Layered World Foundation",
+            "player_display_name": "Demo Player",
+        },
+        headers=auth_headers,
+    )
+    assert session_response.status_code == 200
+    post_turn_and_wait(
+        client,
+        session_id=session_response.json()["session_id"],
+        auth_headers=auth_headers,
+        payload={"input_mode": "choice", "choice_id": "choice_1"},
+    )
+
+    now = datetime.now(timezone.utc)
+    with container.session_factory() as db:
+        turn = db.execute(select(Turn).order_by(Turn.created_at.desc(), Turn.id.desc()).limit(1)).scalar_one()
+        db.add_all(
+            [
+                LLMRun(
+                    world_id=turn.world_id,
+                    turn_id=turn.id,
+                    prompt_id="test.prompt",
+                    workflow_name="gm_council",
+                    model_id="model-latency",
+                    model_lane="main_lane",
+                    provider_name="openai_compatible",
+                    prompt_tokens=10,
+                    completion_tokens=5,
+                    total_tokens=15,
+                    latency_ms=latency_ms,
+                    input_hash=f"hash-{index}",
+                    input_context_hash=f"context-{index}",
+                    schema_version="1",
+                    graph_context_status="ready",
+                    output_schema_status="valid",
+                    output_payload={"status": "resolved"},
+                    created_at=now - timedelta(hours=hours_ago),
+                )
+                for index, (hours_ago, latency_ms) in enumerate([(5, 80), (5, 400), (3, 1800), (0, 90)])
+            ]
+        )
+        db.commit()
+
+    before = client.get("/admin/llm-usage?range=24h", headers=auth_headers).json()
+    before_daily = client.get("/admin/llm-usage?range=30d", headers=auth_headers).json()
+    model = next(item for item in before["models"] if item["model_id"] == "model-latency")
+    assert model["run_count"] == 4
+    assert model["latency_run_count"] == 4
+    assert model["latency_p50_ms"] == 100
+    assert model["latency_p95_ms"] == 2000
+
+    with container.session_factory() as db:
+        assert compact_llm_usage_rollups(db, now=now) is True
+        db.commit()
+        assert llm_usage_rolled_through(db) == now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=1)
+        assert compact_llm_usage_rollups(db, now=now) is False
+        # Rolled-up hours are served from llm_usage_rollups even once the raw rows are gone.
+        db.execute(delete(LLMRun).where(LLMRun.model_id == "model-latency", LLMRun.latency_ms > 100))
+        db.commit()
+
+    after = client.get("/admin/llm-usage?range=24h", headers=auth_headers).json()
+    assert after == before
+    assert client.get("/admin/llm-usage?range=30d", headers=auth_headers).json() == before_daily
+
+
+def test_llm_usage_watermark_advances_across_hours_without_runs(container):
+    now = datetime.now(timezone.utc).replace(minute=30, second=0, microsecond=0)
+    with container.session_factory() as db:
+        db.execute(delete(LLMRun))
+        db.execute(delete(RollupWatermark))
+        db.add(RollupWatermark(name=LLM_USAGE_WATERMARK, rolled_through=now.replace(minute=0) - timedelta(days=10)))
+        db.commit()
+
+    # Ten empty days take two capped passes; each must move the watermark the worker commits.
+    for _ in range(2):
+        with container.session_factory() as db:
+            assert compact_llm_usage_rollups(db, now=now) is True
+            db.commit()
+    with container.session_factory() as db:
+        assert llm_usage_rolled_through(db) == now.replace(minute=0) - timedelta(hours=1)
+        assert compact_llm_usage_rollups(db, now=now) is False
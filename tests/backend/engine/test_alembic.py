@@ -44,6 +44,7 @@ def test_alembic_upgrade_creates_v2_tables(monkeypatch, tmp_path: Path):
         "world_ticks",
         "sp_accounts",
         "sp_ledger",
+        "sp_ledger_daily_rollups",
         "llm_runs",
         "eval_runs",
         "eval_case_results",
@@ -123,6 +124,8 @@ def test_alembic_upgrade_creates_v2_tables(monkeypatch, tmp_path: Path):
         "total_tokens",
         "prompt_cache_hit_tokens",
         "prompt_cache_miss_tokens",
+        "context_tokens_saved",
+        "context_trimming",
         "input_context_hash",
         "langfuse_trace_id",
         "langfuse_observation_id",
@@ -324,5 +327,51 @@ def test_paid_bonus_sp_migration_backfills_existing_balance(monkeypatch, tmp_pat
             )
         ).one()
 
+        rollup = conn.execute(
+            text(
+                "SELECT reason_code, shard, entry_count, delta_total, bonus_delta_total "
+                "FROM sp_ledger_daily_rollups"
+            )
+        ).all()
+
     assert account == (0, 10, 10)
     assert ledger == (0, 10, 0, 10, 10, 10)
+    assert rollup == [("wallet_seed", 0, 1, 10, 10)]
+
+
+def test_quest_similarity_backfill_indexes_existing_templates(monkeypatch, tmp_path: Path):
+    db_path = tmp_path / "quest-similarity-backfill.db"
+    sqlite_url = f"sqlite:///{db_path}"
+    repo_root = next(parent for parent in Path(__file__).resolve().parents if (parent / "AGENTS.md").exists() and (parent / "backend").is_dir())
+    alembic_path = repo_root / "backend" / "alembic.ini"
+
+    monkeypatch.setenv("ALEMBIC_DATABASE_URL", sqlite_url)
+    monkeypatch.setenv("DATABASE_URL", sqlite_url)
+
+    config = Config(str(alembic_path))
+    config.set_main_option("script_location", str(repo_root / "backend" / "alembic"))
+    command.upgrade(config, "0043_sp_ledger_rollups")
+    engine = create_engine(sqlite_url)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO quest_templates "
+                "(id, world_id, title, description, status, stage_key, unlock_requirements, reward_template_key, "
+                "reward_name, reward_description, state, created_at, updated_at) "
+                "VALUES ('legacy-quest', 'legacy-world', 'Visitor Log', 'Register the visitor log at the gate.', "
+                "'active', 'starter', '{}', 'none', '', '', '{}', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            )
+        )
+
+    command.upgrade(config, "head")
+
+    with engine.connect() as conn:
+        signature = conn.execute(
+            text("SELECT similarity_signature FROM quest_templates WHERE id = 'legacy-quest'")
+        ).scalar_one()
+        bucket_count = conn.execute(
+            text("SELECT COUNT(*) FROM quest_template_similarity_buckets WHERE quest_template_id = 'legacy-quest'")
+        ).scalar_one()
+
+    assert signature is not None and "minhash" in signature
+    assert bucket_count > 1
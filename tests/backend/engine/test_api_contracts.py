@@ -1640,6 +1640,12 @@ def test_ops_projection_status_and_rebuild_contract(client, container, auth_head
     assert council_detail_payload["roles"][-1]["model_lane"] in {"main_lane", "pro_lane"}
     assert "attempts" in council_detail_payload["roles"][-1]
     assert council_detail_payload["resolved_output"]["retrieval_trace"]["status"] == "ready"
+    assert {item["source"] for item in council_detail_payload["resolved_output"]["context_prefetch"]} == {
+        "alias_index",
+        "world_directory",
+        "memory_retrieval",
+        "context_plan",
+    }
     assert council_detail_payload["langfuse_trace_url"].startswith("http://langfuse.test/project/gestaloka-v2/traces/")
     assert council_detail_payload["roles"][-1]["langfuse_trace_url"].startswith(
         "http://langfuse.test/project/gestaloka-v2/traces/"
@@ -1987,6 +1993,9 @@ def test_ops_eval_contracts(client, container, auth_headers):
     assert {"primary", "canary", "langfuse", "recent_traces", "metrics"} <= set(observability_payload)
     assert observability_payload["snapshot_id"]
     assert observability_payload["langfuse"]["runtime_status"] == "ready"
+    assert observability_payload["llm_circuit_breakers"]["open_count"] == 0
+    assert observability_payload["llm_circuit_breakers"]["retry_budget"]["capacity"] > 0
+    assert observability_payload["council_speculation"]["enabled"] is True
     scoped_observability_response = client.get(
         "/ops/observability/summary?pack_id=gestaloka_world_reference&world_template_id=layered_world_foundation",
         headers=auth_headers,
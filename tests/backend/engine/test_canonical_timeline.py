@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import event as sqlalchemy_event, func, select
 
 from app.models.entities import (
     Actor,
@@ -20,9 +21,13 @@ from app.models.entities import (
 )
 from app.modules.event_log.service import list_world_events
 from app.modules.world_state.timeline import (
+    ResourceRef,
+    TimelineSequenceAllocator,
     canonicalize_event,
     create_broadcast_from_turn,
+    deliver_broadcast_to_active_sessions,
     pending_broadcast_constraints,
+    reserve_resources,
     sync_active_broadcast_deliveries,
 )
 from tests.backend.turn_async_helpers import post_turn_and_wait
@@ -108,6 +113,167 @@ def test_canonical_timeline_sequences_are_per_world_and_drive_event_log_order(co
         ).scalars()] == [1, 2]
 
 
+def test_reserved_sequences_stay_unique_and_ordered_across_processes(container):
+    allocator = TimelineSequenceAllocator(reserve_dialects=("sqlite",))
+    # A second allocator stands in for another process, e.g. the world scheduler.
+    other_process = TimelineSequenceAllocator(reserve_dialects=("sqlite",))
+    with container.session_factory() as db:
+        db.add(World(id="timeline-blocks", name="Timeline Blocks", status="active"))
+        db.flush()
+        # The world is not committed yet, so only this transaction can number its events.
+        actor, session, turn = _seed_actor_session_turn(db, world_id="timeline-blocks", actor_name="blocks")
+        first = _seed_event(db, world_id="timeline-blocks", session=session, actor=actor, turn=turn)
+        first.canonical_sequence = allocator.allocate(db, "timeline-blocks")
+        second = _seed_event(db, world_id="timeline-blocks", session=session, actor=actor, turn=turn)
+        second.canonical_sequence = allocator.allocate(db, "timeline-blocks")
+        db.commit()
+        assert [first.canonical_sequence, second.canonical_sequence] == [1, 2]
+        actor_id, session_id, turn_id = actor.id, session.id, turn.id
+
+    committed: list[list[int]] = [[] for _ in range(6)]
+    errors: list[BaseException] = []
+
+    def writer(index: int) -> None:
+        try:
+            for attempt in range(5):
+                with container.session_factory() as db:
+                    sequence = (allocator if index % 2 else other_process).allocate(db, "timeline-blocks")
+                    db.add(
+                        Event(
+                            world_id="timeline-blocks",
+                            session_id=session_id,
+                            turn_id=turn_id,
+                            event_type="player.turn.resolved",
+                            source_actor_id=actor_id,
+                            narrative=f"writer {index} attempt {attempt}",
+                            canonical_sequence=sequence,
+                        )
+                    )
+                    if attempt == 2:
+                        db.rollback()  # the abandoned number becomes a gap
+                        continue
+                    db.commit()
+                    committed[index].append(sequence)
+        except BaseException as exc:  # pragma: no cover - surfaced by the assertion below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=writer, args=(index,)) for index in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    # Each writer sees increasing numbers, and no number is handed out twice.
+    assert all(sequences == sorted(sequences) for sequences in committed)
+    flat = [sequence for sequences in committed for sequence in sequences]
+    assert len(flat) == len(set(flat)) == 24
+    with container.session_factory() as db:
+        stored = db.execute(
+            select(Event.canonical_sequence)
+            .where(Event.world_id == "timeline-blocks")
+            .order_by(Event.canonical_sequence.asc())
+        ).scalars().all()
+        counter = db.get(WorldTimelineCounter, "timeline-blocks")
+        assert counter is not None
+        assert stored == sorted({1, 2, *flat})
+        # 30 numbers were reserved one at a time on top of the two in-transaction ones.
+        assert counter.next_sequence == 3 + 30
+        assert max(stored) < counter.next_sequence
+
+    # Alternating processes still number events in the order they allocate them.
+    interleaved: list[int] = []
+    for process in (allocator, other_process, allocator, other_process):
+        with container.session_factory() as db:
+            interleaved.append(process.allocate(db, "timeline-blocks"))
+    assert interleaved == list(range(33, 37))
+
+
+def test_reserve_resources_uses_a_fixed_number_of_statements(container):
+    now = datetime.now(timezone.utc)
+    with container.session_factory() as db:
+        db.add(World(id="timeline-locks", name="Timeline Locks", status="active"))
+        db.flush()
+        _actor, session, turn = _seed_actor_session_turn(db, world_id="timeline-locks", actor_name="locks")
+        _other_actor, other_session, other_turn = _seed_actor_session_turn(db, world_id="timeline-locks", actor_name="other")
+        db.add_all(
+            [
+                WorldResourceLock(
+                    world_id="timeline-locks",
+                    resource_type="npc",
+                    resource_id="npc-busy",
+                    holder_turn_id=other_turn.id,
+                    holder_session_id=other_session.id,
+                    status="active",
+                    expires_at=now + timedelta(minutes=5),
+                    constraint_summary="Busy elsewhere.",
+                ),
+                WorldResourceLock(
+                    world_id="timeline-locks",
+                    resource_type="location",
+                    resource_id="loc-stale",
+                    holder_turn_id=other_turn.id,
+                    holder_session_id=other_session.id,
+                    status="active",
+                    expires_at=now - timedelta(minutes=1),
+                ),
+                WorldResourceLock(
+                    world_id="timeline-locks",
+                    resource_type="faction",
+                    resource_id="faction-mine",
+                    holder_turn_id=turn.id,
+                    holder_session_id=session.id,
+                    status="active",
+                    expires_at=now + timedelta(minutes=5),
+                ),
+            ]
+        )
+        db.commit()
+        resources = [
+            ResourceRef("npc", f"npc-{index}", "An NPC is answering another turn.") for index in range(5, 0, -1)
+        ] + [
+            ResourceRef("npc", "npc-busy", "An NPC is answering another turn."),
+            ResourceRef("location", "loc-stale", "The place is settling another event."),
+            ResourceRef("faction", "faction-mine", "A faction record is being revised."),
+            ResourceRef("npc", "npc-1", "Duplicate plans collapse."),
+        ]
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+        engine = db.get_bind()
+        sqlalchemy_event.listen(engine, "before_cursor_execute", record)
+        try:
+            result = reserve_resources(
+                db, world_id="timeline-locks", session_id=session.id, turn_id=turn.id, resources=resources
+            )
+        finally:
+            sqlalchemy_event.remove(engine, "before_cursor_execute", record)
+
+        # One read of the active locks, one update for the expired row, one bulk insert.
+        assert len(statements) == 3, statements
+        assert [(lock.resource_type, lock.resource_id) for lock in result.held] == [
+            ("npc", "npc-5"),
+            ("npc", "npc-4"),
+            ("npc", "npc-3"),
+            ("npc", "npc-2"),
+            ("npc", "npc-1"),
+            ("location", "loc-stale"),
+            ("faction", "faction-mine"),
+        ]
+        assert [(item["resource_id"], item["holder_turn_id"]) for item in result.constraints] == [("npc-busy", other_turn.id)]
+        db.commit()
+        statuses = dict(
+            db.execute(
+                select(WorldResourceLock.resource_id, WorldResourceLock.status).where(
+                    WorldResourceLock.world_id == "timeline-locks",
+                    WorldResourceLock.holder_turn_id == other_turn.id,
+                )
+            ).all()
+        )
+        assert statuses == {"npc-busy": "active", "loc-stale": "expired"}
+
+
 def test_resource_lock_conflict_continues_turn_and_records_constraints(client, container, auth_headers):
     session_response = client.post(
         "/sessions",
@@ -246,3 +412,67 @@ def test_broadcast_delivers_to_origin_adjacent_and_late_active_sessions(containe
                 WorldBroadcastEvent.semantic_key == broadcast.semantic_key,
             )
         ).scalar_one()
+
+
+def test_broadcast_fan_out_is_one_insert_for_many_sessions(container):
+    with container.session_factory() as db:
+        db.add(World(id="fanout-world", name="Fan-out World", status="active"))
+        db.flush()
+        db.add(Location(id="plaza", world_id="fanout-world", name="Plaza"))
+        db.flush()
+        seeded = [
+            _seed_actor_session_turn(db, world_id="fanout-world", actor_name=f"player-{index}", location_id="plaza")
+            for index in range(30)
+        ]
+        origin_actor, origin_session, origin_turn = seeded[0]
+        event = _seed_event(
+            db, world_id="fanout-world", session=origin_session, actor=origin_actor, turn=origin_turn, location_id="plaza"
+        )
+        broadcast, _ = create_broadcast_from_turn(
+            db,
+            event=event,
+            broadcast_draft={"summary": "Bells ring across the plaza.", "relevance_tags": ["bells"]},
+            action_tag="help",
+        )
+        assert broadcast is not None
+        db.commit()
+        versions_before = dict(db.execute(select(Actor.id, Actor.state_version).where(Actor.world_id == "fanout-world")).all())
+
+        late_actor, late_session, _ = _seed_actor_session_turn(
+            db, world_id="fanout-world", actor_name="late", location_id="plaza"
+        )
+        db.commit()
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+        engine = db.get_bind()
+        sqlalchemy_event.listen(engine, "before_cursor_execute", record)
+        try:
+            deliveries = deliver_broadcast_to_active_sessions(db, broadcast=broadcast)
+        finally:
+            sqlalchemy_event.remove(engine, "before_cursor_execute", record)
+
+        # Insert the missing delivery and read every delivery back; the recipient's version is
+        # bumped once the transaction commits.
+        assert len(statements) == 2, statements
+        assert statements[0].lstrip().upper().startswith("INSERT INTO WORLD_BROADCAST_DELIVERIES")
+        assert len(deliveries) == 31
+        assert len({delivery.id for delivery in deliveries}) == 31
+        assert all(len(delivery.id) == 36 and delivery.id.count("-") == 4 for delivery in deliveries)
+        late_delivery = next(delivery for delivery in deliveries if delivery.session_id == late_session.id)
+        assert late_delivery.actor_id == late_actor.id
+        assert late_delivery.status == "pending"
+        assert late_delivery.payload == {"reason": "broadcast_created"}
+        db.commit()
+        versions_after = dict(db.execute(select(Actor.id, Actor.state_version).where(Actor.world_id == "fanout-world")).all())
+        assert {actor_id for actor_id, version in versions_after.items() if version != versions_before.get(actor_id)} == {
+            late_actor.id
+        }
+        assert sync_active_broadcast_deliveries(
+            db, world_id="fanout-world", session_id=late_session.id, actor_id=late_actor.id, location_id="plaza"
+        ) == [late_delivery]
+        assert db.execute(
+            select(func.count()).select_from(WorldBroadcastDelivery).where(WorldBroadcastDelivery.world_id == "fanout-world")
+        ).scalar_one() == 31
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import select
+
+from app.models.entities import World
+from app.modules.session.prefetch import ContextPrefetcher, ContextSource, ReadOnlyPrefetchSessionError
+
+
+def _prefetcher(container) -> ContextPrefetcher:  # type: ignore[no-untyped-def]
+    return ContextPrefetcher(container.session_factory, ThreadPoolExecutor(max_workers=4))
+
+
+def test_prefetch_runs_independent_sources_concurrently_on_private_sessions(container) -> None:
+    with container.session_factory() as db:
+        db.add(World(id="prefetch-world", name="Prefetch World", state={}))
+        db.commit()
+
+    barrier = threading.Barrier(2, timeout=5)
+    sessions: list[object] = []
+
+    def load_world_name(db, _upstream):  # type: ignore[no-untyped-def]
+        sessions.append(db)
+        barrier.wait()
+        return db.execute(select(World.name).where(World.id == "prefetch-world")).scalar_one()
+
+    def load_threads(db, _upstream):  # type: ignore[no-untyped-def]
+        sessions.append(db)
+        barrier.wait()
+        return threading.current_thread().name
+
+    result = _prefetcher(container).run(
+        [
+            ContextSource("world_name", load_world_name),
+            ContextSource("thread_name", load_threads),
+            ContextSource("greeting", lambda _db, upstream: f"hello {upstream['world_name']}", after=("world_name",)),
+        ]
+    )
+
+    assert result["world_name"] == "Prefetch World"
+    assert result["greeting"] == "hello Prefetch World"
+    assert sessions[0] is not sessions[1]
+    assert [item["source"] for item in result.trace()][-1] == "greeting"
+    assert {item["status"] for item in result.trace()} == {"completed"}
+    assert result["thread_name"] != threading.current_thread().name
+
+
+def test_prefetch_sessions_are_read_only_and_optional_sources_fail_open(container) -> None:
+    def write_world(db, _upstream):  # type: ignore[no-untyped-def]
+        db.add(World(id="prefetch-write", name="Should Not Persist", state={}))
+        db.flush()
+
+    result = _prefetcher(container).run(
+        [
+            ContextSource("write", write_world, optional=True),
+            ContextSource("dependent", lambda _db, _upstream: "unused", after=("write",), optional=True),
+            ContextSource("steady", lambda _db, _upstream: "ok"),
+        ]
+    )
+    assert result["write"] is None
+    assert isinstance(result.errors["write"], ReadOnlyPrefetchSessionError)
+    assert result["dependent"] is None
+    assert result["steady"] == "ok"
+
+    with pytest.raises(ReadOnlyPrefetchSessionError):
+        _prefetcher(container).run([ContextSource("write", write_world)])
+    with container.session_factory() as db:
+        assert db.get(World, "prefetch-write") is None
+
+
+def test_prefetch_keeps_model_sources_off_the_database_pool(container) -> None:
+    release = threading.Event()
+    model_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch-test-model")
+    prefetcher = ContextPrefetcher(
+        container.session_factory,
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch-test-db"),
+        model_executor=model_pool,
+    )
+    # Another turn's planner call holds the whole model pool.
+    busy_planner = model_pool.submit(release.wait, 5)
+
+    loads = prefetcher.run([ContextSource("directory", lambda _db, _upstream: threading.current_thread().name)])
+    assert loads["directory"].startswith("prefetch-test-db")
+    assert not busy_planner.done()
+
+    release.set()
+    plan = prefetcher.run(
+        [ContextSource("plan", lambda _db, _upstream: threading.current_thread().name, model_call=True)]
+    )
+    assert plan["plan"].startswith("prefetch-test-model")
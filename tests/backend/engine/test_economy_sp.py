@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from datetime import datetime, timedelta, timezone
 
-from app.models.entities import Event, Memory, SPAccount, SPLedgerEntry, Turn
+from sqlalchemy import func, select, update
+
+from app.models.entities import Event, Memory, SPAccount, SPLedgerDailyRollup, SPLedgerEntry, Turn
 from tests.backend.turn_async_helpers import post_turn_and_wait
 
 
@@ -288,3 +290,79 @@ def test_world_state_reason_codes_are_rejected_for_sp_adjustments(client, auth_h
     )
     assert response.status_code == 422
     assert response.json()["detail"] == "Admin adjustments must use reason_code=admin_adjustment"
+
+
+def test_sp_ledger_rollups_reconcile_and_keyset_pages(client, container, auth_headers):
+    session_response = client.post("/sessions", json=engine_session_payload(), headers=auth_headers)
+    assert session_response.status_code == 200
+    # The last grant goes to another user, whose rollups land in a different shard.
+    grants = [("local-player", 1), ("local-player", 2), ("local-player", 3), ("local-player", 4), ("other-player", 5)]
+    for user_sub, delta in grants:
+        response = client.post(
+            "/ops/sp/adjustments",
+            json={
+                "user_sub": user_sub,
+                "delta": delta,
+                "reason_code": "admin_adjustment",
+                "sp_bucket": "paid",
+                "world_id": None,
+                "note": f"grant {delta}",
+            },
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+    with container.session_factory() as db:
+        raw_count = db.execute(select(func.count(SPLedgerEntry.id))).scalar_one()
+        assert sorted(
+            db.execute(
+                select(SPLedgerDailyRollup.shard, SPLedgerDailyRollup.entry_count).where(
+                    SPLedgerDailyRollup.reason_code == "admin_adjustment"
+                )
+            ).all()
+        ) == [(2, 4), (15, 1)]
+        all_ids = list(
+            db.execute(
+                select(SPLedgerEntry.id)
+                .where(SPLedgerEntry.user_sub == "local-player")
+                .order_by(SPLedgerEntry.created_at.desc(), SPLedgerEntry.id.desc())
+            ).scalars()
+        )
+
+    overview = client.get("/ops/sp/overview", headers=auth_headers).json()
+    assert overview["total_ledger_entries"] == raw_count
+    adjustments = next(item for item in overview["ledger_by_reason"] if item["reason_code"] == "admin_adjustment")
+    assert adjustments["entry_count"] == 5
+    assert adjustments["delta_total"] == adjustments["paid_delta_total"] == 15
+
+    paged_ids: list[str] = []
+    cursor = None
+    while True:
+        params = {"user_sub": "local-player", "limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/ops/sp/ledger", params=params, headers=auth_headers).json()
+        paged_ids.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert paged_ids == all_ids
+    assert client.get("/ops/sp/ledger", params={"cursor": "not-a-cursor"}, headers=auth_headers).status_code == 422
+
+    tomorrow = datetime.now(timezone.utc).date() + timedelta(days=1)
+    economy = container.economy_service
+    with container.session_factory() as db:
+        assert economy.reconcile_ledger_rollups(db, until=tomorrow)["status"] == "ready"
+
+        db.execute(
+            update(SPLedgerDailyRollup)
+            .where(SPLedgerDailyRollup.reason_code == "admin_adjustment")
+            .values(entry_count=SPLedgerDailyRollup.entry_count + 1)
+        )
+        drift = economy.reconcile_ledger_rollups(db, until=tomorrow)
+        assert drift["status"] == "drift"
+        assert [(item["reason_code"], item["expected"]["entry_count"]) for item in drift["mismatches"]] == [
+            ("admin_adjustment", 5)
+        ]
+
+        assert economy.reconcile_ledger_rollups(db, until=tomorrow, repair=True)["status"] == "repaired"
+        assert economy.reconcile_ledger_rollups(db, until=tomorrow)["status"] == "ready"
+        db.commit()
@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from app.modules.gm_council.scheduler import CouncilNodeResult, CouncilRoleNode, CouncilRoleScheduler
+from app.modules.gm_council.service import CouncilRequest
+from app.modules.session.progress import bind_turn_progress, emit_turn_event, turn_progress_bound
+
+
+def _sleeping_node(role: str, depends_on: tuple[str, ...], seconds: float, log: list[str]) -> CouncilRoleNode:
+    def run(results):  # type: ignore[no-untyped-def]
+        assert all(dependency in results for dependency in depends_on)
+        log.append(f"start:{role}")
+        time.sleep(seconds)
+        log.append(f"end:{role}")
+        return CouncilNodeResult(value=role)
+
+    return CouncilRoleNode(role, depends_on, run)
+
+
+def test_scheduler_overlaps_independent_roles_and_reports_critical_path():
+    log: list[str] = []
+    report = CouncilRoleScheduler(max_workers=4).run(
+        [
+            _sleeping_node("intent", (), 0.01, log),
+            _sleeping_node("memory", ("intent",), 0.08, log),
+            _sleeping_node("npc", ("intent",), 0.02, log),
+            _sleeping_node("situation", ("memory", "npc"), 0.01, log),
+        ]
+    )
+
+    assert log.index("start:npc") < log.index("end:memory")
+    assert log.index("start:situation") > log.index("end:memory")
+    assert report.halted_by is None
+    assert report.critical_path == ["intent", "memory", "situation"]
+    assert report.critical_path_ms >= 100
+    assert report.critical_path_ms <= report.wall_ms + 5
+    assert {item["role"] for item in report.summary()["roles"]} == {"intent", "memory", "npc", "situation"}
+
+
+def test_scheduler_stops_at_halt_but_drains_roles_in_flight():
+    release = threading.Event()
+
+    def intent(results):  # type: ignore[no-untyped-def]
+        return CouncilNodeResult(value="intent")
+
+    def memory(results):  # type: ignore[no-untyped-def]
+        return CouncilNodeResult(halt={"rejection_role": "memory"})
+
+    def npc(results):  # type: ignore[no-untyped-def]
+        release.wait(timeout=1)
+        return CouncilNodeResult(halt={"rejection_role": "npc"})
+
+    def downstream(results):  # type: ignore[no-untyped-def]
+        raise AssertionError("halted graphs must not start dependent roles")
+
+    def watcher(results):  # type: ignore[no-untyped-def]
+        release.set()
+        return CouncilNodeResult(value="watched")
+
+    report = CouncilRoleScheduler(max_workers=4).run(
+        [
+            CouncilRoleNode("intent", (), intent),
+            CouncilRoleNode("memory", ("intent",), memory),
+            CouncilRoleNode("npc", ("intent",), npc),
+            CouncilRoleNode("watcher", ("intent",), watcher),
+            CouncilRoleNode("situation", ("memory", "npc"), downstream),
+        ]
+    )
+
+    assert report.halted_by == "memory"
+    assert report.halt == {"rejection_role": "memory"}
+    assert set(report.results) == {"intent", "memory", "npc", "watcher"}
+
+
+def test_scheduler_rejects_cycles_and_unknown_dependencies():
+    def noop(results):  # type: ignore[no-untyped-def]
+        return CouncilNodeResult()
+
+    with pytest.raises(ValueError, match="cycle"):
+        CouncilRoleScheduler().run([CouncilRoleNode("a", ("b",), noop), CouncilRoleNode("b", ("a",), noop)])
+    with pytest.raises(ValueError, match="unknown roles"):
+        CouncilRoleScheduler().run([CouncilRoleNode("a", ("missing",), noop)])
+
+
+def test_council_resolve_turn_keeps_stage_events_and_role_order(container):
+    progress: list[dict[str, object]] = []
+    lock = threading.Lock()
+
+    def collect(payload: dict[str, object]) -> None:
+        with lock:
+            progress.append(payload)
+
+    with bind_turn_progress(collect):
+        outcome = container.council_service.resolve_turn(
+            CouncilRequest(
+                world_id="scheduler-world",
+                turn_id=None,
+                player_name="Demo Player",
+                npc_name="Rikka",
+                input_text="help the gate keeper sort the arrival records",
+                relevant_memories=[],
+                relation_context=[],
+                graph_context_status="ready",
+                session_state={},
+                input_mode="free_text",
+            )
+        )
+
+    assert outcome.succeeded
+    assert [role_run.council_role for role_run in outcome.role_runs] == [
+        "intent_interpreter",
+        "memory_manager",
+        "npc_manager",
+        "situation_mapper",
+        "world_progress",
+        "rules_arbiter",
+        "safety_guard",
+        "narrative",
+    ]
+    started_phases = {item.get("phase") for item in progress if item.get("status") == "started"}
+    assert {"intent_interpretation", "memory_council", "npc_council", "narrative"} <= started_phases
+    assert any(item.get("event") == "turn.narrative.delta" for item in progress)
+    schedule = outcome.council_schedule
+    assert schedule is not None
+    assert schedule["critical_path"][0] == "intent_interpreter"
+    assert schedule["critical_path"][-1] == "narrative"
+    assert schedule["critical_path_ms"] <= schedule["wall_ms"] + 5
+
+
+def test_scheduler_abandons_speculative_roles_after_halt():
+    release = threading.Event()
+
+    def intent(results):  # type: ignore[no-untyped-def]
+        return CouncilNodeResult(value="intent")
+
+    def speculative(results):  # type: ignore[no-untyped-def]
+        release.wait(timeout=2)
+        return CouncilNodeResult(value="draft")
+
+    def validator(results):  # type: ignore[no-untyped-def]
+        return CouncilNodeResult(halt={"rejection_role": "validator"})
+
+    def commit(results):  # type: ignore[no-untyped-def]
+        raise AssertionError("halted graphs must not commit speculative work")
+
+    started_at = time.perf_counter()
+    report = CouncilRoleScheduler(max_workers=4).run(
+        [
+            CouncilRoleNode("intent", (), intent),
+            CouncilRoleNode("validator", ("intent",), validator),
+            CouncilRoleNode("commit", ("validator", "draft"), commit),
+            CouncilRoleNode("draft", ("intent",), speculative, speculative=True, on_abandon=release.set),
+        ]
+    )
+    elapsed = time.perf_counter() - started_at
+
+    assert report.halted_by == "validator"
+    assert "draft" not in report.results
+    assert release.is_set()  # the abandoned role is told to stop spending
+    assert elapsed < 1
+
+
+def test_scheduler_waits_for_roles_in_flight_before_reraising():
+    sibling_started = threading.Event()
+    sibling_finished = threading.Event()
+
+    def intent(results):  # type: ignore[no-untyped-def]
+        return CouncilNodeResult(value="intent")
+
+    def memory(results):  # type: ignore[no-untyped-def]
+        sibling_started.wait(timeout=1)
+        raise RuntimeError("memory role failed")
+
+    def npc(results):  # type: ignore[no-untyped-def]
+        sibling_started.set()
+        time.sleep(0.05)
+        sibling_finished.set()
+        return CouncilNodeResult(value="npc")
+
+    def downstream(results):  # type: ignore[no-untyped-def]
+        raise AssertionError("failed graphs must not start dependent roles")
+
+    with pytest.raises(RuntimeError, match="memory role failed"):
+        CouncilRoleScheduler(max_workers=4).run(
+            [
+                CouncilRoleNode("intent", (), intent),
+                CouncilRoleNode("memory", ("intent",), memory),
+                CouncilRoleNode("npc", ("intent",), npc),
+                CouncilRoleNode("situation", ("memory", "npc"), downstream),
+            ]
+        )
+
+    assert sibling_finished.is_set()
+
+
+def _speculation_request(input_text: str = "help the gate keeper sort the arrival records") -> CouncilRequest:
+    return CouncilRequest(
+        world_id="speculation-world",
+        turn_id=None,
+        player_name="Demo Player",
+        npc_name="Rikka",
+        input_text=input_text,
+        relevant_memories=[],
+        relation_context=[],
+        graph_context_status="ready",
+        session_state={},
+        input_mode="free_text",
+    )
+
+
+def test_council_commits_speculative_narrative_when_validators_keep_tags(container, monkeypatch):
+    progress: list[dict[str, object]] = []
+    lock = threading.Lock()
+
+    def collect(payload: dict[str, object]) -> None:
+        with lock:
+            progress.append(payload)
+
+    router = container.council_service.model_router
+    original = router.execute_structured_prompt
+
+    def slow_safety(**kwargs):  # type: ignore[no-untyped-def]
+        if kwargs["prompt_id"] == "council.safety_guard":
+            time.sleep(0.05)
+        return original(**kwargs)
+
+    monkeypatch.setattr(router, "execute_structured_prompt", slow_safety)
+    with bind_turn_progress(collect):
+        # The force marker routes the validators through the model, which is what speculation hides.
+        outcome = container.council_service.resolve_turn(
+            _speculation_request("__force_llm_rules__ help the gate keeper sort the arrival records")
+        )
+
+    assert outcome.succeeded
+    assert [role_run.council_role for role_run in outcome.role_runs].count("narrative") == 1
+    assert outcome.council_schedule["speculation"]["hit"] is True
+    assert sum(1 for item in progress if item.get("event") == "turn.narrative.delta") == 1
+    narrative_progress = [item for item in progress if item.get("phase") == "narrative"]
+    assert [item["status"] for item in narrative_progress] == ["started", "completed"]
+    # The speculative call's stage is only reported once the validators before it are done.
+    assert progress.index(narrative_progress[0]) > progress.index(
+        next(item for item in progress if item.get("phase") == "safety_guard" and item["status"] == "completed")
+    )
+    stats = container.council_service.speculation_stats()
+    assert stats["hits"] == 1
+    assert stats["hit_rate"] == 1.0
+    assert stats["discarded_runs"] == 0
+    assert stats["discarded_tokens"] == 0
+
+
+def test_council_skips_speculation_when_validators_are_deterministic(container):
+    outcome = container.council_service.resolve_turn(_speculation_request())
+
+    assert outcome.succeeded
+    assert "speculation" not in outcome.council_schedule
+    assert [role_run.approval_status for role_run in outcome.role_runs if role_run.council_role == "narrative"] == [
+        "approved"
+    ]
+    assert container.council_service.speculation_stats()["attempts"] == 0
+
+
+def test_council_discards_speculative_narrative_when_tags_change(container, monkeypatch):
+    router = container.council_service.model_router
+    original = router.execute_structured_prompt
+
+    def drifting_rules(**kwargs):  # type: ignore[no-untyped-def]
+        result = original(**kwargs)
+        if kwargs["prompt_id"] == "council.rules_arbiter" and result.final_payload is not None:
+            tags = result.final_payload.normalized_world_tags
+            result.final_payload.normalized_world_tags = tags[:-1] if len(tags) > 1 else [*tags, "investigate"]
+        return result
+
+    monkeypatch.setattr(router, "execute_structured_prompt", drifting_rules)
+    progress: list[dict[str, object]] = []
+    lock = threading.Lock()
+
+    def collect(payload: dict[str, object]) -> None:
+        with lock:
+            progress.append(payload)
+
+    # The force marker routes the rules arbiter through the model instead of the deterministic validator.
+    with bind_turn_progress(collect):
+        outcome = container.council_service.resolve_turn(
+            _speculation_request("__force_llm_rules__ help the gate keeper sort the arrival records")
+        )
+
+    assert outcome.succeeded
+    # Only the narrative call that counts reports the stage.
+    assert [item["status"] for item in progress if item.get("phase") == "narrative"] == ["started", "completed"]
+    narrative_runs = [role_run for role_run in outcome.role_runs if role_run.council_role == "narrative"]
+    assert [role_run.approval_status for role_run in narrative_runs] == ["speculation_discarded", "approved"]
+    assert outcome.council_schedule["speculation"] == {"hit": False, "saved_ms": 0}
+    stats = container.council_service.speculation_stats()
+    assert stats["misses"] == 1
+    assert stats["discarded_runs"] == 1
+    assert stats["discarded_tokens"] == sum(attempt.total_tokens or 0 for attempt in narrative_runs[0].attempts)
+
+
+def _streaming_narrative(monkeypatch, router, *, drift_rules: bool = False) -> list[str]:  # type: ignore[no-untyped-def]
+    """Stands in for a streaming provider: narrative calls emit deltas whenever a listener is bound."""
+
+    original = router.execute_structured_prompt
+    drafts: list[str] = []
+    lock = threading.Lock()
+
+    def execute(**kwargs):  # type: ignore[no-untyped-def]
+        if kwargs["prompt_id"] == "council.narrative" and turn_progress_bound():
+            with lock:
+                draft = f"draft-{len(drafts)}"
+                drafts.append(draft)
+            for index, piece in enumerate((draft, "-a", "-b")):
+                emit_turn_event("turn.narrative.delta", {"delta": piece, "final": False, "replace": index == 0})
+        if kwargs["prompt_id"] == "council.safety_guard":
+            time.sleep(0.05)
+        result = original(**kwargs)
+        if drift_rules and kwargs["prompt_id"] == "council.rules_arbiter" and result.final_payload is not None:
+            tags = result.final_payload.normalized_world_tags
+            result.final_payload.normalized_world_tags = tags[:-1] if len(tags) > 1 else [*tags, "investigate"]
+        return result
+
+    monkeypatch.setattr(router, "execute_structured_prompt", execute)
+    return drafts
+
+
+def test_council_replays_streamed_deltas_of_committed_speculative_narrative(container, monkeypatch):
+    drafts = _streaming_narrative(monkeypatch, container.council_service.model_router)
+    progress: list[dict[str, object]] = []
+    lock = threading.Lock()
+
+    def collect(payload: dict[str, object]) -> None:
+        with lock:
+            progress.append(payload)
+
+    with bind_turn_progress(collect):
+        outcome = container.council_service.resolve_turn(
+            _speculation_request("__force_llm_rules__ help the gate keeper sort the arrival records")
+        )
+
+    assert outcome.council_schedule["speculation"]["hit"] is True
+    assert drafts == ["draft-0"]
+    deltas = [item["data"]["delta"] for item in progress if item.get("event") == "turn.narrative.delta"]
+    assert deltas[:3] == ["draft-0", "-a", "-b"]
+    assert deltas[3] == outcome.final_payload.narrative
+    safety_done = next(
+        index for index, item in enumerate(progress) if item.get("phase") == "safety_guard" and item["status"] == "completed"
+    )
+    first_delta = next(index for index, item in enumerate(progress) if item.get("event") == "turn.narrative.delta")
+    assert first_delta > safety_done
+
+
+def test_council_drops_streamed_deltas_of_discarded_speculative_narrative(container, monkeypatch):
+    drafts = _streaming_narrative(monkeypatch, container.council_service.model_router, drift_rules=True)
+    progress: list[dict[str, object]] = []
+    lock = threading.Lock()
+
+    def collect(payload: dict[str, object]) -> None:
+        with lock:
+            progress.append(payload)
+
+    with bind_turn_progress(collect):
+        outcome = container.council_service.resolve_turn(
+            _speculation_request("__force_llm_rules__ help the gate keeper sort the arrival records")
+        )
+
+    assert outcome.council_schedule["speculation"]["hit"] is False
+    assert drafts == ["draft-0", "draft-1"]
+    deltas = [item["data"]["delta"] for item in progress if item.get("event") == "turn.narrative.delta"]
+    assert deltas == ["draft-1", "-a", "-b", outcome.final_payload.narrative]
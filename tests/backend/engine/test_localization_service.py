@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from app.modules.localization.service import PlayLocalizationPayload, _apply_glossary_replacements
+import threading
+
+from sqlalchemy import select
+
+import app.modules.localization.service as localization_service
+from app.models.entities import PlayLocalizedTextCache, World
+from app.modules.localization.service import (
+    WORLD_SHARED_SCOPE,
+    PlayLocalizationPayload,
+    _apply_glossary_replacements,
+    _glossary_matcher,
+    localize_session_state,
+    localize_turn_payload,
+)
 
 
 def test_play_localization_payload_accepts_canonical_items_object() -> None:
@@ -84,3 +97,176 @@ def test_glossary_replacements_collapse_repeated_localized_name_prefixes() -> No
     )
 
     assert localized == "ゲート守リッカに礼を言い、記録官イオネへ報告する。"
+
+
+def test_glossary_matcher_prefers_longest_terms_and_keeps_localized_names() -> None:
+    glossary = [
+        {"source_text": "Gate", "localized_text": "門"},
+        {"source_text": "Gate Keeper", "localized_text": "門番ゲート"},
+        *({"source_text": f"Archive Wing {index:02d}", "localized_text": f"記録棟{index:02d}"} for index in range(80)),
+    ]
+
+    localized = _apply_glossary_replacements(
+        "Gate Keeperは門番ゲートと呼ばれ、Archive Wing 07と記録棟記録棟12の間のGateに立つ。",
+        glossary,
+    )
+
+    assert localized == "門番ゲートは門番ゲートと呼ばれ、記録棟07と記録棟12の間の門に立つ。"
+    context = {"world_id": "glossary-world", "target_language": "ja"}
+    assert _glossary_matcher(glossary, context=context) is _glossary_matcher(list(glossary), context=context)
+    assert _glossary_matcher(glossary[:-1], context=context) is not _glossary_matcher(glossary, context=context)
+
+
+def _shared_world_state(actor_id: str) -> dict[str, object]:
+    return {
+        "world_id": "localization-shared-world",
+        "player_profile": {"actor_id": actor_id, "play_language": {"preset": "ja"}},
+        "current_location": {"id": "nexus_city", "name": "Nexus City", "description": "A busy arrival plaza."},
+        "known_facts": [{"id": f"fact-{actor_id}", "title": "Private lead", "summary": f"Only {actor_id} heard this."}],
+    }
+
+
+def test_world_public_text_is_translated_once_per_world_and_language(container) -> None:
+    prompts: list[list[str]] = []
+    original = container.model_router.execute_structured_prompt
+
+    def recording(**kwargs):  # type: ignore[no-untyped-def]
+        prompts.append([item["kind"] for item in kwargs["input_payload"]["items"]])
+        return original(**kwargs)
+
+    container.model_router.execute_structured_prompt = recording  # type: ignore[method-assign]
+    with container.session_factory() as db:
+        db.add(
+            World(
+                id="localization-shared-world",
+                name="Localization Shared World",
+                state={"pack_id": "gestaloka_world_reference", "world_template_id": "layered_world_foundation"},
+            )
+        )
+        db.commit()
+        localize_session_state(db, container.model_router, _shared_world_state("actor-one"))
+        localize_session_state(db, container.model_router, _shared_world_state("actor-two"))
+        rows = list(db.execute(select(PlayLocalizedTextCache)).scalars())
+
+    assert "location.name" in prompts[0]
+    assert sorted(prompts[1]) == ["known_fact.summary", "known_fact.title"]
+    shared_kinds = {row.source_kind for row in rows if row.actor_id_scope == WORLD_SHARED_SCOPE}
+    assert shared_kinds == {"location.name", "location.description"}
+    assert {row.actor_id_scope for row in rows if row.source_kind.startswith("known_fact")} == {"actor-one", "actor-two"}
+
+
+def test_turn_localization_hands_cached_segments_over_before_generating(container) -> None:
+    with container.session_factory() as db:
+        db.add(
+            World(
+                id="localization-shared-world",
+                name="Localization Shared World",
+                state={"pack_id": "gestaloka_world_reference", "world_template_id": "layered_world_foundation"},
+            )
+        )
+        db.commit()
+        localize_session_state(db, container.model_router, _shared_world_state("actor-one"))
+        cached_payloads: list[dict[str, object]] = []
+        localized = localize_turn_payload(
+            db,
+            container.model_router,
+            {
+                "narrative": "The gate keeper waves you through.",
+                "current_location": _shared_world_state("actor-two")["current_location"],
+            },
+            world_id="localization-shared-world",
+            actor_id="actor-two",
+            play_language={"preset": "ja"},
+            on_cached=cached_payloads.append,
+        )
+
+    assert len(cached_payloads) == 1
+    cached = cached_payloads[0]
+    assert cached["narrative"] == "The gate keeper waves you through."
+    assert cached["current_location"]["name"] != "Nexus City"
+    assert localized["current_location"] == cached["current_location"]
+    assert localized["narrative"] != "The gate keeper waves you through."
+
+
+def test_session_state_polls_only_relocalize_changed_sections(container, monkeypatch) -> None:
+    translated_kinds: list[list[str]] = []
+    original = localization_service._translate_targets
+
+    def recording(db, model_router, context, targets, **kwargs):  # type: ignore[no-untyped-def]
+        translated_kinds.append(sorted({target.source_kind for target in targets}))
+        return original(db, model_router, context, targets, **kwargs)
+
+    monkeypatch.setattr(localization_service, "_translate_targets", recording)
+    state = {**_shared_world_state("actor-one"), "session_id": "memo-session", "turn_count": 1}
+    with container.session_factory() as db:
+        db.add(
+            World(
+                id="localization-shared-world",
+                name="Localization Shared World",
+                state={"pack_id": "gestaloka_world_reference", "world_template_id": "layered_world_foundation"},
+            )
+        )
+        db.commit()
+        first = localize_session_state(db, container.model_router, state)
+        repeated = localize_session_state(db, container.model_router, {**state, "turn_count": 2})
+        changed_state = {
+            **state,
+            "known_facts": [{"id": "fact-new", "title": "Fresh lead", "summary": "A new rumour arrived."}],
+        }
+        changed = localize_session_state(db, container.model_router, changed_state)
+
+    assert len(translated_kinds) == 2
+    assert translated_kinds[1] == ["known_fact.summary", "known_fact.title"]
+    assert repeated["current_location"] == first["current_location"]
+    assert repeated["turn_count"] == 2
+    assert changed["current_location"] == first["current_location"]
+    assert changed["known_facts"][0]["title"] != "Fresh lead"
+    assert state["current_location"]["name"] == "Nexus City"
+    assert changed_state["known_facts"][0]["title"] == "Fresh lead"
+
+
+def test_missing_translations_are_batched_and_a_failed_batch_keeps_the_others(container, monkeypatch) -> None:
+    monkeypatch.setattr(container.model_router.settings, "localization_batch_max_items", 2)
+    batches: list[list[str]] = []
+    original = container.model_router.execute_structured_prompt
+
+    threads: set[str] = set()
+
+    def flaky(**kwargs):  # type: ignore[no-untyped-def]
+        keys = [item["key"] for item in kwargs["input_payload"]["items"]]
+        batches.append(keys)
+        threads.add(threading.current_thread().name)
+        if any(key.startswith("known_fact:fact-2:") for key in keys):
+            raise RuntimeError("malformed batch")
+        return original(**kwargs)
+
+    container.model_router.execute_structured_prompt = flaky  # type: ignore[method-assign]
+    state = {
+        **_shared_world_state("actor-one"),
+        "known_facts": [{"id": f"fact-{index}", "title": f"Lead {index}", "summary": f"Rumour {index}."} for index in range(4)],
+    }
+    with container.session_factory() as db:
+        db.add(
+            World(
+                id="localization-shared-world",
+                name="Localization Shared World",
+                state={"pack_id": "gestaloka_world_reference", "world_template_id": "layered_world_foundation"},
+            )
+        )
+        db.commit()
+        localized = localize_session_state(
+            db,
+            container.model_router,
+            state,
+            batch_executor=container.localization_batch_executor,
+        )
+        stored_keys = set(db.execute(select(PlayLocalizedTextCache.source_kind)).scalars())
+
+    assert len(batches) == 5
+    assert all(len(keys) <= 2 for keys in batches)
+    assert all(name.startswith("play-localization") for name in threads)
+    facts = localized["known_facts"]
+    assert (facts[2]["title"], facts[2]["summary"]) == ("Lead 2", "Rumour 2.")
+    assert all(facts[index]["title"] != f"Lead {index}" for index in (0, 1, 3))
+    assert localized["current_location"]["name"] != "Nexus City"
+    assert {"location.name", "known_fact.title"} <= stored_keys
@@ -1,5 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.modules.observability.loop_lag import EventLoopLagMonitor
 from tests.backend.turn_async_helpers import post_turn_and_wait
 
 
@@ -62,3 +70,37 @@ def test_turn_execution_updates_observability_traces_and_metrics(client, contain
         "llm_fallback_rate",
         "release_gate_verdict",
     } <= set(metrics)
+
+
+def test_event_loop_lag_monitor_reports_blocking_calls(container):
+    monitor = EventLoopLagMonitor(container.observability_service, interval_seconds=0.01)
+
+    async def block_loop() -> None:
+        monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+    asyncio.run(block_loop())
+
+    metrics = container.observability_service.metric_snapshot()
+    assert metrics["event_loop_lag_max_seconds"] >= 0.05
+    assert not monitor.running
+
+
+def test_app_lifespan_leaves_a_passed_container_usable(container):
+    executors = [
+        container.turn_localization_executor,
+        container.localization_batch_executor,
+        container.context_prefetcher.executor,
+        container.context_prefetcher.model_executor,
+    ]
+    for _ in range(2):
+        with TestClient(create_app(container)):
+            assert [executor.submit(lambda: "ready").result() for executor in executors] == ["ready"] * 4
+
+    container.close()
+    for executor in executors:
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: "late")
\ No newline at end of file
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from dataclasses import replace
 from typing import Any
 
@@ -12,7 +13,7 @@ from sqlalchemy.orm import Session, sessionmaker
 import app.modules.llm_harness.service as llm_service
 import app.modules.world_memory.service as memory_service
 from app.core.config import Settings
-from app.core.prompts import PromptDefinition
+from app.core.prompts import PromptDefinition, PromptRegistry
 from app.models.base import Base
 from app.models.entities import LLMContextCacheEntry, LLMRun
 from app.modules.gm_council.service import (
@@ -24,11 +25,19 @@ from app.modules.gm_council.service import (
     CouncilWorldProgressPayload,
 )
 from app.modules.llm_harness.service import (
+    BaseModelProvider,
     CouncilIntentInterpreterPayload,
     CouncilRoleRun,
+    ModelRouter,
     OpenAICompatibleProvider,
     PromptExecutionAttempt,
+    ProviderCircuitBreakers,
+    RetryBudget,
+    abandon_prompts_when,
 )
+from app.modules.llm_harness.context_budget import estimate_tokens, trim_context_payload
+from app.modules.llm_harness.streaming import IncrementalJSONFieldExtractor
+from app.modules.session.progress import bind_turn_progress
 from app.modules.session.service import _persist_role_runs
 from app.modules.world_memory.service import OpenAICompatibleEmbeddingProvider
 
@@ -487,6 +496,296 @@ def test_openai_compatible_provider_reads_gemini_usage_metadata(monkeypatch):
     assert response.prompt_cache_miss_tokens == 30
 
 
+class _FailingClient(_FakeClient):
+    def post(self, url: str, *, json: dict[str, Any]) -> _FakeResponse:
+        self.requests.append({"url": url, "json": json})
+        raise RuntimeError("upstream 503")
+
+
+def test_openai_compatible_provider_retries_are_bounded_by_shared_budget(monkeypatch):
+    _FakeClient.instances.clear()
+    monkeypatch.setattr(llm_service.httpx, "Client", _FailingClient)
+    budget = RetryBudget(ratio=0.0, capacity=1.0)
+    provider = OpenAICompatibleProvider(
+        _settings(openai_compat_max_retries=3, openai_compat_context_cache_enabled=False),
+        retry_budget=budget,
+    )
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="upstream 503"):
+            provider.generate(
+                prompt=_prompt(),
+                response_model=_ProviderPayload,
+                model_id="main-test",
+                lane="main_lane",
+                input_payload={"input_text": "hello"},
+                temperature=0.3,
+            )
+
+    # The first call spends the only retry token; the second call gets no retries at all.
+    assert len(_FakeClient.instances[-1].requests) == 3
+    assert budget.snapshot()["retries_spent"] == 1
+    assert budget.snapshot()["retries_denied"] == 2
+
+
+def test_abandoned_prompts_skip_retries(monkeypatch):
+    _FakeClient.instances.clear()
+    monkeypatch.setattr(llm_service.httpx, "Client", _FailingClient)
+    budget = RetryBudget(ratio=0.0, capacity=5.0)
+    provider = OpenAICompatibleProvider(
+        _settings(openai_compat_max_retries=3, openai_compat_context_cache_enabled=False),
+        retry_budget=budget,
+    )
+    abandoned = threading.Event()
+    abandoned.set()
+
+    with abandon_prompts_when(abandoned), pytest.raises(RuntimeError, match="upstream 503"):
+        provider.generate(
+            prompt=_prompt(),
+            response_model=_ProviderPayload,
+            model_id="main-test",
+            lane="main_lane",
+            input_payload={"input_text": "hello"},
+            temperature=0.3,
+        )
+
+    # The call already on the wire finishes; no retry is started and no budget is spent.
+    assert len(_FakeClient.instances[-1].requests) == 1
+    assert budget.snapshot()["retries_spent"] == 0
+
+
+class _NarrativeStreamPayload(BaseModel):
+    narrative: str = Field(min_length=1)
+    tone: str
+
+
+class _FakeStreamResponse:
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = lines
+
+    def __enter__(self) -> "_FakeStreamResponse":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def iter_lines(self):  # type: ignore[no-untyped-def]
+        yield from self.lines
+
+
+class _StreamingClient(_FakeClient):
+    CONTENT_CHUNKS = ['{"tone":"calm","narr', 'ative":"Rikka smi', 'les \\u00e9\\u', '3042.\\n"', "}"]
+
+    def stream(self, method: str, url: str, *, json: dict[str, Any]) -> _FakeStreamResponse:
+        self.requests.append({"method": method, "url": url, "json": json})
+        lines = [
+            "data: " + llm_service.json.dumps({"id": "chatcmpl-stream", "choices": [{"delta": {"content": chunk}}]})
+            for chunk in self.CONTENT_CHUNKS
+        ]
+        lines.append(": keep-alive")
+        lines.append("data: " + llm_service.json.dumps({"choices": [], "usage": {"prompt_tokens": 20, "completion_tokens": 9, "total_tokens": 29}}))
+        lines.append("data: [DONE]")
+        return _FakeStreamResponse(lines)
+
+
+def test_incremental_json_extractor_decodes_split_escapes_and_ignores_nested_fields():
+    extractor = IncrementalJSONFieldExtractor(["narrative"])
+    document = '{"meta": {"narrative": "nested"}, "narrative": "a\\"b\\ud83d\\ude00c", "tags": ["narrative"]}'
+    deltas = [delta for index in range(len(document)) for delta in extractor.feed(document[index])]
+
+    assert all(field == "narrative" for field, _ in deltas)
+    assert extractor.text("narrative") == json.loads(document)["narrative"]
+
+
+def test_openai_compatible_provider_streams_narrative_deltas_and_validates_full_object(monkeypatch):
+    _FakeClient.instances.clear()
+    monkeypatch.setattr(llm_service.httpx, "Client", _StreamingClient)
+    provider = OpenAICompatibleProvider(
+        _settings(openai_compat_streaming_enabled=True, openai_compat_context_cache_enabled=False)
+    )
+    events: list[dict[str, object]] = []
+
+    with bind_turn_progress(events.append):
+        response = provider.generate(
+            prompt=_prompt(),
+            response_model=_NarrativeStreamPayload,
+            model_id="main-test",
+            lane="main_lane",
+            input_payload={"input_text": "hello"},
+            temperature=0.3,
+        )
+
+    assert response.raw_output == {"tone": "calm", "narrative": "Rikka smiles \u00e9\u3042.\n"}
+    assert response.provider_response_id == "chatcmpl-stream"
+    assert response.total_tokens == 29
+    request = _FakeClient.instances[-1].requests[-1]
+    assert request["json"]["stream"] is True
+    deltas = [event["data"] for event in events if event.get("event") == "turn.narrative.delta"]
+    assert len(deltas) > 1
+    assert "".join(str(delta["delta"]) for delta in deltas) == response.raw_output["narrative"]
+    assert [delta["replace"] for delta in deltas] == [True] + [False] * (len(deltas) - 1)
+
+
+def test_openai_compatible_provider_skips_streaming_without_progress_listener(monkeypatch):
+    _FakeClient.instances.clear()
+    monkeypatch.setattr(llm_service.httpx, "Client", _StreamingClient)
+    provider = OpenAICompatibleProvider(
+        _settings(openai_compat_streaming_enabled=True, openai_compat_context_cache_enabled=False)
+    )
+
+    response = provider.generate(
+        prompt=_prompt(),
+        response_model=_NarrativeStreamPayload,
+        model_id="main-test",
+        lane="main_lane",
+        input_payload={"input_text": "hello"},
+        temperature=0.3,
+    )
+
+    assert response.raw_output == {"answer": "ok"}
+    assert "stream" not in _FakeClient.instances[-1].requests[-1]["json"]
+
+
+def test_circuit_breaker_opens_on_error_rate_and_recovers_through_half_open_probe():
+    now = [0.0]
+    breakers = ProviderCircuitBreakers(
+        _settings(llm_circuit_min_requests=2, llm_circuit_error_rate_threshold=0.5, llm_circuit_open_seconds=10),
+        clock=lambda: now[0],
+    )
+
+    breakers.record("openai_compatible", "main-test", succeeded=True, latency_seconds=0.2)
+    breakers.record("openai_compatible", "main-test", succeeded=False, latency_seconds=0.2)
+    assert breakers.state("openai_compatible", "main-test") == "open"
+    assert breakers.allow("openai_compatible", "main-test") is False
+    assert breakers.allow("openai_compatible", "lite-test") is True
+
+    now[0] = 11.0
+    assert breakers.allow("openai_compatible", "main-test") is True
+    assert breakers.state("openai_compatible", "main-test") == "half_open"
+    assert breakers.allow("openai_compatible", "main-test") is False
+    breakers.record("openai_compatible", "main-test", succeeded=True, latency_seconds=0.1)
+
+    snapshot = breakers.snapshot()
+    assert breakers.state("openai_compatible", "main-test") == "closed"
+    assert snapshot["open_count"] == 0
+    main_item = next(item for item in snapshot["items"] if item["model_id"] == "main-test")
+    assert main_item["trip_count"] == 1
+    assert main_item["last_trip_reason"] == "error_rate"
+    assert main_item["rejected_count"] == 2
+
+
+def test_circuit_breaker_trips_on_slow_call_rate():
+    breakers = ProviderCircuitBreakers(
+        _settings(
+            llm_circuit_min_requests=3,
+            llm_circuit_slow_call_seconds=1.0,
+            llm_circuit_slow_call_rate_threshold=0.6,
+        ),
+        clock=lambda: 0.0,
+    )
+
+    for latency in (1.5, 0.2, 2.0):
+        breakers.record("openai_compatible", "main-test", succeeded=True, latency_seconds=latency)
+
+    assert breakers.snapshot()["items"][0]["last_trip_reason"] == "slow_call_rate"
+    assert breakers.state("openai_compatible", "main-test") == "open"
+
+
+def test_model_router_skips_provider_while_circuit_is_open(monkeypatch):
+    calls: list[str] = []
+
+    class DegradedProvider(BaseModelProvider):
+        provider_name = "openai_compatible"
+
+        def generate(self, *, prompt, response_model, model_id, lane, input_payload, temperature):  # type: ignore[no-untyped-def]
+            del prompt, response_model, input_payload, temperature
+            calls.append(f"{model_id}:{lane}")
+            raise RuntimeError("upstream 503")
+
+    settings = _settings(llm_circuit_min_requests=2, llm_circuit_error_rate_threshold=0.5)
+    monkeypatch.setattr(ModelRouter, "_build_provider", lambda self: DegradedProvider())
+    router = ModelRouter(settings, PromptRegistry(settings.prompt_dir, settings.eval_dataset_dir))
+
+    outcomes = [
+        router.execute_structured_prompt(
+            prompt_id="council.safety_guard",
+            response_model=_ProviderPayload,
+            input_payload={"input_text": "hello"},
+            world_id="world-1",
+        )
+        for _ in range(3)
+    ]
+
+    assert len(calls) == 2
+    assert [outcome.attempts[-1].status for outcome in outcomes] == ["provider_error", "provider_error", "circuit_open"]
+    assert outcomes[-1].final_payload is None
+    assert router.circuit_breakers.snapshot()["open_count"] == 1
+
+
+def _history_payload() -> dict[str, Any]:
+    return {
+        "input_text": "ask about the caravan",
+        "recent_world_beats": [f"beat {index} " + "x" * 200 for index in range(10)],
+        "memory_highlights": [
+            {"text": "low " + "y" * 200, "salience": 0.1},
+            {"text": "high " + "y" * 200, "salience": 0.9},
+            {"text": "mid " + "y" * 200, "salience": 0.5},
+            {"text": "keep " + "y" * 200, "salience": 0.7},
+        ],
+    }
+
+
+def test_context_budget_trims_oldest_history_before_low_salience_memories():
+    payload = _history_payload()
+    full_tokens = estimate_tokens(payload)
+
+    history_only = trim_context_payload(payload, budget_tokens=full_tokens - 200)
+    assert [decision["section"] for decision in history_only.decisions] == ["recent_world_beats"]
+    assert history_only.payload["recent_world_beats"][0].startswith("beat 0 ")
+    assert len(payload["recent_world_beats"]) == 10
+
+    deep = trim_context_payload(payload, budget_tokens=estimate_tokens(payload["input_text"]))
+    assert deep.payload["recent_world_beats"] == payload["recent_world_beats"][:1]
+    assert [item["salience"] for item in deep.payload["memory_highlights"]] == [0.9, 0.7]
+    assert deep.to_record()["over_budget"] is True
+    assert deep.tokens_saved > 0
+    assert estimate_tokens("こんにちは") == 5
+
+
+def test_model_router_sends_trimmed_context_and_records_decisions(monkeypatch):
+    seen_payloads: list[dict[str, Any]] = []
+
+    class RecordingProvider(BaseModelProvider):
+        provider_name = "openai_compatible"
+
+        def generate(self, *, prompt, response_model, model_id, lane, input_payload, temperature):  # type: ignore[no-untyped-def]
+            del prompt, response_model, model_id, lane, temperature
+            seen_payloads.append(input_payload)
+            return llm_service.ProviderResponse(raw_output={"answer": "ok"}, provider_name=self.provider_name, provider_response_id=None)
+
+    payload = _history_payload()
+    settings = _settings(llm_context_token_budget=estimate_tokens(payload) - 200)
+    monkeypatch.setattr(ModelRouter, "_build_provider", lambda self: RecordingProvider())
+    router = ModelRouter(settings, PromptRegistry(settings.prompt_dir, settings.eval_dataset_dir))
+
+    outcome = router.execute_structured_prompt(
+        prompt_id="council.safety_guard",
+        response_model=_ProviderPayload,
+        input_payload=payload,
+        world_id="world-1",
+    )
+
+    assert outcome.succeeded
+    assert len(seen_payloads[0]["recent_world_beats"]) < len(payload["recent_world_beats"])
+    trimming = outcome.attempts[-1].context_trimming
+    assert trimming is not None
+    assert trimming["decisions"][0]["section"] == "recent_world_beats"
+    assert trimming["tokens_saved"] >= 200
+
+
 def test_live_intent_payload_shape_is_normalized_before_validation():
     payload = CouncilIntentInterpreterPayload.model_validate(
         {
@@ -654,6 +953,7 @@ def test_llm_run_persistence_keeps_prompt_cache_token_counts(tmp_path):
         total_tokens=53,
         prompt_cache_hit_tokens=12,
         prompt_cache_miss_tokens=34,
+        context_trimming={"tokens_saved": 120, "decisions": [{"section": "recent_world_beats"}]},
     )
     role_run = CouncilRoleRun(
         council_role="test_role",
@@ -682,6 +982,8 @@ def test_llm_run_persistence_keeps_prompt_cache_token_counts(tmp_path):
     assert row.total_tokens == 53
     assert row.prompt_cache_hit_tokens == 12
     assert row.prompt_cache_miss_tokens == 34
+    assert row.context_tokens_saved == 120
+    assert row.context_trimming["decisions"][0]["section"] == "recent_world_beats"
 
 
 def test_openai_compatible_embedding_posts_dimensions(monkeypatch):
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import copy
+
+from sqlalchemy import event
+
+from app.models.entities import PlayLocalizedTextCache, World
+from app.modules.session import service as session_service
+from app.modules.actor.service import ensure_pack_npcs
+from app.modules.session.service import (
+    CanonicalPublicAliasIndex,
+    _build_canonical_public_alias_index,
+    _build_world_reference_directory,
+    _normalize_public_claim_text,
+)
+from app.modules.world_state.entity_generation import materialize_entity_drafts
+from app.modules.world_state.service import ensure_starter_faction, ensure_world
+
+
+def _seed_world(db) -> None:  # type: ignore[no-untyped-def]
+    db.add(
+        World(
+            id="alias-index-world",
+            name="Alias Index World",
+            state={"pack_id": "gestaloka_world_reference", "world_template_id": "layered_world_foundation"},
+        )
+    )
+    db.commit()
+
+
+def _count_localization_queries(db):  # type: ignore[no-untyped-def]
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+        if "play_localized_text_cache" in statement:
+            statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record)
+    return statements, lambda: event.remove(db.get_bind(), "before_cursor_execute", record)
+
+
+def test_alias_index_matches_like_a_linear_scan() -> None:
+    index = CanonicalPublicAliasIndex()
+    surfaces = {
+        "nexus_city": ["Nexus City", "ネクサス市"],
+        "lift_tower_network": ["Lift Tower Network", "昇降塔ネットワーク", "昇降塔"],
+        "universal_library": ["Universal Library", "万象図書館"],
+    }
+    for key, names in surfaces.items():
+        for name in names:
+            index.add_location_alias(canonical_key=key, canonical_name=names[0], surface_text=name, language="en")
+
+    def linear(claim: str) -> set[str]:
+        normalized_claim = _normalize_public_claim_text(claim)
+        return {
+            match.canonical_key
+            for alias, matches in index.locations.items()
+            if alias in normalized_claim or normalized_claim in alias
+            for match in matches
+        }
+
+    for claim in ("昇降塔ネットワークへ向かう", "昇降", "万象図書館の前", "nexus city gate", "未知の場所"):
+        match = index.match_location(claim)
+        expected = linear(claim)
+        assert (match.canonical_key if match else None) in (expected or {None})
+    assert index.match_location("昇降塔ネットワーク").canonical_key == "lift_tower_network"
+
+
+def test_world_alias_index_is_cached_until_localizations_change(container) -> None:
+    state = {"nearby_routes": [{"destination_key": "lift_tower_network", "destination_name": "Lift Tower Network"}]}
+    with container.session_factory() as db:
+        _seed_world(db)
+        first = _build_canonical_public_alias_index(db, "alias-index-world", state)
+        statements, stop = _count_localization_queries(db)
+        try:
+            second = _build_canonical_public_alias_index(db, "alias-index-world", state)
+            assert len(statements) == 1
+            assert second.locations.keys() == first.locations.keys()
+            assert second.match_location("Alias Quarter") is None
+
+            db.add(
+                PlayLocalizedTextCache(
+                    world_id="alias-index-world",
+                    actor_id_scope="world",
+                    target_language="ja",
+                    source_kind="location.name",
+                    source_key="alias-quarter",
+                    source_hash="0" * 64,
+                    source_text=first.locations[_normalize_public_claim_text("Nexus City")][0].canonical_name,
+                    localized_text="別名クォーター",
+                    model_id="test",
+                    prompt_id="play.localization",
+                )
+            )
+            db.commit()
+            statements.clear()
+            refreshed = _build_canonical_public_alias_index(db, "alias-index-world", state)
+        finally:
+            stop()
+
+    assert len(statements) == 2
+    match = refreshed.match_location("別名クォーターへ向かう")
+    assert match is not None
+    assert match.canonical_key == "nexus_city"
+
+
+def test_world_alias_index_follows_pack_content_not_object_identity(container, monkeypatch) -> None:
+    with container.session_factory() as db:
+        _seed_world(db)
+        pack, template = session_service.resolve_world_pack(db, "alias-index-world")
+        first = session_service._world_public_alias_index(db, "alias-index-world")[0]
+
+        # A reload hands out new objects (whose ids CPython may reuse); equal content stays cached.
+        reloaded = copy.deepcopy(pack)
+        monkeypatch.setattr(
+            session_service,
+            "resolve_world_pack",
+            lambda _db, _world_id: (reloaded, reloaded.template(template.template_id)),
+        )
+        assert session_service._world_public_alias_index(db, "alias-index-world")[0] is first
+
+        # A republished pack under the same manifest version is rebuilt.
+        republished = copy.deepcopy(pack)
+        location = republished.template(template.template_id).locations["nexus_city"]
+        location.name = "Nexus Harbor"
+        monkeypatch.setattr(
+            session_service,
+            "resolve_world_pack",
+            lambda _db, _world_id: (republished, republished.template(template.template_id)),
+        )
+        assert republished.manifest.version == pack.manifest.version
+        refreshed = session_service._world_public_alias_index(db, "alias-index-world")[0]
+
+    assert refreshed is not first
+    match = refreshed.match_location("head for Nexus Harbor")
+    assert match is not None and match.canonical_key == "nexus_city"
+
+
+def test_world_reference_directory_is_memoized_until_the_world_reference_version_moves(container) -> None:
+    world_id = "reference-directory-world"
+    with container.session_factory() as db:
+        ensure_world(db, world_id, pack_id="gestaloka_world_reference", world_template_id="layered_world_foundation")
+        ensure_pack_npcs(db, world_id)
+        ensure_starter_faction(db, world_id)
+        db.commit()
+
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+        event.listen(db.get_bind(), "before_cursor_execute", record)
+        try:
+            first = _build_world_reference_directory(db, world_id=world_id, session_state={})
+            cold_statements = len(statements)
+            statements.clear()
+            second = _build_world_reference_directory(db, world_id=world_id, session_state={})
+            warm_statements = list(statements)
+
+            materialize_entity_drafts(
+                db,
+                world_id=world_id,
+                actor_id="system",
+                session_id=None,
+                source_event_id="reference-directory-event",
+                current_location_id=None,
+                drafts=[{"entity_type": "npc", "display_name": "Archive Courier", "location_key": "nexus_city"}],
+            )
+            # The writer sees its own roster change without caching it or locking the world row.
+            in_flight = _build_world_reference_directory(db, world_id=world_id, session_state={})
+            assert not any("reference_version" in statement for statement in statements if "UPDATE" in statement)
+            db.commit()
+            assert _build_world_reference_directory(db, world_id=world_id, session_state={}) == in_flight
+            refreshed = _build_world_reference_directory(db, world_id=world_id, session_state={})
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", record)
+
+    categories = {entry["category"] for entry in first}
+    assert categories == {"person", "place", "faction"}
+    assert cold_statements <= 8
+    assert second == first
+    assert second is not first
+    assert len(warm_statements) == 3
+    assert not any(table in statement for statement in warm_statements for table in ("FROM actors", "FROM locations", "FROM factions"))
+    people = [entry["name"] for entry in refreshed if entry["category"] == "person"]
+    assert any("Archive Courier" in entry["name"] for entry in in_flight if entry["category"] == "person")
+    assert any("Archive Courier" in name for name in people)
+    assert len(people) == len([entry for entry in first if entry["category"] == "person"]) + 1
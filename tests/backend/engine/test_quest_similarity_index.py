@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import random
+
+from sqlalchemy import select
+
+from app.models.entities import QuestAssignment, QuestTemplate, QuestTemplateSimilarityBucket, Session as GameSession
+from app.modules.world_state.quest_similarity import (
+    index_quest_template,
+    quest_lsh_keys,
+    quest_similarity_text,
+    quest_text_similarity,
+    similar_quest_template_ids,
+)
+from app.modules.world_state.service import (
+    QUEST_SIMILARITY_THRESHOLD,
+    create_dynamic_quest_offer,
+    similar_live_quest_template_ids,
+)
+
+
+def test_lsh_buckets_keep_every_pair_above_the_merge_threshold() -> None:
+    rng = random.Random(7)
+    alphabet = "あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほabcdefghijklmnopqrstuvwxyz"
+    near_duplicates = 0
+    for _ in range(300):
+        base = "".join(rng.choice(alphabet) for _ in range(rng.randint(12, 80)))
+        mutated = list(base)
+        for _ in range(rng.randint(0, len(mutated) // 2)):
+            mutated[rng.randrange(len(mutated))] = rng.choice(alphabet)
+        other = "".join(mutated)
+        if quest_text_similarity(base, other) < QUEST_SIMILARITY_THRESHOLD:
+            continue
+        near_duplicates += 1
+        assert quest_lsh_keys("", base) & quest_lsh_keys("", other), (base, other)
+    assert near_duplicates > 100
+    # Equal normalized titles share the exact-title bucket whatever the descriptions say.
+    title = quest_similarity_text("Visitor Log")
+    assert quest_lsh_keys(title, "visitorlogfirst") & quest_lsh_keys(title, "星図の奪還")
+
+
+def test_dynamic_quest_candidates_come_from_lsh_buckets(client, container, auth_headers) -> None:
+    response = client.post(
+        "/sessions",
+        json={
+            "world_id": "gestaloka_world_reference",
+            "world_name": "GESTALOKA: Layered World Foundation",
+            "player_display_name": "ヌート",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    session_id = response.json()["session_id"]
+
+    with container.session_factory() as db:
+        actor_id = db.execute(select(GameSession.player_actor_id).where(GameSession.id == session_id)).scalar_one()
+        world_id = "gestaloka_world_reference"
+        for assignment in db.execute(
+            select(QuestAssignment).where(
+                QuestAssignment.owner_actor_id == actor_id,
+                QuestAssignment.status.in_(("offered", "active", "paused")),
+            )
+        ).scalars():
+            assignment.status = "completed"
+        unrelated = []
+        for index in range(40):
+            template = QuestTemplate(
+                id=f"bulk_unrelated_{index}",
+                world_id=world_id,
+                title=f"Ledger {index:02d} Audit",
+                description=f"Count crates in warehouse {index:02d} twice.",
+                reward_template_key="none",
+                reward_name="",
+            )
+            db.add(template)
+            unrelated.append(template)
+        db.flush()
+        for template in unrelated:
+            index_quest_template(db, template)
+        db.flush()
+
+        offered = create_dynamic_quest_offer(
+            db,
+            world_id=world_id,
+            actor_id=actor_id,
+            source_event_id="lsh-source-one",
+            offer={
+                "title": "訪問者の証を刻む",
+                "description": "ネクサス・ゲートで訪問者の証を正式に登録する。",
+                "constraints": [],
+            },
+        )
+        assert offered[-1]["action"] == "offered"
+        template_id = offered[-1]["quest_template_id"]
+        buckets = db.execute(
+            select(QuestTemplateSimilarityBucket.band_key).where(QuestTemplateSimilarityBucket.quest_template_id == template_id)
+        ).scalars().all()
+        assert len(buckets) > 1
+        stored = db.get(QuestTemplate, template_id)
+        assert stored is not None and stored.similarity_signature is not None
+
+        templates = db.execute(select(QuestTemplate).where(QuestTemplate.world_id == world_id)).scalars().all()
+        candidates = similar_quest_template_ids(
+            db,
+            world_id=world_id,
+            title="訪問者証の登録を進める",
+            description="ネクサス・ゲートで訪問者の証を刻み、登録の流れを続ける。",
+            template_ids=[template.id for template in templates],
+        )
+        assert template_id in candidates
+        assert not candidates & {template.id for template in unrelated}
+
+        # Lookups only read the bucket table; a template is indexed when it is written.
+        legacy = db.get(QuestTemplate, "bulk_unrelated_3")
+        assert legacy is not None
+        legacy.similarity_signature = None
+        db.execute(
+            QuestTemplateSimilarityBucket.__table__.delete().where(
+                QuestTemplateSimilarityBucket.quest_template_id == legacy.id
+            )
+        )
+        db.flush()
+        ledger_lookup = {"title": "Ledger 03 Audit", "description": "Count crates in warehouse 03 again."}
+        assert similar_quest_template_ids(db, world_id=world_id, template_ids=[legacy.id], **ledger_lookup) == set()
+        assert legacy.similarity_signature is None
+        index_quest_template(db, legacy)
+        db.flush()
+        assert similar_quest_template_ids(db, world_id=world_id, template_ids=[legacy.id], **ledger_lookup) == {legacy.id}
+        assert legacy.id in similar_quest_template_ids(db, world_id=world_id, **ledger_lookup)
+
+        # The emergence gate's duplicate check narrows live quests to the bucket candidates.
+        session_state = {
+            "quests": [
+                {"quest_template_id": legacy.id, "title": legacy.title, "description": legacy.description, "status": "active"}
+            ]
+        }
+        assert similar_live_quest_template_ids(
+            db,
+            world_id=world_id,
+            session_state=session_state,
+            offer=ledger_lookup,
+        ) == {legacy.id}
+        assert similar_live_quest_template_ids(
+            db,
+            world_id=world_id,
+            session_state=session_state,
+            offer={"title": "訪問者証の登録を進める", "description": "ネクサス・ゲートで訪問者の証を刻む。"},
+        ) == set()
+        db.rollback()
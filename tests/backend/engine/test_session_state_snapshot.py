@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from sqlalchemy import event, select
+
+from app.core.container import build_container
+from app.models.entities import Actor, Session as GameSession, World
+from app.modules.world_state import snapshot as snapshot_module
+from app.modules.world_state.service import build_session_state
+from app.modules.world_state.snapshot import build_shared_snapshot_tier, session_state_snapshot_cache
+
+
+def _create_session(client, auth_headers) -> str:  # type: ignore[no-untyped-def]
+    response = client.post(
+        "/sessions",
+        json={
+            "world_id": "gestaloka_world_reference",
+            "world_name": "GESTALOKA: Layered World Foundation",
+            "player_display_name": "ヌート",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    return response.json()["session_id"]
+
+
+def _statement_counter(db):  # type: ignore[no-untyped-def]
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record)
+    return statements, lambda: event.remove(db.get_bind(), "before_cursor_execute", record)
+
+
+def _player(db, session_id: str) -> Actor:  # type: ignore[no-untyped-def]
+    game_session = db.execute(select(GameSession).where(GameSession.id == session_id)).scalar_one()
+    return db.get(Actor, game_session.player_actor_id)
+
+
+def test_session_state_is_served_from_a_versioned_snapshot_until_a_write_commits(client, container, auth_headers) -> None:
+    session_id = _create_session(client, auth_headers)
+    with container.session_factory() as db:
+        player = _player(db, session_id)
+        scope = {"world_id": player.world_id, "actor_id": player.id, "location_id": player.current_location_id}
+        first = build_session_state(db, **scope, include_internal=True)
+        db.commit()
+
+        statements, stop = _statement_counter(db)
+        try:
+            second = build_session_state(db, **scope, include_internal=True)
+        finally:
+            stop()
+        db.commit()
+    assert len(statements) == 1
+    assert second == first
+    second["player_profile"] = None
+    assert first["player_profile"] is not None
+
+    with container.session_factory() as writer:
+        _player(writer, session_id).display_name = "ヌート改"
+        writer.commit()
+
+    with container.session_factory() as db:
+        refreshed = build_session_state(db, **scope, include_internal=True)
+    assert refreshed["player_profile"]["display_name"] == "ヌート改"
+
+
+def test_session_with_uncommitted_writes_bypasses_the_snapshot_cache(client, container, auth_headers) -> None:
+    session_id = _create_session(client, auth_headers)
+    with container.session_factory() as db:
+        player = _player(db, session_id)
+        scope = {"world_id": player.world_id, "actor_id": player.id, "location_id": player.current_location_id}
+        build_session_state(db, **scope)
+        db.commit()
+
+        player.display_name = "未確定の名前"
+        db.flush()
+        in_flight = build_session_state(db, **scope)
+        db.rollback()
+
+        after_rollback = build_session_state(db, **scope)
+    assert in_flight["player_profile"]["display_name"] == "未確定の名前"
+    assert after_rollback["player_profile"]["display_name"] == "ヌート"
+
+
+def test_state_versions_are_bumped_after_commit_outside_the_writer_transaction(client, container, auth_headers) -> None:
+    session_id = _create_session(client, auth_headers)
+    with container.session_factory() as db:
+        player = _player(db, session_id)
+        world = db.get(World, player.world_id)
+        world_version, actor_version = world.state_version, player.state_version
+
+        # Actors are both actor- and world-scoped state.
+        player.display_name = "ヌート改"
+        statements, stop = _statement_counter(db)
+        try:
+            db.flush()
+        finally:
+            stop()
+        # Nothing touches the world or actor rows while the writer's transaction is open.
+        assert [statement for statement in statements if "state_version" in statement] == []
+        db.commit()
+
+        versions = db.execute(
+            select(World.state_version, Actor.state_version)
+            .join(Actor, Actor.world_id == World.id)
+            .where(Actor.id == player.id)
+        ).one()
+    assert versions == (world_version + 1, actor_version + 1)
+
+    with container.session_factory() as db:
+        player = _player(db, session_id)
+        world_version = db.get(World, player.world_id).state_version
+        player.display_name = "取り消し"
+        db.flush()
+        db.rollback()
+        assert db.execute(select(World.state_version).where(World.id == player.world_id)).scalar_one() == world_version
+
+
+class _DictTier:
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+
+    def get(self, key: str) -> bytes | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: bytes, *, ttl_seconds: float) -> None:
+        self.values[key] = value
+
+
+def test_shared_snapshot_tier_round_trips_json(client, container, auth_headers) -> None:
+    session_id = _create_session(client, auth_headers)
+    tier = _DictTier()
+    snapshots = container.session_state_snapshots
+    snapshots.shared_tier = tier
+    with container.session_factory() as db:
+        player = _player(db, session_id)
+        scope = {"world_id": player.world_id, "actor_id": player.id, "location_id": player.current_location_id}
+        built = build_session_state(db, **scope)
+        db.commit()
+        assert len(tier.values) == 1
+        stored = next(iter(tier.values.values()))
+        assert isinstance(json.loads(stored), dict)
+
+        snapshots.clear()
+        assert build_session_state(db, **scope) == built
+        db.commit()
+
+        # Bytes that are not a JSON snapshot are a miss, never evaluated.
+        tier.values = {key: b"\x80\x04not-json" for key in tier.values}
+        snapshots.clear()
+        assert build_session_state(db, **scope) == built
+
+
+def test_each_container_keeps_its_own_snapshot_cache(container, test_settings) -> None:
+    other = build_container(test_settings.model_copy(update={"session_state_snapshot_cache_enabled": False}))
+    try:
+        assert other.session_state_snapshots is not container.session_state_snapshots
+        assert container.session_state_snapshots.enabled
+        with container.session_factory() as db, other.session_factory() as other_db:
+            assert session_state_snapshot_cache(db) is container.session_state_snapshots
+            assert session_state_snapshot_cache(other_db) is None
+    finally:
+        other.close()
+
+
+def test_configured_shared_tier_without_redis_package_fails_loudly(monkeypatch) -> None:
+    monkeypatch.setattr(snapshot_module, "redis", None)
+    assert build_shared_snapshot_tier("") is None
+    with pytest.raises(RuntimeError, match="redis"):
+        build_shared_snapshot_tier("redis://localhost:6379/0")
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+
+from app.models.entities import Memory, SharedConsequenceApplication, WorldAxisState, WorldHealthCheck
+from app.modules.world_state import health as health_module
+from app.modules.world_state.health import (
+    _event_integrity_gaps,
+    cached_shared_world_health,
+    shared_world_health,
+)
+from app.modules.world_state.shared_consequence import apply_shared_consequence_rules
+from tests.backend.turn_async_helpers import post_turn_and_wait
+
+
+WORLD_ID = "gestaloka_world_reference"
+
+
+def _world(health: dict) -> dict:
+    return next(summary for summary in health["worlds"] if summary["world_id"] == WORLD_ID)
+
+
+def _count_applications(db) -> int:
+    return db.execute(
+        select(func.count()).select_from(SharedConsequenceApplication).where(SharedConsequenceApplication.world_id == WORLD_ID)
+    ).scalar_one()
+
+
+def test_incremental_health_matches_full_check_and_keeps_open_gaps(client, container, auth_headers) -> None:
+    response = client.post(
+        "/sessions",
+        json={
+            "world_id": WORLD_ID,
+            "world_name": "GESTALOKA: Layered World Foundation",
+            "player_display_name": "Demo Player",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    session_payload = response.json()
+    _, turn_payload, _ = post_turn_and_wait(
+        client,
+        session_id=session_payload["session_id"],
+        auth_headers=auth_headers,
+        payload={"input_mode": "free_text", "input_text": "ネクサス案内担当の来訪者ログ整理を手伝う"},
+    )
+
+    with container.session_factory() as db:
+        db.execute(delete(WorldHealthCheck))
+        db.commit()
+        unchecked = cached_shared_world_health(db)
+        assert unchecked["status"] == "unchecked"
+        assert WORLD_ID in unchecked["unchecked_world_ids"]
+        assert db.execute(select(func.count()).select_from(WorldHealthCheck)).scalar_one() == 0
+
+        first = shared_world_health(db)
+        assert first["status"] == "ready"
+        assert _world(first)["check_mode"] == "full"
+        applied = _count_applications(db)
+        db.commit()
+        assert _world(cached_shared_world_health(db)) == _world(first)
+        assert cached_shared_world_health(db) == {**first, "unchecked_world_ids": []}
+
+        apply_shared_consequence_rules(
+            db,
+            memory_service=container.memory_service,
+            world_id=WORLD_ID,
+            actor_id=session_payload["player_actor_id"],
+            location_id=session_payload["location_id"],
+            source_event_id=turn_payload["event_id"],
+            world_tags=["aid_local"],
+            consequence_tags=["earned_trust"],
+            action_kind="narrative",
+            interpreted_intent={"consequence_tags": ["earned_trust"]},
+        )
+        db.commit()
+        assert _count_applications(db) > applied
+
+        incremental = shared_world_health(db)
+        assert incremental["status"] == "ready"
+        assert _world(incremental)["check_mode"] == "incremental"
+        replayed = dict(db.get(WorldHealthCheck, WORLD_ID).replay_state["expected"])
+        db.commit()
+
+        full = shared_world_health(db, full=True)
+        assert full["status"] == "ready"
+        assert db.get(WorldHealthCheck, WORLD_ID).replay_state["expected"] == replayed
+        db.commit()
+
+        # Edits through the ORM stamp updated_at, so the incremental pass sees them.
+        axis = db.execute(
+            select(WorldAxisState).where(WorldAxisState.world_id == WORLD_ID, WorldAxisState.axis_id == "world_integrity")
+        ).scalar_one()
+        axis.current_value = axis.current_value + 1
+        db.flush()
+        assert shared_world_health(db)["axis_drift_count"] == 1
+        axis.current_value = axis.current_value - 1
+        db.flush()
+        assert shared_world_health(db)["status"] == "ready"
+        db.commit()
+
+        # Deletions leave no timestamp behind: a full check finds them, and later incremental
+        # checks keep reporting the gap until it is repaired.
+        db.execute(delete(Memory).where(Memory.world_id == WORLD_ID, Memory.source_event_id == turn_payload["event_id"]))
+        assert shared_world_health(db, full=True)["memory_gap_count"] >= 1
+        db.commit()
+        reopened = shared_world_health(db)
+        assert _world(reopened)["check_mode"] == "incremental"
+        assert reopened["memory_gap_count"] >= 1
+        assert _world(cached_shared_world_health(db))["memory_gap_count"] == reopened["memory_gap_count"]
+
+        # Release gates stay incremental until the last full check is older than the window.
+        window = timedelta(hours=24)
+        assert _world(shared_world_health(db, full_check_max_age=window))["check_mode"] == "incremental"
+        db.get(WorldHealthCheck, WORLD_ID).last_full_check_at = datetime.now(timezone.utc) - timedelta(hours=25)
+        db.flush()
+        assert _world(shared_world_health(db, full_check_max_age=window))["check_mode"] == "full"
+        assert _world(shared_world_health(db, full_check_max_age=window))["check_mode"] == "incremental"
+        db.rollback()
+
+
+def test_event_integrity_anti_joins_cap_and_sample(client, container, auth_headers, monkeypatch) -> None:
+    response = client.post(
+        "/sessions",
+        json={
+            "world_id": WORLD_ID,
+            "world_name": "GESTALOKA: Layered World Foundation",
+            "player_display_name": "Demo Player",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    _, turn_payload, _ = post_turn_and_wait(
+        client,
+        session_id=response.json()["session_id"],
+        auth_headers=auth_headers,
+        payload={"input_mode": "free_text", "input_text": "ネクサス案内担当の来訪者ログ整理を手伝う"},
+    )
+    with container.session_factory() as db:
+        memory_ids = sorted(
+            db.execute(
+                select(Memory.id).where(Memory.world_id == WORLD_ID, Memory.source_event_id == turn_payload["event_id"])
+            ).scalars()
+        )
+    assert memory_ids
+
+    engine = container.session_factory.kw["bind"]
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        conn.exec_driver_sql(
+            "UPDATE memories SET source_event_id = 'missing-event' WHERE source_event_id = ?",
+            (turn_payload["event_id"],),
+        )
+        conn.exec_driver_sql(
+            "UPDATE world_axis_states SET last_event_id = 'missing-event' WHERE world_id = ? AND axis_id = 'world_integrity'",
+            (WORLD_ID,),
+        )
+        conn.commit()
+        conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+    full = client.get(f"/ops/worlds/{WORLD_ID}/event-integrity", headers=auth_headers)
+    assert full.status_code == 200
+    payload = full.json()
+    assert payload["mode"] == "full"
+    assert payload["truncated"] is False
+    assert {(gap["entity_type"], gap["entity_id"]) for gap in payload["gaps"]} == {
+        ("world_axis", "world_integrity"),
+        *(("memory", memory_id) for memory_id in memory_ids),
+    }
+    assert {gap["reason"] for gap in payload["gaps"]} == {"missing_event"}
+
+    capped = client.get(f"/ops/worlds/{WORLD_ID}/event-integrity", params={"limit": 1}, headers=auth_headers).json()
+    assert capped["gap_count"] == 1
+    assert capped["truncated"] is True
+
+    sampled = client.get(
+        f"/ops/worlds/{WORLD_ID}/event-integrity",
+        params={"mode": "sample", "sample_size": 10000},
+        headers=auth_headers,
+    ).json()
+    assert sampled["mode"] == "sample"
+    assert sampled["gap_count"] == payload["gap_count"]
+
+    with container.session_factory() as db:
+        # One sampled row per link type, starting at the broken memory's key.
+        gaps, truncated = _event_integrity_gaps(db, world_id=WORLD_ID, sample_size=1, sample_pivot=memory_ids[0])
+        assert not truncated
+        assert ("memory", memory_ids[0]) in {(gap["entity_type"], gap["entity_id"]) for gap in gaps}
+        assert sum(1 for gap in gaps if gap["entity_type"] == "memory") == 1
+
+    # A capped cached result is never refreshed incrementally, or gaps past the cap would vanish.
+    monkeypatch.setattr(health_module, "EVENT_INTEGRITY_GAP_LIMIT", 1)
+    with container.session_factory() as db:
+        capped_health = _world(shared_world_health(db, full=True))
+        assert capped_health["event_integrity_truncated"] is True
+        db.commit()
+        assert _world(shared_world_health(db))["check_mode"] == "full"
+        db.commit()
+    monkeypatch.undo()
+    with container.session_factory() as db:
+        uncapped = _world(shared_world_health(db))
+        assert uncapped["check_mode"] == "full"
+        assert uncapped["event_integrity_gap_count"] == payload["gap_count"]
+        db.commit()
+        incremental = _world(shared_world_health(db))
+        assert incremental["check_mode"] == "incremental"
+        assert incremental["event_integrity_gap_count"] == payload["gap_count"]
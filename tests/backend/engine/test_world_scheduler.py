@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from concurrent.futures import wait
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+
+from app.models.entities import Actor, Session as GameSession, Turn, World, WorldPassLease, WorldTick
+from app.modules.llm_harness.service import prompts_abandoned
+from app.modules.world_state import scheduler as scheduler_module
+from app.modules.world_state.scheduler import AmbientWorldScheduler
+from app.modules.world_state.world_pass_lease import claim_world_pass_lease, release_world_pass_lease
+
+
+class FakeClock:
+    def __init__(self, start: datetime) -> None:
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        # Round up like a real sleep, which never wakes early.
+        self.now += timedelta(microseconds=math.ceil(seconds * 1_000_000))
+
+
+class FakeAmbientService:
+    """Stands in for AmbientWorldPassService: due times live in memory, passes are recorded."""
+
+    def __init__(self, clock: FakeClock, *, interval_seconds: int) -> None:
+        self.clock = clock
+        self.interval_seconds = interval_seconds
+        self.due: dict[str, datetime] = {}
+        self.runs: list[tuple[datetime, str]] = []
+        self.blocked: dict[str, threading.Event] = {}
+        self.failing: set[str] = set()
+        # Worlds whose pass found its model calls abandoned by the time it was released.
+        self.abandoned: list[str] = []
+
+    def idle_pass_due_times(self, db) -> dict[str, datetime]:  # type: ignore[no-untyped-def]
+        return dict(sorted(self.due.items()))
+
+    def idle_pass_due_at(self, db, world_id: str) -> datetime | None:  # type: ignore[no-untyped-def]
+        return self.due.get(world_id)
+
+    def run_idle_world_pass(self, db, *, world_id: str):  # type: ignore[no-untyped-def]
+        self.runs.append((self.clock(), world_id))
+        if world_id in self.blocked:
+            self.blocked[world_id].wait(10)
+            if prompts_abandoned():
+                self.abandoned.append(world_id)
+        if world_id in self.failing:
+            raise RuntimeError(f"role call failed for {world_id}")
+        db.add(WorldTick(world_id=world_id, tick_kind="idle_world_pass", status="completed", summary="fake pass"))
+        self.due[world_id] = self.clock() + timedelta(seconds=self.interval_seconds)
+        return SimpleNamespace(tick=SimpleNamespace(world_id=world_id, id=f"tick-{len(self.runs)}", status="completed", summary=""))
+
+
+def _scheduler(  # type: ignore[no-untyped-def]
+    container,
+    clock: FakeClock,
+    ambient: FakeAmbientService,
+    *,
+    holder: str | None = None,
+    **overrides,
+) -> AmbientWorldScheduler:
+    # Leases reference the worlds table, so the fake worlds need rows.
+    with container.session_factory() as db:
+        db.add_all(World(id=world_id, name=world_id) for world_id in ambient.due if db.get(World, world_id) is None)
+        db.commit()
+    settings = container.settings.model_copy(
+        update={
+            "world_idle_interval_seconds": 60,
+            "world_scheduler_jitter_ratio": 0.1,
+            "world_scheduler_refresh_seconds": 30,
+            "world_scheduler_max_passes_per_tick": 8,
+            "world_scheduler_max_workers": 4,
+            "world_pass_timeout_seconds": 5.0,
+            **overrides,
+        }
+    )
+    resident = SimpleNamespace(
+        settings=settings,
+        session_factory=container.session_factory,
+        ambient_world_service=ambient,
+        observability_service=container.observability_service,
+    )
+    return AmbientWorldScheduler(resident, clock=clock, rng=random.Random(11), holder=holder)  # type: ignore[arg-type]
+
+
+def _settle(scheduler: AmbientWorldScheduler, timeout: float = 5.0) -> None:
+    """Waits for the passes the last tick submitted, so the next tick collects them."""
+
+    wait(list(scheduler._pending.values()), timeout=timeout)
+
+
+def test_scheduler_drains_a_jittered_heap_and_reports_backlog(container) -> None:
+    clock = FakeClock(datetime(2030, 1, 1, tzinfo=timezone.utc))
+    ambient = FakeAmbientService(clock, interval_seconds=60)
+    for index in range(20):
+        ambient.due[f"world-{index:02d}"] = clock()
+    scheduler = _scheduler(container, clock, ambient)
+
+    first = scheduler.tick()
+    assert first.scheduled_worlds == 20
+    assert ambient.runs == []  # jitter only ever delays a world, by up to 6 seconds here
+    assert 0.0 < scheduler.seconds_until_next_tick() <= 6.0
+
+    clock.advance(6)
+    reports = []
+    for _ in range(4):
+        reports.append(scheduler.tick())
+        _settle(scheduler)
+    # Each tick collects the passes the previous one submitted.
+    assert [len(report.results) for report in reports] == [0, 8, 8, 4]
+    assert [report.backlog for report in reports] == [12, 4, 0, 0]
+    assert container.observability_service.metric_snapshot()["world_scheduler_backlog"] == 0.0
+    assert len({world_id for _at, world_id in ambient.runs}) == 20
+
+    # Rescheduled passes are spread over the jitter window instead of sharing one tick.
+    next_due = sorted(scheduler._due_at.values())
+    assert len(set(next_due)) == 20
+    assert next_due[-1] - next_due[0] > 1.0
+    assert scheduler.tick().results == []
+
+    # Worlds without an active session fall out of the schedule when they come due.
+    del ambient.due["world-00"]
+    clock.advance(66)
+    for _ in range(4):
+        scheduler.tick()
+        _settle(scheduler)
+    scheduler.tick()
+    assert "world-00" not in scheduler._due_at
+    assert sum(1 for _at, world_id in ambient.runs if world_id == "world-00") == 1
+
+
+def test_scheduler_loop_reuses_one_container(container, monkeypatch) -> None:
+    def fail_build_container():  # type: ignore[no-untyped-def]
+        raise AssertionError("the resident scheduler must not rebuild its container")
+
+    monkeypatch.setattr(scheduler_module, "build_container", fail_build_container)
+    clock = FakeClock(datetime(2030, 1, 1, tzinfo=timezone.utc))
+    ambient = FakeAmbientService(clock, interval_seconds=60)
+    ambient.due["world-a"] = clock()
+    scheduler = _scheduler(container, clock, ambient)
+    sleeps: list[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        _settle(scheduler)
+        clock.advance(seconds)
+        if len(sleeps) >= 12:
+            scheduler.stop()
+
+    scheduler.run_forever(sleep=fake_sleep)
+
+    assert len(ambient.runs) >= 2
+    assert all(0.0 <= seconds <= 30.0 for seconds in sleeps)
+    gaps = [(later - earlier).total_seconds() for (earlier, _), (later, _) in zip(ambient.runs, ambient.runs[1:])]
+    assert all(60.0 <= gap <= 66.0 for gap in gaps)
+
+
+def test_world_pass_lease_is_exclusive_until_released_or_expired(container) -> None:
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    with container.session_factory() as db:
+        db.add(World(id="leased-world", name="leased-world"))
+        db.commit()
+
+        def claim(holder: str, at: datetime) -> bool:
+            claimed = claim_world_pass_lease(db, world_id="leased-world", holder=holder, lease_seconds=60, now=at)
+            db.commit()
+            return claimed
+
+        assert claim("replica-a", now)
+        assert not claim("replica-b", now + timedelta(seconds=30))
+        assert claim("replica-a", now + timedelta(seconds=30))  # the holder may renew
+        release_world_pass_lease(db, world_id="leased-world", holder="replica-b", now=now + timedelta(seconds=31))
+        db.commit()
+        assert not claim("replica-b", now + timedelta(seconds=32))  # only the holder releases
+        release_world_pass_lease(db, world_id="leased-world", holder="replica-a", now=now + timedelta(seconds=33))
+        db.commit()
+        assert claim("replica-b", now + timedelta(seconds=34))
+        assert claim("replica-a", now + timedelta(seconds=95))  # replica-b crashed; its lease expired
+        lease = db.get(WorldPassLease, "leased-world")
+        assert lease is not None and lease.holder == "replica-a" and lease.attempts == 4
+        assert not claim_world_pass_lease(db, world_id="missing-world", holder="replica-a", lease_seconds=60, now=now)
+
+
+def test_replicas_share_leases_and_back_off_failed_passes(container) -> None:
+    clock = FakeClock(datetime(2030, 1, 1, tzinfo=timezone.utc))
+    ambient = FakeAmbientService(clock, interval_seconds=60)
+    for world_id in ("world-ok", "world-slow", "world-flaky"):
+        ambient.due[world_id] = clock()
+    release_slow = threading.Event()
+    ambient.blocked["world-slow"] = release_slow
+    ambient.failing.add("world-flaky")
+    overrides = {
+        "world_scheduler_jitter_ratio": 0.0,
+        "world_pass_timeout_seconds": 0.3,
+        "world_pass_retry_base_seconds": 5.0,
+        "world_pass_max_retries": 2,
+    }
+    replica_a = _scheduler(container, clock, ambient, holder="replica-a", **overrides)
+    replica_b = _scheduler(container, clock, ambient, holder="replica-b", **overrides)
+    start = clock().timestamp()
+    try:
+        replica_a.tick()
+        _settle(replica_a, timeout=0.5)
+        report = replica_a.tick()
+        assert [result["world_id"] for result in report.results] == ["world-ok"]
+        assert sorted(report.failed_worlds) == ["world-flaky", "world-slow"]
+        assert replica_a._due_at["world-flaky"] == pytest.approx(start + 5)
+
+        # The other replica finds world-slow leased and leaves it alone.
+        replica_b.tick()
+        _settle(replica_b)
+        report = replica_b.tick()
+        assert report.results == []
+        assert replica_b._due_at["world-slow"] == pytest.approx(start + 60)
+        assert [world_id for _at, world_id in ambient.runs].count("world-slow") == 1
+
+        # Backoff doubles, and the overrunning pass is never started a second time.
+        clock.advance(5)
+        first = replica_a.tick()
+        _settle(replica_a)
+        second = replica_a.tick()
+        assert sorted([*first.failed_worlds, *second.failed_worlds]) == ["world-flaky", "world-slow"]
+        assert replica_a._due_at["world-flaky"] == pytest.approx(start + 15)
+        assert [world_id for _at, world_id in ambient.runs].count("world-slow") == 1
+        clock.advance(10)
+        replica_a.tick()
+        _settle(replica_a)
+        replica_a.tick()
+        # Past world_pass_max_retries the world waits a full interval.
+        assert replica_a._due_at["world-flaky"] == pytest.approx(start + 75)
+
+        release_slow.set()
+        deadline = time.monotonic() + 5
+        while "world-slow" in replica_a._in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+        ambient.failing.clear()
+        clock.advance(60)
+        replica_a.tick()
+        _settle(replica_a)
+        report = replica_a.tick()
+        assert sorted(result["world_id"] for result in report.results) == ["world-flaky", "world-ok", "world-slow"]
+        assert report.failed_worlds == [] and replica_a._failures == {}
+    finally:
+        release_slow.set()
+        replica_a.close()
+        replica_b.close()
+
+
+def test_tick_never_waits_on_passes_and_times_them_from_their_start(container) -> None:
+    clock = FakeClock(datetime(2030, 1, 1, tzinfo=timezone.utc))
+    ambient = FakeAmbientService(clock, interval_seconds=60)
+    for world_id in ("world-slow", "world-waiting"):  # the heap starts world-slow first
+        ambient.due[world_id] = clock()
+    release_slow = threading.Event()
+    ambient.blocked["world-slow"] = release_slow
+    scheduler = _scheduler(
+        container,
+        clock,
+        ambient,
+        world_scheduler_jitter_ratio=0.0,
+        world_scheduler_max_workers=1,
+        world_pass_timeout_seconds=0.3,
+    )
+    try:
+        started = time.monotonic()
+        report = scheduler.tick()
+        assert time.monotonic() - started < 0.3
+        assert report.results == [] and sorted(scheduler._pending) == ["world-slow", "world-waiting"]
+
+        # world-slow overruns; world-waiting has not started on the single worker, so it keeps waiting.
+        time.sleep(0.5)
+        report = scheduler.tick()
+        assert report.failed_worlds == ["world-slow"]
+        assert list(scheduler._pending) == ["world-waiting"]
+
+        release_slow.set()
+        _settle(scheduler)
+        report = scheduler.tick()
+        assert [result["world_id"] for result in report.results] == ["world-waiting"]
+        assert report.failed_worlds == []
+    finally:
+        release_slow.set()
+        scheduler.close()
+
+
+def test_a_pass_that_outlives_its_lease_is_abandoned_and_rolled_back(container) -> None:
+    clock = FakeClock(datetime(2030, 1, 1, tzinfo=timezone.utc))
+    ambient = FakeAmbientService(clock, interval_seconds=60)
+    ambient.due["world-stale"] = clock()
+    release_stale = threading.Event()
+    ambient.blocked["world-stale"] = release_stale
+    scheduler = _scheduler(
+        container,
+        clock,
+        ambient,
+        holder="replica-a",
+        world_scheduler_jitter_ratio=0.0,
+        world_pass_timeout_seconds=0.1,
+        world_pass_lease_seconds=0.2,
+    )
+    try:
+        scheduler.tick()
+        time.sleep(0.4)
+        # The lease ran out while the pass hung, and another replica claimed the world.
+        clock.advance(1)
+        with container.session_factory() as db:
+            assert claim_world_pass_lease(db, world_id="world-stale", holder="replica-b", lease_seconds=60, now=clock())
+            db.commit()
+        release_stale.set()
+        _settle(scheduler)
+        report = scheduler.tick()
+        assert report.results == [] and report.failed_worlds == ["world-stale"]
+        assert ambient.abandoned == ["world-stale"]
+        with container.session_factory() as db:
+            assert db.scalars(select(WorldTick).where(WorldTick.world_id == "world-stale")).all() == []
+            lease = db.get(WorldPassLease, "world-stale")
+            assert lease is not None and lease.holder == "replica-b"
+            assert not claim_world_pass_lease(db, world_id="world-stale", holder="replica-a", lease_seconds=60, now=clock())
+    finally:
+        release_stale.set()
+        scheduler.close()
+
+
+def test_run_once_for_one_world_takes_the_lease(container) -> None:
+    clock = FakeClock(datetime(2030, 1, 1, tzinfo=timezone.utc))
+    ambient = FakeAmbientService(clock, interval_seconds=60)
+    # Not due yet: a forced pass ignores the due time, but not the lease.
+    ambient.due["world-forced"] = datetime.now(timezone.utc) + timedelta(hours=1)
+    resident = _scheduler(container, clock, ambient).container
+    with container.session_factory() as db:
+        assert claim_world_pass_lease(db, world_id="world-forced", holder="replica-b", lease_seconds=60)
+        db.commit()
+    assert scheduler_module.run_once(world_id="world-forced", container=resident) == []
+    assert ambient.runs == []
+
+    with container.session_factory() as db:
+        release_world_pass_lease(db, world_id="world-forced", holder="replica-b")
+        db.commit()
+    results = scheduler_module.run_once(world_id="world-forced", container=resident)
+    assert [result["world_id"] for result in results] == ["world-forced"]
+    with container.session_factory() as db:
+        # The forced pass released its own lease, so a replica can claim the world right away.
+        assert claim_world_pass_lease(db, world_id="world-forced", holder="replica-b", lease_seconds=60)
+
+
+def test_idle_pass_due_at_waits_out_the_grace_period(client, container, auth_headers) -> None:
+    response = client.post(
+        "/sessions",
+        json={
+            "world_id": "gestaloka_world_reference",
+            "world_name": "GESTALOKA: Layered World Foundation",
+            "player_display_name": "ヌート",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    ambient = container.ambient_world_service
+    with container.session_factory() as db:
+        assert ambient.active_world_ids(db) == ["gestaloka_world_reference"]
+        due_at = ambient.idle_pass_due_at(db, "gestaloka_world_reference")
+        assert due_at is not None
+        assert due_at > datetime.now(timezone.utc)
+        assert ambient.due_world_ids(db) == []
+        assert ambient.idle_pass_due_at(db, "missing-world") is None
+
+
+def _legacy_due_rows(db, settings) -> list[tuple[str, datetime]]:  # type: ignore[no-untyped-def]
+    """The per-world loop the grouped query replaced: two lookups for every active world."""
+
+    rows: list[tuple[str, datetime]] = []
+    seen: set[str] = set()
+    for game_session in db.execute(
+        select(GameSession)
+        .where(GameSession.status == "active")
+        .order_by(GameSession.updated_at.desc(), GameSession.id.asc())
+    ).scalars():
+        if game_session.world_id in seen:
+            continue
+        seen.add(game_session.world_id)
+        last_turn = db.execute(
+            select(Turn)
+            .where(Turn.world_id == game_session.world_id, Turn.action_type != "system")
+            .order_by(Turn.created_at.desc(), Turn.id.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+        activity_at = last_turn.created_at if last_turn is not None else game_session.created_at
+        due_at = activity_at.replace(tzinfo=timezone.utc) + timedelta(seconds=settings.world_idle_grace_seconds)
+        last_tick = db.execute(
+            select(WorldTick)
+            .where(
+                WorldTick.world_id == game_session.world_id,
+                WorldTick.tick_kind == "idle_world_pass",
+                WorldTick.status == "completed",
+            )
+            .order_by(WorldTick.completed_at.desc(), WorldTick.created_at.desc(), WorldTick.id.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+        if last_tick is not None:
+            tick_at = (last_tick.completed_at or last_tick.created_at).replace(tzinfo=timezone.utc)
+            due_at = max(due_at, tick_at + timedelta(seconds=settings.world_idle_interval_seconds))
+        rows.append((game_session.world_id, due_at))
+    return rows
+
+
+def test_grouped_due_query_matches_the_per_world_loop(container) -> None:
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    ambient = container.ambient_world_service
+    settings = ambient.settings
+
+    def minutes_ago() -> datetime:
+        # A coarse grid so sessions, turns and ticks regularly tie on their timestamps.
+        return now - timedelta(minutes=rng.randint(0, 40))
+
+    with container.session_factory() as db:
+        for world_index in range(30):
+            world_id = f"due-world-{world_index:02d}"
+            db.add(World(id=world_id, name=world_id))
+            db.flush()
+            actor = Actor(world_id=world_id, actor_type="player", display_name="p")
+            db.add(actor)
+            db.flush()
+            sessions = []
+            for session_index in range(rng.randint(1, 4)):
+                stamp = minutes_ago()
+                game_session = GameSession(
+                    id=f"{world_id}-s{session_index}",
+                    world_id=world_id,
+                    player_actor_id=actor.id,
+                    status=rng.choice(["active", "active", "closed"]),
+                    created_at=stamp,
+                    updated_at=rng.choice([stamp, minutes_ago()]),
+                )
+                sessions.append(game_session)
+            db.add_all(sessions)
+            db.flush()
+            for turn_index in range(rng.randint(0, 3)):
+                db.add(
+                    Turn(
+                        world_id=world_id,
+                        session_id=rng.choice(sessions).id,
+                        actor_id=actor.id,
+                        input_text=f"turn {turn_index}",
+                        model_lane="stub",
+                        action_type=rng.choice(["narrative", "narrative", "system"]),
+                        created_at=minutes_ago(),
+                    )
+                )
+            for _ in range(rng.randint(0, 3)):
+                db.add(
+                    WorldTick(
+                        world_id=world_id,
+                        tick_kind=rng.choice(["idle_world_pass", "idle_world_pass", "scene"]),
+                        status=rng.choice(["completed", "completed", "failed"]),
+                        created_at=minutes_ago(),
+                        completed_at=rng.choice([None, minutes_ago()]),
+                    )
+                )
+        db.flush()
+
+        legacy = _legacy_due_rows(db, settings)
+        assert any(world_id.startswith("due-world-") for world_id, _ in legacy)
+        assert list(ambient.idle_pass_due_times(db).items()) == legacy
+        for world_id, due_at in legacy:
+            assert ambient.idle_pass_due_at(db, world_id) == due_at
+        assert ambient.due_world_ids(db) == [world_id for world_id, due_at in legacy if due_at <= datetime.now(timezone.utc)]
+        db.rollback()